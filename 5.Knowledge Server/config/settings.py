@@ -36,6 +36,10 @@ class Neo4jSettings(BaseSettings):
     connection_timeout: int = Field(default=30, ge=1)
     max_transaction_retry_time: int = Field(default=30, ge=1)
 
+    # Async driver pool used by MCP tool handlers
+    async_max_pool_size: int = Field(default=50, ge=1, le=500)
+    connection_acquisition_timeout: float = Field(default=10.0, gt=0)
+
 
 class ChromaDbSettings(BaseSettings):
     """ChromaDB vector store configuration."""
@@ -86,13 +90,18 @@ class EmbeddingSettings(BaseSettings):
     )
 
     model: str = Field(default="all-MiniLM-L6-v2")
-    backend: str = Field(default="sentence-transformers")  # "mistral" or "sentence-transformers"
+    backend: str = Field(default="sentence-transformers")  # "sentence-transformers", "mistral" or "onnx"
     cache_dir: str = Field(default="./data/embeddings")
+    onnx_dir: str = Field(default="./data/onnx")  # exports from scripts/export_onnx_model.py
     device: str = Field(default="cpu")
     batch_size: int = Field(default=32, ge=1)
     normalize: bool = Field(default=True)
     max_text_length: int = Field(default=8000)  # Mistral supports up to 8192 tokens
 
+    # Micro-batching of concurrent tool-call embeddings (EMBEDDING_MICROBATCH_*)
+    microbatch_max_size: int = Field(default=32, ge=1)
+    microbatch_max_wait_ms: float = Field(default=5.0, ge=0)
+
 
 class RedisSettings(BaseSettings):
     """Redis cache configuration for confidence scoring."""
@@ -146,9 +155,26 @@ class ConfidenceSettings(BaseSettings):
         "Concepts with this many or more relationships score 1.0 for density."
     )
 
+    # Explanation quality definition: 1 = vocabulary-richness heuristic,
+    # 2 = TF-IDF against the persisted corpus vectorizer (refit in the background)
+    explanation_score_version: int = Field(default=1, ge=1, le=2)
+    tfidf_vectorizer_path: str = Field(default="services/confidence/cache/tfidf_vectorizer.pkl")
+    tfidf_refit_interval_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds between background TF-IDF refits with score version 2 "
+        "(0 disables the refit task)"
+    )
+
     # Cache settings
     score_cache_ttl: int = Field(default=3600)  # 1 hour
     calc_cache_ttl: int = Field(default=86400)  # 24 hours
+    near_cache_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds to keep cache reads in process memory in front of Redis "
+        "(0 disables the near-cache)"
+    )
 
     # Key prefixes (not typically overridden via env)
     score_key_prefix: str = Field(default="confidence:score:")
@@ -176,6 +202,11 @@ class ConfidenceSettings(BaseSettings):
         le=100,
         description="Maximum pending recalculations processed per cycle"
     )
+    recalc_queue_path: str = Field(
+        default="data/confidence/recalc_queue.db",
+        description="SQLite file backing the RecalculationScheduler queue "
+        "(\":memory:\" keeps it in process and loses it on restart)"
+    )
 
 
 class AppSettings(BaseSettings):
@@ -195,6 +226,72 @@ class AppSettings(BaseSettings):
     # Data paths
     event_store_path: str = Field(default="./data/events.db", validation_alias="EVENT_STORE_PATH")
 
+    # Event store group commit (0 disables; concurrent appends within the window share a commit)
+    event_group_commit_window_ms: float = Field(
+        default=0.0, ge=0, validation_alias="EVENT_GROUP_COMMIT_WINDOW_MS"
+    )
+    event_group_commit_max_batch: int = Field(
+        default=256, ge=1, validation_alias="EVENT_GROUP_COMMIT_MAX_BATCH"
+    )
+
+    # Encoding of newly written event_data ("json", or "msgpack" BLOBs; both stay readable)
+    event_data_codec: str = Field(
+        default="json", pattern="^(json|msgpack)$", validation_alias="EVENT_DATA_CODEC"
+    )
+
+    # Event-log segments: events behind their aggregate's snapshot and older than
+    # EVENT_ARCHIVE_AFTER_SECONDS move into compressed segment files (interval 0 disables)
+    event_segment_dir: str = Field(default="./data/segments", validation_alias="EVENT_SEGMENT_DIR")
+    event_segment_compression: str = Field(
+        default="auto", pattern="^(auto|zstd|zlib)$", validation_alias="EVENT_SEGMENT_COMPRESSION"
+    )
+    event_archive_interval_seconds: float = Field(
+        default=3600.0, ge=0, validation_alias="EVENT_ARCHIVE_INTERVAL_SECONDS"
+    )
+    event_archive_after_seconds: float = Field(
+        default=604800.0, ge=0, validation_alias="EVENT_ARCHIVE_AFTER_SECONDS"
+    )
+
+    # Outbox drain worker
+    outbox_worker_batch_size: int = Field(
+        default=200, ge=1, validation_alias="OUTBOX_WORKER_BATCH_SIZE"
+    )
+    outbox_worker_max_in_flight: int = Field(
+        default=2, ge=1, validation_alias="OUTBOX_WORKER_MAX_IN_FLIGHT"
+    )
+    outbox_worker_interval_seconds: float = Field(
+        default=5.0, gt=0, validation_alias="OUTBOX_WORKER_INTERVAL_SECONDS"
+    )
+    # Claimed rows not finished within the lease go back to pending
+    outbox_lease_seconds: float = Field(
+        default=300.0, gt=0, validation_alias="OUTBOX_LEASE_SECONDS"
+    )
+    # Completed-row archival into outbox_history (interval 0 disables it)
+    outbox_archive_interval_seconds: float = Field(
+        default=600.0, ge=0, validation_alias="OUTBOX_ARCHIVE_INTERVAL_SECONDS"
+    )
+    outbox_archive_retention_seconds: float = Field(
+        default=3600.0, ge=0, validation_alias="OUTBOX_ARCHIVE_RETENTION_SECONDS"
+    )
+
+    # Read models (hierarchy view, relationship graph, lexical index) are marked
+    # stale and rescanned from Neo4j this often, undoing any drift (0 disables)
+    read_model_rescan_interval_seconds: float = Field(
+        default=3600.0, ge=0, validation_alias="READ_MODEL_RESCAN_INTERVAL_SECONDS"
+    )
+
+    # Startup ("staged" serves tools as their services come up; "sequential"
+    # waits for every service before accepting requests)
+    startup_mode: str = Field(
+        default="staged", pattern="^(staged|sequential)$", validation_alias="STARTUP_MODE"
+    )
+    startup_wait_timeout_seconds: float = Field(
+        default=60.0, ge=0, validation_alias="STARTUP_WAIT_TIMEOUT_SECONDS"
+    )
+
+    # Aggregate snapshots (a concept is snapshotted every N versions; 0 disables)
+    snapshot_interval: int = Field(default=50, ge=0, validation_alias="SNAPSHOT_INTERVAL")
+
     # Performance
     max_batch_size: int = Field(default=50, validation_alias="MAX_BATCH_SIZE")
     cache_ttl_seconds: int = Field(default=300, validation_alias="CACHE_TTL_SECONDS")
@@ -228,6 +325,21 @@ class AppSettings(BaseSettings):
                 str(project_root / self.embedding.cache_dir),
             )
 
+        if not Path(self.embedding.onnx_dir).is_absolute():
+            object.__setattr__(
+                self.embedding,
+                "onnx_dir",
+                str(project_root / self.embedding.onnx_dir),
+            )
+
+        queue_path = self.confidence.recalc_queue_path
+        if queue_path != ":memory:" and not Path(queue_path).is_absolute():
+            object.__setattr__(
+                self.confidence,
+                "recalc_queue_path",
+                str(project_root / queue_path),
+            )
+
         return self
 
     def is_production(self) -> bool:
@@ -5,24 +5,39 @@ Main entry point for the FastMCP server
 
 import asyncio
 import logging
+from collections.abc import Sequence
 from contextlib import asynccontextmanager, suppress
 from typing import Any, Dict, Optional
 
 from fastmcp import FastMCP
 
-from config import Config
+from config import Config, get_settings
 from projections.chromadb_projection import ChromaDBProjection
 from projections.neo4j_projection import Neo4jProjection
+from services.async_neo4j_service import create_async_neo4j_service_from_env
 from services.chromadb_service import ChromaDbService
 from services.compensation import CompensationManager
+from services.confidence.data_access import DataAccessLayer
 from services.confidence.event_listener import ConfidenceEventListener
+from services.confidence.models import Error
 from services.confidence.runtime import ConfidenceRuntime, build_confidence_runtime
+from services.confidence.understanding_calculator import TFIDFCorpusManager
+from services.embedding_batcher import EmbeddingBatcher
 from services.embedding_cache import EmbeddingCache
 from services.embedding_service import EmbeddingConfig, EmbeddingService
 from services.event_store import EventStore
+from services.hierarchy_view import HierarchyView
+from services.lexical_index import LexicalIndex
 from services.neo4j_service import Neo4jService
+from services.onnx_embedding import default_model_dir
 from services.outbox import Outbox
+from services.outbox_worker import OutboxWorker
+from services.read_model import EventFedReadModel
+from services.relationship_graph import RelationshipGraph
 from services.repository import DualStorageRepository
+from services.snapshot_store import SnapshotStore
+from services.startup import StartupState
+from services.tracing import get_trace_recorder, prometheus_lines, traced_tool
 from services.confidence.event_listener import ConfidenceEventListener
 from services.confidence.runtime import ConfidenceRuntime, build_confidence_runtime
 from services.container import get_container, reset_container
@@ -81,7 +96,9 @@ async def _run_confidence_worker(
 
     Args:
         listener: ConfidenceEventListener to process events
-        event_signal: Optional asyncio.Event to trigger immediate processing
+        event_signal: Optional asyncio.Event to trigger immediate processing.
+            The worker clears it after each wake-up, so it must not be shared
+            with other consumers (see EventStore.subscribe_new_events()).
         interval_seconds: Fallback polling interval if no signal provided
     """
     while True:
@@ -110,46 +127,185 @@ async def _run_confidence_worker(
                 await asyncio.sleep(interval_seconds)
 
 
-async def initialize():
+async def _run_outbox_worker(
+    worker: OutboxWorker,
+    *,
+    event_signal: asyncio.Event | None = None,
+    interval_seconds: float = 5.0,
+) -> None:
     """
-    Initialize all server services and configure tools.
-    This function can be called standalone (for testing) or via the lifespan handler.
+    Background task that drains the outbox in batches.
+
+    Args:
+        worker: OutboxWorker to drive
+        event_signal: Optional asyncio.Event to trigger immediate processing.
+            The worker clears it after each wake-up, so it must not be shared
+            with other consumers (see EventStore.subscribe_new_events()).
+        interval_seconds: Fallback polling interval if no signal provided
     """
-    # Get or create the service container
-    container = get_container()
+    while True:
+        try:
+            stats = await worker.drain()
+            if stats["total"]:
+                logger.debug("Outbox worker stats: %s", stats)
+        except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("Outbox worker error: %s", exc, exc_info=True)
+            await asyncio.sleep(interval_seconds * 2)
+        else:
+            if event_signal:
+                try:
+                    await asyncio.wait_for(event_signal.wait(), timeout=interval_seconds)
+                except TimeoutError:
+                    pass
+                finally:
+                    event_signal.clear()
+            else:
+                await asyncio.sleep(interval_seconds)
 
-    logger.info(f"Initializing {Config.MCP_SERVER_NAME}...")
 
-    try:
-        # Initialize event store
-        container.event_store = EventStore(db_path=Config.EVENT_STORE_PATH)
-        logger.info("✅ Event store initialized")
+async def _run_outbox_archiver(
+    outbox: Outbox, *, interval_seconds: float, retention_seconds: float
+) -> None:
+    """
+    Background task that moves completed outbox rows into outbox_history.
+
+    Args:
+        outbox: Outbox to archive
+        interval_seconds: Pause between archival runs
+        retention_seconds: Minimum age of completed rows before they are archived
+    """
+    while True:
+        try:
+            await asyncio.to_thread(outbox.archive_completed, retention_seconds)
+        except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("Outbox archiver error: %s", exc, exc_info=True)
+        await asyncio.sleep(interval_seconds)
+
+
+async def _run_event_archiver(
+    event_store: EventStore, *, interval_seconds: float, older_than_seconds: float
+) -> None:
+    """
+    Background task that moves snapshotted history into event segments.
+
+    Each run writes segments until no full segment's worth of events is left,
+    so a large backlog is worked off in one go.
+
+    Args:
+        event_store: EventStore to archive
+        interval_seconds: Pause between archival runs
+        older_than_seconds: Minimum age of archived events
+    """
+    while True:
+        try:
+            while (
+                await asyncio.to_thread(event_store.archive_segment, older_than_seconds)
+                >= event_store.SEGMENT_MAX_EVENTS
+            ):
+                pass
+        except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("Event archiver error: %s", exc, exc_info=True)
+        await asyncio.sleep(interval_seconds)
+
+
+async def _run_read_model_rescan(
+    read_models: Sequence[EventFedReadModel], *, interval_seconds: float
+) -> None:
+    """
+    Background task that periodically forces the read models to rescan Neo4j.
+
+    Events are replayed from before the oldest unprojected one, so a read
+    model only drifts if Neo4j itself is changed outside the event log; the
+    rescan on the next read after mark_stale() undoes that.
+
+    Args:
+        read_models: Read models to mark stale
+        interval_seconds: Pause between rescans
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for model in read_models:
+            if not model.needs_rebuild:
+                model.mark_stale()
 
-        # Initialize outbox
-        container.outbox = Outbox(db_path=Config.EVENT_STORE_PATH)
-        logger.info("✅ Outbox initialized")
 
-        # Initialize Neo4j service with retry logic
-        container.neo4j_service = Neo4jService(
+async def _run_tfidf_refit(
+    corpus_manager: TFIDFCorpusManager,
+    data_access: DataAccessLayer,
+    event_store: EventStore,
+    *,
+    interval_seconds: float,
+) -> None:
+    """
+    Background task that keeps the explanation-quality TF-IDF corpus current.
+
+    Each run either refits the vectorizer from Neo4j (first run, 15% growth,
+    30 days) or folds explanations from new concept events into its idf
+    weights; see TFIDFCorpusManager.refresh().
+
+    Args:
+        corpus_manager: Corpus manager shared with the UnderstandingCalculator
+        data_access: Confidence data access layer (corpus fetch)
+        event_store: EventStore read for new explanations
+        interval_seconds: Pause between runs
+    """
+    while True:
+        try:
+            result = await corpus_manager.refresh(data_access, event_store)
+            if isinstance(result, Error):
+                logger.warning("TF-IDF refit skipped: %s", result.message)
+            elif result.value:
+                logger.debug("TF-IDF corpus refreshed with %s explanations", result.value)
+        except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("TF-IDF refit error: %s", exc, exc_info=True)
+        await asyncio.sleep(interval_seconds)
+
+
+# Container attributes a staged startup gates; tools decorated with
+# requires_services(...) wait for these to be assigned
+_STAGED_SERVICES = (
+    "event_store",
+    "outbox",
+    "neo4j_service",
+    "chromadb_service",
+    "embedding_service",
+    "snapshot_store",
+    "repository",
+)
+
+
+async def _connect_neo4j(container, startup: StartupState) -> None:
+    """Connect Neo4j (with retries), check migrations and health, open the async driver."""
+    with startup.phase("neo4j"):
+        neo4j_service = Neo4jService(
             uri=Config.NEO4J_URI,
             user=Config.NEO4J_USER,
             password=Config.NEO4J_PASSWORD
         )
 
-        # Connect to Neo4j with exponential backoff retry
+        # Connect to Neo4j with exponential backoff retry (the sync driver
+        # blocks, so it runs in a thread while ChromaDB connects)
         max_retries = 3
         retry_delays = [2, 4, 8]  # seconds
         neo4j_connected = False
 
         for attempt in range(max_retries):
             logger.info(f"Connecting to Neo4j (attempt {attempt + 1}/{max_retries})...")
-            if container.neo4j_service.connect():
+            if await asyncio.to_thread(neo4j_service.connect):
                 neo4j_connected = True
                 logger.info("✅ Neo4j service connected")
 
                 # Check for unmigrated data before proceeding
                 logger.info("Checking database migration status...")
-                _check_migration_status(container.neo4j_service)
+                await asyncio.to_thread(_check_migration_status, neo4j_service)
                 logger.info("✅ Database migration check passed")
 
                 break
@@ -168,30 +324,76 @@ async def initialize():
                 f"Connection URI: {Config.NEO4J_URI}"
             )
 
-        # Initialize ChromaDB service
-        container.chromadb_service = ChromaDbService(
+        # Validate service health before exposing it to tools
+        neo4j_health = await asyncio.to_thread(neo4j_service.health_check)
+        if neo4j_health.get("status") != "healthy":
+            logger.error(f"❌ Neo4j health check failed: {neo4j_health}")
+            raise RuntimeError(
+                f"Neo4j service is unhealthy: {neo4j_health.get('error', 'Unknown error')}"
+            )
+        logger.info(
+            f"✅ Neo4j health check passed (latency: {neo4j_health.get('latency_ms', 'N/A')}ms)"
+        )
+
+        # Async driver for tool handlers (falls back to the sync service if unavailable)
+        if container.async_neo4j_service:
+            await container.async_neo4j_service.close()
+        async_neo4j = create_async_neo4j_service_from_env()
+        if await async_neo4j.connect():
+            container.async_neo4j_service = async_neo4j
+            logger.info("✅ Async Neo4j service connected")
+        else:
+            container.async_neo4j_service = None
+            logger.warning("⚠️  Async Neo4j driver unavailable - tools will use the sync service")
+
+        container.neo4j_service = neo4j_service
+    startup.ready("neo4j_service")
+
+
+async def _connect_chromadb(container, startup: StartupState) -> None:
+    """Open the ChromaDB collection and check its health."""
+    with startup.phase("chromadb"):
+        chromadb_service = ChromaDbService(
             persist_directory=Config.CHROMA_PERSIST_DIRECTORY,
             collection_name="concepts"
         )
 
-        # Connect to ChromaDB
         logger.info("Connecting to ChromaDB...")
-        if not container.chromadb_service.connect():
+        if not await asyncio.to_thread(chromadb_service.connect):
             raise RuntimeError(
                 "Failed to connect to ChromaDB. "
                 f"Persist directory: {Config.CHROMA_PERSIST_DIRECTORY}"
             )
         logger.info("✅ ChromaDB service connected")
 
-        # Initialize and load embedding service
+        chromadb_health = await asyncio.to_thread(chromadb_service.health_check)
+        if chromadb_health.get("status") != "healthy":
+            logger.error(f"❌ ChromaDB health check failed: {chromadb_health}")
+            raise RuntimeError(
+                f"ChromaDB service is unhealthy: {chromadb_health.get('error', 'Unknown error')}"
+            )
+        logger.info(
+            f"✅ ChromaDB health check passed (collection: {chromadb_health.get('collection_name', 'N/A')})"
+        )
+
+        container.chromadb_service = chromadb_service
+    startup.ready("chromadb_service")
+
+
+async def _load_embedding_model(container, startup: StartupState, settings) -> None:
+    """Load the embedding model (degraded mode if it fails) and start the micro-batcher."""
+    with startup.phase("embedding_model"):
         embedding_config = EmbeddingConfig(
             model_name=Config.EMBEDDING_MODEL,
-            backend=Config.EMBEDDING_BACKEND
+            backend=Config.EMBEDDING_BACKEND,
+            onnx_model_dir=str(
+                default_model_dir(settings.embedding.onnx_dir, Config.EMBEDDING_MODEL)
+            ),
         )
-        container.embedding_service = EmbeddingService(config=embedding_config)
+        embedding_service = EmbeddingService(config=embedding_config)
 
         logger.info(f"Initializing embedding service: {Config.EMBEDDING_MODEL} (backend: {Config.EMBEDDING_BACKEND})...")
-        model_loaded = await container.embedding_service.initialize()
+        model_loaded = await embedding_service.initialize()
         if not model_loaded:
             logger.warning(
                 "⚠️  Embedding model failed to load - semantic search will be degraded. "
@@ -200,123 +402,311 @@ async def initialize():
         else:
             logger.info("✅ Embedding service initialized and model loaded")
 
-        # Initialize embedding cache
-        embedding_cache = EmbeddingCache(db_path=Config.EVENT_STORE_PATH)
-        logger.info("✅ Embedding cache initialized")
-
-        # Initialize projections
-        neo4j_projection = Neo4jProjection(container.neo4j_service)
-        chromadb_projection = ChromaDBProjection(container.chromadb_service)
-        logger.info("✅ Projections initialized")
-
-        # Initialize compensation manager with SQLite connection
-        import sqlite3
-
-        compensation_connection = sqlite3.connect(Config.EVENT_STORE_PATH)
-        compensation_manager = CompensationManager(
-            neo4j_service=container.neo4j_service,
-            chromadb_service=container.chromadb_service,
-            connection=compensation_connection
-        )
-        logger.info("✅ Compensation manager initialized")
-
-        # Initialize repository
-        container.repository = DualStorageRepository(
-            event_store=container.event_store,
-            outbox=container.outbox,
-            neo4j_projection=neo4j_projection,
-            chromadb_projection=chromadb_projection,
-            embedding_service=container.embedding_service,
-            embedding_cache=embedding_cache,
-            compensation_manager=compensation_manager,
-        )
-        logger.info("✅ Repository initialized")
-
-        # Initialize confidence scoring runtime (optional)
-        if container.confidence_listener_task:
-            container.confidence_listener_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await container.confidence_listener_task
-            container.confidence_listener_task = None
-        container.confidence_listener = None
-        if container.confidence_runtime:
-            await container.confidence_runtime.close()
-            container.confidence_runtime = None
-        container.confidence_runtime = await build_confidence_runtime(
-            container.neo4j_service,
-            event_store=container.event_store,
-            outbox=container.outbox,
-            neo4j_projection=neo4j_projection,
-        )
-        if container.confidence_runtime:
-            container.confidence_listener = ConfidenceEventListener(
-                event_store=container.event_store,
-                calculator=container.confidence_runtime.calculator,
-                cache_manager=container.confidence_runtime.cache_manager,
-                neo4j_service=container.neo4j_service,
-            )
-            container.confidence_listener_task = asyncio.create_task(
-                _run_confidence_worker(
-                    container.confidence_listener,
-                    event_signal=container.event_store.new_event_signal
-                )
+        # Check Embedding service health (allow degraded mode)
+        embedding_health = embedding_service.health_check()
+        if embedding_health.get("status") == "healthy":
+            logger.info(
+                f"✅ Embedding service health check passed (model: {embedding_health.get('model', 'N/A')})"
             )
-            logger.info("✅ Confidence event listener started")
         else:
-            container.confidence_listener = None
-            container.confidence_listener_task = None
             logger.warning(
-                "Confidence scoring runtime unavailable; automated confidence scores disabled."
+                f"⚠️  Embedding service is degraded: {embedding_health.get('error', 'Model not loaded')} "
+                "- Semantic search will use fallback behavior"
             )
 
-        logger.info("✅ Tools configured")
+        # Coalesce concurrent tool-call embeddings into batched model calls
+        if container.embedding_batcher:
+            await container.embedding_batcher.close()
+        container.embedding_batcher = EmbeddingBatcher(
+            embedding_service,
+            max_batch_size=settings.embedding.microbatch_max_size,
+            max_wait_ms=settings.embedding.microbatch_max_wait_ms,
+        )
+        container.embedding_service = embedding_service
+    startup.ready("embedding_service")
 
-        # Validate service health before marking server as ready
-        logger.info("Validating service health...")
 
-        # Check Neo4j health
-        neo4j_health = container.neo4j_service.health_check()
-        if neo4j_health.get("status") != "healthy":
-            logger.error(f"❌ Neo4j health check failed: {neo4j_health}")
-            raise RuntimeError(
-                f"Neo4j service is unhealthy: {neo4j_health.get('error', 'Unknown error')}"
+async def initialize(startup: StartupState | None = None):
+    """
+    Initialize all server services and configure tools.
+    This function can be called standalone (for testing) or via the lifespan handler.
+
+    Neo4j and ChromaDB connect concurrently while the embedding model loads
+    in the background; each service is assigned on the container (and its
+    readiness gate opened) as soon as it is up, so tools that only need
+    Neo4j are served before the model has loaded. Returns once every
+    service is ready.
+
+    Args:
+        startup: Readiness gates and phase timings to record into (a new
+            StartupState is created when omitted)
+    """
+    # Get or create the service container
+    container = get_container()
+    settings = get_settings()
+
+    if startup is None:
+        startup = StartupState(mode=settings.startup_mode)
+    startup.expect(*_STAGED_SERVICES)
+    container.startup = startup
+
+    logger.info(f"Initializing {Config.MCP_SERVER_NAME}...")
+
+    embedding_task: asyncio.Task | None = None
+    try:
+        with startup.phase("storage"):
+            # Initialize event store
+            container.event_store = EventStore(
+                db_path=Config.EVENT_STORE_PATH,
+                event_data_codec=settings.event_data_codec,
+                segment_dir=settings.event_segment_dir,
+                segment_compression=settings.event_segment_compression,
             )
-        logger.info(
-            f"✅ Neo4j health check passed (latency: {neo4j_health.get('latency_ms', 'N/A')}ms)"
-        )
+            if settings.event_group_commit_window_ms > 0:
+                container.event_store.enable_group_commit(
+                    window_ms=settings.event_group_commit_window_ms,
+                    max_batch_size=settings.event_group_commit_max_batch,
+                )
+            logger.info("✅ Event store initialized")
 
-        # Check ChromaDB health
-        chromadb_health = container.chromadb_service.health_check()
-        if chromadb_health.get("status") != "healthy":
-            logger.error(f"❌ ChromaDB health check failed: {chromadb_health}")
-            raise RuntimeError(
-                f"ChromaDB service is unhealthy: {chromadb_health.get('error', 'Unknown error')}"
+            # Initialize outbox
+            container.outbox = Outbox(
+                db_path=Config.EVENT_STORE_PATH, lease_seconds=settings.outbox_lease_seconds
             )
-        logger.info(
-            f"✅ ChromaDB health check passed (collection: {chromadb_health.get('collection_name', 'N/A')})"
+            logger.info("✅ Outbox initialized")
+
+            # Hierarchy counters, the relationship adjacency index and the lexical
+            # search index are loaded from Neo4j on first use, then kept fresh
+            # from the event stream
+            container.hierarchy_view = HierarchyView()
+            container.relationship_graph = RelationshipGraph()
+            container.lexical_index = LexicalIndex()
+            if container.read_model_rescan_task:
+                container.read_model_rescan_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await container.read_model_rescan_task
+                container.read_model_rescan_task = None
+            if settings.read_model_rescan_interval_seconds > 0:
+                container.read_model_rescan_task = asyncio.create_task(
+                    _run_read_model_rescan(
+                        (
+                            container.hierarchy_view,
+                            container.relationship_graph,
+                            container.lexical_index,
+                        ),
+                        interval_seconds=settings.read_model_rescan_interval_seconds,
+                    )
+                )
+        startup.ready("event_store", "outbox")
+
+        # The model load is the slowest phase and nothing but semantic search
+        # and the repository needs it, so it runs behind the database connects
+        embedding_task = asyncio.create_task(
+            _load_embedding_model(container, startup, settings)
         )
 
-        # Check Embedding service health (allow degraded mode)
-        embedding_health = container.embedding_service.health_check()
-        if embedding_health.get("status") == "healthy":
-            logger.info(
-                f"✅ Embedding service health check passed (model: {embedding_health.get('model', 'N/A')})"
+        # Neo4j and ChromaDB are independent; a Neo4j failure is reported first
+        results = await asyncio.gather(
+            _connect_neo4j(container, startup),
+            _connect_chromadb(container, startup),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        # Writes need real embeddings, so the repository waits for the model
+        await embedding_task
+
+        with startup.phase("repository"):
+            # Initialize embedding cache
+            embedding_cache = EmbeddingCache(db_path=Config.EVENT_STORE_PATH)
+            logger.info("✅ Embedding cache initialized")
+
+            # Initialize projections
+            neo4j_projection = Neo4jProjection(container.neo4j_service)
+            chromadb_projection = ChromaDBProjection(container.chromadb_service)
+            logger.info("✅ Projections initialized")
+
+            # Initialize compensation manager with SQLite connection
+            import sqlite3
+
+            compensation_connection = sqlite3.connect(Config.EVENT_STORE_PATH)
+            compensation_manager = CompensationManager(
+                neo4j_service=container.neo4j_service,
+                chromadb_service=container.chromadb_service,
+                connection=compensation_connection
             )
-        else:
-            logger.warning(
-                f"⚠️  Embedding service is degraded: {embedding_health.get('error', 'Model not loaded')} "
-                "- Semantic search will use fallback behavior"
+            logger.info("✅ Compensation manager initialized")
+
+            # Initialize aggregate snapshot store (same database as the event store)
+            container.snapshot_store = SnapshotStore(db_path=Config.EVENT_STORE_PATH)
+
+            # Initialize repository
+            repository = DualStorageRepository(
+                event_store=container.event_store,
+                outbox=container.outbox,
+                neo4j_projection=neo4j_projection,
+                chromadb_projection=chromadb_projection,
+                embedding_service=container.embedding_service,
+                embedding_cache=embedding_cache,
+                compensation_manager=compensation_manager,
+                snapshot_store=container.snapshot_store,
+                snapshot_interval=settings.snapshot_interval,
+            )
+            repository.warm_version_cache()
+            container.repository = repository
+            logger.info("✅ Repository initialized")
+        startup.ready("snapshot_store", "repository")
+
+        with startup.phase("workers"):
+            # Start batched outbox drain worker (retries projections that failed inline)
+            if container.outbox_worker_task:
+                container.outbox_worker_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await container.outbox_worker_task
+            container.outbox_worker = OutboxWorker(
+                outbox=container.outbox,
+                event_store=container.event_store,
+                projections={"neo4j": neo4j_projection, "chromadb": chromadb_projection},
+                batch_size=settings.outbox_worker_batch_size,
+                max_in_flight=settings.outbox_worker_max_in_flight,
+            )
+            container.outbox_worker_task = asyncio.create_task(
+                _run_outbox_worker(
+                    container.outbox_worker,
+                    event_signal=container.event_store.subscribe_new_events(),
+                    interval_seconds=settings.outbox_worker_interval_seconds,
+                )
+            )
+            logger.info("✅ Outbox worker started")
+
+            if container.outbox_archiver_task:
+                container.outbox_archiver_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await container.outbox_archiver_task
+                container.outbox_archiver_task = None
+            if settings.outbox_archive_interval_seconds > 0:
+                container.outbox_archiver_task = asyncio.create_task(
+                    _run_outbox_archiver(
+                        container.outbox,
+                        interval_seconds=settings.outbox_archive_interval_seconds,
+                        retention_seconds=settings.outbox_archive_retention_seconds,
+                    )
+                )
+                logger.info("✅ Outbox archiver started")
+
+            if container.event_archiver_task:
+                container.event_archiver_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await container.event_archiver_task
+                container.event_archiver_task = None
+            if settings.event_archive_interval_seconds > 0:
+                container.event_archiver_task = asyncio.create_task(
+                    _run_event_archiver(
+                        container.event_store,
+                        interval_seconds=settings.event_archive_interval_seconds,
+                        older_than_seconds=settings.event_archive_after_seconds,
+                    )
+                )
+                logger.info("✅ Event archiver started")
+
+            # Initialize confidence scoring runtime (optional)
+            if container.confidence_listener_task:
+                container.confidence_listener_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await container.confidence_listener_task
+                container.confidence_listener_task = None
+            container.confidence_listener = None
+            if container.tfidf_refit_task:
+                container.tfidf_refit_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await container.tfidf_refit_task
+                container.tfidf_refit_task = None
+            if container.confidence_runtime:
+                await container.confidence_runtime.close()
+                container.confidence_runtime = None
+            container.confidence_runtime = await build_confidence_runtime(
+                container.neo4j_service,
+                event_store=container.event_store,
+                outbox=container.outbox,
+                neo4j_projection=neo4j_projection,
             )
+            if container.confidence_runtime:
+                container.confidence_listener = ConfidenceEventListener(
+                    event_store=container.event_store,
+                    calculator=container.confidence_runtime.calculator,
+                    cache_manager=container.confidence_runtime.cache_manager,
+                    neo4j_service=container.neo4j_service,
+                )
+                container.confidence_listener_task = asyncio.create_task(
+                    _run_confidence_worker(
+                        container.confidence_listener,
+                        event_signal=container.event_store.subscribe_new_events(),
+                    )
+                )
+                logger.info("✅ Confidence event listener started")
+
+                corpus_manager = container.confidence_runtime.corpus_manager
+                refit_interval = settings.confidence.tfidf_refit_interval_seconds
+                if corpus_manager is not None and refit_interval > 0:
+                    container.tfidf_refit_task = asyncio.create_task(
+                        _run_tfidf_refit(
+                            corpus_manager,
+                            container.confidence_runtime.data_access,
+                            container.event_store,
+                            interval_seconds=refit_interval,
+                        )
+                    )
+                    logger.info("✅ TF-IDF refit task started")
+            else:
+                container.confidence_listener = None
+                container.confidence_listener_task = None
+                logger.warning(
+                    "Confidence scoring runtime unavailable; automated confidence scores disabled."
+                )
 
-        logger.info(f"🚀 {Config.MCP_SERVER_NAME} ready!")
+        logger.info("✅ Tools configured")
+
+        logger.info(f"🚀 {Config.MCP_SERVER_NAME} ready in {startup.elapsed_ms():.0f}ms!")
         logger.info(f"   • Neo4j: {Config.NEO4J_URI}")
         logger.info(f"   • ChromaDB: {Config.CHROMA_PERSIST_DIRECTORY}")
         logger.info(f"   • Embedding Model: {Config.EMBEDDING_MODEL}")
         logger.info("   • Tools: 17 concept management tools available")
 
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize server: {e}", exc_info=True)
+    except BaseException as e:
+        if embedding_task is not None and not embedding_task.done():
+            embedding_task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await embedding_task
+        startup.finish(error=e)
+        if not isinstance(e, asyncio.CancelledError):
+            logger.error(f"❌ Failed to initialize server: {e}", exc_info=True)
         raise
+    else:
+        startup.finish()
+
+
+async def _run_staged_startup(startup: StartupState) -> None:
+    """
+    Background initialize(); failures are recorded on the StartupState.
+
+    A failed staged startup (including the migration guard) cannot be retried
+    in-process: tools needing the missing services answer SERVICE_UNAVAILABLE
+    and ping/get_server_stats report the server as unhealthy until restart.
+    """
+    try:
+        await initialize(startup)
+    except Exception:
+        logger.critical(
+            f"❌ Startup failed ({startup.error}); the server is unhealthy until restarted"
+        )
+
+
+def _startup_error() -> str | None:
+    """Error of a failed (staged) startup, or None."""
+    startup = get_container().startup
+    return startup.error if startup is not None else None
 
 
 @asynccontextmanager
@@ -324,9 +714,23 @@ async def lifespan(server: FastMCP):
     """
     FastMCP lifespan handler - initializes services on startup and cleans up on shutdown.
     This context manager is called automatically by FastMCP when the server starts.
+
+    In the default staged mode the server starts answering requests at once
+    and initialize() runs in the background; tool calls wait for the
+    services they need (see requires_services). STARTUP_MODE=sequential
+    restores the blocking startup.
     """
-    # Initialize all services
-    await initialize()
+    container = get_container()
+    settings = get_settings()
+
+    if settings.startup_mode == "staged":
+        startup = StartupState(mode="staged")
+        startup.expect(*_STAGED_SERVICES)
+        container.startup = startup
+        container.startup_task = asyncio.create_task(_run_staged_startup(startup))
+    else:
+        # Initialize all services
+        await initialize(StartupState(mode="sequential"))
 
     # Yield control to the FastMCP server - server runs while yielded
     yield
@@ -335,7 +739,6 @@ async def lifespan(server: FastMCP):
     logger.info(f"Shutting down {Config.MCP_SERVER_NAME}...")
 
     # Use container's shutdown method for graceful cleanup
-    container = get_container()
     await container.shutdown()
 
     logger.info("✅ Server shutdown complete")
@@ -346,15 +749,27 @@ mcp = FastMCP(Config.MCP_SERVER_NAME, lifespan=lifespan)
 
 
 @mcp.tool()
+@traced_tool
 async def ping() -> dict[str, Any]:
     """
     Simple ping tool to test MCP server connectivity
 
     Returns:
-        Dictionary with server status and timestamp
+        Dictionary with server status and timestamp; status is "error" (with
+        startup_error) if the staged startup failed
     """
     from datetime import datetime
 
+    startup_error = _startup_error()
+    if startup_error:
+        return {
+            "status": "error",
+            "message": "MCP Knowledge Server failed to start",
+            "startup_error": startup_error,
+            "server_name": Config.MCP_SERVER_NAME,
+            "timestamp": datetime.now().isoformat(),
+        }
+
     return {
         "status": "ok",
         "message": "MCP Knowledge Server is running",
@@ -364,13 +779,15 @@ async def ping() -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
 @requires_services("event_store", "outbox")
 async def get_server_stats() -> dict[str, Any]:
     """
     Get server statistics
 
     Returns:
-        Dictionary with event store and outbox statistics
+        Dictionary with event store and outbox statistics; status is
+        "unhealthy" (with startup_error) if the staged startup failed
     """
     try:
         container = get_container()
@@ -381,12 +798,28 @@ async def get_server_stats() -> dict[str, Any]:
 
         # Get outbox stats
         outbox_counts = container.outbox.count_by_status()
+        worker_metrics = (
+            container.outbox_worker.get_metrics() if container.outbox_worker else None
+        )
+        neo4j_query_stats = (
+            container.async_neo4j_service.get_stats()
+            if container.async_neo4j_service
+            else None
+        )
+        startup_error = _startup_error()
 
         return {
             "success": True,
-            "event_store": {"total_events": total_events, "concept_events": concept_events},
+            "event_store": {
+                "total_events": total_events,
+                "concept_events": concept_events,
+                "segments": container.event_store.get_segment_stats(),
+            },
             "outbox": outbox_counts,
-            "status": "healthy",
+            "outbox_worker": worker_metrics,
+            "neo4j_queries": neo4j_query_stats,
+            "status": "unhealthy" if startup_error else "healthy",
+            "startup_error": startup_error,
         }
     except Exception as e:
         logger.error(f"Error getting server stats: {e}", exc_info=True, extra={
@@ -398,6 +831,41 @@ async def get_server_stats() -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
+async def get_tool_metrics(output_format: str = "json", reset: bool = False) -> dict[str, Any]:
+    """
+    Get latency histograms per MCP tool and per internal stage
+
+    Stages cover embedding generation, event store appends, outbox writes and
+    drains, Neo4j/ChromaDB projections, Cypher reads, ChromaDB queries and
+    compensation. Percentiles come from HDR-style histograms (~3% error).
+
+    Args:
+        output_format: "json" for structured stats, "prometheus" for text exposition format
+        reset: Clear all histograms after taking the snapshot
+
+    Returns:
+        Dictionary with per-tool and per-stage count, errors, throughput,
+        avg/max/p50/p95/p99/p999 latency in ms and bucket counts
+    """
+    try:
+        recorder = get_trace_recorder()
+        snapshot = recorder.snapshot()
+        if reset:
+            recorder.reset()
+
+        if output_format == "prometheus":
+            return {"success": True, "prometheus": "\n".join(prometheus_lines(snapshot))}
+        return {"success": True, **snapshot}
+    except Exception as e:
+        logger.error(f"Error getting tool metrics: {e}", exc_info=True, extra={
+            "operation": "get_tool_metrics"
+        })
+        return internal_error("Failed to get tool metrics")
+
+
+@mcp.tool()
+@traced_tool
 async def get_tool_availability() -> dict[str, Any]:
     """
     Check which MCP tools are currently available based on service initialization status.
@@ -406,6 +874,7 @@ async def get_tool_availability() -> dict[str, Any]:
     - Which tools are available and can be used
     - Which tools are unavailable due to missing services
     - The initialization status of all backend services
+    - Per-phase startup timings and which tools are still starting
     - Total tool count
 
     Use this tool when:
@@ -418,12 +887,28 @@ async def get_tool_availability() -> dict[str, Any]:
             "success": True,
             "available": [...],         # List of available tool names
             "unavailable": [...],       # List of unavailable tool names
+            "starting": [...],         # Unavailable tools whose services are still starting
             "total_tools": int,        # Total number of tools (16)
             "service_status": {        # Detailed service initialization status
                 "concept_tools": {...},
                 "search_tools": {...},
                 "relationship_tools": {...},
                 "analytics_tools": {...}
+            },
+            "startup": {               # Present once initialize() has begun
+                "mode": "staged",
+                "complete": bool,
+                "elapsed_ms": float,   # Time to full readiness once complete
+                "error": str | None,
+                "pending_services": [...],
+                "phases": {            # storage, neo4j, chromadb, embedding_model,
+                    "neo4j": {         # repository, workers
+                        "status": "ready",   # running | ready | failed | cancelled
+                        "started_ms": float,
+                        "duration_ms": float
+                    },
+                    ...
+                }
             }
         }
 
@@ -463,6 +948,7 @@ async def get_tool_availability() -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
 async def create_concept(
     name: str,
     explanation: str,
@@ -507,6 +993,7 @@ async def create_concept(
 
 
 @mcp.tool()
+@traced_tool
 async def get_concept(concept_id: str, include_history: bool = False) -> dict[str, Any]:
     """
     Retrieve a concept by ID.
@@ -522,6 +1009,7 @@ async def get_concept(concept_id: str, include_history: bool = False) -> dict[st
 
 
 @mcp.tool()
+@traced_tool
 async def update_concept(
     concept_id: str,
     explanation: str | None = None,
@@ -562,6 +1050,7 @@ async def update_concept(
 
 
 @mcp.tool()
+@traced_tool
 async def delete_concept(concept_id: str) -> dict[str, Any]:
     """
     Delete a concept (soft delete).
@@ -576,18 +1065,22 @@ async def delete_concept(concept_id: str) -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
 async def search_concepts_semantic(
     query: str,
     limit: int = 10,
     min_confidence: float = None,
     area: str = None,
-    topic: str = None
+    topic: str = None,
+    mode: str = "semantic"
 ) -> Dict[str, Any]:
     """
     Search for concepts using semantic similarity (ChromaDB embeddings).
 
     Performs semantic search by generating an embedding for the query and finding
     similar concepts using cosine similarity. Optionally filters by metadata.
+    In "hybrid" mode the vector results are fused with a BM25 keyword search
+    over concept names and explanations (reciprocal rank fusion).
 
     Args:
         query: Natural language search query (required)
@@ -595,6 +1088,7 @@ async def search_concepts_semantic(
         min_confidence: Minimum confidence score filter (0-100, optional)
         area: Filter by subject area (optional)
         topic: Filter by topic (optional)
+        mode: "semantic" (default) or "hybrid"
 
     Returns:
         {"success": bool, "results": [...], "total": int, "message": str}
@@ -604,11 +1098,13 @@ async def search_concepts_semantic(
         limit=limit,
         min_confidence=min_confidence,
         area=area,
-        topic=topic
+        topic=topic,
+        mode=mode
     )
 
 
 @mcp.tool()
+@traced_tool
 async def search_concepts_exact(
     name: str = None,
     area: str = None,
@@ -646,6 +1142,7 @@ async def search_concepts_exact(
 
 
 @mcp.tool()
+@traced_tool
 async def get_recent_concepts(days: int = 7, limit: int = 20) -> dict[str, Any]:
     """
     Get recently created or modified concepts.
@@ -664,6 +1161,7 @@ async def get_recent_concepts(days: int = 7, limit: int = 20) -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
 async def create_relationship(
     source_id: str,
     target_id: str,
@@ -697,6 +1195,7 @@ async def create_relationship(
 
 
 @mcp.tool()
+@traced_tool
 async def delete_relationship(
     source_id: str, target_id: str, relationship_type: str
 ) -> dict[str, Any]:
@@ -720,6 +1219,7 @@ async def delete_relationship(
 
 
 @mcp.tool()
+@traced_tool
 async def get_related_concepts(
     concept_id: str,
     relationship_type: str | None = None,
@@ -754,6 +1254,7 @@ async def get_related_concepts(
 
 
 @mcp.tool()
+@traced_tool
 async def get_prerequisites(concept_id: str, max_depth: int = 5) -> dict[str, Any]:
     """
     Get complete prerequisite chain for a concept.
@@ -776,6 +1277,7 @@ async def get_prerequisites(concept_id: str, max_depth: int = 5) -> dict[str, An
 
 
 @mcp.tool()
+@traced_tool
 async def get_concept_chain(
     start_id: str, end_id: str, relationship_type: str | None = None
 ) -> dict[str, Any]:
@@ -808,6 +1310,7 @@ async def get_concept_chain(
 
 
 @mcp.tool()
+@traced_tool
 async def list_hierarchy() -> dict[str, Any]:
     """
     Get complete knowledge hierarchy with concept counts.
@@ -844,6 +1347,7 @@ async def list_hierarchy() -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
 async def list_areas() -> dict[str, Any]:
     """
     Get list of all knowledge areas with concept counts.
@@ -874,6 +1378,7 @@ async def list_areas() -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool
 async def get_concepts_by_confidence(
     min_confidence: float = 0,
     max_confidence: float = 100,
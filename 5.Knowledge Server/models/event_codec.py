@@ -0,0 +1,139 @@
+"""
+Codecs for the event_data and metadata columns of the event store
+
+JSON stays the default so rows remain plain TEXT that older code and SQLite's
+JSON functions can read. It is encoded with orjson when that is installed and
+with the stdlib json module otherwise; payloads orjson rejects (integers
+outside 64 bits, non-string keys) fall back to the stdlib encoder.
+
+The msgpack codec (EVENT_DATA_CODEC=msgpack) stores event_data as a BLOB,
+which is smaller and faster to decode for large payloads. decode_column()
+picks the codec from the stored value's type, so JSON and msgpack rows can
+live in the same table and switching codecs needs no migration.
+"""
+
+import json
+import re
+from typing import Any
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+
+# orjson would otherwise serialize these natively, accepting payloads the
+# stdlib encoder rejects and decoding them back as strings
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+)
+
+# orjson decodes integers outside the 64-bit range as floats. It cannot encode
+# them either, so they only occur in text from the stdlib encoder, recognisable
+# by its '": ' separator; such text with a 19+ digit run is decoded by stdlib.
+_STDLIB_KEY_SEPARATOR = '": '
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+class JsonCodec:
+    """JSON text codec (orjson when available)."""
+
+    name = "json"
+    backend = "orjson" if orjson else "json"
+
+    def encode(self, value: Any) -> str:
+        """
+        Encode ``value`` as JSON text (compact when encoded by orjson).
+
+        Raises:
+            TypeError/ValueError: If ``value`` is not JSON-serializable
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+            except TypeError:
+                pass
+        return json.dumps(value)
+
+    def decode(self, raw: str | bytes) -> Any:
+        """
+        Decode JSON text.
+
+        Raises:
+            json.JSONDecodeError: If ``raw`` is not valid JSON
+        """
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        if orjson is not None and not (
+            _STDLIB_KEY_SEPARATOR in raw and _LONG_DIGITS.search(raw)
+        ):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # The stdlib encoder writes NaN/Infinity, which orjson rejects
+                pass
+        return json.loads(raw)
+
+
+class MsgpackCodec:
+    """Binary msgpack codec, used for event_data only."""
+
+    name = "msgpack"
+    backend = "msgpack"
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError("EVENT_DATA_CODEC=msgpack requires the msgpack package")
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, raw: bytes) -> Any:
+        """
+        Decode a msgpack BLOB.
+
+        Raises:
+            ValueError: If ``raw`` is not valid msgpack
+        """
+        try:
+            return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        except Exception as exc:
+            raise ValueError(f"Invalid msgpack payload: {exc}") from exc
+
+
+EventCodec = JsonCodec | MsgpackCodec
+
+CODECS: dict[str, type[EventCodec]] = {"json": JsonCodec, "msgpack": MsgpackCodec}
+
+_instances: dict[str, EventCodec] = {}
+
+
+def get_codec(name: str = "json") -> EventCodec:
+    """
+    Return the shared codec registered as ``name``.
+
+    Raises:
+        ValueError: If no codec has that name
+        ImportError: If the codec's package is not installed
+    """
+    codec = _instances.get(name)
+    if codec is None:
+        if name not in CODECS:
+            raise ValueError(f"Unknown event codec '{name}'. Available: {', '.join(CODECS)}")
+        codec = _instances[name] = CODECS[name]()
+    return codec
+
+
+def decode_column(raw: str | bytes | None) -> Any:
+    """Decode a stored payload column: TEXT is JSON, BLOB is msgpack."""
+    if raw is None:
+        return None
+    if isinstance(raw, (bytes, memoryview)):
+        return get_codec("msgpack").decode(bytes(raw))
+    return get_codec("json").decode(raw)
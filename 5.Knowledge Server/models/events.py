@@ -2,12 +2,13 @@
 Event models for event sourcing
 """
 
-import json
 import uuid
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, Field, field_serializer, model_validator
+
+from models.event_codec import decode_column, get_codec
 
 
 class Event(BaseModel):
@@ -35,96 +36,146 @@ class Event(BaseModel):
         """Alias for aggregate_id - use this in application code for clarity."""
         return self.aggregate_id
 
-    @field_validator('event_data', 'metadata', mode='after')
-    @classmethod
-    def validate_json_serializable(cls, value: dict[str, Any] | None, info):
-        """Ensure payload dictionaries are JSON-serializable at creation time."""
-        cls._ensure_serializable(value, info.field_name)
-        return value
+    @model_validator(mode="after")
+    def validate_json_serializable(self) -> "Event":
+        """
+        Ensure payload dictionaries are JSON-serializable at creation time.
+
+        The JSON produced by the check is not kept: payloads are plain dicts
+        that callers may still change in place, so to_db_dict() and to_json()
+        always encode what the event holds when they are called.
+        """
+        self._encode_payload("event_data")
+        self._encode_payload("metadata")
+        return self
 
     @field_serializer("created_at")
     def serialize_datetime(self, dt: datetime) -> str:
         """Serialize datetime to ISO format string (Bug #8 fix - Pydantic V2 compatible)."""
         return dt.isoformat()
 
-    @staticmethod
-    def _ensure_serializable(data: dict[str, Any] | None, field_name: str) -> None:
-        """Validate that `data` can be JSON serialized."""
-        if data is None:
-            return
+    def _encode_payload(self, field_name: str) -> str | None:
+        """JSON text of the current ``event_data`` or ``metadata``."""
+        value = getattr(self, field_name)
+        if value is None:
+            return None
 
         try:
-            json.dumps(data)
+            return get_codec("json").encode(value)
         except (TypeError, ValueError) as exc:
             raise ValueError(
                 f"{field_name} must contain only JSON-serializable data. "
                 f"Serialization failed: {exc}"
             ) from exc
 
-    @staticmethod
-    def _dump_json(data: dict[str, Any] | None, field_name: str) -> str | None:
-        """Serialize payload dictionaries to JSON strings with validation."""
-        if data is None:
-            return None
-        Event._ensure_serializable(data, field_name)
-        return json.dumps(data)
-
     def to_json(self) -> str:
         """Convert event to JSON string"""
-        payload = self.model_dump()
-        payload["event_data"] = json.loads(self._dump_json(self.event_data, "event_data"))
-        payload["metadata"] = (
-            json.loads(self._dump_json(self.metadata, "metadata"))
-            if self.metadata is not None
-            else None
+        event_data = self._encode_payload("event_data")
+        metadata = self._encode_payload("metadata")
+        return (
+            f'{{"event_id":{_json_string(self.event_id)},'
+            f'"event_type":{_json_string(self.event_type)},'
+            f'"aggregate_id":{_json_string(self.aggregate_id)},'
+            f'"aggregate_type":{_json_string(self.aggregate_type)},'
+            f'"event_data":{event_data},'
+            f'"metadata":{"null" if metadata is None else metadata},'
+            f'"version":{int(self.version)},'
+            f'"created_at":"{self.created_at.isoformat()}"}}'
         )
-        return json.dumps(payload)
 
     @classmethod
     def from_json(cls, json_str: str) -> "Event":
         """Create event from JSON string"""
         return cls.model_validate_json(json_str)
 
-    def to_db_dict(self) -> dict[str, Any]:
+    def to_db_dict(self, event_data_codec: str = "json") -> dict[str, Any]:
         """
         Convert event to dictionary suitable for database storage
 
+        Args:
+            event_data_codec: Codec for the event_data column ("json" or
+                "msgpack"); metadata is always stored as JSON
+
         Returns:
-            Dictionary with JSON-serialized event_data and metadata
+            Dictionary with serialized event_data and metadata
         """
+        if event_data_codec == "json":
+            event_data = self._encode_payload("event_data")
+        else:
+            event_data = get_codec(event_data_codec).encode(self.event_data)
+
         return {
             "event_id": self.event_id,
             "event_type": self.event_type,
             "aggregate_id": self.aggregate_id,
             "aggregate_type": self.aggregate_type,
-            "event_data": self._dump_json(self.event_data, "event_data"),
-            "metadata": self._dump_json(self.metadata, "metadata"),
+            "event_data": event_data,
+            "metadata": self._encode_payload("metadata"),
             "version": self.version,
             "created_at": self.created_at.isoformat(),
         }
 
     @classmethod
-    def from_db_row(cls, row: tuple) -> "Event":
+    def from_db_row(cls, row: tuple, trusted: bool = False) -> "Event":
         """
         Create event from database row
 
         Args:
             row: Tuple from SQLite query (event_id, event_type, aggregate_id,
                  aggregate_type, event_data, metadata, version, created_at)
+            trusted: Skip pydantic validation. Only for rows the event store
+                wrote itself, which were validated before they were stored.
 
         Returns:
             Event instance
+
+        Raises:
+            ValueError: If a payload column or created_at cannot be decoded
         """
-        return cls(
-            event_id=row[0],
-            event_type=row[1],
-            aggregate_id=row[2],
-            aggregate_type=row[3],
-            event_data=json.loads(row[4]),
-            metadata=json.loads(row[5]) if row[5] is not None else None,
-            version=row[6],
-            created_at=datetime.fromisoformat(row[7]),
-        )
+        event_data = decode_column(row[4])
+        metadata = decode_column(row[5])
+        created_at = datetime.fromisoformat(row[7])
+
+        if not trusted:
+            return cls(
+                event_id=row[0],
+                event_type=row[1],
+                aggregate_id=row[2],
+                aggregate_type=row[3],
+                event_data=event_data,
+                metadata=metadata,
+                version=row[6],
+                created_at=created_at,
+            )
+
+        if not isinstance(event_data, dict):
+            raise ValueError(f"event_data of event {row[0]} is not an object")
+
+        # Same instance state as model_construct() with every field given;
+        # model_construct() itself loops over the fields in Python and is
+        # slower than validating
+        event = cls.__new__(cls)
+        object.__setattr__(event, "__dict__", {
+            "event_id": row[0],
+            "event_type": row[1],
+            "aggregate_id": row[2],
+            "aggregate_type": row[3],
+            "event_data": event_data,
+            "metadata": metadata,
+            "version": row[6],
+            "created_at": created_at,
+        })
+        object.__setattr__(event, "__pydantic_fields_set__", set(_EVENT_FIELDS))
+        object.__setattr__(event, "__pydantic_extra__", None)
+        object.__setattr__(event, "__pydantic_private__", None)
+        return event
+
+
+_EVENT_FIELDS = frozenset(Event.model_fields)
+
+
+def _json_string(value: str) -> str:
+    return get_codec("json").encode(value)
 
 
 class ConceptCreated(Event):
@@ -8,7 +8,7 @@ Monitors system resources and exports metrics in Prometheus format:
 - Disk space
 - Process-specific metrics
 - Database sizes
-- Request/response metrics
+- Per-tool and per-stage latency histograms (when running inside the server)
 
 Can run as standalone script or integrated with monitoring systems.
 
@@ -36,6 +36,8 @@ import psutil
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from services.tracing import get_trace_recorder, prometheus_lines
+
 
 class ResourceMonitor:
     """Monitor system and application resources"""
@@ -311,6 +313,9 @@ class ResourceMonitor:
         chroma_size = metrics["database"]["chromadb"].get("size_mb", 0)
         lines.append(f'mcp_database_size_mb{{database="chromadb"}} {chroma_size}')
 
+        # Per-tool and per-stage latency histograms (only recorded in the server process)
+        lines.extend(prometheus_lines(metrics.get("tracing", {})))
+
         return "\n".join(lines)
 
     def collect_metrics(self) -> dict[str, Any]:
@@ -320,6 +325,7 @@ class ResourceMonitor:
             "system": self.get_system_metrics(),
             "process": self.get_process_metrics(),
             "database": self.get_database_metrics(),
+            "tracing": get_trace_recorder().snapshot(),
         }
 
 
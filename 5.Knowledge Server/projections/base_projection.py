@@ -33,6 +33,27 @@ class BaseProjection(ABC):
         """
         pass
 
+    def project_events(self, events: list[Event]) -> list[bool]:
+        """
+        Project a batch of events, in order, to the target data store.
+
+        The default implementation applies events one at a time; projections
+        override it with bulk writes.
+
+        Args:
+            events: Events to project, oldest first
+
+        Returns:
+            Per-event success flags aligned with ``events``
+        """
+        results = []
+        for event in events:
+            try:
+                results.append(self.project_event(event))
+            except Exception:
+                results.append(False)
+        return results
+
     @abstractmethod
     def get_projection_name(self) -> str:
         """
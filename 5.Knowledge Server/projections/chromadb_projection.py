@@ -9,6 +9,7 @@ Domain Mapping:
     Concept.{name,area,topic,subtopic} → ChromaDB 'metadatas' dict
     Concept.concept_id → ChromaDB 'ids' list
     confidence_score is stored in metadata (updated by confidence service)
+    content_digest/last_event_version/digest_bucket → metadata (consistency checks)
 """
 
 import logging
@@ -17,6 +18,8 @@ from datetime import UTC, datetime
 from models.events import Event
 from projections.base_projection import BaseProjection
 from services.chromadb_service import ChromaDbService
+from services.concept_digest import stamp_concept_digest
+from services.tracing import traced
 
 
 logger = logging.getLogger(__name__)
@@ -44,6 +47,7 @@ class ChromaDBProjection(BaseProjection):
         """Get the name of this projection."""
         return self.projection_name
 
+    @traced("projection.chromadb")
     def project_event(self, event: Event) -> bool:
         """
         Project an event to ChromaDB.
@@ -104,6 +108,130 @@ class ChromaDBProjection(BaseProjection):
             logger.error(f"Unexpected error projecting event {event.event_id}: {e}", exc_info=True)
             return False
 
+    @traced("projection.chromadb.batch")
+    def project_events(self, events: list[Event]) -> list[bool]:
+        """
+        Project a batch of events with one upsert and one delete.
+
+        Events are folded per concept in order, so several updates to the same
+        concept coalesce into a single document/metadata write. Concepts whose
+        first event in the batch is an update are loaded with one get().
+
+        Args:
+            events: Events to project, oldest first
+
+        Returns:
+            Per-event success flags aligned with ``events``
+        """
+        results = [False] * len(events)
+        if not events:
+            return results
+
+        if not self.chromadb.is_connected():
+            logger.error(
+                f"ChromaDB not connected. Cannot project {len(events)} events. "
+                f"Call chromadb_service.connect() first."
+            )
+            return results
+
+        try:
+            collection = self.chromadb.get_collection()
+
+            # Load stored state only for concepts that are updated before being (re)created
+            first_event_types: dict[str, str] = {}
+            for event in events:
+                first_event_types.setdefault(event.aggregate_id, event.event_type)
+            to_load = [cid for cid, etype in first_event_types.items() if etype == "ConceptUpdated"]
+
+            # concept_id -> (document, metadata) for every concept that currently exists
+            documents: dict[str, tuple[str, dict]] = {}
+            if to_load:
+                existing = collection.get(ids=to_load)
+                for i, concept_id in enumerate(existing["ids"]):
+                    document = existing["documents"][i] if existing.get("documents") else ""
+                    metadata = existing["metadatas"][i] if existing.get("metadatas") else {}
+                    documents[concept_id] = (document or "", dict(metadata or {}))
+
+        except Exception as e:
+            logger.error(f"Error loading existing ChromaDB documents: {e}", exc_info=True)
+            return results
+
+        # Fold events per concept; indexes succeed once their concept's final write succeeds
+        touched: dict[str, list[int]] = {}
+        deleted: set[str] = set()
+        for idx, event in enumerate(events):
+            concept_id = event.aggregate_id
+
+            if event.event_type == "ConceptCreated":
+                documents[concept_id] = (
+                    event.event_data.get("explanation", ""),
+                    self._build_created_metadata(event),
+                )
+                deleted.discard(concept_id)
+            elif event.event_type == "ConceptUpdated":
+                if concept_id not in documents:
+                    logger.warning(
+                        f"ConceptUpdated: Concept {concept_id} not found in ChromaDB. "
+                        f"Event: {event.event_id}. Cannot update non-existent document."
+                    )
+                    continue
+                document, metadata = documents[concept_id]
+                updates = event.event_data
+                metadata = metadata.copy()
+                self._apply_metadata_updates(metadata, updates)
+                stamp_concept_digest(metadata, concept_id, event.version)
+                if updates.get("explanation") is not None:
+                    document = updates["explanation"]
+                documents[concept_id] = (document, metadata)
+            elif event.event_type == "ConceptDeleted":
+                documents.pop(concept_id, None)
+                deleted.add(concept_id)
+            else:
+                logger.warning(
+                    f"No handler found for event type: {event.event_type}. "
+                    f"Event ID: {event.event_id}"
+                )
+                continue
+
+            touched.setdefault(concept_id, []).append(idx)
+
+        upsert_ids = [cid for cid in touched if cid in documents]
+        delete_ids = [cid for cid in touched if cid in deleted and cid not in documents]
+
+        succeeded: list[str] = []
+        if upsert_ids:
+            try:
+                collection.upsert(
+                    ids=upsert_ids,
+                    documents=[documents[cid][0] for cid in upsert_ids],
+                    metadatas=[documents[cid][1] for cid in upsert_ids],
+                )
+                succeeded.extend(upsert_ids)
+            except Exception as e:
+                logger.error(
+                    f"Error upserting {len(upsert_ids)} ChromaDB documents: {e}", exc_info=True
+                )
+
+        if delete_ids:
+            try:
+                # Note: ChromaDB delete() is idempotent - doesn't fail if ID doesn't exist
+                collection.delete(ids=delete_ids)
+                succeeded.extend(delete_ids)
+            except Exception as e:
+                logger.error(
+                    f"Error deleting {len(delete_ids)} ChromaDB documents: {e}", exc_info=True
+                )
+
+        for concept_id in succeeded:
+            for idx in touched[concept_id]:
+                results[idx] = True
+
+        logger.info(
+            f"Projected {sum(results)}/{len(events)} events to ChromaDB "
+            f"({len(upsert_ids)} upserts, {len(delete_ids)} deletes)"
+        )
+        return results
+
     def _handle_concept_created(self, event: Event) -> bool:
         """
         Handle ConceptCreated event.
@@ -129,30 +257,7 @@ class ChromaDBProjection(BaseProjection):
                 )
 
             # Build metadata for filtering and display
-            metadata = {
-                "name": event_data.get("name", ""),
-                "created_at": event.created_at.isoformat(),
-                "last_modified": event.created_at.isoformat(),
-            }
-
-            # Add optional hierarchical metadata
-            if "area" in event_data:
-                metadata["area"] = event_data["area"]
-            if "topic" in event_data:
-                metadata["topic"] = event_data["topic"]
-            if "subtopic" in event_data:
-                metadata["subtopic"] = event_data["subtopic"]
-            if "confidence_score" in event_data:
-                metadata["confidence_score"] = event_data["confidence_score"]
-
-            # NEW: Add source_urls summary (not full array - prevents metadata size issues)
-            if event_data.get("source_urls"):
-                urls = event_data["source_urls"]  # Already a list
-                metadata["source_urls_count"] = len(urls)
-                metadata["has_official_sources"] = any(
-                    u.get("domain_category") == "official" for u in urls
-                )
-                # Full data stored in Neo4j only
+            metadata = self._build_created_metadata(event)
 
             # Get collection
             collection = self.chromadb.get_collection()
@@ -173,6 +278,63 @@ class ChromaDBProjection(BaseProjection):
             )
             return False
 
+    @staticmethod
+    def _build_created_metadata(event: Event) -> dict:
+        """Build the ChromaDB metadata for a ConceptCreated event."""
+        event_data = event.event_data
+        metadata = {
+            "name": event_data.get("name", ""),
+            "created_at": event.created_at.isoformat(),
+            "last_modified": event.created_at.isoformat(),
+        }
+
+        # Add optional hierarchical metadata
+        if "area" in event_data:
+            metadata["area"] = event_data["area"]
+        if "topic" in event_data:
+            metadata["topic"] = event_data["topic"]
+        if "subtopic" in event_data:
+            metadata["subtopic"] = event_data["subtopic"]
+        if "confidence_score" in event_data:
+            metadata["confidence_score"] = event_data["confidence_score"]
+
+        # NEW: Add source_urls summary (not full array - prevents metadata size issues)
+        if event_data.get("source_urls"):
+            urls = event_data["source_urls"]  # Already a list
+            metadata["source_urls_count"] = len(urls)
+            metadata["has_official_sources"] = any(
+                u.get("domain_category") == "official" for u in urls
+            )
+            # Full data stored in Neo4j only
+
+        return stamp_concept_digest(metadata, event.aggregate_id, event.version)
+
+    @staticmethod
+    def _apply_metadata_updates(metadata: dict, updates: dict) -> None:
+        """Apply ConceptUpdated fields to ``metadata`` in place."""
+        # Update timestamp
+        metadata["last_modified"] = datetime.now(UTC).isoformat()
+
+        # Apply field updates from event
+        if "name" in updates:
+            metadata["name"] = updates["name"]
+        if "area" in updates:
+            metadata["area"] = updates["area"]
+        if "topic" in updates:
+            metadata["topic"] = updates["topic"]
+        if "subtopic" in updates:
+            metadata["subtopic"] = updates["subtopic"]
+        if "confidence_score" in updates:
+            metadata["confidence_score"] = updates["confidence_score"]
+
+        # NEW: Update source_urls summary if provided
+        if updates.get("source_urls"):
+            urls = updates["source_urls"]  # Already a list
+            metadata["source_urls_count"] = len(urls)
+            metadata["has_official_sources"] = any(
+                u.get("domain_category") == "official" for u in urls
+            )
+
     def _handle_concept_updated(self, event: Event) -> bool:
         """
         Handle ConceptUpdated event.
@@ -214,28 +376,9 @@ class ChromaDBProjection(BaseProjection):
             existing_metadata = existing["metadatas"][0] if existing["metadatas"] else {}
             updated_metadata = existing_metadata.copy()
 
-            # Update timestamp
-            updated_metadata["last_modified"] = datetime.now(UTC).isoformat()
-
-            # Apply field updates from event
-            if "name" in updates:
-                updated_metadata["name"] = updates["name"]
-            if "area" in updates:
-                updated_metadata["area"] = updates["area"]
-            if "topic" in updates:
-                updated_metadata["topic"] = updates["topic"]
-            if "subtopic" in updates:
-                updated_metadata["subtopic"] = updates["subtopic"]
-            if "confidence_score" in updates:
-                updated_metadata["confidence_score"] = updates["confidence_score"]
-
-            # NEW: Update source_urls summary if provided
-            if updates.get("source_urls"):
-                urls = updates["source_urls"]  # Already a list
-                updated_metadata["source_urls_count"] = len(urls)
-                updated_metadata["has_official_sources"] = any(
-                    u.get("domain_category") == "official" for u in urls
-                )
+            # Update timestamp and apply field updates from event
+            self._apply_metadata_updates(updated_metadata, updates)
+            stamp_concept_digest(updated_metadata, concept_id, event.version)
 
             # Use update() if we have new document, otherwise just update metadata
             if updated_document is not None:
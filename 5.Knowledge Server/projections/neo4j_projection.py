@@ -13,11 +13,16 @@ from neo4j.exceptions import DatabaseError, ServiceUnavailable
 
 from models.events import Event
 from projections.base_projection import BaseProjection
+from services.concept_digest import DIGEST_FIELDS, stamp_concept_digest
 from services.neo4j_service import Neo4jService
+from services.tracing import traced
 
 
 logger = logging.getLogger(__name__)
 
+# Relationship types allowed in Cypher (types cannot be parameterized)
+VALID_RELATIONSHIP_TYPES = ["CONTAINS", "PREREQUISITE", "RELATES_TO", "INCLUDES"]
+
 
 class Neo4jProjection(BaseProjection):
     """
@@ -41,6 +46,7 @@ class Neo4jProjection(BaseProjection):
         """Get the name of this projection."""
         return self.projection_name
 
+    @traced("projection.neo4j")
     def project_event(self, event: Event) -> bool:
         """
         Project an event to Neo4j.
@@ -100,6 +106,161 @@ class Neo4jProjection(BaseProjection):
             logger.error(f"Unexpected error projecting event {event.event_id}: {e}", exc_info=True)
             return False
 
+    # UNWIND queries used by project_events(); each returns the idx of every row it applied
+    _BULK_QUERIES = {
+        "ConceptCreated": """
+            UNWIND $rows AS row
+            MERGE (c:Concept {concept_id: row.concept_id})
+            SET c += row.properties
+            RETURN DISTINCT row.idx AS idx
+        """,
+        "ConceptUpdated": """
+            UNWIND $rows AS row
+            MATCH (c:Concept {concept_id: row.concept_id})
+            SET c += row.properties
+            RETURN DISTINCT row.idx AS idx
+        """,
+        "ConceptDeleted": """
+            UNWIND $rows AS row
+            MATCH (c:Concept {concept_id: row.concept_id})
+            SET c.deleted = true,
+                c.deleted_at = row.deleted_at
+            RETURN DISTINCT row.idx AS idx
+        """,
+        "ConceptTauUpdated": """
+            UNWIND $rows AS row
+            MATCH (c:Concept {concept_id: row.concept_id})
+            SET c.retention_tau = row.tau,
+                c.retention_tau_updated_at = row.updated_at
+            RETURN DISTINCT row.idx AS idx
+        """,
+        "RelationshipDeleted": """
+            UNWIND $rows AS row
+            MATCH ()-[r {relationship_id: row.relationship_id}]->()
+            DELETE r
+            RETURN DISTINCT row.idx AS idx
+        """,
+    }
+
+    # Relationship type is interpolated (validated against VALID_RELATIONSHIP_TYPES)
+    _BULK_RELATIONSHIP_CREATED = """
+        UNWIND $rows AS row
+        MATCH (from:Concept {{concept_id: row.from_id}})
+        MATCH (to:Concept {{concept_id: row.to_id}})
+        MERGE (from)-[r:{relationship_type}]->(to)
+        SET r += row.properties
+        RETURN DISTINCT row.idx AS idx
+    """
+
+    @traced("projection.neo4j.batch")
+    def project_events(self, events: list[Event]) -> list[bool]:
+        """
+        Project a batch of events with one UNWIND query per run.
+
+        Consecutive events of the same type (and relationship type) form a
+        run that is written with a single Cypher statement; runs execute in
+        order, so later events see the effects of earlier ones.
+
+        Args:
+            events: Events to project, oldest first
+
+        Returns:
+            Per-event success flags aligned with ``events``
+        """
+        results = [False] * len(events)
+        runs: list[tuple[tuple[str, str | None], list[dict]]] = []
+
+        for idx, event in enumerate(events):
+            built = self._build_bulk_row(idx, event)
+            if built is None:
+                continue
+            key, row = built
+            if runs and runs[-1][0] == key:
+                runs[-1][1].append(row)
+            else:
+                runs.append((key, [row]))
+
+        for (event_type, relationship_type), rows in runs:
+            if event_type == "RelationshipCreated":
+                query = self._BULK_RELATIONSHIP_CREATED.format(
+                    relationship_type=relationship_type
+                )
+            else:
+                query = self._BULK_QUERIES[event_type]
+
+            try:
+                records = self.neo4j.execute_write_records(query, parameters={"rows": rows})
+            except ServiceUnavailable as e:
+                logger.error(f"Neo4j service unavailable while projecting {event_type} batch: {e}")
+                continue
+            except DatabaseError as e:
+                logger.error(f"Database error while projecting {event_type} batch: {e}")
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error projecting {event_type} batch: {e}", exc_info=True)
+                continue
+
+            for record in records:
+                results[record["idx"]] = True
+
+            applied = len(records)
+            if applied < len(rows):
+                logger.warning(
+                    f"Bulk {event_type} projection applied {applied}/{len(rows)} events; "
+                    f"missing concepts or relationships were skipped"
+                )
+            else:
+                logger.debug(f"Bulk {event_type} projection applied {applied} events")
+
+        logger.info(
+            f"Projected {sum(results)}/{len(events)} events to Neo4j in {len(runs)} queries"
+        )
+        return results
+
+    def _build_bulk_row(
+        self, idx: int, event: Event
+    ) -> tuple[tuple[str, str | None], dict] | None:
+        """Build the UNWIND row for an event, or None if it cannot be projected."""
+        event_type = event.event_type
+        row: dict = {"idx": idx}
+
+        if event_type == "ConceptCreated":
+            row.update(
+                concept_id=event.aggregate_id, properties=self._build_created_properties(event)
+            )
+        elif event_type == "ConceptUpdated":
+            row.update(
+                concept_id=event.aggregate_id, properties=self._build_update_properties(event)
+            )
+        elif event_type == "ConceptDeleted":
+            row.update(concept_id=event.aggregate_id, deleted_at=datetime.now(UTC).isoformat())
+        elif event_type == "ConceptTauUpdated":
+            tau = event.event_data.get("tau")
+            if tau is None:
+                logger.error(f"ConceptTauUpdated event {event.event_id} missing tau value")
+                return None
+            row.update(
+                concept_id=event.aggregate_id,
+                tau=max(1, int(tau)),
+                updated_at=datetime.now(UTC).isoformat(),
+            )
+        elif event_type == "RelationshipCreated":
+            relationship = self._build_relationship_params(event)
+            if relationship is None:
+                return None
+            relationship_type, from_concept_id, to_concept_id, properties = relationship
+            row.update(from_id=from_concept_id, to_id=to_concept_id, properties=properties)
+            return (event_type, relationship_type), row
+        elif event_type == "RelationshipDeleted":
+            row.update(relationship_id=event.aggregate_id)
+        else:
+            logger.warning(
+                f"No handler found for event type: {event_type}. Event ID: {event.event_id}"
+            )
+            return None
+
+        return (event_type, None), row
+
     def _handle_concept_created(self, event: Event) -> bool:
         """
         Handle ConceptCreated event.
@@ -115,35 +276,7 @@ class Neo4jProjection(BaseProjection):
         """
         try:
             concept_id = event.aggregate_id
-            event_data = event.event_data
-
-            # Extract properties from event_data
-            properties = {
-                "concept_id": concept_id,
-                "name": event_data.get("name", ""),
-                "explanation": event_data.get("explanation", ""),
-                "confidence_score": event_data.get("confidence_score", 0.0),
-                "created_at": event.created_at.isoformat(),
-                "last_modified": event.created_at.isoformat(),
-            }
-
-            # Optional properties
-            if "area" in event_data:
-                properties["area"] = event_data["area"]
-            if "topic" in event_data:
-                properties["topic"] = event_data["topic"]
-            if "subtopic" in event_data:
-                properties["subtopic"] = event_data["subtopic"]
-            if "examples" in event_data:
-                properties["examples"] = event_data["examples"]
-            if "prerequisites" in event_data:
-                properties["prerequisites"] = event_data["prerequisites"]
-
-            # NEW: Add source_urls (serialized to JSON string for Neo4j compatibility)
-            # Neo4j cannot store lists of dictionaries as properties (only primitives or lists of primitives)
-            # Issue #1 fix: Serialize source_urls list of dicts to JSON string
-            if "source_urls" in event_data:
-                properties["source_urls"] = json.dumps(event_data["source_urls"])
+            properties = self._build_created_properties(event)
 
             # Use MERGE for idempotency - won't create duplicates
             query = """
@@ -172,6 +305,42 @@ class Neo4jProjection(BaseProjection):
             )
             return False
 
+    @staticmethod
+    def _build_created_properties(event: Event) -> dict:
+        """Build the Concept node properties for a ConceptCreated event."""
+        concept_id = event.aggregate_id
+        event_data = event.event_data
+
+        # Extract properties from event_data
+        properties = {
+            "concept_id": concept_id,
+            "name": event_data.get("name", ""),
+            "explanation": event_data.get("explanation", ""),
+            "confidence_score": event_data.get("confidence_score", 0.0),
+            "created_at": event.created_at.isoformat(),
+            "last_modified": event.created_at.isoformat(),
+        }
+
+        # Optional properties
+        if "area" in event_data:
+            properties["area"] = event_data["area"]
+        if "topic" in event_data:
+            properties["topic"] = event_data["topic"]
+        if "subtopic" in event_data:
+            properties["subtopic"] = event_data["subtopic"]
+        if "examples" in event_data:
+            properties["examples"] = event_data["examples"]
+        if "prerequisites" in event_data:
+            properties["prerequisites"] = event_data["prerequisites"]
+
+        # NEW: Add source_urls (serialized to JSON string for Neo4j compatibility)
+        # Neo4j cannot store lists of dictionaries as properties (only primitives or lists of primitives)
+        # Issue #1 fix: Serialize source_urls list of dicts to JSON string
+        if "source_urls" in event_data:
+            properties["source_urls"] = json.dumps(event_data["source_urls"])
+
+        return stamp_concept_digest(properties, concept_id, event.version)
+
     def _handle_concept_updated(self, event: Event) -> bool:
         """
         Handle ConceptUpdated event.
@@ -186,15 +355,7 @@ class Neo4jProjection(BaseProjection):
         """
         try:
             concept_id = event.aggregate_id
-            updates = event.event_data.copy()
-
-            # Add updated timestamp (timezone-aware UTC)
-            updates["last_modified"] = datetime.now(UTC).isoformat()
-
-            # Serialize source_urls if present (same as in _handle_concept_created)
-            # Neo4j cannot store lists of dictionaries as properties
-            if "source_urls" in updates:
-                updates["source_urls"] = json.dumps(updates["source_urls"])
+            updates = self._build_update_properties(event)
 
             # Update existing concept node
             query = """
@@ -227,6 +388,28 @@ class Neo4jProjection(BaseProjection):
             )
             return False
 
+    @staticmethod
+    def _build_update_properties(event: Event) -> dict:
+        """Build the properties set on a Concept node for a ConceptUpdated event."""
+        updates = event.event_data.copy()
+
+        # Add updated timestamp (timezone-aware UTC)
+        updates["last_modified"] = datetime.now(UTC).isoformat()
+
+        # Serialize source_urls if present (same as in _handle_concept_created)
+        # Neo4j cannot store lists of dictionaries as properties
+        if "source_urls" in updates:
+            updates["source_urls"] = json.dumps(updates["source_urls"])
+
+        # The node's other fields are not known here, so a change to a digested field
+        # clears content_digest (null removes the property); ConsistencyChecker
+        # recomputes missing digests before comparing buckets
+        updates["last_event_version"] = event.version
+        if any(name in updates for name in DIGEST_FIELDS):
+            updates["content_digest"] = None
+
+        return updates
+
     def _handle_concept_deleted(self, event: Event) -> bool:
         """
         Handle ConceptDeleted event.
@@ -349,43 +532,10 @@ class Neo4jProjection(BaseProjection):
             True if successful, False otherwise
         """
         try:
-            event_data = event.event_data
-
-            # Extract relationship data
-            relationship_type = event_data.get("relationship_type", "RELATES_TO")
-            from_concept_id = event_data.get("from_concept_id")
-            to_concept_id = event_data.get("to_concept_id")
-
-            if not from_concept_id or not to_concept_id:
-                logger.error(
-                    f"RelationshipCreated event {event.event_id} missing from/to concept IDs"
-                )
+            relationship = self._build_relationship_params(event)
+            if relationship is None:
                 return False
-
-            # Validate relationship type (security: prevent Cypher injection)
-            valid_types = ["CONTAINS", "PREREQUISITE", "RELATES_TO", "INCLUDES"]
-            if relationship_type not in valid_types:
-                logger.warning(
-                    f"Invalid relationship type: {relationship_type}. Valid types: {valid_types}. Using RELATES_TO"
-                )
-                relationship_type = "RELATES_TO"
-
-            # Defensive assertion to prevent Cypher injection
-            assert (
-                relationship_type in valid_types
-            ), f"Relationship type must be one of {valid_types}"
-
-            # Build relationship properties
-            rel_properties = {
-                "relationship_id": event.aggregate_id,
-                "created_at": event.created_at.isoformat(),
-            }
-
-            # Add optional properties
-            if "strength" in event_data:
-                rel_properties["strength"] = event_data["strength"]
-            if "description" in event_data:
-                rel_properties["description"] = event_data["description"]
+            relationship_type, from_concept_id, to_concept_id, rel_properties = relationship
 
             # Create relationship using dynamic relationship type
             # Note: Neo4j doesn't support parameterized relationship types in Cypher,
@@ -426,6 +576,55 @@ class Neo4jProjection(BaseProjection):
             )
             return False
 
+    @staticmethod
+    def _build_relationship_params(event: Event) -> tuple[str, str, str, dict] | None:
+        """
+        Extract and validate RelationshipCreated data.
+
+        Returns:
+            (relationship_type, from_concept_id, to_concept_id, properties),
+            or None if the event is missing its endpoints
+        """
+        event_data = event.event_data
+
+        # Extract relationship data
+        relationship_type = event_data.get("relationship_type", "RELATES_TO")
+        from_concept_id = event_data.get("from_concept_id")
+        to_concept_id = event_data.get("to_concept_id")
+
+        if not from_concept_id or not to_concept_id:
+            logger.error(
+                f"RelationshipCreated event {event.event_id} missing from/to concept IDs"
+            )
+            return None
+
+        # Validate relationship type (security: prevent Cypher injection)
+        if relationship_type not in VALID_RELATIONSHIP_TYPES:
+            logger.warning(
+                f"Invalid relationship type: {relationship_type}. "
+                f"Valid types: {VALID_RELATIONSHIP_TYPES}. Using RELATES_TO"
+            )
+            relationship_type = "RELATES_TO"
+
+        # Defensive assertion to prevent Cypher injection
+        assert (
+            relationship_type in VALID_RELATIONSHIP_TYPES
+        ), f"Relationship type must be one of {VALID_RELATIONSHIP_TYPES}"
+
+        # Build relationship properties
+        rel_properties = {
+            "relationship_id": event.aggregate_id,
+            "created_at": event.created_at.isoformat(),
+        }
+
+        # Add optional properties
+        if "strength" in event_data:
+            rel_properties["strength"] = event_data["strength"]
+        if "description" in event_data:
+            rel_properties["description"] = event_data["description"]
+
+        return relationship_type, from_concept_id, to_concept_id, rel_properties
+
     def _handle_relationship_deleted(self, event: Event) -> bool:
         """
         Handle RelationshipDeleted event.
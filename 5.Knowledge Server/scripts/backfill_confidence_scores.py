@@ -8,6 +8,10 @@ This script:
 3. Persists scores to Neo4j as confidence_score_auto
 4. Updates cache in Redis
 
+Concepts are scored in batches: inputs for a batch are fetched with two
+UNWIND queries and each batch is written back with one Neo4j write and one
+Redis pipeline.
+
 Usage:
     python scripts/backfill_confidence_scores.py
 
@@ -15,6 +19,7 @@ Options:
     --all           Recalculate ALL concepts (even those with existing scores)
     --limit N       Process only N concepts (default: all)
     --dry-run       Calculate but don't persist scores
+    --batch-size N  Concepts scored per batch (default: 500)
 """
 
 import argparse
@@ -33,7 +38,10 @@ from services.neo4j_service import Neo4jService
 
 
 async def backfill_scores(
-    recalculate_all: bool = False, limit: int | None = None, dry_run: bool = False
+    recalculate_all: bool = False,
+    limit: int | None = None,
+    dry_run: bool = False,
+    batch_size: int = 500,
 ):
     """Backfill confidence scores for existing concepts."""
 
@@ -43,6 +51,7 @@ async def backfill_scores(
     print(f"Mode: {'Recalculate ALL' if recalculate_all else 'Only missing scores'}")
     print(f"Limit: {limit if limit else 'No limit'}")
     print(f"Dry run: {dry_run}")
+    print(f"Batch size: {batch_size}")
     print()
 
     # Initialize Neo4j
@@ -107,65 +116,78 @@ async def backfill_scores(
     print(f"Found {total} concept(s) to process\n")
     print("=" * 60)
 
-    # Process each concept
+    # Process concepts in batches: one data fetch, one Neo4j write and one
+    # Redis pipeline per batch
     success_count = 0
     error_count = 0
 
-    for i, concept in enumerate(concepts, 1):
-        concept_id = concept["id"]
-        concept_name = concept["name"]
+    update_query = """
+    UNWIND $scores AS row
+    MATCH (c:Concept {concept_id: row.concept_id})
+    SET c.confidence_score_auto = row.score,
+        c.confidence_last_calculated = datetime()
+    RETURN c.concept_id AS concept_id
+    """
 
-        # Calculate score
-        try:
-            result = await runtime.calculator.calculate_composite_score(concept_id)
+    for batch_start in range(0, total, batch_size):
+        batch = concepts[batch_start : batch_start + batch_size]
+        names = {concept["id"]: concept["name"] or concept["id"] for concept in batch}
 
-            if isinstance(result, Error):
-                print(f"[{i}/{total}] ❌ {concept_name[:40]}")
-                print(f"         Error: {result.message}")
+        try:
+            results = await runtime.calculator.calculate_composite_scores(list(names))
+        except Exception as e:
+            print(f"[{batch_start + 1}-{batch_start + len(batch)}/{total}] ❌ Batch failed")
+            print(f"         Exception: {e}")
+            error_count += len(batch)
+            continue
+
+        scores = {}
+        for i, concept_id in enumerate(names, batch_start + 1):
+            result = results.get(concept_id)
+            if result is None or isinstance(result, Error):
+                print(f"[{i}/{total}] ❌ {names[concept_id][:40]}")
+                print(f"         Error: {result.message if result else 'not calculated'}")
                 error_count += 1
                 continue
 
             score = result.value
-            score_percentage = score * 100
-
-            print(f"[{i}/{total}] {concept_name[:40]}")
-            print(f"         Score: {score_percentage:.2f}/100 (raw: {score:.4f})")
-
-            if not dry_run:
-                # Persist to Neo4j
-                update_query = """
-                MATCH (c:Concept {concept_id: $concept_id})
-                SET c.confidence_score_auto = $score,
-                    c.confidence_last_calculated = datetime()
-                RETURN c.confidence_score_auto AS persisted_score
-                """
-
-                try:
-                    with neo4j.session() as session:
-                        update_result = session.run(
-                            update_query, concept_id=concept_id, score=float(score)
-                        )
-                        persisted = update_result.single()
-
-                        if persisted:
-                            # Also cache in Redis
-                            await runtime.cache_manager.set_cached_score(concept_id, score)
-                            print("         ✅ Persisted to Neo4j and cached")
-                            success_count += 1
-                        else:
-                            print("         ⚠️  Concept not found in Neo4j")
-                            error_count += 1
-                except Exception as e:
-                    print(f"         ❌ Persistence failed: {e}")
-                    error_count += 1
-            else:
-                success_count += 1
-                print("         ℹ️  Would persist (dry-run mode)")
+            scores[concept_id] = score
+            print(f"[{i}/{total}] {names[concept_id][:40]}")
+            print(f"         Score: {score * 100:.2f}/100 (raw: {score:.4f})")
+
+        if not scores:
+            continue
 
+        if dry_run:
+            success_count += len(scores)
+            print(f"         ℹ️  Would persist {len(scores)} score(s) (dry-run mode)")
+            continue
+
+        try:
+            with neo4j.session() as session:
+                update_result = session.run(
+                    update_query,
+                    scores=[
+                        {"concept_id": concept_id, "score": float(score)}
+                        for concept_id, score in scores.items()
+                    ],
+                )
+                persisted = {record["concept_id"] for record in update_result}
         except Exception as e:
-            print(f"[{i}/{total}] ❌ {concept_name[:40]}")
-            print(f"         Exception: {e}")
-            error_count += 1
+            print(f"         ❌ Persistence failed for {len(scores)} concept(s): {e}")
+            error_count += len(scores)
+            continue
+
+        # Also cache in Redis
+        await runtime.cache_manager.set_scores_many(
+            {concept_id: score for concept_id, score in scores.items() if concept_id in persisted}
+        )
+        missing = len(scores) - len(persisted)
+        if missing:
+            print(f"         ⚠️  {missing} concept(s) not found in Neo4j")
+        print(f"         ✅ Persisted {len(persisted)} score(s) to Neo4j and cached")
+        success_count += len(persisted)
+        error_count += missing
 
     # Cleanup
     await runtime.close()
@@ -199,11 +221,19 @@ def main():
     )
     parser.add_argument("--limit", type=int, default=None, help="Process only N concepts")
     parser.add_argument("--dry-run", action="store_true", help="Calculate but don't persist scores")
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Concepts scored per batch (default: 500)"
+    )
 
     args = parser.parse_args()
 
     success = asyncio.run(
-        backfill_scores(recalculate_all=args.all, limit=args.limit, dry_run=args.dry_run)
+        backfill_scores(
+            recalculate_all=args.all,
+            limit=args.limit,
+            dry_run=args.dry_run,
+            batch_size=max(1, args.batch_size),
+        )
     )
 
     sys.exit(0 if success else 1)
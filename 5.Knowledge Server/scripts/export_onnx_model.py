@@ -0,0 +1,182 @@
+"""
+Export a sentence-transformers model to int8 ONNX for EMBEDDING_BACKEND=onnx
+
+Exports the model's transformer with torch.onnx, applies onnxruntime dynamic
+int8 quantization to its weights, saves the fast tokenizer and the pooling
+settings, then compares the quantized model against the fp32
+sentence-transformers model on a fixture corpus:
+
+    python scripts/export_onnx_model.py
+    python scripts/export_onnx_model.py --model all-mpnet-base-v2 --min-cosine 0.97
+
+Export needs torch, sentence-transformers and onnx; serving the result only
+needs onnxruntime and tokenizers. The exit status is 1 if the quantized model
+falls below the parity thresholds.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import get_settings
+from services.onnx_embedding import (
+    CONFIG_FILE,
+    FP32_MODEL_FILE,
+    POOLING_MODES,
+    QUANTIZED_MODEL_FILE,
+    TOKENIZER_FILE,
+    OnnxSentenceEncoder,
+    default_model_dir,
+    parity_report,
+)
+
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "embedding_parity_corpus.json"
+
+# Quantized embeddings below these cosine similarities to fp32 fail the export
+DEFAULT_MIN_COSINE = 0.95
+DEFAULT_MEAN_COSINE = 0.98
+
+_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def export_onnx_model(
+    model: Any, output_dir: Path, model_name: str | None = None, opset: int = 17
+) -> Path:
+    """
+    Export ``model`` to ``output_dir`` (see services/onnx_embedding.py for the layout).
+
+    Args:
+        model: SentenceTransformer instance or model name
+        output_dir: Export directory (created if missing)
+        model_name: Name recorded in onnx_config.json (defaults to the directory name)
+        opset: ONNX opset version
+
+    Returns:
+        output_dir
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
+
+    if isinstance(model, str):
+        model_name = model_name or model
+        model = SentenceTransformer(model, device="cpu")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    transformer = model[0]
+    pooling = next(module for module in model if isinstance(module, Pooling))
+    pooling_mode = pooling.get_pooling_mode_str()
+    if pooling_mode not in POOLING_MODES:
+        raise ValueError(f"Pooling mode '{pooling_mode}' is not supported by the ONNX backend")
+
+    tokenizer = transformer.tokenizer
+    sample = tokenizer(["export sample text"], return_tensors="pt")
+    input_names = [name for name in _INPUT_NAMES if name in sample]
+
+    class _HiddenStates(torch.nn.Module):
+        def __init__(self, auto_model):
+            super().__init__()
+            self.auto_model = auto_model
+
+        def forward(self, *inputs):
+            return self.auto_model(**dict(zip(input_names, inputs, strict=True)))[0]
+
+    dynamic = {0: "batch", 1: "sequence"}
+    with torch.no_grad():
+        torch.onnx.export(
+            _HiddenStates(transformer.auto_model.eval()),
+            tuple(sample[name] for name in input_names),
+            str(output_dir / FP32_MODEL_FILE),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dict.fromkeys([*input_names, "last_hidden_state"], dynamic),
+            opset_version=opset,
+            dynamo=False,
+        )
+    quantize_dynamic(
+        str(output_dir / FP32_MODEL_FILE),
+        str(output_dir / QUANTIZED_MODEL_FILE),
+        weight_type=QuantType.QInt8,
+    )
+
+    tokenizer.backend_tokenizer.save(str(output_dir / TOKENIZER_FILE))
+    config = {
+        "model_name": model_name or output_dir.name,
+        "dimension": model.get_sentence_embedding_dimension(),
+        "max_seq_length": model.max_seq_length,
+        "pooling": pooling_mode,
+        "normalize": any(isinstance(module, Normalize) for module in model),
+        "pad_token": tokenizer.pad_token,
+        "pad_token_id": tokenizer.pad_token_id,
+        "opset": opset,
+    }
+    (output_dir / CONFIG_FILE).write_text(json.dumps(config, indent=2))
+    return output_dir
+
+
+def load_corpus(path: Path = DEFAULT_CORPUS) -> list[str]:
+    """Texts of the parity fixture corpus."""
+    return json.loads(path.read_text())["texts"]
+
+
+def check_parity(model: Any, model_dir: Path, texts: list[str]) -> dict[str, float]:
+    """Compare the quantized export with the fp32 sentence-transformers model."""
+    reference = np.asarray(model.encode(texts, normalize_embeddings=True, show_progress_bar=False))
+    candidate = OnnxSentenceEncoder.load(model_dir).encode(texts, normalize_embeddings=True)
+    return parity_report(reference, candidate)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=settings.embedding.model, help="Model to export")
+    parser.add_argument(
+        "--output", type=Path,
+        help="Export directory (default: EMBEDDING_ONNX_DIR/<model>)",
+    )
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--min-cosine", type=float, default=DEFAULT_MIN_COSINE)
+    parser.add_argument("--mean-cosine", type=float, default=DEFAULT_MEAN_COSINE)
+    parser.add_argument("--opset", type=int, default=17)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from sentence_transformers import SentenceTransformer
+
+    args = parse_args(argv)
+    output = args.output or default_model_dir(get_settings().embedding.onnx_dir, args.model)
+
+    print(f"Exporting {args.model} -> {output}")
+    model = SentenceTransformer(args.model, device="cpu")
+    export_onnx_model(model, output, model_name=args.model, opset=args.opset)
+
+    fp32_mb = (output / FP32_MODEL_FILE).stat().st_size / 1e6
+    int8_mb = (output / QUANTIZED_MODEL_FILE).stat().st_size / 1e6
+    print(f"Model size: fp32 {fp32_mb:.1f} MB, int8 {int8_mb:.1f} MB")
+
+    report = check_parity(model, output, load_corpus(args.corpus))
+    print(
+        f"Parity on {report['texts']} texts: min cosine {report['min_cosine']:.4f}, "
+        f"mean cosine {report['mean_cosine']:.4f}, "
+        f"top-{report['top_k']} neighbour overlap {report['neighbour_overlap']:.2%}"
+    )
+
+    if report["min_cosine"] < args.min_cosine or report["mean_cosine"] < args.mean_cosine:
+        print("❌ Quantized model is below the parity thresholds")
+        return 1
+    print("✅ Export complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,14 +7,20 @@ import sqlite3
 from pathlib import Path
 
 
-def init_event_store():
-    """Initialize the event store database with schema"""
+def init_event_store(db_path: Path | None = None):
+    """
+    Initialize the event store database with schema
 
-    # Ensure data directory exists
-    data_dir = Path(__file__).parent.parent / "data"
-    data_dir.mkdir(exist_ok=True)
+    Args:
+        db_path: Database file (defaults to data/events.db in the project)
+    """
 
-    db_path = data_dir / "events.db"
+    if db_path is None:
+        # Ensure data directory exists
+        data_dir = Path(__file__).parent.parent / "data"
+        data_dir.mkdir(exist_ok=True)
+
+        db_path = data_dir / "events.db"
 
     print(f"Initializing event store at: {db_path}")
 
@@ -23,6 +29,10 @@ def init_event_store():
     cursor = conn.cursor()
 
     try:
+        # Let archival hand freed pages back (PRAGMA incremental_vacuum); only
+        # takes effect before the first table is created
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # Create events table
         cursor.execute(
             """
@@ -69,6 +79,34 @@ def init_event_store():
         """
         )
 
+        # Create event_segments table (catalog of archived event segment files)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS event_segments (
+                segment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL UNIQUE,
+                first_sequence INTEGER NOT NULL,
+                last_sequence INTEGER NOT NULL,
+                first_created_at DATETIME NOT NULL,
+                last_created_at DATETIME NOT NULL,
+                event_count INTEGER NOT NULL,
+                compression TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # Create archived_events table (segment and sequence of each archived event)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS archived_events (
+                event_id TEXT PRIMARY KEY,
+                segment_id INTEGER NOT NULL,
+                sequence INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """
+        )
+
         # Create outbox table
         cursor.execute(
             """
@@ -81,6 +119,8 @@ def init_event_store():
                 last_attempt DATETIME,
                 error_message TEXT,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                lease_expires_at DATETIME,
+                lease_id TEXT,
                 FOREIGN KEY (event_id) REFERENCES events(event_id)
             )
         """
@@ -101,6 +141,42 @@ def init_event_store():
         """
         )
 
+        # Partial indexes: only rows a worker still has to look at
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_outbox_pending
+            ON outbox(status, created_at) WHERE status = 'pending'
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_outbox_failed
+            ON outbox(status, created_at) WHERE status = 'failed'
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_outbox_leased
+            ON outbox(status, lease_expires_at) WHERE status = 'processing'
+        """
+        )
+
+        # Create outbox_history table (compressed batches of archived completed rows)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox_history (
+                batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                archived_at DATETIME NOT NULL,
+                row_count INTEGER NOT NULL,
+                first_created_at DATETIME,
+                last_created_at DATETIME,
+                rows BLOB NOT NULL
+            )
+        """
+        )
+
         # Create consistency_snapshots table
         cursor.execute(
             """
@@ -128,7 +204,7 @@ def init_event_store():
             CREATE TABLE IF NOT EXISTS embedding_cache (
                 text_hash TEXT NOT NULL,
                 model_name TEXT NOT NULL,
-                embedding TEXT NOT NULL,
+                embedding BLOB NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 PRIMARY KEY (text_hash, model_name)
             )
@@ -151,14 +227,39 @@ def init_event_store():
         """
         )
 
+        # Create aggregate_snapshots table (folded aggregate state per latest snapshot)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS aggregate_snapshots (
+                aggregate_id TEXT PRIMARY KEY,
+                aggregate_type TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # Create covering index for snapshot version lookups
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_snapshot_version
+            ON aggregate_snapshots(aggregate_id, version)
+        """
+        )
+
         # Commit changes
         conn.commit()
 
         print("✅ Event store database initialized successfully!")
         print("   - events table created")
+        print("   - event_segments table created")
+        print("   - archived_events table created")
         print("   - outbox table created")
+        print("   - outbox_history table created")
         print("   - consistency_snapshots table created")
         print("   - embedding_cache table created")
+        print("   - aggregate_snapshots table created")
         print("   - Indexes created")
 
         # Verify schema
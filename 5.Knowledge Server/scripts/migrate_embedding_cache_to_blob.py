@@ -0,0 +1,59 @@
+"""
+Migration script to convert cached embeddings from JSON text to float32 BLOBs
+
+Older versions stored each vector as a JSON array. The cache still reads those
+rows, but BLOBs are ~4x smaller and decode without parsing.
+
+Safe to run repeatedly and against a live database; rows are converted in
+batches, each committed separately.
+"""
+
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.embedding_cache import EmbeddingCache
+
+
+def main():
+    """Main migration entry point"""
+
+    # Determine database path
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    db_path = project_root / "data" / "events.db"
+
+    # Parse command line args
+    check_only = "--check" in sys.argv
+
+    print("=" * 60)
+    print("Migration: Embedding cache JSON -> float32 BLOB")
+    print("=" * 60)
+
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return 1
+
+    cache = EmbeddingCache(db_path=str(db_path), memory_cache_size=0)
+    try:
+        stats = cache.get_cache_stats()
+        print(f"\n📊 {stats.total_entries} cached embeddings, {stats.legacy_entries} legacy rows")
+
+        if check_only:
+            print("\n🔍 CHECK MODE - No changes will be made")
+            return 0
+
+        converted = cache.migrate_legacy_rows()
+        print(f"✅ Converted {converted} rows")
+    finally:
+        cache.close()
+
+    print("\n" + "=" * 60)
+    print("✅ Migration complete!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Rebuild the Neo4j and ChromaDB projections from the event log.
+
+This script:
+1. Streams the events table in sequence order
+2. Folds events per concept/relationship into their final state
+3. Writes that net state to the projections in large batches
+4. Checkpoints after every batch so an interrupted run can resume
+
+The target databases should be empty; clear them first with
+scripts/cleanup_databases.py.
+
+Usage:
+    python scripts/rebuild_projections.py
+
+Options:
+    --resume            Continue an interrupted rebuild from its checkpoint
+    --batch-size N      Events per projection write (default: 1000)
+    --projections P     Comma-separated subset of neo4j,chromadb (default: both)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import Config
+from projections.chromadb_projection import ChromaDBProjection
+from projections.neo4j_projection import Neo4jProjection
+from services.chromadb_service import ChromaDbService
+from services.event_store import EventStore
+from services.neo4j_service import Neo4jService
+from services.replay import ProjectionRebuilder
+
+
+def rebuild(resume: bool, batch_size: int, projection_names: list[str]) -> bool:
+    """Rebuild the selected projections."""
+
+    print("=" * 60)
+    print("PROJECTION REBUILD")
+    print("=" * 60)
+    print(f"Projections: {', '.join(projection_names)}")
+    print(f"Batch size: {batch_size}")
+    print(f"Resume: {resume}")
+    print()
+
+    event_store = EventStore(db_path=Config.EVENT_STORE_PATH)
+    projections = {}
+    neo4j = None
+    chromadb = None
+
+    try:
+        if "neo4j" in projection_names:
+            print("Connecting to Neo4j...")
+            neo4j = Neo4jService(
+                uri=Config.NEO4J_URI, user=Config.NEO4J_USER, password=Config.NEO4J_PASSWORD
+            )
+            if not neo4j.connect():
+                print("❌ Failed to connect to Neo4j")
+                return False
+            projections["neo4j"] = Neo4jProjection(neo4j)
+            print("✅ Neo4j connected\n")
+
+        if "chromadb" in projection_names:
+            print("Connecting to ChromaDB...")
+            chromadb = ChromaDbService(
+                persist_directory=Config.CHROMA_PERSIST_DIRECTORY, collection_name="concepts"
+            )
+            if not chromadb.connect():
+                print("❌ Failed to connect to ChromaDB")
+                return False
+            projections["chromadb"] = ChromaDBProjection(chromadb)
+            print("✅ ChromaDB connected\n")
+
+        rebuilder = ProjectionRebuilder(event_store, projections, batch_size=batch_size)
+        report = rebuilder.rebuild(resume=resume)
+
+    finally:
+        if neo4j is not None:
+            neo4j.close()
+        if chromadb is not None:
+            chromadb.close()
+        event_store.close()
+
+    print("=" * 60)
+    print("REBUILD SUMMARY")
+    print("=" * 60)
+    print(f"Resumed: {report.resumed}")
+    print(f"Events replayed: {report.events_replayed} (up to sequence {report.target_sequence})")
+    print(f"Concepts: {report.concepts} ({report.deleted_concepts} deleted)")
+    print(f"Relationships: {report.relationships}")
+    if report.orphaned_events:
+        print(f"⚠️  Orphaned events skipped: {report.orphaned_events}")
+    for name in projections:
+        print(
+            f"{name}: {report.written.get(name, 0)} written, {report.failed.get(name, 0)} failed"
+        )
+    print(f"Fold: {report.fold_seconds:.2f}s, write: {report.write_seconds:.2f}s")
+    print(f"Throughput: {report.events_per_second:.0f} events/s")
+    print()
+
+    return not any(report.failed.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild Neo4j and ChromaDB projections from the event log"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue an interrupted rebuild from its checkpoint"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Events per projection write")
+    parser.add_argument(
+        "--projections",
+        default="neo4j,chromadb",
+        help="Comma-separated projections to rebuild (neo4j, chromadb)",
+    )
+
+    args = parser.parse_args()
+    projection_names = [name.strip() for name in args.projections.split(",") if name.strip()]
+    unknown = set(projection_names) - {"neo4j", "chromadb"}
+    if unknown:
+        parser.error(f"Unknown projections: {', '.join(sorted(unknown))}")
+
+    success = rebuild(args.resume, args.batch_size, projection_names)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Async Neo4j Service Module
+
+Native asyncio access to Neo4j for MCP tool handlers.
+
+Neo4jService is synchronous: every query a tool handler runs through it blocks
+the FastMCP event loop until Neo4j answers, so concurrent agents are served one
+query at a time. AsyncNeo4jService uses the driver's AsyncGraphDatabase, so a
+handler awaiting Neo4j yields the loop to other tool calls.
+
+Features:
+- Connection pool sized for concurrent tool calls, with a bounded
+  acquisition timeout so a saturated pool fails fast instead of hanging
+- Managed read/write transactions (the driver retries transient errors)
+- Per-query latencies recorded as trace stages (``neo4j.query.<query_name>``)
+  and in-flight counters to spot pool saturation
+- Same serialized result shape as Neo4jService.execute_read/execute_write
+"""
+
+import logging
+import time
+from typing import Any
+
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncDriver, AsyncGraphDatabase, basic_auth
+from neo4j.exceptions import AuthError, ServiceUnavailable
+
+from services.neo4j_service import Neo4jConfig, serialize_neo4j_types
+from services.tracing import get_trace_recorder
+
+
+logger = logging.getLogger(__name__)
+
+
+# Trace stage prefix for per-query latencies (see services/tracing.py)
+QUERY_STAGE_PREFIX = "neo4j.query."
+
+
+class AsyncNeo4jService:
+    """Async service for Neo4j queries issued from MCP tool handlers."""
+
+    def __init__(
+        self,
+        uri: str = "bolt://localhost:7687",
+        user: str = "neo4j",
+        password: str = "password",
+        config: Neo4jConfig | None = None,
+        max_pool_size: int = 50,
+        connection_acquisition_timeout: float = 10.0,
+    ):
+        """
+        Initialize async Neo4j service.
+
+        Args:
+            uri: Neo4j connection URI
+            user: Neo4j username
+            password: Neo4j password
+            config: Optional Neo4jConfig (uri, credentials, lifetimes, retry time)
+            max_pool_size: Connections shared by concurrent tool calls
+            connection_acquisition_timeout: Seconds to wait for a free pooled connection
+        """
+        self.config = config or Neo4jConfig(uri=uri, user=user, password=password)
+        self.max_pool_size = max(1, max_pool_size)
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+
+        self.driver: AsyncDriver | None = None
+        self._connected = False
+
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    async def connect(self) -> bool:
+        """
+        Create the async driver and verify connectivity.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            if self.driver is not None:
+                try:
+                    await self.driver.close()
+                except Exception as e:
+                    logger.warning(f"Error closing existing async driver: {e}")
+
+            self.driver = AsyncGraphDatabase.driver(
+                self.config.uri,
+                auth=basic_auth(self.config.user, self.config.password),
+                max_connection_pool_size=self.max_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                max_connection_lifetime=self.config.max_connection_lifetime,
+                connection_timeout=self.config.connection_timeout,
+                max_transaction_retry_time=self.config.max_transaction_retry_time,
+            )
+
+            await self.driver.verify_connectivity()
+            self._connected = True
+            logger.info(
+                f"Async Neo4j driver connected to {self.config.uri} "
+                f"(pool size {self.max_pool_size})"
+            )
+            return True
+
+        except ServiceUnavailable as e:
+            logger.error(f"Neo4j service unavailable (async driver): {e}")
+        except AuthError as e:
+            logger.error(f"Neo4j authentication failed (async driver): {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error connecting async Neo4j driver: {e}")
+
+        self._connected = False
+        return False
+
+    async def close(self) -> None:
+        """Close the async driver and its connection pool."""
+        if self.driver:
+            await self.driver.close()
+            self._connected = False
+            logger.info("Async Neo4j connection closed")
+
+    def is_connected(self) -> bool:
+        """Check if the async driver is connected."""
+        return self._connected and self.driver is not None
+
+    async def execute_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+        query_name: str = "read",
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read query in a managed read transaction.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name
+            query_name: Label for the latency histogram (e.g. the tool name)
+
+        Returns:
+            List of result records as dictionaries
+        """
+
+        async def _work(tx):
+            result = await tx.run(query, parameters or {})
+            return [serialize_neo4j_types(dict(record)) async for record in result]
+
+        return await self._run(_work, READ_ACCESS, database, query_name)
+
+    async def execute_write(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+        query_name: str = "write",
+    ) -> dict[str, Any]:
+        """
+        Execute a write query in a managed write transaction.
+
+        Returns:
+            Dictionary with write operation statistics
+        """
+
+        async def _work(tx):
+            result = await tx.run(query, parameters or {})
+            summary = await result.consume()
+            counters = summary.counters
+            return {
+                "nodes_created": counters.nodes_created,
+                "nodes_deleted": counters.nodes_deleted,
+                "relationships_created": counters.relationships_created,
+                "relationships_deleted": counters.relationships_deleted,
+                "properties_set": counters.properties_set,
+                "labels_added": counters.labels_added,
+                "labels_removed": counters.labels_removed,
+                "indexes_added": counters.indexes_added,
+                "indexes_removed": counters.indexes_removed,
+                "constraints_added": counters.constraints_added,
+                "constraints_removed": counters.constraints_removed,
+            }
+
+        return await self._run(_work, WRITE_ACCESS, database, query_name)
+
+    async def _run(self, work, access_mode: str, database: str, query_name: str) -> Any:
+        """Run a transaction function and record its latency as a query_name trace stage."""
+        if not self.driver or not self._connected:
+            raise RuntimeError("Not connected to Neo4j. Call connect() first.")
+
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        start = time.perf_counter_ns()
+        error = False
+        try:
+            async with self.driver.session(
+                database=database, default_access_mode=access_mode
+            ) as session:
+                if access_mode == READ_ACCESS:
+                    return await session.execute_read(work)
+                return await session.execute_write(work)
+        except Exception as e:
+            error = True
+            logger.error(f"Async Neo4j query '{query_name}' failed: {e}")
+            raise
+        finally:
+            self._in_flight -= 1
+            get_trace_recorder().observe_stage(
+                QUERY_STAGE_PREFIX + query_name, (time.perf_counter_ns() - start) // 1000, error
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get per-query latency histograms and pool pressure counters.
+
+        peak_in_flight approaching max_pool_size, together with rising p95/p99
+        latencies, means callers are queueing for pooled connections. The
+        histograms are the trace recorder's ``neo4j.query.*`` stages, so they
+        also include reads served by the sync fallback in execute_neo4j_read().
+        """
+        stages = get_trace_recorder().snapshot()["stages"]
+        return {
+            "connected": self.is_connected(),
+            "max_pool_size": self.max_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "queries": {
+                name.removeprefix(QUERY_STAGE_PREFIX): snapshot
+                for name, snapshot in stages.items()
+                if name.startswith(QUERY_STAGE_PREFIX)
+            },
+        }
+
+    async def health_check(self) -> dict[str, Any]:
+        """Run a trivial query through the async pool."""
+        health_status = {
+            "service": "neo4j_async",
+            "connected": self._connected,
+            "uri": self.config.uri,
+            "status": "unhealthy",
+        }
+        if not self.is_connected():
+            health_status["error"] = "Not connected to Neo4j"
+            return health_status
+
+        try:
+            records = await self.execute_read("RETURN 1 AS test", query_name="health_check")
+            if records and records[0].get("test") == 1:
+                health_status["status"] = "healthy"
+        except Exception as e:
+            health_status["error"] = str(e)
+        return health_status
+
+
+def create_async_neo4j_service_from_env() -> AsyncNeo4jService:
+    """
+    Create async Neo4j service from the centralized config system.
+
+    Returns:
+        Configured AsyncNeo4jService instance (not yet connected)
+    """
+    from config import get_settings
+
+    settings = get_settings()
+
+    config = Neo4jConfig(
+        uri=settings.neo4j.uri,
+        user=settings.neo4j.user,
+        password=settings.neo4j.password,
+        min_pool_size=settings.neo4j.min_pool_size,
+        max_pool_size=settings.neo4j.max_pool_size,
+        max_connection_lifetime=settings.neo4j.max_connection_lifetime,
+        connection_timeout=settings.neo4j.connection_timeout,
+        max_transaction_retry_time=settings.neo4j.max_transaction_retry_time,
+    )
+
+    return AsyncNeo4jService(
+        config=config,
+        max_pool_size=settings.neo4j.async_max_pool_size,
+        connection_acquisition_timeout=settings.neo4j.connection_acquisition_timeout,
+    )
@@ -0,0 +1,71 @@
+"""
+Per-concept content digests for incremental consistency checks.
+
+Both projections stamp every concept they write with:
+
+- ``content_digest``: a 40-bit integer hash of the fields the two stores share
+- ``last_event_version``: version of the last Created/Updated event applied
+- ``digest_bucket``: the concept_id prefix used to group concepts into buckets
+
+Digests are integers so that a bucket can be summarised by a plain ``sum()``,
+which Neo4j computes server-side. Two buckets are equal when their concept
+count, digest sum and version sum are equal; only unequal buckets need to be
+compared concept by concept (see ConsistencyChecker.check_incremental).
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+
+# Fields present in both Neo4j and ChromaDB; confidence_score is excluded because
+# it is written by the confidence listener outside the projections.
+DIGEST_FIELDS = ("name", "area", "topic", "subtopic")
+
+# Concept-id prefix length per bucket (256 buckets for UUIDs)
+DIGEST_BUCKET_PREFIX_LENGTH = 2
+
+# 40-bit digests keep per-bucket sums inside Neo4j's 64-bit integers
+# for up to 2^23 concepts per bucket
+DIGEST_BITS = 40
+
+
+def digest_bucket(concept_id: str) -> str:
+    """Get the bucket key of a concept."""
+    return concept_id[:DIGEST_BUCKET_PREFIX_LENGTH]
+
+
+def compute_concept_digest(concept_id: str, fields: Mapping[str, Any]) -> int:
+    """
+    Hash the shared concept fields into a DIGEST_BITS-bit integer.
+
+    Missing and None values hash like empty strings, so a property absent in
+    Neo4j matches a metadata key absent in ChromaDB.
+    """
+    values = [concept_id] + [
+        "" if fields.get(name) is None else str(fields.get(name)) for name in DIGEST_FIELDS
+    ]
+    digest = hashlib.sha256(json.dumps(values).encode("utf-8")).digest()
+    return int.from_bytes(digest[: DIGEST_BITS // 8], "big")
+
+
+def stamp_concept_digest(
+    properties: dict[str, Any], concept_id: str, version: int | None
+) -> dict[str, Any]:
+    """
+    Add digest bookkeeping fields to a concept's properties/metadata in place.
+
+    Args:
+        properties: Full concept properties (must include every DIGEST_FIELDS value it has)
+        concept_id: Concept ID
+        version: Version of the event being applied
+
+    Returns:
+        ``properties``, for chaining
+    """
+    properties["content_digest"] = compute_concept_digest(concept_id, properties)
+    properties["digest_bucket"] = digest_bucket(concept_id)
+    if version is not None:
+        properties["last_event_version"] = version
+    return properties
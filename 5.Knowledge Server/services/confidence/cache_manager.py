@@ -6,17 +6,22 @@ with graceful degradation and selective invalidation.
 
 Includes distributed locking to prevent race conditions during
 cache invalidation and score recalculation.
+
+Multi-key reads and writes (get_scores_many, get_calc_inputs_many,
+set_scores_many, set_calc_inputs_many) cost one Redis round trip regardless
+of the number of concepts. An optional near-cache (CacheConfig.NEAR_CACHE_TTL)
+keeps decoded values in process memory for a few seconds; it is cleared by
+invalidate_concept_cache, which the event listener calls on every change.
 """
 
 import json
 import logging
+import time
 import uuid
+from collections.abc import Callable, Iterable
 from contextlib import asynccontextmanager
-from typing import Any, Optional
-from redis.asyncio import Redis
-from services.confidence.models import RelationshipData, ReviewData
-from services.confidence.config import CacheConfig
 from datetime import datetime
+from typing import Any
 
 from redis.asyncio import Redis
 
@@ -26,6 +31,74 @@ from services.confidence.models import RelationshipData, ReviewData
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+def _encode_relationships(data: RelationshipData) -> str:
+    return json.dumps(
+        {
+            "total_relationships": data.total_relationships,
+            "relationship_types": data.relationship_types,
+            "connected_concept_ids": data.connected_concept_ids,
+        },
+        separators=(",", ":"),
+    )
+
+
+def _decode_relationships(value: str) -> RelationshipData:
+    return RelationshipData(**json.loads(value))
+
+
+def _encode_review(data: ReviewData) -> str:
+    return json.dumps(
+        {
+            "last_reviewed_at": data.last_reviewed_at.isoformat(),
+            "days_since_review": data.days_since_review,
+            "review_count": data.review_count,
+        },
+        separators=(",", ":"),
+    )
+
+
+def _decode_review(value: str) -> ReviewData:
+    data = json.loads(value)
+    # Parse datetime from ISO string
+    data["last_reviewed_at"] = datetime.fromisoformat(data["last_reviewed_at"])
+    return ReviewData(**data)
+
+
+class _NearCache:
+    """Process-local copy of recent Redis reads, keyed by Redis key."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return _MISSING
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest write
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def discard(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class CacheManager:
     """Two-tier Redis cache for confidence calculations"""
@@ -36,7 +109,14 @@ class CacheManager:
     # Lock key prefix
     LOCK_KEY_PREFIX = "confidence:lock:"
 
-    def __init__(self, redis_client: Redis, config: CacheConfig = None, *, lock_timeout: int = None):
+    def __init__(
+        self,
+        redis_client: Redis,
+        config: CacheConfig = None,
+        *,
+        lock_timeout: int = None,
+        near_cache_ttl: float | None = None,
+    ):
         """
         Initialize cache manager.
 
@@ -44,11 +124,68 @@ class CacheManager:
             redis_client: Redis async client instance
             config: Cache configuration (uses defaults if None)
             lock_timeout: Timeout for distributed locks in seconds (default: 10)
+            near_cache_ttl: Seconds to keep reads in process memory
+                (default: config.NEAR_CACHE_TTL; 0 disables the near-cache)
         """
         self.redis = redis_client
         self.config = config or CacheConfig()
         self.lock_timeout = lock_timeout or self.DEFAULT_LOCK_TIMEOUT
 
+        if near_cache_ttl is None:
+            near_cache_ttl = self.config.NEAR_CACHE_TTL
+        self._near = (
+            _NearCache(near_cache_ttl, self.config.MAX_CACHE_KEYS) if near_cache_ttl > 0 else None
+        )
+
+    # Near-cache helpers
+    def _near_get(self, key: str) -> Any:
+        return self._near.get(key) if self._near is not None else _MISSING
+
+    def _near_put(self, key: str, value: Any) -> None:
+        if self._near is not None:
+            self._near.put(key, value)
+
+    def _near_discard(self, keys: Iterable[str]) -> None:
+        if self._near is not None:
+            self._near.discard(keys)
+
+    async def _get_many(
+        self, entries: list[tuple[str, Callable[[str], Any]]]
+    ) -> dict[str, Any]:
+        """
+        Read many keys with the near-cache in front of a single MGET.
+
+        Args:
+            entries: (Redis key, decoder) pairs
+
+        Returns:
+            Mapping of Redis key to decoded value for every hit
+        """
+        found: dict[str, Any] = {}
+        missing: list[tuple[str, Callable[[str], Any]]] = []
+        for key, decode in entries:
+            value = self._near_get(key)
+            if value is _MISSING:
+                missing.append((key, decode))
+            else:
+                found[key] = value
+
+        if not missing:
+            return found
+
+        values = await self.redis.mget([key for key, _ in missing])
+        for (key, decode), raw in zip(missing, values, strict=True):
+            if raw is None:
+                continue
+            try:
+                value = decode(raw)
+            except Exception as e:
+                logger.warning(f"Ignoring undecodable cache entry {key}: {e}")
+                continue
+            found[key] = value
+            self._near_put(key, value)
+        return found
+
     # Score cache methods
     async def get_cached_score(self, concept_id: str) -> float | None:
         """
@@ -62,6 +199,10 @@ class CacheManager:
         """
         try:
             key = f"{self.config.SCORE_KEY_PREFIX}{concept_id}"
+            score = self._near_get(key)
+            if score is not _MISSING:
+                return score
+
             value = await self.redis.get(key)
 
             if value is None:
@@ -69,7 +210,9 @@ class CacheManager:
                 return None
 
             logger.debug(f"Score cache hit: {concept_id}")
-            return float(value)
+            score = float(value)
+            self._near_put(key, score)
+            return score
 
         except Exception as e:
             logger.error(f"Cache get error: {e}")
@@ -88,13 +231,71 @@ class CacheManager:
             key = f"{self.config.SCORE_KEY_PREFIX}{concept_id}"
             ttl = ttl or self.config.SCORE_CACHE_TTL
 
+            self._near_discard([key])
             await self.redis.set(key, score, ex=ttl)
+            self._near_put(key, float(score))
             logger.debug(f"Cached score: {concept_id} = {score} (TTL: {ttl}s)")
 
         except Exception as e:
             logger.error(f"Cache set error: {e}")
             # Don't raise - caching is optional
 
+    async def get_scores_many(self, concept_ids: Iterable[str]) -> dict[str, float]:
+        """
+        Retrieve many cached confidence scores in one Redis round trip.
+
+        Args:
+            concept_ids: Concept identifiers
+
+        Returns:
+            Mapping of concept identifier to score for cache hits only
+        """
+        prefix = self.config.SCORE_KEY_PREFIX
+        concept_ids = list(dict.fromkeys(concept_ids))
+        if not concept_ids:
+            return {}
+
+        try:
+            found = await self._get_many([(f"{prefix}{cid}", float) for cid in concept_ids])
+        except Exception as e:
+            logger.error(f"Cache get scores error: {e}")
+            return {}  # Graceful degradation
+
+        scores = {
+            cid: found[f"{prefix}{cid}"] for cid in concept_ids if f"{prefix}{cid}" in found
+        }
+        logger.debug(f"Score cache multi-get: {len(scores)}/{len(concept_ids)} hits")
+        return scores
+
+    async def set_scores_many(self, scores: dict[str, float], ttl: int | None = None):
+        """
+        Store many confidence scores in one Redis round trip.
+
+        Args:
+            scores: Mapping of concept identifier to score
+            ttl: Time-to-live in seconds (uses config default if None)
+        """
+        if not scores:
+            return
+
+        try:
+            ttl = ttl or self.config.SCORE_CACHE_TTL
+            keys = {cid: f"{self.config.SCORE_KEY_PREFIX}{cid}" for cid in scores}
+            self._near_discard(keys.values())
+
+            pipe = self.redis.pipeline(transaction=False)
+            for concept_id, score in scores.items():
+                pipe.set(keys[concept_id], score, ex=ttl)
+            await pipe.execute()
+
+            for concept_id, score in scores.items():
+                self._near_put(keys[concept_id], float(score))
+            logger.debug(f"Cached {len(scores)} scores (TTL: {ttl}s)")
+
+        except Exception as e:
+            logger.error(f"Cache set scores error: {e}")
+            # Don't raise - caching is optional
+
     # Calculation cache methods
     async def get_cached_relationships(self, concept_id: str) -> RelationshipData | None:
         """
@@ -108,15 +309,20 @@ class CacheManager:
         """
         try:
             key = f"{self.config.CALC_RELATIONSHIP_PREFIX}{concept_id}"
+            data = self._near_get(key)
+            if data is not _MISSING:
+                return data
+
             value = await self.redis.get(key)
 
             if value is None:
                 logger.debug(f"Relationship cache miss: {concept_id}")
                 return None
 
-            data = json.loads(value)
+            data = _decode_relationships(value)
             logger.debug(f"Relationship cache hit: {concept_id}")
-            return RelationshipData(**data)
+            self._near_put(key, data)
+            return data
 
         except Exception as e:
             logger.error(f"Cache get relationships error: {e}")
@@ -137,16 +343,9 @@ class CacheManager:
             key = f"{self.config.CALC_RELATIONSHIP_PREFIX}{concept_id}"
             ttl = ttl or self.config.CALC_CACHE_TTL
 
-            # Serialize to JSON
-            value = json.dumps(
-                {
-                    "total_relationships": data.total_relationships,
-                    "relationship_types": data.relationship_types,
-                    "connected_concept_ids": data.connected_concept_ids,
-                }
-            )
-
-            await self.redis.set(key, value, ex=ttl)
+            self._near_discard([key])
+            await self.redis.set(key, _encode_relationships(data), ex=ttl)
+            self._near_put(key, data)
             logger.debug(f"Cached relationships: {concept_id} (TTL: {ttl}s)")
 
         except Exception as e:
@@ -164,17 +363,20 @@ class CacheManager:
         """
         try:
             key = f"{self.config.CALC_REVIEW_PREFIX}{concept_id}"
+            data = self._near_get(key)
+            if data is not _MISSING:
+                return data
+
             value = await self.redis.get(key)
 
             if value is None:
                 logger.debug(f"Review cache miss: {concept_id}")
                 return None
 
-            data = json.loads(value)
-            # Parse datetime from ISO string
-            data["last_reviewed_at"] = datetime.fromisoformat(data["last_reviewed_at"])
+            data = _decode_review(value)
             logger.debug(f"Review cache hit: {concept_id}")
-            return ReviewData(**data)
+            self._near_put(key, data)
+            return data
 
         except Exception as e:
             logger.error(f"Cache get review error: {e}")
@@ -195,20 +397,94 @@ class CacheManager:
             key = f"{self.config.CALC_REVIEW_PREFIX}{concept_id}"
             ttl = ttl or self.config.CALC_CACHE_TTL
 
-            value = json.dumps(
-                {
-                    "last_reviewed_at": data.last_reviewed_at.isoformat(),
-                    "days_since_review": data.days_since_review,
-                    "review_count": data.review_count,
-                }
-            )
-
-            await self.redis.set(key, value, ex=ttl)
+            self._near_discard([key])
+            await self.redis.set(key, _encode_review(data), ex=ttl)
+            self._near_put(key, data)
             logger.debug(f"Cached review history: {concept_id} (TTL: {ttl}s)")
 
         except Exception as e:
             logger.error(f"Cache set review error: {e}")
 
+    async def get_calc_inputs_many(
+        self, concept_ids: Iterable[str]
+    ) -> tuple[dict[str, RelationshipData], dict[str, ReviewData]]:
+        """
+        Retrieve cached relationship and review data for many concepts.
+
+        Both prefixes are read with a single MGET.
+
+        Args:
+            concept_ids: Concept identifiers
+
+        Returns:
+            (relationships, reviews) mappings of concept identifier to data,
+            containing cache hits only
+        """
+        rel_prefix = self.config.CALC_RELATIONSHIP_PREFIX
+        review_prefix = self.config.CALC_REVIEW_PREFIX
+        concept_ids = list(dict.fromkeys(concept_ids))
+        if not concept_ids:
+            return {}, {}
+
+        entries = [(f"{rel_prefix}{cid}", _decode_relationships) for cid in concept_ids]
+        entries += [(f"{review_prefix}{cid}", _decode_review) for cid in concept_ids]
+        try:
+            found = await self._get_many(entries)
+        except Exception as e:
+            logger.error(f"Cache get calc inputs error: {e}")
+            return {}, {}
+
+        relationships = {
+            cid: found[f"{rel_prefix}{cid}"] for cid in concept_ids if f"{rel_prefix}{cid}" in found
+        }
+        reviews = {
+            cid: found[f"{review_prefix}{cid}"]
+            for cid in concept_ids
+            if f"{review_prefix}{cid}" in found
+        }
+        return relationships, reviews
+
+    async def set_calc_inputs_many(
+        self,
+        relationships: dict[str, RelationshipData] | None = None,
+        reviews: dict[str, ReviewData] | None = None,
+        ttl: int | None = None,
+    ):
+        """
+        Store relationship and review data for many concepts in one round trip.
+
+        Args:
+            relationships: Mapping of concept identifier to relationship data
+            reviews: Mapping of concept identifier to review data
+            ttl: Time-to-live in seconds (uses config default if None)
+        """
+        writes = [
+            (f"{self.config.CALC_RELATIONSHIP_PREFIX}{cid}", data, _encode_relationships(data))
+            for cid, data in (relationships or {}).items()
+        ]
+        writes += [
+            (f"{self.config.CALC_REVIEW_PREFIX}{cid}", data, _encode_review(data))
+            for cid, data in (reviews or {}).items()
+        ]
+        if not writes:
+            return
+
+        try:
+            ttl = ttl or self.config.CALC_CACHE_TTL
+            self._near_discard(key for key, _, _ in writes)
+
+            pipe = self.redis.pipeline(transaction=False)
+            for key, _, value in writes:
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
+            for key, data, _ in writes:
+                self._near_put(key, data)
+            logger.debug(f"Cached {len(writes)} calculation entries (TTL: {ttl}s)")
+
+        except Exception as e:
+            logger.error(f"Cache set calc inputs error: {e}")
+
     # Invalidation methods
     async def invalidate_concept_cache(
         self, concept_id: str, invalidate_score: bool = True, invalidate_calc: bool = True
@@ -231,6 +507,9 @@ class CacheManager:
                 keys_to_delete.append(f"{self.config.CALC_RELATIONSHIP_PREFIX}{concept_id}")
                 keys_to_delete.append(f"{self.config.CALC_REVIEW_PREFIX}{concept_id}")
 
+            # Drop local copies first so a Redis failure cannot leave them behind
+            self._near_discard(keys_to_delete)
+
             if keys_to_delete:
                 deleted_count = await self.redis.delete(*keys_to_delete)
                 logger.info(f"Invalidated {deleted_count} cache keys for {concept_id}")
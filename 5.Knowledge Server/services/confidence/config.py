@@ -40,6 +40,7 @@ class CacheConfig:
     # TTL values (seconds)
     SCORE_CACHE_TTL: int = 3600  # 1 hour
     CALC_CACHE_TTL: int = 86400  # 24 hours
+    NEAR_CACHE_TTL: float = 0.0  # in-process near-cache, 0 = disabled
 
     # Key prefixes
     SCORE_KEY_PREFIX: str = "confidence:score:"
@@ -77,6 +78,7 @@ class CacheConfig:
             # Confidence cache settings from centralized config
             self.SCORE_CACHE_TTL = settings.confidence.score_cache_ttl
             self.CALC_CACHE_TTL = settings.confidence.calc_cache_ttl
+            self.NEAR_CACHE_TTL = settings.confidence.near_cache_ttl
             self.SCORE_KEY_PREFIX = settings.confidence.score_key_prefix
             self.CALC_RELATIONSHIP_PREFIX = settings.confidence.calc_relationship_prefix
             self.CALC_REVIEW_PREFIX = settings.confidence.calc_review_prefix
@@ -143,10 +145,16 @@ class ConfidenceConfig:
     # Relationship density parameters
     MAX_RELATIONSHIPS: int = field(default=20)
 
+    # Explanation quality score version and TF-IDF corpus
+    EXPLANATION_SCORE_VERSION: int = field(default=1)
+    TFIDF_VECTORIZER_PATH: str = field(default="services/confidence/cache/tfidf_vectorizer.pkl")
+    TFIDF_REFIT_INTERVAL_SECONDS: float = field(default=300.0)
+
     # Pending recalculation retry settings
     MAX_RECALC_RETRIES: int = field(default=5)
     RECALC_RETRY_DELAY_SECONDS: int = field(default=2)
     RECALC_BATCH_SIZE: int = field(default=10)
+    RECALC_QUEUE_PATH: str = field(default="data/confidence/recalc_queue.db")
 
     def __post_init__(self):
         """Load values from centralized config."""
@@ -163,11 +171,15 @@ class ConfidenceConfig:
             self.UNDERSTANDING_WEIGHT = conf.understanding_weight
             self.RETENTION_WEIGHT = conf.retention_weight
             self.MAX_RELATIONSHIPS = conf.max_relationships
+            self.EXPLANATION_SCORE_VERSION = conf.explanation_score_version
+            self.TFIDF_VECTORIZER_PATH = conf.tfidf_vectorizer_path
+            self.TFIDF_REFIT_INTERVAL_SECONDS = conf.tfidf_refit_interval_seconds
 
             # Pending recalculation retry settings
             self.MAX_RECALC_RETRIES = conf.max_recalc_retries
             self.RECALC_RETRY_DELAY_SECONDS = conf.recalc_retry_delay_seconds
             self.RECALC_BATCH_SIZE = conf.recalc_batch_size
+            self.RECALC_QUEUE_PATH = conf.recalc_queue_path
 
         except Exception as e:
             logger.warning(f"Could not load centralized config, using defaults: {e}")
@@ -12,6 +12,7 @@ from datetime import datetime
 from services.confidence.config import ConfidenceConfig
 from services.confidence.models import (
     ConceptData,
+    ConfidenceInputs,
     Error,
     ErrorCode,
     RelationshipData,
@@ -45,6 +46,8 @@ class DataAccessLayer:
         - get_concept_relationships(): Count and type relationships
         - get_review_history(): Fetch review data for retention calculation
         - get_concept_tau(): Get retention decay constant
+        - get_confidence_inputs_batch(): All of the above for many concepts
+        - get_all_explanations(): Explanation corpus for the TF-IDF vectorizer
     """
 
     def __init__(self, neo4j_session):
@@ -250,3 +253,162 @@ class DataAccessLayer:
                 details={"exception": type(e).__name__},
             )
 
+    async def get_all_explanations(self) -> Success | Error:
+        """
+        Fetch the explanations of all live concepts (TF-IDF corpus).
+
+        Returns:
+            Success(dict[str, str]) of non-empty explanations by concept_id
+            Error(DATABASE_ERROR) if Neo4j query fails
+        """
+        try:
+            query = """
+            MATCH (c:Concept)
+            WHERE (c.deleted IS NULL OR c.deleted = false) AND c.explanation IS NOT NULL
+            RETURN c.concept_id AS concept_id, c.explanation AS explanation
+            """
+
+            result = await self.session.run(query)
+            records = await result.data()
+            return Success(
+                {
+                    record["concept_id"]: record["explanation"]
+                    for record in records
+                    if record["explanation"]
+                }
+            )
+
+        except Exception as e:
+            return Error(
+                f"Database error: {e!s}",
+                ErrorCode.DATABASE_ERROR,
+                details={"exception": type(e).__name__},
+            )
+
+    async def get_confidence_inputs_batch(self, concept_ids: list[str]) -> Success | Error:
+        """
+        Fetch concept fields, relationships, review history and tau for many concepts.
+
+        Runs two UNWIND queries regardless of batch size: one for the node
+        properties (concept fields, review history and tau all live on the
+        Concept node) and one for relationships in both directions.
+
+        Args:
+            concept_ids: Concept identifiers to fetch
+
+        Returns:
+            Success(dict) mapping each concept_id to ConfidenceInputs, or to an
+            Error(NOT_FOUND / VALIDATION_ERROR) for that concept alone
+            Error(DATABASE_ERROR) if a Neo4j query fails
+        """
+        config = ConfidenceConfig()
+        concept_ids = list(dict.fromkeys(concept_ids))
+        if not concept_ids:
+            return Success({})
+
+        try:
+            node_query = """
+            UNWIND $concept_ids AS concept_id
+            MATCH (c:Concept {concept_id: concept_id})
+            RETURN c.concept_id AS id,
+                   c.name AS name,
+                   c.explanation AS explanation,
+                   c.created_at AS created_at,
+                   c.last_reviewed_at AS last_reviewed_at,
+                   c.tags AS tags,
+                   c.examples AS examples,
+                   c.area AS area,
+                   c.topic AS topic,
+                   c.subtopic AS subtopic,
+                   COALESCE(c.review_count, 0) AS review_count,
+                   COALESCE(c.retention_tau, $default_tau) AS tau
+            """
+            result = await self.session.run(
+                node_query,
+                concept_ids=concept_ids,
+                default_tau=config.DEFAULT_TAU_DAYS,
+            )
+            node_records = await result.data()
+
+            # Undirected match covers both directions; DISTINCT mirrors the
+            # UNION in get_concept_relationships()
+            relationship_query = """
+            UNWIND $concept_ids AS concept_id
+            MATCH (c:Concept {concept_id: concept_id})
+            OPTIONAL MATCH (c)-[r]-(other:Concept)
+            WITH concept_id, collect(DISTINCT {target_id: other.concept_id, type: type(r)}) AS links
+            RETURN concept_id, links
+            """
+            result = await self.session.run(relationship_query, concept_ids=concept_ids)
+            relationship_records = await result.data()
+
+        except Exception as e:
+            return Error(
+                f"Database error: {e!s}",
+                ErrorCode.DATABASE_ERROR,
+                details={"exception": type(e).__name__},
+            )
+
+        links_by_id = {
+            record["concept_id"]: [
+                link for link in (record["links"] or []) if link.get("target_id") is not None
+            ]
+            for record in relationship_records
+        }
+
+        now = datetime.now()
+        inputs: dict[str, ConfidenceInputs | Error] = {
+            concept_id: Error(f"Concept not found: {concept_id}", ErrorCode.NOT_FOUND)
+            for concept_id in concept_ids
+        }
+        for record in node_records:
+            concept_id = record["id"]
+            try:
+                created_at = datetime.fromisoformat(record["created_at"])
+                last_reviewed_at = (
+                    datetime.fromisoformat(record["last_reviewed_at"])
+                    if record["last_reviewed_at"]
+                    else None
+                )
+                concept = ConceptData(
+                    id=concept_id,
+                    name=record["name"],
+                    explanation=record["explanation"],
+                    created_at=created_at,
+                    last_reviewed_at=last_reviewed_at,
+                    tags=record["tags"] or [],
+                    examples=record["examples"] or [],
+                    area=record.get("area"),
+                    topic=record.get("topic"),
+                    subtopic=record.get("subtopic"),
+                )
+
+                links = links_by_id.get(concept_id, [])
+                relationships = RelationshipData(
+                    total_relationships=len(links),
+                    relationship_types=dict(Counter(link["type"] for link in links)),
+                    connected_concept_ids=[link["target_id"] for link in links],
+                )
+
+                reviewed = last_reviewed_at or created_at
+                review = ReviewData(
+                    last_reviewed_at=reviewed,
+                    days_since_review=max(0, (now - reviewed).days),
+                    review_count=record["review_count"],
+                )
+
+                tau = record["tau"] if record["tau"] is not None else config.DEFAULT_TAU_DAYS
+                inputs[concept_id] = ConfidenceInputs(
+                    concept=concept,
+                    relationships=relationships,
+                    review=review,
+                    tau=max(1, int(tau)),
+                )
+            except Exception as e:
+                inputs[concept_id] = Error(
+                    f"Invalid concept data for {concept_id}: {e!s}",
+                    ErrorCode.VALIDATION_ERROR,
+                    details={"exception": type(e).__name__},
+                )
+
+        return Success(inputs)
@@ -44,15 +44,24 @@ class PendingRecalc:
 
 @dataclass
 class ListenerCheckpoint:
-    """Persisted checkpoint for the event listener."""
+    """Persisted checkpoint for the event listener.
+
+    ``last_sequence`` is the event-store sequence (rowid) of the last consumed
+    event and is the resume cursor. ``last_offset`` counts consumed events and
+    is kept for compatibility with checkpoints written before sequences
+    existed; those load with ``last_sequence=None`` and are migrated by the
+    listener on startup.
+    """
 
     last_offset: int = 0
     last_event_id: str | None = None
+    last_sequence: int | None = 0
 
     def to_dict(self) -> dict[str, int | str | None]:
         return {
             "last_offset": self.last_offset,
             "last_event_id": self.last_event_id,
+            "last_sequence": self.last_sequence,
         }
 
     @classmethod
@@ -72,7 +81,12 @@ class ListenerCheckpoint:
 
         last_offset = int(raw.get("last_offset", 0))
         last_event_id = raw.get("last_event_id")
-        return cls(last_offset=last_offset, last_event_id=last_event_id)
+        last_sequence = raw.get("last_sequence")
+        return cls(
+            last_offset=last_offset,
+            last_event_id=last_event_id,
+            last_sequence=int(last_sequence) if last_sequence is not None else None,
+        )
 
     def save(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -138,6 +152,8 @@ class ConfidenceEventListener:
         self.recalc_db_path = Path(recalc_db_path or self.DEFAULT_RECALC_DB)
 
         self._checkpoint = ListenerCheckpoint.from_file(self.checkpoint_path)
+        if self._checkpoint.last_sequence is None:
+            self._checkpoint.last_sequence = self._migrate_legacy_checkpoint()
 
         # Configuration for retry behavior
         self._config = ConfidenceConfig()
@@ -147,6 +163,36 @@ class ConfidenceEventListener:
         self._recalc_lock = threading.Lock()
         self._init_recalc_db()
 
+    def _migrate_legacy_checkpoint(self) -> int:
+        """
+        Translate an offset-based checkpoint into an event-store sequence.
+
+        Uses the sequence of the last processed event when it is known. Older
+        checkpoints without an event id fall back to the offset itself, which
+        equals the sequence for an append-only log that has never been pruned.
+        """
+        if self._checkpoint.last_event_id:
+            try:
+                sequence = self.event_store.get_event_sequence(self._checkpoint.last_event_id)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to resolve checkpoint event sequence: %s", exc)
+                sequence = None
+            if sequence is not None:
+                logger.info(
+                    "Migrated confidence listener checkpoint from offset %d to sequence %d",
+                    self._checkpoint.last_offset,
+                    sequence,
+                )
+                return sequence
+
+        if self._checkpoint.last_offset:
+            logger.warning(
+                "Confidence listener checkpoint has no resolvable event id; "
+                "resuming from sequence %d",
+                self._checkpoint.last_offset,
+            )
+        return self._checkpoint.last_offset
+
     def _init_recalc_db(self) -> None:
         """Initialize the SQLite database for pending recalculations."""
         self.recalc_db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -523,16 +569,17 @@ class ConfidenceEventListener:
         stats["pending_retries"] = retry_stats.get("retried", 0)
 
         # PHASE 2: Process new events from event store
+        # Keyset cursor: cost is O(limit) regardless of how long the log is
         try:
-            events = self.event_store.get_all_events(
-                limit=limit, offset=self._checkpoint.last_offset
+            events = list(
+                self.event_store.iter_events_after(self._checkpoint.last_sequence, limit=limit)
             )
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Failed to load events from store: %s", exc, exc_info=True)
             stats["failed"] += 1
             return stats
 
-        for event in events:
+        for sequence, event in events:
             advance_offset = False
             try:
                 if event.event_type not in self._HANDLED_EVENT_TYPES:
@@ -549,7 +596,7 @@ class ConfidenceEventListener:
                 # Handle relationship events by recalculating both connected concepts
                 # CRITICAL: Only advance checkpoint if ALL concepts were processed
                 if event.event_type in ("RelationshipCreated", "RelationshipDeleted"):
-                    success = await self._handle_relationship_change(event)
+                    success = await self._handle_relationship_change(event, sequence)
                     if success:
                         stats["processed"] += 1
                         advance_offset = True
@@ -591,7 +638,7 @@ class ConfidenceEventListener:
                 break
             finally:
                 if advance_offset:
-                    self._advance_checkpoint(event)
+                    self._advance_checkpoint(event, sequence)
 
         self._checkpoint.save(self.checkpoint_path)
         return stats
@@ -671,7 +718,9 @@ class ConfidenceEventListener:
             )
             raise
 
-    async def _handle_relationship_change(self, event: Event) -> bool:
+    async def _handle_relationship_change(
+        self, event: Event, sequence: Optional[int] = None
+    ) -> bool:
         """
         Handle relationship creation/deletion by recalculating scores for both connected concepts.
 
@@ -690,6 +739,7 @@ class ConfidenceEventListener:
 
         Args:
             event: RelationshipCreated or RelationshipDeleted event
+            sequence: Event-store sequence of the event (used as the retry key)
 
         Returns:
             True if ALL concepts were successfully processed
@@ -716,7 +766,7 @@ class ConfidenceEventListener:
 
         concept_ids = [from_concept_id, to_concept_id]
         all_succeeded = True
-        event_offset = self._checkpoint.last_offset + 1
+        event_offset = sequence if sequence is not None else self._checkpoint.last_offset + 1
 
         # Process each concept with distributed locking to prevent race conditions
         # The lock ensures invalidate -> calculate -> persist is atomic per concept
@@ -801,7 +851,8 @@ class ConfidenceEventListener:
 
         return all_succeeded
 
-    def _advance_checkpoint(self, event: Event) -> None:
+    def _advance_checkpoint(self, event: Event, sequence: int) -> None:
         """Advance the checkpoint to the supplied event."""
         self._checkpoint.last_offset += 1
         self._checkpoint.last_event_id = event.event_id
+        self._checkpoint.last_sequence = sequence
@@ -56,6 +56,15 @@ class ReviewData(BaseModel):
     review_count: int = Field(default=0, ge=0)
 
 
+class ConfidenceInputs(BaseModel):
+    """Everything needed to score one concept, fetched in a batch"""
+
+    concept: ConceptData
+    relationships: RelationshipData
+    review: ReviewData
+    tau: int = Field(..., ge=1)
+
+
 class CompletenessReport(BaseModel):
     """Data completeness metrics"""
 
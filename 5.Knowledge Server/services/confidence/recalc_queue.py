@@ -0,0 +1,272 @@
+"""Durable, coalescing queue of pending confidence recalculations.
+
+One SQLite row per concept. Repeated enqueues of the same concept collapse
+into that row (keeping the most urgent priority), so an event storm such as a
+bulk relationship import yields a single recalculation per concept:
+
+    enqueue(c)        INSERT ... ON CONFLICT(concept_id) DO UPDATE
+    claim(now)        due rows (not_before <= now) are marked claimed_at
+    complete(ids)     claimed rows are deleted, unless re-enqueued meanwhile
+    defer(c, delay)   lock held elsewhere -> unclaim with a later not_before
+
+Claimed rows survive a crash and are released again when the queue is
+reopened, so no queued work is lost across restarts.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedRecalc:
+    """A claimed queue row."""
+
+    concept_id: str
+    priority: int
+    enqueued_at: float
+    attempts: int
+
+
+class RecalculationQueue:
+    """
+    SQLite-backed recalculation queue with per-concept coalescing.
+
+    Args:
+        db_path: SQLite file; ":memory:" keeps the queue in process memory
+        debounce_seconds: Delay from the first enqueue of a concept until it is
+            due; further enqueues inside the window are coalesced into it
+    """
+
+    # Rolling window for the processing-rate metric (seconds)
+    RATE_WINDOW_SECONDS = 60.0
+
+    def __init__(self, db_path: Path | str = ":memory:", *, debounce_seconds: float = 0.0):
+        self.db_path = str(db_path)
+        self.debounce_seconds = debounce_seconds
+
+        self._lock = threading.Lock()
+        self._completions: deque[float] = deque()
+        self.enqueued = 0
+        self.coalesced = 0
+        self.completed = 0
+        self.deferred = 0
+        self.dropped = 0
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS recalc_queue (
+                    concept_id TEXT PRIMARY KEY,
+                    priority INTEGER NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    not_before REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    claimed_at REAL,
+                    dirty INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_recalc_queue_due
+                ON recalc_queue(not_before) WHERE claimed_at IS NULL
+            """)
+            # Claims left behind by a crashed process are work not yet done
+            released = self._conn.execute(
+                "UPDATE recalc_queue SET claimed_at = NULL, dirty = 0 "
+                "WHERE claimed_at IS NOT NULL"
+            ).rowcount
+        if released:
+            logger.warning("Released %d unfinished recalculation claims", released)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, concept_id: str, priority: int, now: float | None = None) -> bool:
+        """
+        Add a concept, coalescing with an existing row.
+
+        An unclaimed row keeps its due time (so a steady stream of enqueues
+        cannot postpone it forever, and lock backoff is preserved) and takes
+        the more urgent priority. A row currently being processed is marked
+        dirty so that it is recalculated again after the running calculation
+        completes.
+
+        Returns:
+            True if a new row was created, False if coalesced into an existing one
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            existing = self._conn.execute(
+                "SELECT claimed_at FROM recalc_queue WHERE concept_id = ?", (concept_id,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT INTO recalc_queue (concept_id, priority, enqueued_at, not_before)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(concept_id) DO UPDATE SET
+                    priority = MIN(priority, excluded.priority),
+                    dirty = CASE WHEN claimed_at IS NULL THEN dirty ELSE 1 END,
+                    enqueued_at = CASE
+                        WHEN claimed_at IS NULL THEN enqueued_at ELSE excluded.enqueued_at
+                    END,
+                    not_before = CASE
+                        WHEN claimed_at IS NULL THEN not_before ELSE excluded.not_before
+                    END
+                """,
+                (concept_id, priority, now, now + self.debounce_seconds),
+            )
+        if existing is None:
+            self.enqueued += 1
+            return True
+        self.coalesced += 1
+        return False
+
+    def claim(self, limit: int, now: float | None = None) -> list[QueuedRecalc]:
+        """
+        Claim up to ``limit`` due rows, most urgent first.
+
+        Returns:
+            Claimed rows ordered by (priority, enqueued_at)
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                """
+                SELECT concept_id, priority, enqueued_at, attempts FROM recalc_queue
+                WHERE claimed_at IS NULL AND not_before <= ?
+                ORDER BY priority, enqueued_at
+                LIMIT ?
+                """,
+                (now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE recalc_queue SET claimed_at = ? WHERE concept_id = ?",
+                [(now, row["concept_id"]) for row in rows],
+            )
+        return [QueuedRecalc(**dict(row)) for row in rows]
+
+    def complete(self, concept_ids: Iterable[str], now: float | None = None) -> None:
+        """Remove claimed rows; rows re-enqueued while claimed go back to the queue."""
+        params = [(concept_id,) for concept_id in concept_ids]
+        if not params:
+            return
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            removed = self._conn.executemany(
+                "DELETE FROM recalc_queue "
+                "WHERE concept_id = ? AND claimed_at IS NOT NULL AND dirty = 0",
+                params,
+            ).rowcount
+            self._conn.executemany(
+                "UPDATE recalc_queue SET claimed_at = NULL, dirty = 0, attempts = 0 "
+                "WHERE concept_id = ? AND claimed_at IS NOT NULL",
+                params,
+            )
+            self.completed += removed
+            self._completions.extend([now] * removed)
+
+    def defer(
+        self,
+        concept_id: str,
+        priority: int,
+        backoff_seconds: float,
+        max_attempts: int,
+        now: float | None = None,
+    ) -> bool:
+        """
+        Retry a concept later because its lock is held elsewhere.
+
+        The delay grows as ``backoff_seconds * 2 ** (attempts - 1)``.
+
+        Returns:
+            False if the concept exhausted ``max_attempts`` and was dropped
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT attempts FROM recalc_queue WHERE concept_id = ?", (concept_id,)
+            ).fetchone()
+            attempts = (row["attempts"] if row else 0) + 1
+            if attempts > max_attempts:
+                self._conn.execute("DELETE FROM recalc_queue WHERE concept_id = ?", (concept_id,))
+                self.dropped += 1
+                return False
+
+            not_before = now + backoff_seconds * 2 ** (attempts - 1)
+            self._conn.execute(
+                """
+                INSERT INTO recalc_queue
+                    (concept_id, priority, enqueued_at, not_before, attempts)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(concept_id) DO UPDATE SET
+                    attempts = excluded.attempts,
+                    not_before = MAX(not_before, excluded.not_before),
+                    claimed_at = NULL,
+                    dirty = 0
+                """,
+                (concept_id, priority, now, not_before, attempts),
+            )
+            self.deferred += 1
+            return True
+
+    def depth(self) -> int:
+        """Number of queued concepts, including claimed ones."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM recalc_queue").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every row."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM recalc_queue")
+
+    def get_metrics(self, now: float | None = None) -> dict[str, float | int]:
+        """Queue depth, backlog age and throughput counters."""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT COUNT(*) AS depth,
+                       COALESCE(SUM(claimed_at IS NOT NULL), 0) AS in_flight,
+                       COALESCE(SUM(claimed_at IS NULL AND not_before <= ?), 0) AS due,
+                       MIN(enqueued_at) AS oldest
+                FROM recalc_queue
+                """,
+                (now,),
+            ).fetchone()
+            cutoff = now - self.RATE_WINDOW_SECONDS
+            while self._completions and self._completions[0] < cutoff:
+                self._completions.popleft()
+            recent = len(self._completions)
+
+        return {
+            "depth": row["depth"],
+            "due": row["due"],
+            "in_flight": row["in_flight"],
+            "oldest_age_seconds": max(0.0, now - row["oldest"]) if row["oldest"] else 0.0,
+            "processing_rate_per_second": recent / self.RATE_WINDOW_SECONDS,
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "completed": self.completed,
+            "deferred": self.deferred,
+            "dropped": self.dropped,
+        }
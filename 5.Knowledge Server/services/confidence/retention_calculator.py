@@ -5,10 +5,12 @@ from __future__ import annotations
 import logging
 import math
 
+import numpy as np
+
 from services.confidence.cache_manager import CacheManager
 from services.confidence.config import ConfidenceConfig
 from services.confidence.data_access import DataAccessLayer
-from services.confidence.models import Error, ErrorCode, ReviewData, Success
+from services.confidence.models import ConfidenceInputs, Error, ErrorCode, ReviewData, Success
 from services.confidence.tau_event_emitter import (
     NoOpTauEventEmitter,
     TauEventEmitterProtocol,
@@ -82,6 +84,20 @@ class RetentionCalculator:
                 ErrorCode.DATABASE_ERROR,
             )
 
+    def score_batch(self, inputs: list[ConfidenceInputs]) -> np.ndarray:
+        """
+        Calculate retention scores for prefetched inputs (no I/O).
+
+        Returns:
+            Array of e^(-(days / τ)) in [0.0, 1.0], aligned with inputs
+        """
+        days = np.fromiter(
+            (item.review.days_since_review for item in inputs), dtype=np.float64, count=len(inputs)
+        )
+        taus = np.fromiter((item.tau for item in inputs), dtype=np.float64, count=len(inputs))
+        scores = np.exp(-(np.maximum(days, 0.0) / np.maximum(taus, 1.0)))
+        return np.clip(scores, 0.0, 1.0)
+
     async def update_retention_tau(
         self,
         concept_id: str,
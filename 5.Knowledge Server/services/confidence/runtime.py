@@ -13,9 +13,13 @@ from services.confidence.cache_manager import CacheManager
 from services.confidence.composite_calculator import CompositeCalculator
 from services.confidence.config import CacheConfig, ConfidenceConfig
 from services.confidence.data_access import DataAccessLayer
+from services.confidence.models import Error
 from services.confidence.retention_calculator import RetentionCalculator
 from services.confidence.tau_event_emitter import TauEventEmitter
-from services.confidence.understanding_calculator import UnderstandingCalculator
+from services.confidence.understanding_calculator import (
+    TFIDFCorpusManager,
+    UnderstandingCalculator,
+)
 from services.neo4j_service import Neo4jService
 
 if TYPE_CHECKING:
@@ -69,6 +73,7 @@ class ConfidenceRuntime:
     cache_manager: CacheManager
     calculator: CompositeCalculator
     data_access: DataAccessLayer
+    corpus_manager: Optional[TFIDFCorpusManager] = None
 
     async def close(self) -> None:
         try:
@@ -134,8 +139,22 @@ async def build_confidence_runtime(
 
     cache_manager = CacheManager(redis_client, cache_config)
     confidence_config = ConfidenceConfig()
+
+    # Score version 2 reads the persisted corpus vectorizer; until the refit
+    # task has fitted one, explanations fall back to the version 1 heuristic
+    corpus_manager = None
+    if confidence_config.EXPLANATION_SCORE_VERSION == UnderstandingCalculator.SCORE_VERSION_TFIDF:
+        corpus_manager = TFIDFCorpusManager(confidence_config.TFIDF_VECTORIZER_PATH)
+        loaded = corpus_manager.load_vectorizer()
+        if isinstance(loaded, Error):
+            logger.info("TF-IDF vectorizer not loaded (%s); refit task will fit it", loaded.message)
+
     understanding = UnderstandingCalculator(
-        data_access, cache_manager, max_relationships=confidence_config.MAX_RELATIONSHIPS
+        data_access,
+        cache_manager,
+        max_relationships=confidence_config.MAX_RELATIONSHIPS,
+        score_version=confidence_config.EXPLANATION_SCORE_VERSION,
+        corpus_manager=corpus_manager,
     )
 
     # Configure tau event emitter for proper event sourcing
@@ -166,4 +185,5 @@ async def build_confidence_runtime(
         cache_manager=cache_manager,
         calculator=calculator,
         data_access=data_access,
+        corpus_manager=corpus_manager,
     )
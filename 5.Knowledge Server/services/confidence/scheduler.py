@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
-import heapq
+import asyncio
 import logging
-import time
 import uuid
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from contextlib import AsyncExitStack, asynccontextmanager
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from redis.asyncio import Redis
 
 from services.confidence.cache_manager import CacheManager
 from services.confidence.composite_calculator import CompositeCalculator
+from services.confidence.config import ConfidenceConfig
 from services.confidence.models import Error
+from services.confidence.recalc_queue import QueuedRecalc, RecalculationQueue
 
 
 logger = logging.getLogger(__name__)
@@ -29,21 +30,17 @@ class Priority(Enum):
     LOW = 3
 
 
-@dataclass
-class QueueEntry:
-    """Internal representation of a queue entry."""
-
-    priority: int
-    timestamp: float
-    concept_id: str
-
-    def as_tuple(self) -> tuple[int, float, str]:
-        """Return value suitable for heap operations."""
-        return (self.priority, self.timestamp, self.concept_id)
-
-
 class RecalculationScheduler:
-    """Manage queued recalculations with Redis-backed locking."""
+    """
+    Manage queued recalculations with Redis-backed locking.
+
+    Pending work lives in a RecalculationQueue backed by SQLite, so it survives
+    restarts. ``queue_path`` defaults to CONFIDENCE_RECALC_QUEUE_PATH; pass
+    ":memory:" to keep the queue in process.
+    Enqueues of the same concept coalesce, optionally within a
+    ``debounce_seconds`` window, and concepts whose lock is held elsewhere are
+    requeued with exponential backoff instead of being dropped.
+    """
 
     def __init__(
         self,
@@ -53,15 +50,26 @@ class RecalculationScheduler:
         *,
         batch_window_seconds: float = 5.0,
         lock_timeout: int = 10,
+        queue_path: Path | str | None = None,
+        debounce_seconds: float = 0.0,
+        max_concurrency: int = 1,
+        max_batch_size: int = 100,
+        lock_retry_backoff_seconds: float = 1.0,
+        max_lock_retries: int = 5,
     ) -> None:
         self.calculator = composite_calculator
         self.cache = cache_manager
         self.redis = redis_client
         self.batch_window_seconds = batch_window_seconds
         self.lock_timeout = lock_timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_batch_size = max(1, max_batch_size)
+        self.lock_retry_backoff_seconds = lock_retry_backoff_seconds
+        self.max_lock_retries = max_lock_retries
 
-        self._queue: list[tuple[int, float, str]] = []
-        self._pending: dict[str, QueueEntry] = {}
+        if queue_path is None:
+            queue_path = ConfidenceConfig().RECALC_QUEUE_PATH
+        self._queue = RecalculationQueue(queue_path, debounce_seconds=debounce_seconds)
 
     async def schedule_recalculation(
         self,
@@ -78,79 +86,87 @@ class RecalculationScheduler:
             logger.warning("Attempted to schedule recalculation with empty concept_id")
             return
 
-        timestamp = time.time()
-        priority_value = priority.value
-
-        existing = self._pending.get(concept_id)
-        if existing:
-            if priority_value >= existing.priority:
-                logger.debug(
-                    "Concept %s already queued with priority %s; skipping duplicate",
-                    concept_id,
-                    Priority(existing.priority).name,
-                )
-                return
-            logger.debug(
-                "Upgrading priority for %s from %s to %s",
-                concept_id,
-                Priority(existing.priority).name,
-                priority.name,
-            )
-
-        entry = QueueEntry(priority_value, timestamp, concept_id)
-        self._pending[concept_id] = entry
-        heapq.heappush(self._queue, entry.as_tuple())
-        logger.info("Scheduled recalculation for %s (priority: %s)", concept_id, priority.name)
+        if self._queue.enqueue(concept_id, priority.value):
+            logger.info("Scheduled recalculation for %s (priority: %s)", concept_id, priority.name)
+        else:
+            logger.debug("Coalesced recalculation for %s (priority: %s)", concept_id, priority.name)
 
     async def get_queue_size(self) -> int:
         """Return number of pending concepts (deduplicated)."""
-        return len(self._pending)
+        return self._queue.depth()
+
+    async def get_queue_metrics(self) -> dict[str, float | int]:
+        """Return queue depth, backlog age and processing-rate metrics."""
+        return self._queue.get_metrics()
 
     async def clear_queue(self) -> None:
         """Clear all pending recalculations (testing helper)."""
         self._queue.clear()
-        self._pending.clear()
+
+    def close(self) -> None:
+        """Close the queue database."""
+        self._queue.close()
 
     async def process_queue(self) -> None:
         """
-        Process queued recalculations.
+        Process due recalculations until none are left.
 
-        Concepts are processed in priority order with batching inside the configured window.
+        Concepts are claimed in priority order and grouped into batches of the
+        same priority enqueued within the configured window; up to
+        ``max_concurrency`` batches run at once. Concepts deferred because of
+        a held lock become due again after their backoff, in a later call.
         """
-        while self._queue:
-            priority_value, timestamp, concept_id = heapq.heappop(self._queue)
-
-            # Skip stale entries (e.g., replaced due to priority upgrade)
-            entry = self._pending.get(concept_id)
-            if not entry or (entry.priority, entry.timestamp) != (priority_value, timestamp):
-                continue
-
-            # Prepare batch for same priority within time window
-            batch_cutoff = timestamp + self.batch_window_seconds
-            batch = [concept_id]
-            del self._pending[concept_id]
-
-            while self._queue:
-                next_priority, next_timestamp, next_concept_id = self._queue[0]
-                next_entry = self._pending.get(next_concept_id)
-
-                # Clean up stale entries
-                if not next_entry or (next_entry.priority, next_entry.timestamp) != (
-                    next_priority,
-                    next_timestamp,
-                ):
-                    heapq.heappop(self._queue)
-                    continue
-
-                if next_priority != priority_value or next_timestamp > batch_cutoff:
-                    break
-
-                heapq.heappop(self._queue)
-                batch.append(next_concept_id)
-                del self._pending[next_concept_id]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        while True:
+            claimed = self._queue.claim(self.max_batch_size * self.max_concurrency)
+            if not claimed:
+                return
+            await asyncio.gather(
+                *(self._run_batch(batch, semaphore) for batch in self._group_batches(claimed))
+            )
 
-            for concept in batch:
-                await self.process_recalculation(concept)
+    def _group_batches(self, claimed: list[QueuedRecalc]) -> list[list[str]]:
+        """Split claimed rows into same-priority batches within the batch window."""
+        batches: list[list[str]] = []
+        first: QueuedRecalc | None = None
+        for item in claimed:
+            if (
+                first is None
+                or item.priority != first.priority
+                or item.enqueued_at > first.enqueued_at + self.batch_window_seconds
+                or len(batches[-1]) >= self.max_batch_size
+            ):
+                batches.append([])
+                first = item
+            batches[-1].append(item.concept_id)
+        return batches
+
+    async def _run_batch(self, batch: list[str], semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                if len(batch) > 1 and hasattr(self.calculator, "calculate_composite_scores"):
+                    await self.process_batch_recalculation(batch)
+                else:
+                    for concept in batch:
+                        await self.process_recalculation(concept)
+            except Exception as exc:
+                logger.error("Recalculation batch failed, retrying later: %s", exc, exc_info=True)
+                for concept in batch:
+                    self._retry_later(concept)
+                return
+            self._queue.complete(batch)
+
+    def _retry_later(self, concept_id: str) -> None:
+        """Requeue a concept with exponential backoff, dropping it after max retries."""
+        if not self._queue.defer(
+            concept_id,
+            Priority.MEDIUM.value,
+            self.lock_retry_backoff_seconds,
+            self.max_lock_retries,
+        ):
+            logger.error(
+                "Dropping recalculation for %s after %d retries", concept_id, self.max_lock_retries
+            )
 
     @asynccontextmanager
     async def concept_lock(self, concept_id: str) -> Any:
@@ -194,7 +210,8 @@ class RecalculationScheduler:
         """Recalculate confidence score with distributed locking."""
         async with self.concept_lock(concept_id) as acquired:
             if not acquired:
-                logger.warning("Skipping recalculation for %s (lock held)", concept_id)
+                logger.warning("Deferring recalculation for %s (lock held)", concept_id)
+                self._retry_later(concept_id)
                 return
 
             try:
@@ -216,3 +233,45 @@ class RecalculationScheduler:
                 logger.info("Updated cached score for %s", concept_id)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("Failed to cache recalculated score for %s: %s", concept_id, exc)
+
+    async def process_batch_recalculation(self, concept_ids: list[str]) -> None:
+        """
+        Recalculate a batch of concepts with one data fetch and one cache write.
+
+        Each concept is still guarded by its own lock; concepts whose lock is
+        held elsewhere are requeued, as in process_recalculation().
+        """
+        async with AsyncExitStack() as stack:
+            locked = []
+            for concept_id in concept_ids:
+                if await stack.enter_async_context(self.concept_lock(concept_id)):
+                    locked.append(concept_id)
+                else:
+                    logger.warning("Deferring recalculation for %s (lock held)", concept_id)
+                    self._retry_later(concept_id)
+
+            if not locked:
+                return
+
+            try:
+                results = await self.calculator.calculate_composite_scores(locked)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Batch recalculation failed for %d concepts: %s", len(locked), exc)
+                return
+
+            scores = {}
+            for concept_id, result in results.items():
+                if isinstance(result, Error):
+                    logger.error(
+                        "Composite calculation returned error for %s: %s",
+                        concept_id,
+                        result.message,
+                    )
+                else:
+                    scores[concept_id] = result.value
+
+            try:
+                await self.cache.set_scores_many(scores)
+                logger.info("Updated cached scores for %d concepts", len(scores))
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to cache recalculated scores: %s", exc)
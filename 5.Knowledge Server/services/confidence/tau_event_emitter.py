@@ -135,19 +135,26 @@ class TauEventEmitter:
             logger.debug(f"Outbox entry created: neo4j={outbox_id}")
 
             # Process projection synchronously
+            lease_id = None
             try:
-                self.outbox.mark_processing(outbox_id)
+                lease_id = self.outbox.mark_processing(outbox_id)
+                if lease_id is None:
+                    # An outbox worker claimed the entry first and will project it
+                    logger.info(f"Outbox entry {outbox_id} already leased; projection deferred")
+                    return Success(new_tau)
                 success = self.neo4j_projection.project_event(event)
 
                 if success:
-                    self.outbox.mark_processed(outbox_id)
+                    self.outbox.mark_processed(outbox_id, lease_id=lease_id)
                     logger.info(
                         f"Tau updated for concept {concept_id}: "
                         f"{previous_tau} -> {new_tau}"
                     )
                     return Success(new_tau)
                 else:
-                    self.outbox.mark_failed(outbox_id, "Projection returned False")
+                    self.outbox.mark_failed(
+                        outbox_id, "Projection returned False", lease_id=lease_id
+                    )
                     logger.warning(
                         f"Neo4j projection failed for tau update of {concept_id}. "
                         f"Will retry via outbox."
@@ -158,7 +165,8 @@ class TauEventEmitter:
             except Exception as e:
                 error_msg = f"Projection error: {e}"
                 logger.error(error_msg, exc_info=True)
-                self.outbox.mark_failed(outbox_id, error_msg)
+                if lease_id is not None:
+                    self.outbox.mark_failed(outbox_id, error_msg, lease_id=lease_id)
                 # Return success since event is persisted - projection will retry
                 return Success(new_tau)
 
@@ -3,30 +3,50 @@ Understanding score calculator for confidence scoring system.
 
 Calculates understanding score from three weighted components:
 - Relationship density (40%): How well concept is connected
-- Explanation quality (30%): TF-IDF based vocabulary richness
+- Explanation quality (30%): vocabulary richness (score version 1) or TF-IDF
+  weight against the persisted corpus vectorizer (score version 2)
 - Metadata completeness (30%): Presence of tags, examples, etc.
 """
 
+import asyncio
+import copy
 import json
 import logging
 import os
 import time
+from collections.abc import Mapping
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import joblib
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from services.confidence.cache_manager import CacheManager
 from services.confidence.data_access import DataAccessLayer
-from services.confidence.models import Error, ErrorCode, Success
+from services.confidence.models import ConfidenceInputs, Error, ErrorCode, Success
 from services.confidence.validation import check_data_completeness
 
 
+if TYPE_CHECKING:
+    from services.event_store import EventStore
+
 logger = logging.getLogger(__name__)
 
 
 class TFIDFCorpusManager:
-    """Manages TF-IDF vectorizer lifecycle with trigger-based recalculation."""
+    """
+    Manages TF-IDF vectorizer lifecycle with trigger-based recalculation.
+
+    A full refit (new vocabulary) runs on first use, after 15% growth of the
+    live corpus or after 30 days. In between, refresh() applies new concept
+    events to the per-term document frequencies: the vocabulary terms of each
+    concept's current explanation are kept, so an update replaces the
+    concept's document and a delete removes it, and the idf weights of the
+    existing vocabulary are recomputed. The vectorizer, the frequencies, the
+    per-concept terms and the event sequence they cover are persisted, so a
+    restart resumes where the last refresh stopped.
+    """
 
     def __init__(self, vectorizer_path="services/confidence/cache/tfidf_vectorizer.pkl"):
         self.vectorizer_path = vectorizer_path
@@ -35,6 +55,14 @@ class TFIDFCorpusManager:
         self.last_concept_count = 0
         self.last_recalc_date = None
 
+        # Incremental state: live documents per vocabulary term, live documents,
+        # vocabulary term indices of each concept's explanation and the last
+        # event sequence applied (None until the first full fit)
+        self.document_frequency: np.ndarray | None = None
+        self.document_count = 0
+        self.concept_terms: dict[str, np.ndarray] = {}
+        self.event_sequence: int | None = None
+
     def should_recalculate(self, current_concept_count: int) -> bool:
         """Check if corpus recalculation needed."""
         # First initialization - vectorizer must exist as object AND file
@@ -60,11 +88,33 @@ class TFIDFCorpusManager:
 
         return False
 
-    async def recalculate_corpus(self, all_explanations: list[str]) -> Success | Error:
-        """Fully recalculate TF-IDF vectorizer with entire corpus."""
+    async def recalculate_corpus(
+        self, all_explanations: Mapping[str, str] | list[str]
+    ) -> Success | Error:
+        """Fully recalculate TF-IDF vectorizer with entire corpus (off the event loop)."""
+        return await asyncio.to_thread(self.fit_corpus, all_explanations)
+
+    def fit_corpus(
+        self, all_explanations: Mapping[str, str] | list[str], event_sequence: int | None = None
+    ) -> Success | Error:
+        """
+        Fit a new vectorizer on the entire corpus and persist it.
+
+        Args:
+            all_explanations: Explanations of all live concepts by concept_id.
+                A plain list is fitted too, but later events cannot replace
+                its documents, so they are counted as new ones
+            event_sequence: Event store sequence read before the corpus was
+                fetched; later events are applied by refresh()
+        """
         try:
             start_time = time.time()
 
+            concept_ids: list[str] = []
+            if isinstance(all_explanations, Mapping):
+                concept_ids = list(all_explanations)
+                all_explanations = list(all_explanations.values())
+
             # Validate corpus
             if not all_explanations or len(all_explanations) == 0:
                 return Error(
@@ -73,37 +123,28 @@ class TFIDFCorpusManager:
                 )
 
             # Fit new vectorizer
-            self.vectorizer = TfidfVectorizer(
+            vectorizer = TfidfVectorizer(
                 max_features=1000,
                 stop_words="english",
                 ngram_range=(1, 2),
                 min_df=2,  # Ignore words appearing in <2 documents
                 max_df=0.8,  # Ignore words appearing in >80% documents
             )
-            self.vectorizer.fit(all_explanations)
-
-            # Ensure directory exists (handle empty dirname for relative paths)
-            dir_path = os.path.dirname(self.vectorizer_path)
-            if dir_path:  # Only create if dirname is not empty
-                os.makedirs(dir_path, exist_ok=True)
+            matrix = vectorizer.fit_transform(all_explanations)
 
-            # Persist atomically (write temp, then rename)
-            temp_path = self.vectorizer_path + ".tmp"
-            joblib.dump(self.vectorizer, temp_path)
-            os.rename(temp_path, self.vectorizer_path)
-
-            # Update tracking metadata
+            self.vectorizer = vectorizer
+            self.document_frequency = np.bincount(
+                matrix.indices, minlength=len(vectorizer.vocabulary_)
+            )
+            self.document_count = len(all_explanations)
+            self.concept_terms = {
+                concept_id: matrix.indices[matrix.indptr[row]:matrix.indptr[row + 1]].copy()
+                for row, concept_id in enumerate(concept_ids)
+            }
+            self.event_sequence = event_sequence
             self.last_concept_count = len(all_explanations)
             self.last_recalc_date = datetime.now()
-
-            metadata = {
-                "last_concept_count": self.last_concept_count,
-                "last_recalc_date": self.last_recalc_date.isoformat(),
-                "vocabulary_size": len(self.vectorizer.vocabulary_),
-                "vectorizer_version": "1.0",
-            }
-            with open(self.metadata_path, "w") as f:
-                json.dump(metadata, f)
+            self._persist()
 
             duration = time.time() - start_time
             logger.info(
@@ -124,6 +165,157 @@ class TFIDFCorpusManager:
                 ErrorCode.DATABASE_ERROR,
             )
 
+    def update_documents(
+        self, changes: Mapping[str, str | None], event_sequence: int | None = None
+    ) -> int:
+        """
+        Apply explanation changes to the idf weights without changing the vocabulary.
+
+        Each concept's previous document (if tracked) is subtracted from the
+        document frequencies and its new explanation, if any, is added, so
+        updates replace documents and deletes remove them. Uses the same
+        smoothed formula as TfidfVectorizer, ``idf = ln((1 + n) / (1 + df)) + 1``.
+        The vectorizer is copied and swapped in, so concurrent scoring keeps a
+        consistent one.
+
+        Args:
+            changes: Current explanation per changed concept (None or empty
+                when the concept was deleted or lost its explanation)
+            event_sequence: Last event sequence the changes cover
+
+        Returns:
+            Number of concept documents added, replaced or removed (0 before
+            the first full fit)
+        """
+        vectorizer = self.vectorizer
+        if vectorizer is None or self.document_frequency is None:
+            return 0
+
+        document_frequency = self.document_frequency.copy()
+        document_count = self.document_count
+        concept_terms = dict(self.concept_terms)
+        updated = {
+            concept_id: text
+            for concept_id, text in changes.items()
+            if text and text.strip()
+        }
+        presence = vectorizer.transform(list(updated.values())) if updated else None
+
+        changed = 0
+        for concept_id in changes:
+            previous = concept_terms.pop(concept_id, None)
+            if previous is not None:
+                document_frequency[previous] -= 1
+                document_count -= 1
+                changed += 1
+        for row, concept_id in enumerate(updated):
+            terms = presence.indices[presence.indptr[row]:presence.indptr[row + 1]].copy()
+            document_frequency[terms] += 1
+            document_count += 1
+            concept_terms[concept_id] = terms
+            if concept_id not in self.concept_terms:
+                changed += 1
+
+        if changed:
+            refreshed = copy.deepcopy(vectorizer)
+            refreshed.idf_ = np.log((1 + document_count) / (1 + document_frequency)) + 1.0
+            self.vectorizer = refreshed
+            self.document_frequency = document_frequency
+            self.document_count = document_count
+            self.concept_terms = concept_terms
+
+        if event_sequence is not None:
+            self.event_sequence = event_sequence
+        if changed or event_sequence is not None:
+            self._persist()
+        return changed
+
+    async def refresh(
+        self, data_access: DataAccessLayer, event_store: "EventStore"
+    ) -> Success | Error:
+        """
+        One background refit step.
+
+        Runs a full refit from Neo4j when should_recalculate() fires (or no
+        event sequence is known yet), otherwise applies explanation changes
+        from events appended since the last step.
+
+        Returns:
+            Success(number of explanations fitted or documents changed), or the
+            Error of the failed fetch or refit
+        """
+        # document_count is the number of live concepts with an explanation,
+        # the same quantity last_concept_count recorded at the last full fit
+        if self.event_sequence is None or self.should_recalculate(self.document_count):
+            sequence = await asyncio.to_thread(event_store.get_last_sequence)
+            fetched = await data_access.get_all_explanations()
+            if isinstance(fetched, Error):
+                return fetched
+            result = await asyncio.to_thread(self.fit_corpus, fetched.value, sequence)
+            if isinstance(result, Error):
+                return result
+            return Success(len(fetched.value))
+
+        changes, sequence = await asyncio.to_thread(
+            self._explanation_changes_after, event_store, self.event_sequence
+        )
+        if sequence == self.event_sequence:
+            return Success(0)
+        return Success(await asyncio.to_thread(self.update_documents, changes, sequence))
+
+    @staticmethod
+    def _explanation_changes_after(
+        event_store: "EventStore", after: int
+    ) -> tuple[dict[str, str | None], int]:
+        """
+        Latest explanation per concept changed by events after ``after``.
+
+        Returns:
+            ``{concept_id: explanation or None if deleted}`` and the last sequence read
+        """
+        changes: dict[str, str | None] = {}
+        last = after
+        for sequence, event in event_store.iter_events_after(after):
+            last = sequence
+            data = event.event_data or {}
+            if event.event_type == "ConceptCreated":
+                changes[event.aggregate_id] = data.get("explanation") or None
+            elif event.event_type == "ConceptUpdated" and "explanation" in data:
+                changes[event.aggregate_id] = data["explanation"] or None
+            elif event.event_type == "ConceptDeleted":
+                changes[event.aggregate_id] = None
+        return changes, last
+
+    def _persist(self) -> None:
+        """Write vectorizer and metadata atomically (write temp, then rename)."""
+        # Ensure directory exists (handle empty dirname for relative paths)
+        dir_path = os.path.dirname(self.vectorizer_path)
+        if dir_path:  # Only create if dirname is not empty
+            os.makedirs(dir_path, exist_ok=True)
+
+        temp_path = self.vectorizer_path + ".tmp"
+        joblib.dump(self.vectorizer, temp_path)
+        os.replace(temp_path, self.vectorizer_path)
+
+        metadata = {
+            "last_concept_count": self.last_concept_count,
+            "last_recalc_date": self.last_recalc_date.isoformat()
+            if self.last_recalc_date
+            else None,
+            "vocabulary_size": len(self.vectorizer.vocabulary_),
+            "document_count": self.document_count,
+            "document_frequency": self.document_frequency.tolist(),
+            "concept_terms": {
+                concept_id: terms.tolist() for concept_id, terms in self.concept_terms.items()
+            },
+            "event_sequence": self.event_sequence,
+            "vectorizer_version": "1.2",
+        }
+        temp_path = self.metadata_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(metadata, f)
+        os.replace(temp_path, self.metadata_path)
+
     def load_vectorizer(self) -> Success | Error:
         """Load persisted vectorizer from disk."""
         try:
@@ -141,6 +333,23 @@ class TFIDFCorpusManager:
                     if date_str:
                         self.last_recalc_date = datetime.fromisoformat(date_str)
 
+                    # Metadata before version 1.2 has no per-concept terms; the
+                    # next refresh() then runs a full refit
+                    frequency = metadata.get("document_frequency")
+                    concept_terms = metadata.get("concept_terms")
+                    if (
+                        frequency is not None
+                        and concept_terms is not None
+                        and len(frequency) == len(self.vectorizer.vocabulary_)
+                    ):
+                        self.document_frequency = np.asarray(frequency, dtype=np.int64)
+                        self.document_count = metadata.get("document_count", 0)
+                        self.concept_terms = {
+                            concept_id: np.asarray(terms, dtype=np.int32)
+                            for concept_id, terms in concept_terms.items()
+                        }
+                        self.event_sequence = metadata.get("event_sequence")
+
             return Success("Vectorizer loaded successfully")
 
         except Exception as e:
@@ -158,15 +367,23 @@ class UnderstandingCalculator:
     EXPLANATION_WEIGHT = 0.30
     METADATA_WEIGHT = 0.30
 
+    # Explanation quality definitions (CONFIDENCE_EXPLANATION_SCORE_VERSION)
+    SCORE_VERSION_HEURISTIC = 1
+    SCORE_VERSION_TFIDF = 2
+
     def __init__(
         self,
         data_access: DataAccessLayer,
         cache_manager: CacheManager,
         max_relationships: int = 20,
+        score_version: int = SCORE_VERSION_HEURISTIC,
+        corpus_manager: TFIDFCorpusManager | None = None,
     ):
         self.data_access = data_access
         self.cache = cache_manager
         self.max_relationships = max_relationships
+        self.score_version = score_version
+        self.corpus_manager = corpus_manager
 
     async def calculate_relationship_density(self, concept_id: str) -> Success | Error:
         """
@@ -234,16 +451,25 @@ class UnderstandingCalculator:
         "uri", "url", "urn", "oop", "ddd", "tdd", "bdd", "ioc", "di",
     })
 
+    # Kept as a class constant so the single and batch paths agree
+    STOPWORDS = frozenset({
+        "the", "and", "or", "but", "a", "an", "is", "are", "was",
+        "were", "in", "on", "at", "to", "for",
+    })
+
     # Minimum score floor for any non-empty explanation
     MINIMUM_EXPLANATION_SCORE = 0.1
 
+    # Score version 2: in-vocabulary terms for full coverage
+    TFIDF_TARGET_TERMS = 15
+
     def calculate_explanation_quality(self, explanation: str) -> float:
         """
         Calculate explanation quality using vocabulary richness heuristic (0.0-1.0).
 
         Uses word count, uniqueness ratio, and domain-specific term recognition.
-        Full TF-IDF corpus fitting is available via TFIDFCorpusManager but
-        requires background corpus building (future enhancement for per-query scoring).
+        With score version 2 and a fitted corpus vectorizer the TF-IDF score of
+        calculate_explanation_quality_batch() is used instead.
 
         Improvements over basic word counting:
         - Recognizes short technical terms (API, SQL, HTTP, etc.)
@@ -255,40 +481,18 @@ class UnderstandingCalculator:
         if not explanation or explanation.strip() == "":
             return 0.0
 
+        vectorizer = self._tfidf_vectorizer()
+        if vectorizer is not None:
+            return float(self._tfidf_quality_batch([explanation], vectorizer)[0])
+
         try:
-            # Tokenize and normalize
-            words = explanation.lower().split()
-            unique_words = set(words)
+            word_count, meaningful_count, technical_term_count = self._explanation_features(
+                explanation
+            )
 
-            if len(words) == 0:
+            if word_count == 0:
                 return 0.0
 
-            # Stopwords list (keeping original set for backward compatibility)
-            stopwords = {
-                "the", "and", "or", "but", "a", "an", "is", "are", "was",
-                "were", "in", "on", "at", "to", "for",
-            }
-
-            # Identify meaningful words with improved logic:
-            # - Not a stopword
-            # - Either length > 2 OR is a recognized technical term
-            meaningful_words = []
-            technical_term_count = 0
-
-            for w in unique_words:
-                if w in stopwords:
-                    continue
-
-                # Check if it's a technical term (bypass length requirement)
-                if w in self.TECHNICAL_TERMS:
-                    meaningful_words.append(w)
-                    technical_term_count += 1
-                elif len(w) > 2:
-                    meaningful_words.append(w)
-
-            meaningful_count = len(meaningful_words)
-            word_count = len(words)
-
             # Apply minimum score floor for any non-empty explanation
             if meaningful_count == 0:
                 return self.MINIMUM_EXPLANATION_SCORE
@@ -326,6 +530,107 @@ class UnderstandingCalculator:
             logger.error(f"Explanation quality calculation error: {e}")
             return self.MINIMUM_EXPLANATION_SCORE  # Return floor instead of 0 on error
 
+    def calculate_explanation_quality_batch(self, explanations: list[str]) -> np.ndarray:
+        """
+        Calculate explanation quality for many explanations at once (0.0-1.0).
+
+        Same definition as calculate_explanation_quality(). Score version 1
+        takes word counts from _explanation_features() and evaluates the
+        scoring branches as array operations over the whole batch; score
+        version 2 scores the batch with one sparse TF-IDF transform.
+
+        Returns:
+            Array of scores aligned with explanations
+        """
+        if not explanations:
+            return np.zeros(0)
+
+        vectorizer = self._tfidf_vectorizer()
+        if vectorizer is not None:
+            return self._tfidf_quality_batch(explanations, vectorizer)
+
+        features = np.array(
+            [self._explanation_features(text) for text in explanations], dtype=np.float64
+        )
+        word_count, meaningful_count, technical_count = features.T
+
+        short_score = np.where(
+            technical_count > 0,
+            np.minimum(0.15 + technical_count * 0.05, 0.25),
+            self.MINIMUM_EXPLANATION_SCORE,
+        )
+        uniqueness_ratio = meaningful_count / np.maximum(word_count, 1)
+        length_score = np.minimum(meaningful_count / 20.0, 1.0)
+        technical_bonus = np.minimum(technical_count * 0.05, 0.15)
+        full_score = np.clip(
+            0.5 * uniqueness_ratio + 0.5 * length_score + technical_bonus,
+            self.MINIMUM_EXPLANATION_SCORE,
+            1.0,
+        )
+
+        scores = np.where(meaningful_count <= 2, short_score, full_score)
+        scores = np.where(meaningful_count == 0, self.MINIMUM_EXPLANATION_SCORE, scores)
+        return np.where(word_count == 0, 0.0, scores)
+
+    def _tfidf_vectorizer(self) -> TfidfVectorizer | None:
+        """The corpus vectorizer when score version 2 is active and fitted, else None."""
+        if self.score_version != self.SCORE_VERSION_TFIDF or self.corpus_manager is None:
+            return None
+        return self.corpus_manager.vectorizer
+
+    def _tfidf_quality_batch(
+        self, explanations: list[str], vectorizer: TfidfVectorizer
+    ) -> np.ndarray:
+        """
+        Score version 2: coverage and specificity of corpus vocabulary (0.0-1.0).
+
+        Coverage is the number of distinct in-vocabulary terms relative to
+        TFIDF_TARGET_TERMS; specificity is the mean idf of those terms scaled
+        to the vocabulary's idf range, so explanations built from rare corpus
+        terms score higher than ones built from common terms.
+        """
+        present = np.fromiter(
+            (bool(text and text.strip()) for text in explanations),
+            dtype=bool,
+            count=len(explanations),
+        )
+
+        # One sparse document-term matrix for the batch; keep only term presence
+        matrix = vectorizer.transform([text or "" for text in explanations])
+        matrix.data[:] = 1.0
+        term_count = np.diff(matrix.indptr)
+
+        idf = vectorizer.idf_
+        mean_idf = (matrix @ idf) / np.maximum(term_count, 1)
+        idf_range = idf.max() - idf.min() if len(idf) else 0.0
+        if idf_range > 0:
+            specificity = np.clip((mean_idf - idf.min()) / idf_range, 0.0, 1.0)
+        else:
+            specificity = np.ones(len(explanations))
+        coverage = np.minimum(term_count / self.TFIDF_TARGET_TERMS, 1.0)
+
+        scores = np.clip(
+            0.5 * coverage + 0.5 * specificity, self.MINIMUM_EXPLANATION_SCORE, 1.0
+        )
+        scores = np.where(term_count == 0, self.MINIMUM_EXPLANATION_SCORE, scores)
+        return np.where(present, scores, 0.0)
+
+    def _explanation_features(self, explanation: str | None) -> tuple[int, int, int]:
+        """
+        Count words, meaningful unique words and technical terms.
+
+        Meaningful words are unique non-stopwords that are either recognized
+        technical terms or longer than two characters.
+        """
+        if not explanation:
+            return 0, 0, 0
+
+        words = explanation.lower().split()
+        candidates = set(words) - self.STOPWORDS
+        technical = candidates & self.TECHNICAL_TERMS
+        meaningful = len(technical) + sum(1 for w in candidates - technical if len(w) > 2)
+        return len(words), meaningful, len(technical)
+
     async def calculate_understanding_score(self, concept_id: str) -> Success | Error:
         """
         Calculate overall understanding score (0.0-1.0).
@@ -384,3 +689,41 @@ class UnderstandingCalculator:
                 f"Failed to calculate understanding score: {e!s}",
                 ErrorCode.DATABASE_ERROR,
             )
+
+    def score_batch(self, inputs: list[ConfidenceInputs]) -> np.ndarray:
+        """
+        Calculate understanding scores for prefetched inputs (no I/O).
+
+        Same formula as calculate_understanding_score(), evaluated over arrays.
+
+        Returns:
+            Array of scores in [0.0, 1.0], aligned with inputs
+        """
+        if not inputs:
+            return np.zeros(0)
+
+        unique_connections = np.fromiter(
+            (item.relationships.unique_connections for item in inputs),
+            dtype=np.float64,
+            count=len(inputs),
+        )
+        if self.max_relationships == 0:
+            density = np.zeros(len(inputs))
+        else:
+            density = np.minimum(unique_connections / self.max_relationships, 1.0)
+
+        explanation = self.calculate_explanation_quality_batch(
+            [item.concept.explanation for item in inputs]
+        )
+        metadata = np.fromiter(
+            (check_data_completeness(item.concept).metadata_score for item in inputs),
+            dtype=np.float64,
+            count=len(inputs),
+        )
+
+        scores = (
+            self.RELATIONSHIP_WEIGHT * density
+            + self.EXPLANATION_WEIGHT * explanation
+            + self.METADATA_WEIGHT * metadata
+        )
+        return np.clip(scores, 0.0, 1.0)
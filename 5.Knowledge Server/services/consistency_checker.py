@@ -2,12 +2,21 @@
 Consistency checker for dual storage system.
 
 Verifies synchronization between Neo4j and ChromaDB databases.
+
+Two modes are available:
+
+- check_consistency(): loads every concept from both stores and diffs them
+- check_incremental(): compares per-bucket digest summaries (see
+  services/concept_digest.py) and only loads the concepts of buckets that
+  differ; discrepancies are streamed rather than collected in memory
 """
 
 import logging
 import sqlite3
+import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +24,13 @@ from neo4j.exceptions import DatabaseError as Neo4jDatabaseError
 from neo4j.exceptions import ServiceUnavailable, TransientError
 
 from services.chromadb_service import ChromaDbService
+from services.concept_digest import (
+    DIGEST_BUCKET_PREFIX_LENGTH,
+    DIGEST_FIELDS,
+    compute_concept_digest,
+    digest_bucket,
+)
+from services.hierarchy_view import HierarchyView
 from services.neo4j_service import Neo4jService
 
 
@@ -60,6 +76,66 @@ class ConsistencyReport:
         return "\n".join(lines)
 
 
+@dataclass
+class BucketSummary:
+    """Order-independent summary of the concepts in one digest bucket."""
+
+    count: int = 0
+    digest_sum: int = 0
+    version_sum: int = 0
+
+    def add(self, content_digest: int, last_event_version: int | None) -> None:
+        self.count += 1
+        self.digest_sum += content_digest
+        self.version_sum += last_event_version or 0
+
+
+@dataclass
+class IncrementalConsistencyReport:
+    """Summary of an incremental consistency check.
+
+    Only counts and the first ``sample_size`` concept IDs of each kind are
+    kept; the full list of discrepancies is streamed by
+    ConsistencyChecker.iter_incremental_discrepancies().
+    """
+
+    neo4j_count: int
+    chromadb_count: int
+    buckets_checked: int
+    mismatched_buckets: list[str]
+    neo4j_only_count: int
+    chromadb_only_count: int
+    mismatched_count: int
+    digests_refreshed: int
+    is_consistent: bool
+    checked_at: datetime
+    duration_seconds: float
+    samples: dict[str, list[str]] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        """Human-readable report."""
+        lines = [
+            "=== Dual Storage Consistency Report (incremental) ===",
+            f"Checked at: {self.checked_at.isoformat()}",
+            f"Neo4j concepts: {self.neo4j_count}",
+            f"ChromaDB concepts: {self.chromadb_count}",
+            f"Buckets: {len(self.mismatched_buckets)}/{self.buckets_checked} mismatched",
+            f"Duration: {self.duration_seconds:.2f}s",
+            "",
+            f"Status: {'✅ CONSISTENT' if self.is_consistent else '❌ INCONSISTENT'}",
+        ]
+
+        for kind, count in (
+            ("neo4j_only", self.neo4j_only_count),
+            ("chromadb_only", self.chromadb_only_count),
+            ("mismatched", self.mismatched_count),
+        ):
+            if count:
+                lines.append(f"\n{kind} ({count}): {self.samples.get(kind, [])[:5]}")
+
+        return "\n".join(lines)
+
+
 class ConsistencyChecker:
     """
     Verifies consistency between Neo4j and ChromaDB.
@@ -81,7 +157,11 @@ class ConsistencyChecker:
     """
 
     def __init__(
-        self, neo4j: Neo4jService, chromadb: ChromaDbService, db_path: str | None = None
+        self,
+        neo4j: Neo4jService,
+        chromadb: ChromaDbService,
+        db_path: str | None = None,
+        hierarchy_view: HierarchyView | None = None,
     ) -> None:
         """
         Initialize ConsistencyChecker.
@@ -90,10 +170,12 @@ class ConsistencyChecker:
             neo4j: Neo4j service instance
             chromadb: ChromaDB service instance
             db_path: Optional path to SQLite database for storing snapshots
+            hierarchy_view: Optional view to mark stale when a check fails
         """
         self.neo4j = neo4j
         self.chromadb = chromadb
         self.db_path = db_path
+        self.hierarchy_view = hierarchy_view
 
         logger.info("ConsistencyChecker initialized")
 
@@ -217,14 +299,14 @@ class ConsistencyChecker:
 
             # Compare metadata fields
             differences = []
-            for field in ['name', 'area', 'topic', 'subtopic', 'confidence_score']:
-                neo4j_val = neo4j_data.get(field)
-                chromadb_val = chromadb_data.get(field)
+            for field_name in ['name', 'area', 'topic', 'subtopic', 'confidence_score']:
+                neo4j_val = neo4j_data.get(field_name)
+                chromadb_val = chromadb_data.get(field_name)
 
                 # Handle None and missing values
                 if neo4j_val != chromadb_val:
                     # Allow for type differences (int vs float for confidence_score)
-                    if field == 'confidence_score':
+                    if field_name == 'confidence_score':
                         try:
                             if float(neo4j_val or 0) == float(chromadb_val or 0):
                                 continue
@@ -232,7 +314,7 @@ class ConsistencyChecker:
                             pass
 
                     differences.append(
-                        {"field": field, "neo4j": neo4j_val, "chromadb": chromadb_val}
+                        {"field": field_name, "neo4j": neo4j_val, "chromadb": chromadb_val}
                     )
 
             if differences:
@@ -292,6 +374,7 @@ class ConsistencyChecker:
         )
 
         logger.info(f"Consistency check complete: {report.is_consistent}")
+        self._verify_hierarchy_view(report, live_count=None if include_deleted else neo4j_count)
 
         # Save snapshot if requested
         if save_snapshot and self.db_path:
@@ -299,7 +382,335 @@ class ConsistencyChecker:
 
         return report
 
-    def save_snapshot(self, report: ConsistencyReport) -> str:
+    # ------------------------------------------------------------------
+    # Incremental mode
+    # ------------------------------------------------------------------
+
+    def refresh_neo4j_digests(self, batch_size: int = 500) -> int:
+        """
+        Compute content digests for live Neo4j concepts that lack one.
+
+        Neo4jProjection clears ``content_digest`` when an update touches a
+        digested field, so this only visits concepts changed since the last
+        check (and, once, concepts written before digests existed).
+
+        Args:
+            batch_size: Concepts read and written per round trip
+
+        Returns:
+            Number of digests written
+        """
+        read_query = """
+        MATCH (c:Concept)
+        WHERE c.content_digest IS NULL AND c.concept_id IS NOT NULL
+          AND (c.deleted IS NULL OR c.deleted = false)
+        RETURN c.concept_id AS concept_id, c.name AS name, c.area AS area,
+               c.topic AS topic, c.subtopic AS subtopic
+        LIMIT $limit
+        """
+        write_query = """
+        UNWIND $rows AS row
+        MATCH (c:Concept {concept_id: row.concept_id})
+        SET c.content_digest = row.digest,
+            c.digest_bucket = row.bucket
+        """
+
+        refreshed = 0
+        while True:
+            records = self.neo4j.execute_read(read_query, {"limit": batch_size})
+            if not records:
+                break
+
+            rows = [
+                {
+                    "concept_id": record["concept_id"],
+                    "digest": compute_concept_digest(record["concept_id"], record),
+                    "bucket": digest_bucket(record["concept_id"]),
+                }
+                for record in records
+            ]
+            self.neo4j.execute_write(write_query, {"rows": rows})
+            refreshed += len(rows)
+
+            if len(records) < batch_size:
+                break
+
+        if refreshed:
+            logger.info(f"Refreshed {refreshed} Neo4j content digests")
+        return refreshed
+
+    def get_neo4j_bucket_summaries(self) -> dict[str, BucketSummary]:
+        """
+        Summarise live Neo4j concepts per bucket with one aggregate query.
+
+        Only one row per bucket crosses the network.
+        """
+        query = """
+        MATCH (c:Concept)
+        WHERE c.concept_id IS NOT NULL AND (c.deleted IS NULL OR c.deleted = false)
+        RETURN substring(c.concept_id, 0, $prefix_length) AS bucket,
+               count(c) AS count,
+               sum(coalesce(c.content_digest, 0)) AS digest_sum,
+               sum(coalesce(c.last_event_version, 0)) AS version_sum
+        """
+        records = self.neo4j.execute_read(query, {"prefix_length": DIGEST_BUCKET_PREFIX_LENGTH})
+        return {
+            record["bucket"]: BucketSummary(
+                count=record["count"],
+                digest_sum=record["digest_sum"] or 0,
+                version_sum=record["version_sum"] or 0,
+            )
+            for record in records
+        }
+
+    def get_chromadb_bucket_summaries(
+        self, page_size: int = 1000
+    ) -> tuple[dict[str, BucketSummary], int]:
+        """
+        Summarise ChromaDB concepts per bucket by paging through metadata.
+
+        ChromaDB cannot aggregate, so metadata is read one page at a time and
+        only the bucket summaries are kept. Documents written before digests
+        existed get their digest metadata backfilled on the way.
+
+        Returns:
+            Tuple of (bucket summaries, number of documents backfilled)
+        """
+        collection = self.chromadb.get_collection()
+        summaries: dict[str, BucketSummary] = {}
+        backfilled = 0
+        offset = 0
+
+        while True:
+            page = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+            ids = page.get("ids") or []
+            if not ids:
+                break
+            metadatas = page.get("metadatas") or [{}] * len(ids)
+
+            backfill_ids: list[str] = []
+            backfill_metadatas: list[dict[str, Any]] = []
+            for concept_id, metadata in zip(ids, metadatas):
+                metadata = metadata or {}
+                bucket = digest_bucket(concept_id)
+                content_digest = metadata.get("content_digest")
+                if content_digest is None or metadata.get("digest_bucket") != bucket:
+                    content_digest = compute_concept_digest(concept_id, metadata)
+                    backfill_ids.append(concept_id)
+                    backfill_metadatas.append(
+                        {**metadata, "content_digest": content_digest, "digest_bucket": bucket}
+                    )
+                summaries.setdefault(bucket, BucketSummary()).add(
+                    content_digest, metadata.get("last_event_version")
+                )
+
+            if backfill_ids:
+                collection.update(ids=backfill_ids, metadatas=backfill_metadatas)
+                backfilled += len(backfill_ids)
+
+            if len(ids) < page_size:
+                break
+            offset += page_size
+
+        if backfilled:
+            logger.info(f"Backfilled {backfilled} ChromaDB content digests")
+        return summaries, backfilled
+
+    @staticmethod
+    def find_mismatched_buckets(
+        neo4j_buckets: dict[str, BucketSummary], chromadb_buckets: dict[str, BucketSummary]
+    ) -> list[str]:
+        """Get the (sorted) buckets whose summaries differ between the stores."""
+        empty = BucketSummary()
+        return sorted(
+            bucket
+            for bucket in set(neo4j_buckets) | set(chromadb_buckets)
+            if neo4j_buckets.get(bucket, empty) != chromadb_buckets.get(bucket, empty)
+        )
+
+    def _get_neo4j_bucket(self, bucket: str) -> dict[str, dict[str, Any]]:
+        """Load digest fields of the live Neo4j concepts in one bucket."""
+        query = """
+        MATCH (c:Concept)
+        WHERE c.concept_id STARTS WITH $prefix AND (c.deleted IS NULL OR c.deleted = false)
+        RETURN c.concept_id AS concept_id, c.content_digest AS content_digest,
+               c.last_event_version AS last_event_version, c.name AS name,
+               c.area AS area, c.topic AS topic, c.subtopic AS subtopic
+        """
+        records = self.neo4j.execute_read(query, {"prefix": bucket})
+        # STARTS WITH also matches longer prefixes when a concept_id is shorter than a bucket key
+        return {
+            record["concept_id"]: dict(record)
+            for record in records
+            if digest_bucket(record["concept_id"]) == bucket
+        }
+
+    def _get_chromadb_bucket(self, bucket: str) -> dict[str, dict[str, Any]]:
+        """Load metadata of the ChromaDB concepts in one bucket."""
+        collection = self.chromadb.get_collection()
+        page = collection.get(where={"digest_bucket": bucket}, include=["metadatas"])
+        ids = page.get("ids") or []
+        metadatas = page.get("metadatas") or [{}] * len(ids)
+        return {concept_id: dict(metadata or {}) for concept_id, metadata in zip(ids, metadatas)}
+
+    def iter_bucket_discrepancies(self, buckets: list[str]) -> Iterator[dict[str, Any]]:
+        """
+        Compare the given buckets concept by concept.
+
+        Yields:
+            One dict per discrepancy: ``{"kind", "concept_id", "bucket"}``
+            plus ``"differences"`` for ``kind == "mismatched"``; ``kind`` is
+            ``"neo4j_only"``, ``"chromadb_only"`` or ``"mismatched"``
+        """
+        for bucket in buckets:
+            neo4j_concepts = self._get_neo4j_bucket(bucket)
+            chromadb_concepts = self._get_chromadb_bucket(bucket)
+
+            for concept_id in sorted(set(neo4j_concepts) | set(chromadb_concepts)):
+                neo4j_data = neo4j_concepts.get(concept_id)
+                chromadb_data = chromadb_concepts.get(concept_id)
+
+                if chromadb_data is None:
+                    yield {"kind": "neo4j_only", "concept_id": concept_id, "bucket": bucket}
+                    continue
+                if neo4j_data is None:
+                    yield {"kind": "chromadb_only", "concept_id": concept_id, "bucket": bucket}
+                    continue
+
+                differences = [
+                    {
+                        "field": name,
+                        "neo4j": neo4j_data.get(name),
+                        "chromadb": chromadb_data.get(name),
+                    }
+                    for name in DIGEST_FIELDS
+                    if (neo4j_data.get(name) or "") != (chromadb_data.get(name) or "")
+                ]
+                neo4j_version = neo4j_data.get("last_event_version")
+                chromadb_version = chromadb_data.get("last_event_version")
+                if (neo4j_version or 0) != (chromadb_version or 0):
+                    differences.append(
+                        {
+                            "field": "last_event_version",
+                            "neo4j": neo4j_version,
+                            "chromadb": chromadb_version,
+                        }
+                    )
+
+                if differences:
+                    yield {
+                        "kind": "mismatched",
+                        "concept_id": concept_id,
+                        "bucket": bucket,
+                        "differences": differences,
+                    }
+
+    def iter_incremental_discrepancies(self) -> Iterator[dict[str, Any]]:
+        """
+        Stream discrepancies found by comparing bucket summaries.
+
+        Yields:
+            Discrepancy dicts as produced by iter_bucket_discrepancies()
+        """
+        self.refresh_neo4j_digests()
+        neo4j_buckets = self.get_neo4j_bucket_summaries()
+        chromadb_buckets, _ = self.get_chromadb_bucket_summaries()
+        yield from self.iter_bucket_discrepancies(
+            self.find_mismatched_buckets(neo4j_buckets, chromadb_buckets)
+        )
+
+    def check_incremental(
+        self,
+        save_snapshot: bool = True,
+        sample_size: int = 10,
+        on_discrepancy: Callable[[dict[str, Any]], None] | None = None,
+    ) -> IncrementalConsistencyReport:
+        """
+        Check consistency by comparing per-bucket digests.
+
+        Only live concepts are compared (soft-deleted Neo4j concepts are
+        skipped, matching ChromaDB's hard deletes). Memory use is bounded by
+        the number of buckets plus the size of one mismatched bucket.
+
+        Args:
+            save_snapshot: Whether to save a snapshot row to the database
+            sample_size: Concept IDs of each kind kept in the report
+            on_discrepancy: Optional callback invoked for every discrepancy
+
+        Returns:
+            IncrementalConsistencyReport with counts and samples
+        """
+        logger.info("Starting incremental consistency check...")
+        started = time.perf_counter()
+
+        refreshed = self.refresh_neo4j_digests()
+        neo4j_buckets = self.get_neo4j_bucket_summaries()
+        chromadb_buckets, backfilled = self.get_chromadb_bucket_summaries()
+        mismatched_buckets = self.find_mismatched_buckets(neo4j_buckets, chromadb_buckets)
+
+        counts = {"neo4j_only": 0, "chromadb_only": 0, "mismatched": 0}
+        samples: dict[str, list[str]] = {kind: [] for kind in counts}
+        for discrepancy in self.iter_bucket_discrepancies(mismatched_buckets):
+            kind = discrepancy["kind"]
+            counts[kind] += 1
+            if len(samples[kind]) < sample_size:
+                samples[kind].append(discrepancy["concept_id"])
+            if on_discrepancy is not None:
+                on_discrepancy(discrepancy)
+
+        report = IncrementalConsistencyReport(
+            neo4j_count=sum(summary.count for summary in neo4j_buckets.values()),
+            chromadb_count=sum(summary.count for summary in chromadb_buckets.values()),
+            buckets_checked=len(set(neo4j_buckets) | set(chromadb_buckets)),
+            mismatched_buckets=mismatched_buckets,
+            neo4j_only_count=counts["neo4j_only"],
+            chromadb_only_count=counts["chromadb_only"],
+            mismatched_count=counts["mismatched"],
+            digests_refreshed=refreshed + backfilled,
+            is_consistent=not any(counts.values()),
+            checked_at=datetime.utcnow(),
+            duration_seconds=time.perf_counter() - started,
+            samples=samples,
+        )
+
+        logger.info(
+            f"Incremental consistency check complete: {report.is_consistent} "
+            f"({len(mismatched_buckets)}/{report.buckets_checked} buckets drilled into "
+            f"in {report.duration_seconds:.2f}s)"
+        )
+
+        self._verify_hierarchy_view(report, live_count=report.neo4j_count)
+
+        if save_snapshot and self.db_path:
+            self.save_snapshot(report)
+
+        return report
+
+    def _verify_hierarchy_view(
+        self,
+        report: ConsistencyReport | IncrementalConsistencyReport,
+        live_count: int | None,
+    ) -> None:
+        """
+        Mark the hierarchy view stale if the check failed or its total drifted.
+
+        Args:
+            report: Finished consistency report
+            live_count: Live Neo4j concept count seen by the check (None if unknown)
+        """
+        view = self.hierarchy_view
+        if view is None or view.needs_rebuild:
+            return
+        if not report.is_consistent:
+            view.mark_stale()
+        elif live_count is not None and view.total_concepts != live_count:
+            logger.warning(
+                f"Hierarchy view tracks {view.total_concepts} concepts but Neo4j has "
+                f"{live_count}; scheduling rescan"
+            )
+            view.mark_stale()
+
+    def save_snapshot(self, report: ConsistencyReport | IncrementalConsistencyReport) -> str:
         """
         Save consistency check snapshot to database.
 
@@ -322,13 +733,24 @@ class ConsistencyChecker:
 
                 # Prepare discrepancies as text
                 discrepancies = []
-                if report.neo4j_only:
-                    discrepancies.append(f"Neo4j only: {report.neo4j_only[:10]}")
-                if report.chromadb_only:
-                    discrepancies.append(f"ChromaDB only: {report.chromadb_only[:10]}")
-                if report.mismatched:
-                    mismatched_ids = [m["concept_id"] for m in report.mismatched[:10]]
-                    discrepancies.append(f"Mismatched: {mismatched_ids}")
+                if isinstance(report, IncrementalConsistencyReport):
+                    samples = report.samples
+                    if report.neo4j_only_count:
+                        discrepancies.append(f"Neo4j only: {samples.get('neo4j_only', [])}")
+                    if report.chromadb_only_count:
+                        discrepancies.append(
+                            f"ChromaDB only: {samples.get('chromadb_only', [])}"
+                        )
+                    if report.mismatched_count:
+                        discrepancies.append(f"Mismatched: {samples.get('mismatched', [])}")
+                else:
+                    if report.neo4j_only:
+                        discrepancies.append(f"Neo4j only: {report.neo4j_only[:10]}")
+                    if report.chromadb_only:
+                        discrepancies.append(f"ChromaDB only: {report.chromadb_only[:10]}")
+                    if report.mismatched:
+                        mismatched_ids = [m["concept_id"] for m in report.mismatched[:10]]
+                        discrepancies.append(f"Mismatched: {mismatched_ids}")
 
                 discrepancies_text = "; ".join(discrepancies) if discrepancies else "None"
 
@@ -12,12 +12,20 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    from services.async_neo4j_service import AsyncNeo4jService
     from services.chromadb_service import ChromaDbService
+    from services.embedding_batcher import EmbeddingBatcher
     from services.embedding_service import EmbeddingService
     from services.event_store import EventStore
+    from services.hierarchy_view import HierarchyView
+    from services.lexical_index import LexicalIndex
     from services.neo4j_service import Neo4jService
     from services.outbox import Outbox
+    from services.outbox_worker import OutboxWorker
+    from services.relationship_graph import RelationshipGraph
     from services.repository import DualStorageRepository
+    from services.snapshot_store import SnapshotStore
+    from services.startup import StartupState
     from services.confidence.composite_calculator import CompositeCalculator
     from services.confidence.event_listener import ConfidenceEventListener
     from services.confidence.runtime import ConfidenceRuntime
@@ -44,19 +52,37 @@ class ServiceContainer:
     # Core infrastructure services
     event_store: Optional["EventStore"] = None
     outbox: Optional["Outbox"] = None
+    outbox_worker: Optional["OutboxWorker"] = None
+    outbox_worker_task: Optional[asyncio.Task] = None
+    outbox_archiver_task: Optional[asyncio.Task] = None
+    event_archiver_task: Optional[asyncio.Task] = None
+    snapshot_store: Optional["SnapshotStore"] = None
 
     # Database services
     neo4j_service: Optional["Neo4jService"] = None
+    async_neo4j_service: Optional["AsyncNeo4jService"] = None
     chromadb_service: Optional["ChromaDbService"] = None
     embedding_service: Optional["EmbeddingService"] = None
+    embedding_batcher: Optional["EmbeddingBatcher"] = None
 
     # Repository (orchestrates dual storage)
     repository: Optional["DualStorageRepository"] = None
 
+    # Read models maintained from the event stream
+    hierarchy_view: Optional["HierarchyView"] = None
+    relationship_graph: Optional["RelationshipGraph"] = None
+    lexical_index: Optional["LexicalIndex"] = None
+    read_model_rescan_task: Optional[asyncio.Task] = None
+
+    # Staged startup (readiness gates, phase timings, background initialize())
+    startup: Optional["StartupState"] = None
+    startup_task: Optional[asyncio.Task] = None
+
     # Confidence scoring
     confidence_runtime: Optional["ConfidenceRuntime"] = None
     confidence_listener: Optional["ConfidenceEventListener"] = None
     confidence_listener_task: Optional[asyncio.Task] = None
+    tfidf_refit_task: Optional[asyncio.Task] = None
 
     @property
     def confidence_service(self) -> Optional["CompositeCalculator"]:
@@ -80,10 +106,17 @@ class ServiceContainer:
         return {
             "event_store": self.event_store is not None,
             "outbox": self.outbox is not None,
+            "outbox_worker": self.outbox_worker is not None,
+            "snapshot_store": self.snapshot_store is not None,
             "neo4j_service": self.neo4j_service is not None,
+            "async_neo4j_service": self.async_neo4j_service is not None,
             "chromadb_service": self.chromadb_service is not None,
             "embedding_service": self.embedding_service is not None,
+            "embedding_batcher": self.embedding_batcher is not None,
             "repository": self.repository is not None,
+            "hierarchy_view": self.hierarchy_view is not None,
+            "relationship_graph": self.relationship_graph is not None,
+            "lexical_index": self.lexical_index is not None,
             "confidence_runtime": self.confidence_runtime is not None,
             "confidence_listener": self.confidence_listener is not None,
         }
@@ -92,6 +125,15 @@ class ServiceContainer:
         """Gracefully shutdown all services."""
         logger.info("Shutting down service container...")
 
+        # Stop a staged startup that is still running before tearing down
+        if self.startup_task and not self.startup_task.done():
+            self.startup_task.cancel()
+            try:
+                await self.startup_task
+            except asyncio.CancelledError:
+                pass
+            logger.debug("Startup task cancelled")
+
         # Cancel async task first
         if self.confidence_listener_task:
             self.confidence_listener_task.cancel()
@@ -101,11 +143,59 @@ class ServiceContainer:
                 pass
             logger.debug("Confidence listener task cancelled")
 
-        # Close async service
+        if self.tfidf_refit_task:
+            self.tfidf_refit_task.cancel()
+            try:
+                await self.tfidf_refit_task
+            except asyncio.CancelledError:
+                pass
+            logger.debug("TF-IDF refit task cancelled")
+
+        if self.outbox_worker_task:
+            self.outbox_worker_task.cancel()
+            try:
+                await self.outbox_worker_task
+            except asyncio.CancelledError:
+                pass
+            logger.debug("Outbox worker task cancelled")
+
+        if self.outbox_archiver_task:
+            self.outbox_archiver_task.cancel()
+            try:
+                await self.outbox_archiver_task
+            except asyncio.CancelledError:
+                pass
+            logger.debug("Outbox archiver task cancelled")
+
+        if self.event_archiver_task:
+            self.event_archiver_task.cancel()
+            try:
+                await self.event_archiver_task
+            except asyncio.CancelledError:
+                pass
+            logger.debug("Event archiver task cancelled")
+
+        if self.read_model_rescan_task:
+            self.read_model_rescan_task.cancel()
+            try:
+                await self.read_model_rescan_task
+            except asyncio.CancelledError:
+                pass
+            logger.debug("Read model rescan task cancelled")
+
+        # Close async services
+        if self.embedding_batcher:
+            await self.embedding_batcher.close()
+            logger.debug("Embedding batcher closed")
+
         if self.confidence_runtime:
             await self.confidence_runtime.close()
             logger.debug("Confidence runtime closed")
 
+        if self.async_neo4j_service:
+            await self.async_neo4j_service.close()
+            logger.debug("Async Neo4j service closed")
+
         # Close sync services (SQLite connections)
         if self.event_store:
             self.event_store.close()
@@ -115,6 +205,10 @@ class ServiceContainer:
             self.outbox.close()
             logger.debug("Outbox closed")
 
+        if self.snapshot_store:
+            self.snapshot_store.close()
+            logger.debug("Snapshot store closed")
+
         # Close database services
         if self.neo4j_service:
             self.neo4j_service.close()
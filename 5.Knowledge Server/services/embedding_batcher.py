@@ -0,0 +1,213 @@
+"""
+Async micro-batching front end for EmbeddingService.
+
+Concurrent MCP tool calls each used to run their own forward pass, inline on
+the event loop. EmbeddingBatcher collects requests for at most
+``max_wait_ms`` (or until ``max_batch_size`` texts are queued) and embeds them
+with a single ``generate_batch`` call in a worker thread:
+
+    embed("a") ┐
+    embed("b") ├─> pending ─(timer or full)─> to_thread(generate_batch([a, b, c]))
+    embed("c") ┘                                   └─> resolve each caller's future
+
+Only one batch runs at a time. Requests arriving while a batch is in flight
+keep accumulating and are taken by the next batch, so under load batches grow
+toward ``max_batch_size`` instead of queueing many small forward passes.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from services.embedding_service import EmbeddingService
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingBatcherStats:
+    """Cumulative batcher counters."""
+
+    requests: int = 0
+    batches: int = 0
+    texts_embedded: int = 0
+    failed_batches: int = 0
+    largest_batch: int = 0
+    busy_seconds: float = 0.0
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests into batched model calls.
+
+    Example:
+        ```python
+        batcher = EmbeddingBatcher(embedding_service, max_batch_size=32, max_wait_ms=5)
+
+        vectors = await asyncio.gather(
+            batcher.embed("What is a closure?"),
+            batcher.embed("Python decorators"),
+        )  # one generate_batch call
+
+        await batcher.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """
+        Initialize EmbeddingBatcher.
+
+        Args:
+            embedding_service: Service whose generate_batch() performs inference
+            max_batch_size: Texts per model call; a full queue is flushed immediately
+            max_wait_ms: Longest time a request waits for others to join its batch
+        """
+        self.embedding_service = embedding_service
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.stats = EmbeddingBatcherStats()
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._model_lock = asyncio.Lock()
+        self._closed = False
+
+    async def embed(self, text: str) -> list[float]:
+        """
+        Embed a single text as part of the next batch.
+
+        Raises:
+            RuntimeError: If the batcher is closed
+            Exception: Whatever generate_batch raised for the batch
+        """
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed several texts, sharing batches with concurrent callers.
+
+        Returns:
+            One embedding per input text, in order
+        """
+        if self._closed:
+            raise RuntimeError("EmbeddingBatcher is closed")
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._pending.append((text, future))
+            futures.append(future)
+        self.stats.requests += len(texts)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(full_only=True)
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self, full_only: bool = False) -> None:
+        """
+        Start batch tasks for the queued requests.
+
+        Args:
+            full_only: Only take complete batches and leave the remainder waiting
+        """
+        if not full_only and self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending and (not full_only or len(self._pending) >= self.max_batch_size):
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+        if not self._pending and self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch in a worker thread and resolve its callers' futures."""
+        async with self._model_lock:
+            # Top up with requests that queued while the previous batch was running
+            room = self.max_batch_size - len(batch)
+            if room > 0 and self._pending:
+                batch = batch + self._pending[:room]
+                del self._pending[:room]
+                if not self._pending and self._flush_handle is not None:
+                    self._flush_handle.cancel()
+                    self._flush_handle = None
+
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                return
+
+            unique_texts = list(dict.fromkeys(text for text, _ in batch))
+            start = time.perf_counter()
+            try:
+                vectors = await asyncio.to_thread(
+                    self.embedding_service.generate_batch, unique_texts
+                )
+                if len(vectors) != len(unique_texts):
+                    raise RuntimeError(
+                        f"generate_batch returned {len(vectors)} embeddings "
+                        f"for {len(unique_texts)} texts"
+                    )
+            except Exception as e:
+                self.stats.failed_batches += 1
+                logger.error(f"Embedding batch of {len(unique_texts)} texts failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            finally:
+                self.stats.busy_seconds += time.perf_counter() - start
+
+            self.stats.batches += 1
+            self.stats.texts_embedded += len(unique_texts)
+            self.stats.largest_batch = max(self.stats.largest_batch, len(unique_texts))
+
+            by_text = dict(zip(unique_texts, vectors))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(by_text[text])
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching counters and derived averages."""
+        stats = self.stats
+        return {
+            "requests": stats.requests,
+            "batches": stats.batches,
+            "texts_embedded": stats.texts_embedded,
+            "failed_batches": stats.failed_batches,
+            "largest_batch": stats.largest_batch,
+            "average_batch_size": (
+                round(stats.texts_embedded / stats.batches, 2) if stats.batches else 0.0
+            ),
+            "busy_seconds": round(stats.busy_seconds, 4),
+            "pending": len(self._pending),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    async def close(self) -> None:
+        """Flush queued requests, wait for running batches and refuse new ones."""
+        self._closed = True
+        if self._pending:
+            self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
@@ -3,15 +3,26 @@ Embedding Cache Service.
 
 Provides persistent SQLite-based caching for embedding vectors to avoid
 recomputation and improve performance for repeated text.
+
+Vectors are stored as raw float32 BLOBs and decoded zero-copy with
+``numpy.frombuffer``. A bounded in-process LRU tier sits in front of SQLite
+so hot texts never touch the database. Rows written by older versions as
+JSON text are still readable and can be converted with migrate_legacy_rows().
 """
 
 import hashlib
 import json
 import logging
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
 
 
 logger = logging.getLogger(__name__)
@@ -27,12 +38,26 @@ class CacheStats:
         cache_hits: Number of successful cache retrievals
         cache_misses: Number of cache misses (not found)
         hit_rate: Percentage of cache hits (0-100)
+        memory_hits: Hits served by the in-process LRU tier
+        disk_hits: Hits served by SQLite
+        memory_entries: Number of vectors currently held in the LRU tier
+        legacy_entries: Rows still stored in the legacy JSON format
+        lookups: Number of lookup calls (get_cached and get_many)
+        avg_lookup_ms: Mean lookup latency in milliseconds
+        max_lookup_ms: Slowest lookup latency in milliseconds
     """
 
     total_entries: int
     cache_hits: int
     cache_misses: int
     hit_rate: float
+    memory_hits: int = 0
+    disk_hits: int = 0
+    memory_entries: int = 0
+    legacy_entries: int = 0
+    lookups: int = 0
+    avg_lookup_ms: float = 0.0
+    max_lookup_ms: float = 0.0
 
 
 class EmbeddingCache:
@@ -43,8 +68,11 @@ class EmbeddingCache:
     - SHA256 hashing for consistent cache keys
     - Text normalization before hashing
     - Model-aware caching (separate cache per model)
-    - Cache hit/miss tracking
-    - Performance <1ms for cache retrieval
+    - float32 BLOB storage with zero-copy decoding
+    - Bounded in-memory LRU tier in front of SQLite
+    - Batch lookups/stores with a single IN (...) query per chunk
+    - Cache hit/miss/latency tracking
+    - Persistent connection reused across calls
 
     Example:
         ```python
@@ -61,16 +89,34 @@ class EmbeddingCache:
         ```
     """
 
-    def __init__(self, db_path: str = "./data/events.db") -> None:
+    # Maximum number of hashes bound per IN (...) lookup (SQLite default limit is 999)
+    IN_QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, db_path: str = "./data/events.db", memory_cache_size: int = 2048) -> None:
         """
         Initialize embedding cache.
 
         Args:
             db_path: Path to SQLite database file
+            memory_cache_size: Maximum vectors kept in the in-process LRU tier
+                (0 disables the memory tier)
         """
         self.db_path = db_path
+        self.memory_cache_size = max(0, memory_cache_size)
         self._cache_hits = 0
         self._cache_misses = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._lookups = 0
+        self._lookup_seconds = 0.0
+        self._max_lookup_seconds = 0.0
+
+        self._memory: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
 
         # Ensure database and table exist
         self._ensure_db_exists()
@@ -90,34 +136,68 @@ class EmbeddingCache:
 
         # Verify table exists or create it
         try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            with self._conn_lock:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS embedding_cache (
+                        text_hash TEXT NOT NULL,
+                        model_name TEXT NOT NULL,
+                        embedding BLOB NOT NULL,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (text_hash, model_name)
+                    )
                 """
-                CREATE TABLE IF NOT EXISTS embedding_cache (
-                    text_hash TEXT NOT NULL,
-                    model_name TEXT NOT NULL,
-                    embedding TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (text_hash, model_name)
                 )
-            """
-            )
 
-            cursor.execute(
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_text_hash
+                    ON embedding_cache(text_hash)
                 """
-                CREATE INDEX IF NOT EXISTS idx_text_hash
-                ON embedding_cache(text_hash)
-            """
-            )
+                )
 
-            conn.commit()
-            conn.close()
+                conn.commit()
 
         except Exception as e:
             logger.error(f"Failed to ensure database exists: {e}")
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the persistent database connection, creating it lazily.
+
+        If the connection was closed externally, it will be recreated.
+        Callers must hold ``_conn_lock`` while using the connection.
+        """
+        with self._conn_lock:
+            need_new_connection = self._conn is None
+            if not need_new_connection:
+                try:
+                    self._conn.execute("SELECT 1")
+                except sqlite3.ProgrammingError:
+                    need_new_connection = True
+                    self._conn = None
+
+            if need_new_connection:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                logger.debug("EmbeddingCache: Created persistent connection to %s", self.db_path)
+            return self._conn
+
+    def close(self) -> None:
+        """Close the persistent database connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                    logger.debug("EmbeddingCache: Closed persistent connection")
+                except Exception as exc:
+                    logger.warning("EmbeddingCache: Error closing connection: %s", exc)
+                finally:
+                    self._conn = None
+
     def _normalize_text(self, text: str) -> str:
         """
         Normalize text before hashing for consistent cache keys.
@@ -156,6 +236,119 @@ class EmbeddingCache:
         """
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
+    def _key_for(self, text: str) -> str:
+        """Return the cache key (hash of normalized text) for ``text``."""
+        return self._compute_hash(self._normalize_text(text))
+
+    @staticmethod
+    def _encode(embedding: Sequence[float] | np.ndarray) -> bytes:
+        """Encode an embedding as a little-endian float32 BLOB."""
+        array = np.asarray(embedding, dtype="<f4")
+        if array.ndim != 1 or array.size == 0:
+            raise ValueError(f"Embedding must be a non-empty 1-D vector, got shape {array.shape}")
+        return array.tobytes()
+
+    @staticmethod
+    def _decode(value: bytes | str) -> np.ndarray:
+        """
+        Decode a stored embedding into a read-only float32 array.
+
+        BLOBs are wrapped zero-copy with ``numpy.frombuffer``; legacy JSON text
+        rows are parsed and converted.
+        """
+        if isinstance(value, (bytes, memoryview)):
+            return np.frombuffer(value, dtype="<f4")
+        array = np.asarray(json.loads(value), dtype="<f4")
+        if array.ndim != 1:
+            raise ValueError("Legacy embedding row is not a 1-D vector")
+        array.setflags(write=False)
+        return array
+
+    def _memory_get(self, key: tuple[str, str]) -> np.ndarray | None:
+        if not self.memory_cache_size:
+            return None
+        with self._memory_lock:
+            array = self._memory.get(key)
+            if array is not None:
+                self._memory.move_to_end(key)
+            return array
+
+    def _memory_put(self, key: tuple[str, str], array: np.ndarray) -> None:
+        if not self.memory_cache_size:
+            return
+        with self._memory_lock:
+            self._memory[key] = array
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_cache_size:
+                self._memory.popitem(last=False)
+
+    def _record_lookup(self, started: float, memory_hits: int, disk_hits: int, misses: int) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._lookups += 1
+            self._lookup_seconds += elapsed
+            self._max_lookup_seconds = max(self._max_lookup_seconds, elapsed)
+            self._memory_hits += memory_hits
+            self._disk_hits += disk_hits
+            self._cache_hits += memory_hits + disk_hits
+            self._cache_misses += misses
+
+    def get_cached_array(self, text: str, model_name: str) -> np.ndarray | None:
+        """
+        Retrieve cached embedding as a read-only float32 array.
+
+        Avoids the list conversion of get_cached(); prefer this in code that
+        can work with numpy arrays directly.
+
+        Args:
+            text: Text to retrieve embedding for
+            model_name: Model name used to generate embedding
+
+        Returns:
+            Cached embedding array, or None if not cached
+        """
+        started = time.perf_counter()
+        text_hash = self._key_for(text)
+        key = (text_hash, model_name)
+
+        array = self._memory_get(key)
+        if array is not None:
+            self._record_lookup(started, memory_hits=1, disk_hits=0, misses=0)
+            logger.debug(f"Cache HIT (memory): text_hash={text_hash[:8]}..., model={model_name}")
+            return array
+
+        try:
+            with self._conn_lock:
+                cursor = self._get_connection().cursor()
+                cursor.execute(
+                    """
+                    SELECT embedding
+                    FROM embedding_cache
+                    WHERE text_hash = ? AND model_name = ?
+                    """,
+                    (text_hash, model_name),
+                )
+                row = cursor.fetchone()
+
+            if row:
+                array = self._decode(row[0])
+                self._memory_put(key, array)
+                self._record_lookup(started, memory_hits=0, disk_hits=1, misses=0)
+                logger.debug(
+                    f"Cache HIT: text_hash={text_hash[:8]}..., "
+                    f"model={model_name}, dim={array.size}"
+                )
+                return array
+
+            self._record_lookup(started, memory_hits=0, disk_hits=0, misses=1)
+            logger.debug(f"Cache MISS: text_hash={text_hash[:8]}..., " f"model={model_name}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error retrieving from cache: {e}. Returning None.", exc_info=True)
+            self._record_lookup(started, memory_hits=0, disk_hits=0, misses=1)
+            return None
+
     def get_cached(self, text: str, model_name: str) -> list[float] | None:
         """
         Retrieve cached embedding for text and model.
@@ -176,43 +369,87 @@ class EmbeddingCache:
                 print("Cache miss, need to generate")
             ```
         """
-        # Normalize text and compute hash
-        normalized = self._normalize_text(text)
-        text_hash = self._compute_hash(normalized)
+        array = self.get_cached_array(text, model_name)
+        return array.tolist() if array is not None else None
 
-        try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            cursor = conn.cursor()
+    def get_many(
+        self, texts: Sequence[str], model_name: str, as_arrays: bool = False
+    ) -> list[list[float] | np.ndarray | None]:
+        """
+        Retrieve cached embeddings for many texts at once.
 
-            cursor.execute(
-                """
-                SELECT embedding
-                FROM embedding_cache
-                WHERE text_hash = ? AND model_name = ?
-                """,
-                (text_hash, model_name),
-            )
+        The memory tier is checked first; remaining texts are looked up with a
+        single ``IN (...)`` query per chunk of hashes.
 
-            row = cursor.fetchone()
-            conn.close()
+        Args:
+            texts: Texts to retrieve embeddings for
+            model_name: Model name used to generate embeddings
+            as_arrays: Return read-only float32 arrays instead of lists
 
-            if row:
-                self._cache_hits += 1
-                embedding = json.loads(row[0])
-                logger.debug(
-                    f"Cache HIT: text_hash={text_hash[:8]}..., "
-                    f"model={model_name}, dim={len(embedding)}"
-                )
-                return embedding
+        Returns:
+            List aligned with ``texts``; each entry is the embedding or None
+        """
+        started = time.perf_counter()
+        hashes = [self._key_for(text) for text in texts]
+        found: dict[str, np.ndarray] = {}
+        memory_hits = 0
+        disk_hits = 0
+
+        missing: list[str] = []
+        for text_hash in dict.fromkeys(hashes):
+            array = self._memory_get((text_hash, model_name))
+            if array is not None:
+                found[text_hash] = array
+                memory_hits += 1
             else:
-                self._cache_misses += 1
-                logger.debug(f"Cache MISS: text_hash={text_hash[:8]}..., " f"model={model_name}")
-                return None
+                missing.append(text_hash)
+
+        try:
+            for start in range(0, len(missing), self.IN_QUERY_CHUNK_SIZE):
+                chunk = missing[start:start + self.IN_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                with self._conn_lock:
+                    cursor = self._get_connection().cursor()
+                    cursor.execute(
+                        f"""
+                        SELECT text_hash, embedding
+                        FROM embedding_cache
+                        WHERE model_name = ? AND text_hash IN ({placeholders})
+                        """,
+                        (model_name, *chunk),
+                    )
+                    rows = cursor.fetchall()
+
+                for text_hash, value in rows:
+                    try:
+                        array = self._decode(value)
+                    except (ValueError, json.JSONDecodeError) as e:
+                        logger.warning(f"Skipping corrupted cache row {text_hash[:8]}...: {e}")
+                        continue
+                    found[text_hash] = array
+                    self._memory_put((text_hash, model_name), array)
+                    disk_hits += 1
 
         except Exception as e:
-            logger.error(f"Error retrieving from cache: {e}. Returning None.", exc_info=True)
-            self._cache_misses += 1
-            return None
+            logger.error(f"Error retrieving batch from cache: {e}", exc_info=True)
+
+        results: list[list[float] | np.ndarray | None] = []
+        misses = 0
+        for text_hash in hashes:
+            array = found.get(text_hash)
+            if array is None:
+                misses += 1
+                results.append(None)
+            else:
+                results.append(array if as_arrays else array.tolist())
+
+        # Count per requested text so hit rates match repeated get_cached() calls
+        duplicate_hits = len(hashes) - misses - memory_hits - disk_hits
+        self._record_lookup(started, memory_hits + duplicate_hits, disk_hits, misses)
+        logger.debug(
+            f"Cache batch lookup: {len(hashes) - misses} hits, {misses} misses, model={model_name}"
+        )
+        return results
 
     def store(self, text: str, model_name: str, embedding: list[float]) -> bool:
         """
@@ -234,40 +471,132 @@ class EmbeddingCache:
                 print("Stored in cache")
             ```
         """
-        # Normalize text and compute hash
-        normalized = self._normalize_text(text)
-        text_hash = self._compute_hash(normalized)
-
-        try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
-            # Serialize embedding as JSON
-            embedding_json = json.dumps(embedding)
-
-            # Use INSERT OR REPLACE to handle duplicates
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO embedding_cache
-                (text_hash, model_name, embedding, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (text_hash, model_name, embedding_json, datetime.now()),
-            )
+        return self.store_many([text], model_name, [embedding]) == 1
+
+    def store_many(
+        self,
+        texts: Sequence[str],
+        model_name: str,
+        embeddings: Sequence[Sequence[float] | np.ndarray],
+    ) -> int:
+        """
+        Store many embeddings in a single transaction.
 
-            conn.commit()
-            conn.close()
+        Args:
+            texts: Original texts
+            model_name: Model name used to generate embeddings
+            embeddings: Embedding vectors aligned with ``texts``
 
-            logger.debug(
-                f"Cache STORE: text_hash={text_hash[:8]}..., "
-                f"model={model_name}, dim={len(embedding)}"
+        Returns:
+            Number of embeddings stored (0 on failure)
+        """
+        if len(texts) != len(embeddings):
+            raise ValueError(
+                f"texts and embeddings must have the same length "
+                f"({len(texts)} != {len(embeddings)})"
             )
+        if not texts:
+            return 0
 
-            return True
+        try:
+            rows = []
+            arrays = {}
+            now = datetime.now()
+            for text, embedding in zip(texts, embeddings):
+                text_hash = self._key_for(text)
+                blob = self._encode(embedding)
+                rows.append((text_hash, model_name, blob, now))
+                arrays[text_hash] = np.frombuffer(blob, dtype="<f4")
+
+            with self._conn_lock:
+                conn = self._get_connection()
+                try:
+                    # Use INSERT OR REPLACE to handle duplicates
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO embedding_cache
+                        (text_hash, model_name, embedding, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        rows,
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+            for text_hash, array in arrays.items():
+                self._memory_put((text_hash, model_name), array)
+
+            logger.debug(f"Cache STORE: {len(rows)} embedding(s), model={model_name}")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Error storing in cache: {e}.", exc_info=True)
-            return False
+            return 0
+
+    def migrate_legacy_rows(self, batch_size: int = 1000) -> int:
+        """
+        Convert rows stored as JSON text into float32 BLOBs.
+
+        Safe to run repeatedly and while the cache is in use; each batch is
+        committed separately. Rows that cannot be parsed are deleted so they
+        are regenerated on the next miss.
+
+        Args:
+            batch_size: Rows converted per transaction
+
+        Returns:
+            Number of rows converted
+        """
+        converted = 0
+        while True:
+            with self._conn_lock:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT text_hash, model_name, embedding
+                    FROM embedding_cache
+                    WHERE typeof(embedding) = 'text'
+                    LIMIT ?
+                    """,
+                    (batch_size,),
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                updates = []
+                corrupted = []
+                for text_hash, model_name, value in rows:
+                    try:
+                        updates.append((self._encode(json.loads(value)), text_hash, model_name))
+                    except (ValueError, TypeError, json.JSONDecodeError):
+                        corrupted.append((text_hash, model_name))
+
+                try:
+                    cursor.executemany(
+                        "UPDATE embedding_cache SET embedding = ? "
+                        "WHERE text_hash = ? AND model_name = ?",
+                        updates,
+                    )
+                    cursor.executemany(
+                        "DELETE FROM embedding_cache WHERE text_hash = ? AND model_name = ?",
+                        corrupted,
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+            converted += len(updates)
+            if corrupted:
+                logger.warning(f"Dropped {len(corrupted)} unreadable legacy cache row(s)")
+
+        if converted:
+            logger.info(f"Migrated {converted} legacy JSON embedding(s) to float32 BLOBs")
+        return converted
 
     def clear_cache(self, model_name: str | None = None) -> int:
         """
@@ -291,21 +620,30 @@ class EmbeddingCache:
             print(f"Deleted {deleted} entries")
             ```
         """
-        try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
+        with self._memory_lock:
             if model_name:
-                cursor.execute("DELETE FROM embedding_cache WHERE model_name = ?", (model_name,))
-                deleted = cursor.rowcount
-                logger.info(f"Cleared cache for model '{model_name}': {deleted} entries")
+                for key in [key for key in self._memory if key[1] == model_name]:
+                    del self._memory[key]
             else:
-                cursor.execute("DELETE FROM embedding_cache")
-                deleted = cursor.rowcount
-                logger.info(f"Cleared entire cache: {deleted} entries")
+                self._memory.clear()
 
-            conn.commit()
-            conn.close()
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                if model_name:
+                    cursor.execute(
+                        "DELETE FROM embedding_cache WHERE model_name = ?", (model_name,)
+                    )
+                    deleted = cursor.rowcount
+                    logger.info(f"Cleared cache for model '{model_name}': {deleted} entries")
+                else:
+                    cursor.execute("DELETE FROM embedding_cache")
+                    deleted = cursor.rowcount
+                    logger.info(f"Cleared entire cache: {deleted} entries")
+
+                conn.commit()
 
             return deleted
 
@@ -327,33 +665,54 @@ class EmbeddingCache:
             print(f"Hit rate: {stats.hit_rate:.1f}%")
             ```
         """
-        try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM embedding_cache")
-            total_entries = cursor.fetchone()[0]
-
-            conn.close()
+        with self._stats_lock:
+            hits = self._cache_hits
+            misses = self._cache_misses
+            counters = {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "lookups": self._lookups,
+                "avg_lookup_ms": (
+                    self._lookup_seconds / self._lookups * 1000 if self._lookups else 0.0
+                ),
+                "max_lookup_ms": self._max_lookup_seconds * 1000,
+            }
+        with self._memory_lock:
+            counters["memory_entries"] = len(self._memory)
+
+        # Calculate hit rate
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0.0
 
-            # Calculate hit rate
-            total_requests = self._cache_hits + self._cache_misses
-            hit_rate = (self._cache_hits / total_requests * 100) if total_requests > 0 else 0.0
+        try:
+            with self._conn_lock:
+                cursor = self._get_connection().cursor()
+                cursor.execute(
+                    """
+                    SELECT COUNT(*),
+                           COALESCE(SUM(typeof(embedding) = 'text'), 0)
+                    FROM embedding_cache
+                    """
+                )
+                total_entries, legacy_entries = cursor.fetchone()
 
             return CacheStats(
                 total_entries=total_entries,
-                cache_hits=self._cache_hits,
-                cache_misses=self._cache_misses,
+                cache_hits=hits,
+                cache_misses=misses,
                 hit_rate=hit_rate,
+                legacy_entries=legacy_entries,
+                **counters,
             )
 
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}", exc_info=True)
             return CacheStats(
                 total_entries=0,
-                cache_hits=self._cache_hits,
-                cache_misses=self._cache_misses,
+                cache_hits=hits,
+                cache_misses=misses,
                 hit_rate=0.0,
+                **counters,
             )
 
     def get_cached_with_hash(self, text: str, model_name: str) -> tuple[list[float] | None, str]:
@@ -369,7 +728,6 @@ class EmbeddingCache:
         Returns:
             Tuple of (embedding or None, text_hash)
         """
-        normalized = self._normalize_text(text)
-        text_hash = self._compute_hash(normalized)
+        text_hash = self._key_for(text)
         embedding = self.get_cached(text, model_name)
         return (embedding, text_hash)
@@ -4,6 +4,7 @@ Embedding Generation Service.
 Provides semantic embedding generation using either:
 - sentence-transformers (local inference)
 - Mistral API (cloud-based, higher quality)
+- ONNX (local int8-quantized export run by onnxruntime, CPU only)
 
 Enables vector similarity search in ChromaDB.
 """
@@ -40,30 +41,49 @@ class EmbeddingConfig:
         model_name: Name of embedding model to use
             - For sentence-transformers: "all-MiniLM-L6-v2", "all-mpnet-base-v2", etc.
             - For mistral: "mistral-embed"
-        backend: Embedding backend ("sentence-transformers" or "mistral")
-        device: Device for local model inference ('cpu' or 'cuda')
+        backend: Embedding backend ("sentence-transformers", "mistral" or "onnx")
+        device: Device for local model inference ('cpu' or 'cuda'; onnx always runs on CPU)
         batch_size: Default batch size for batch processing
         normalize: Whether to normalize embeddings to unit vectors
         max_text_length: Maximum text length in characters (truncated beyond this)
         mistral_api_key_env: Environment variable name for Mistral API key
+        onnx_model_dir: Export directory for the onnx backend
+            (written by scripts/export_onnx_model.py)
     """
 
     model_name: str = "all-MiniLM-L6-v2"
-    backend: Literal["sentence-transformers", "mistral"] = "sentence-transformers"
+    backend: Literal["sentence-transformers", "mistral", "onnx"] = "sentence-transformers"
     device: str = "cpu"
     batch_size: int = 32
     normalize: bool = True
     max_text_length: int = 8000  # Mistral supports up to 8192 tokens
     mistral_api_key_env: str = "MISTRAL_API_KEY"
+    onnx_model_dir: str | None = None
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Model identity under which EmbeddingCache stores this config's vectors.
+
+        The onnx export is quantized, so its vectors differ from the
+        sentence-transformers ones for the same model_name. Backends other
+        than the default get their own key, and existing cache rows (keyed by
+        model_name alone) stay valid for the default backend.
+        """
+        if self.backend == "sentence-transformers":
+            return self.model_name
+        return f"{self.model_name}@{self.backend}"
 
 
 class EmbeddingService:
     """
     Service for generating semantic embeddings from text.
 
-    Supports two backends:
+    Supports three backends:
     - sentence-transformers: Local inference with models like all-MiniLM-L6-v2 (384 dims)
     - mistral: Mistral API with mistral-embed model (1024 dims)
+    - onnx: int8-quantized export of a sentence-transformers model, run by
+      onnxruntime without PyTorch (see services/onnx_embedding.py)
 
     Features:
     - Async model loading to prevent blocking
@@ -175,15 +195,17 @@ class EmbeddingService:
             logger.debug("EmbeddingService already initialized")
             return self._model_available
 
-        # Reuse cached model if compatible (sentence-transformers only)
+        # Reuse cached model if compatible (local backends only)
         if (
-            self.config.backend == "sentence-transformers"
+            self.config.backend in ("sentence-transformers", "onnx")
             and EmbeddingService._shared_model is not None
             and EmbeddingService._shared_model_config == self.config
             and self._is_default_loader()
         ):
             logger.debug("Reusing cached embedding model instance")
             self.model = EmbeddingService._shared_model
+            if self.config.backend == "onnx":
+                self._embedding_dim = self.model.dimension
             self._model_available = True
             self._initialized = True
             return True
@@ -197,6 +219,8 @@ class EmbeddingService:
             try:
                 if self.config.backend == "mistral":
                     await self._initialize_mistral()
+                elif self.config.backend == "onnx":
+                    await self._initialize_onnx()
                 else:
                     await self._initialize_sentence_transformers()
 
@@ -272,11 +296,41 @@ class EmbeddingService:
         )
         return model
 
+    async def _initialize_onnx(self) -> None:
+        """Initialize the quantized ONNX encoder."""
+        logger.info(
+            f"Loading ONNX embedding model: {self.config.model_name} "
+            f"from {self.config.onnx_model_dir}"
+        )
+
+        loop = asyncio.get_event_loop()
+        self.model = await loop.run_in_executor(None, self._load_onnx_model)
+        self._embedding_dim = self.model.dimension
+
+        EmbeddingService._shared_model = self.model
+        EmbeddingService._shared_model_config = self.config
+
+    def _load_onnx_model(self):
+        """Load the ONNX encoder (blocking operation)."""
+        from services.onnx_embedding import OnnxSentenceEncoder
+
+        if not self.config.onnx_model_dir:
+            raise ValueError("The onnx backend requires EmbeddingConfig.onnx_model_dir")
+
+        model = OnnxSentenceEncoder.load(self.config.onnx_model_dir)
+        logger.debug(
+            f"ONNX model loaded: {self.config.model_name}, max_seq_length: {model.max_seq_length}"
+        )
+        return model
+
     def _is_default_loader(self) -> bool:
-        """Check if using default _load_model implementation."""
-        loader = self._load_model
+        """Check if using the default loader implementation for the backend."""
+        if self.config.backend == "onnx":
+            loader, default = self._load_onnx_model, EmbeddingService._load_onnx_model
+        else:
+            loader, default = self._load_model, EmbeddingService._load_model
         func = getattr(loader, "__func__", None)
-        return func is EmbeddingService._load_model
+        return func is default
 
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text before embedding generation."""
@@ -332,7 +386,7 @@ class EmbeddingService:
         try:
             # Check cache first if available
             if self.cache:
-                cached = self.cache.get_cached(text, self.config.model_name)
+                cached = self.cache.get_cached(text, self.config.cache_key)
                 if cached:
                     logger.debug(f"Cache HIT for text_len={len(text)}")
                     return cached
@@ -352,7 +406,7 @@ class EmbeddingService:
 
             # Store in cache if available
             if self.cache:
-                self.cache.store(text, self.config.model_name, embedding_list)
+                self.cache.store(text, self.config.cache_key, embedding_list)
                 logger.debug(f"Stored embedding in cache for text_len={len(text)}")
 
             logger.debug(
@@ -435,13 +489,11 @@ class EmbeddingService:
             uncached_indices = []
 
             if self.cache:
-                for i, text in enumerate(texts):
-                    cached = self.cache.get_cached(text, self.config.model_name)
-                    if cached:
-                        results.append(cached)
-                    else:
-                        results.append(None)
-                        uncached_texts.append(text)
+                # One batched lookup instead of a query per text
+                results = self.cache.get_many(texts, self.config.cache_key)
+                for i, cached in enumerate(results):
+                    if cached is None:
+                        uncached_texts.append(texts[i])
                         uncached_indices.append(i)
 
                 logger.debug(
@@ -478,11 +530,10 @@ class EmbeddingService:
 
                 # Insert generated embeddings into results and cache them
                 for i, orig_idx in enumerate(uncached_indices):
-                    embedding = embeddings_list[i]
-                    results[orig_idx] = embedding
+                    results[orig_idx] = embeddings_list[i]
 
-                    if self.cache:
-                        self.cache.store(uncached_texts[i], self.config.model_name, embedding)
+                if self.cache:
+                    self.cache.store_many(uncached_texts, self.config.cache_key, embeddings_list)
 
                 logger.debug(
                     f"Generated {len(embeddings_list)} new embeddings "
@@ -549,13 +600,21 @@ class EmbeddingService:
         """Get the dimensionality of generated embeddings."""
         return self._embedding_dim
 
+    def _device_label(self) -> str:
+        """Where inference runs: the configured device, "cpu" for onnx, "api" for Mistral."""
+        if self.config.backend == "mistral":
+            return "api"
+        if self.config.backend == "onnx":
+            return "cpu"
+        return self.config.device
+
     def get_model_info(self) -> dict:
         """Get information about the loaded model."""
         return {
             "model_name": self.config.model_name,
             "backend": self.config.backend,
             "embedding_dim": self._embedding_dim,
-            "device": self.config.device if self.config.backend == "sentence-transformers" else "api",
+            "device": self._device_label(),
             "available": self._model_available,
             "initialized": self._initialized,
             "normalize": self.config.normalize,
@@ -572,7 +631,7 @@ class EmbeddingService:
             "model_name": self.config.model_name,
             "backend": self.config.backend,
             "embedding_dimension": self._embedding_dim,
-            "device": self.config.device if self.config.backend == "sentence-transformers" else "api",
+            "device": self._device_label(),
             "details": {
                 "normalize": self.config.normalize,
                 "batch_size": self.config.batch_size,
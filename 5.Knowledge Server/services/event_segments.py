@@ -0,0 +1,339 @@
+"""
+Immutable, compressed segment files for archived events
+
+EventStore.archive_segment() moves events that are covered by an aggregate
+snapshot out of the hot ``events`` table into one segment file per run. A
+segment never changes after it is written:
+
+    header   b"KSEG1\\n"
+    blocks   compressed JSON arrays of up to ``block_size`` rows, in sequence order
+    footer   compressed JSON: codec, sparse block index, per-aggregate and
+             per-event-type summaries
+    trailer  footer length (8 bytes, little endian) + b"KSEG"
+
+The sparse index holds one ``[first_sequence, last_sequence, offset, length]``
+entry per block, so a reader seeks straight to the blocks it needs and only
+decompresses those. The ``aggregates`` summary maps each aggregate id to its
+event count, version range and block numbers, which is what per-aggregate
+reads and counts use. Lookups by event id go through the ``archived_events``
+table in the database, which maps each id to its sequence; the sparse index
+then names the one block to read.
+
+Blocks are compressed with zstandard when it is installed and with zlib
+otherwise; the codec is recorded in the footer, so segments written with
+either codec stay readable wherever that codec is available.
+"""
+
+import base64
+import bisect
+import json
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from models.event_codec import get_codec
+
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+SEGMENT_HEADER = b"KSEG1\n"
+SEGMENT_TRAILER_MAGIC = b"KSEG"
+_TRAILER = struct.Struct("<Q4s")
+
+# Rows are (sequence, event_id, event_type, aggregate_id, aggregate_type,
+# event_data, metadata, version, created_at), i.e. "rowid AS sequence, *"
+SEQUENCE, EVENT_ID, EVENT_TYPE, AGGREGATE_ID = 0, 1, 2, 3
+EVENT_DATA, VERSION, CREATED_AT = 5, 7, 8
+
+DEFAULT_BLOCK_SIZE = 256
+ZSTD_LEVEL = 9
+
+
+class SegmentError(Exception):
+    """Raised when a segment file is missing, truncated or unreadable"""
+
+    pass
+
+
+def resolve_compression(name: str = "auto") -> str:
+    """
+    Resolve a configured compression name to the codec used for new segments.
+
+    Args:
+        name: "auto" (zstd when zstandard is installed, zlib otherwise),
+            "zstd" or "zlib"
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If "zstd" is requested without the zstandard package
+    """
+    if name == "auto":
+        return "zstd" if zstandard is not None else "zlib"
+    if name == "zstd" and zstandard is None:
+        raise ImportError("EVENT_SEGMENT_COMPRESSION=zstd requires the zstandard package")
+    if name not in ("zstd", "zlib"):
+        raise ValueError(f"Unknown segment compression '{name}'. Available: auto, zstd, zlib")
+    return name
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise SegmentError("Segment is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def _encode_row(row: tuple) -> list:
+    values = list(row)
+    # msgpack event_data is binary; JSON payloads are always text
+    if isinstance(values[EVENT_DATA], (bytes, memoryview)):
+        values[EVENT_DATA] = {"b64": base64.b64encode(bytes(values[EVENT_DATA])).decode()}
+    return values
+
+
+def _decode_row(values: list) -> tuple:
+    if isinstance(values[EVENT_DATA], dict):
+        values[EVENT_DATA] = base64.b64decode(values[EVENT_DATA]["b64"])
+    return tuple(values)
+
+
+@dataclass
+class SegmentFooter:
+    """Sparse index and summaries stored at the end of a segment file."""
+
+    compression: str
+    blocks: list[list[int]] = field(default_factory=list)
+    aggregates: dict[str, list] = field(default_factory=dict)
+    event_types: dict[str, int] = field(default_factory=dict)
+
+    def blocks_after(self, after_sequence: int) -> list[int]:
+        """Numbers of the blocks holding sequences greater than ``after_sequence``."""
+        return [i for i, block in enumerate(self.blocks) if block[1] > after_sequence]
+
+    def block_for_sequence(self, sequence: int) -> int | None:
+        """Number of the block that would hold ``sequence``, or None if out of range."""
+        number = bisect.bisect_left(self.blocks, sequence, key=itemgetter(1))
+        if number < len(self.blocks) and self.blocks[number][0] <= sequence:
+            return number
+        return None
+
+    def blocks_for_aggregate(self, aggregate_id: str) -> list[int]:
+        """Numbers of the blocks holding events of ``aggregate_id``."""
+        summary = self.aggregates.get(aggregate_id)
+        return summary[3] if summary else []
+
+    def count(self, aggregate_id: str | None = None, event_type: str | None = None) -> int | None:
+        """
+        Count events from the summaries alone.
+
+        Returns:
+            The count, or None when both filters are given (the caller then
+            has to read the aggregate's blocks)
+        """
+        if aggregate_id and event_type:
+            return None
+        if aggregate_id:
+            summary = self.aggregates.get(aggregate_id)
+            return summary[0] if summary else 0
+        if event_type:
+            return self.event_types.get(event_type, 0)
+        return sum(self.event_types.values())
+
+
+def write_segment(
+    path: Path,
+    rows: list[tuple],
+    compression: str = "auto",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> SegmentFooter:
+    """
+    Write ``rows`` (sorted by sequence) to a new segment file at ``path``.
+
+    The file is written under a temporary name, fsynced and then renamed,
+    so ``path`` either does not exist or holds a complete segment.
+
+    Returns:
+        The footer that was written
+
+    Raises:
+        ValueError: If rows is empty or block_size is not positive
+    """
+    if not rows:
+        raise ValueError("Cannot write an empty segment")
+    if block_size <= 0:
+        raise ValueError(f"block_size must be positive, got {block_size}")
+
+    json_codec = get_codec("json")
+    footer = SegmentFooter(compression=resolve_compression(compression))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(SEGMENT_HEADER)
+        for number, start in enumerate(range(0, len(rows), block_size)):
+            block = rows[start:start + block_size]
+            payload = _compress(
+                footer.compression,
+                json_codec.encode([_encode_row(row) for row in block]).encode(),
+            )
+            footer.blocks.append(
+                [block[0][SEQUENCE], block[-1][SEQUENCE], f.tell(), len(payload)]
+            )
+            f.write(payload)
+
+            for row in block:
+                summary = footer.aggregates.setdefault(
+                    row[AGGREGATE_ID], [0, row[VERSION], row[VERSION], []]
+                )
+                summary[0] += 1
+                summary[1] = min(summary[1], row[VERSION])
+                summary[2] = max(summary[2], row[VERSION])
+                if not summary[3] or summary[3][-1] != number:
+                    summary[3].append(number)
+                footer.event_types[row[EVENT_TYPE]] = (
+                    footer.event_types.get(row[EVENT_TYPE], 0) + 1
+                )
+
+        footer_bytes = zlib.compress(
+            json_codec.encode(
+                {
+                    "compression": footer.compression,
+                    "blocks": footer.blocks,
+                    "aggregates": footer.aggregates,
+                    "event_types": footer.event_types,
+                }
+            ).encode()
+        )
+        f.write(footer_bytes)
+        f.write(_TRAILER.pack(len(footer_bytes), SEGMENT_TRAILER_MAGIC))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+    return footer
+
+
+class SegmentReader:
+    """
+    Random access to one segment file.
+
+    The footer is read once and kept; blocks are read and decompressed on
+    demand. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._footer: SegmentFooter | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def footer(self) -> SegmentFooter:
+        """
+        The segment's footer.
+
+        Raises:
+            SegmentError: If the file is missing or not a complete segment
+        """
+        if self._footer is None:
+            with self._lock:
+                if self._footer is None:
+                    self._footer = self._read_footer()
+        return self._footer
+
+    def _read_footer(self) -> SegmentFooter:
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(SEGMENT_HEADER)) != SEGMENT_HEADER:
+                    raise SegmentError(f"{self.path} is not an event segment")
+                f.seek(-_TRAILER.size, os.SEEK_END)
+                length, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+                if magic != SEGMENT_TRAILER_MAGIC:
+                    raise SegmentError(f"{self.path} is truncated")
+                f.seek(-(_TRAILER.size + length), os.SEEK_END)
+                raw = json.loads(zlib.decompress(f.read(length)))
+        except (OSError, ValueError, zlib.error, struct.error) as e:
+            raise SegmentError(f"Cannot read segment {self.path}: {e}") from e
+
+        return SegmentFooter(
+            compression=raw["compression"],
+            blocks=raw["blocks"],
+            aggregates=raw["aggregates"],
+            event_types=raw["event_types"],
+        )
+
+    def read_blocks(self, numbers: Iterable[int]) -> Iterator[tuple]:
+        """
+        Yield the rows of the given blocks, in the order requested.
+
+        Raises:
+            SegmentError: If a block cannot be read or decoded
+        """
+        footer = self.footer
+        json_codec = get_codec("json")
+        try:
+            with open(self.path, "rb") as f:
+                for number in numbers:
+                    _, _, offset, length = footer.blocks[number]
+                    f.seek(offset)
+                    payload = _decompress(footer.compression, f.read(length))
+                    for values in json_codec.decode(payload):
+                        yield _decode_row(values)
+        except SegmentError:
+            raise
+        except Exception as e:
+            raise SegmentError(f"Cannot read segment {self.path}: {e}") from e
+
+    def iter_rows(self, after_sequence: int = 0) -> Iterator[tuple]:
+        """Yield rows with a sequence greater than ``after_sequence``, in order."""
+        for row in self.read_blocks(self.footer.blocks_after(after_sequence)):
+            if row[SEQUENCE] > after_sequence:
+                yield row
+
+    def rows_at(self, sequences: Iterable[int]) -> list[tuple]:
+        """Rows with the given sequences, reading only the blocks that hold them."""
+        wanted = set(sequences)
+        numbers = {self.footer.block_for_sequence(sequence) for sequence in wanted}
+        numbers.discard(None)
+        return [row for row in self.read_blocks(sorted(numbers)) if row[SEQUENCE] in wanted]
+
+    def rows_for_aggregate(self, aggregate_id: str) -> list[tuple]:
+        """All rows of ``aggregate_id`` in this segment, in sequence order."""
+        return [
+            row
+            for row in self.read_blocks(self.footer.blocks_for_aggregate(aggregate_id))
+            if row[AGGREGATE_ID] == aggregate_id
+        ]
+
+
+def segment_file_name(first_sequence: int, last_sequence: int) -> str:
+    """File name of the segment covering ``first_sequence..last_sequence``."""
+    return f"events-{first_sequence:012d}-{last_sequence:012d}.seg"
+
+
+def row_summary(rows: list[tuple]) -> dict[str, Any]:
+    """Catalog fields describing the rows of a new segment."""
+    created = [row[CREATED_AT] for row in rows]
+    return {
+        "first_sequence": rows[0][SEQUENCE],
+        "last_sequence": rows[-1][SEQUENCE],
+        "first_created_at": min(created),
+        "last_created_at": max(created),
+        "event_count": len(rows),
+    }
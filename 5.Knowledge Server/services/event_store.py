@@ -1,16 +1,45 @@
 """
 Event Store service for event sourcing pattern
+
+Events live in the hot ``events`` table until archive_segment() moves the
+ones covered by an aggregate snapshot into immutable segment files (see
+services/event_segments.py), catalogued in the ``event_segments`` table.
+Reads span both, so callers never need to know where an event is stored.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import queue
 import sqlite3
+import time
+import weakref
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
 import threading
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
 
+from models.event_codec import get_codec
 from models.events import Event
+from services.event_segments import (
+    CREATED_AT,
+    EVENT_ID,
+    EVENT_TYPE,
+    SEQUENCE,
+    VERSION,
+    SegmentError,
+    SegmentReader,
+    resolve_compression,
+    row_summary,
+    segment_file_name,
+    write_segment,
+)
+from services.outbox import Outbox
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +63,168 @@ class VersionConflictError(EventStoreError):
     pass
 
 
+class AppendOutcomeUnknownError(EventStoreError):
+    """
+    Raised when a group-committed append timed out while its commit was running
+
+    The event may or may not have been written; get_event_sequence(event_id)
+    tells which.
+    """
+
+    def __init__(self, message: str, event_id: str):
+        super().__init__(message)
+        self.event_id = event_id
+
+
+@dataclass
+class _PendingAppend:
+    """A single append waiting for the group-commit worker"""
+
+    event: Event
+    done: threading.Event = field(default_factory=threading.Event)
+    error: Optional[BaseException] = None
+    # Set under _GroupCommitter._claim_lock: by the worker when it takes the
+    # append into a commit, or by the caller when it gives up waiting first
+    claimed: bool = False
+    withdrawn: bool = False
+
+
+class _GroupCommitter:
+    """
+    Background writer that merges concurrent single appends into one transaction.
+
+    Callers of ``EventStore.append_event`` enqueue their event and block until the
+    worker has committed it. The worker waits at most ``window_seconds`` after the
+    first queued event for more appends to arrive, then commits the whole group
+    with a single fsync. Per-event errors (duplicates, version conflicts) are
+    reported back to the individual caller without failing the rest of the group.
+
+    A caller that times out withdraws its append if the worker has not taken
+    it yet, so it is never written. Once the append is part of a running
+    commit the outcome is unknown and AppendOutcomeUnknownError is raised.
+    """
+
+    _STOP = object()
+
+    def __init__(self, store: "EventStore", window_seconds: float, max_batch_size: int):
+        self._store = store
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._claim_lock = threading.Lock()
+        self.groups_committed = 0
+        self.events_committed = 0
+        self.thread = threading.Thread(
+            target=self._run, name="EventStoreGroupCommit", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, event: Event, timeout: float) -> bool:
+        """
+        Queue an event and block until its group has been committed.
+
+        Raises:
+            EventStoreError: On timeout before the worker took the event (it is
+                withdrawn and will not be written)
+            AppendOutcomeUnknownError: On timeout while its commit was running
+        """
+        pending = _PendingAppend(event=event)
+        self._queue.put(pending)
+        if not pending.done.wait(timeout):
+            with self._claim_lock:
+                if not pending.claimed:
+                    pending.withdrawn = True
+            if pending.withdrawn:
+                raise EventStoreError(
+                    f"Timed out after {timeout}s waiting for group commit of event "
+                    f"{event.event_id}; the event was not appended"
+                )
+            raise AppendOutcomeUnknownError(
+                f"Timed out after {timeout}s during the group commit of event "
+                f"{event.event_id}; check get_event_sequence() for the outcome",
+                event_id=event.event_id,
+            )
+        if pending.error is not None:
+            raise pending.error
+        return True
+
+    def stop(self) -> None:
+        """Flush queued appends and stop the worker thread."""
+        self._queue.put(self._STOP)
+        self.thread.join()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is self._STOP:
+                break
+
+            group = [first]
+            deadline = time.monotonic() + self.window_seconds
+            while len(group) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                group.append(item)
+
+            self._commit(group)
+
+        # Drain anything that raced with stop() so no caller is left waiting
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                leftovers.append(item)
+        if leftovers:
+            self._commit(leftovers)
+
+    def _commit(self, group: List[_PendingAppend]) -> None:
+        with self._claim_lock:
+            group = [pending for pending in group if not pending.withdrawn]
+            for pending in group:
+                pending.claimed = True
+        if not group:
+            return
+
+        try:
+            errors = self._store._append_group([p.event for p in group])
+        except Exception as exc:
+            # Whole-group failure (e.g. integrity error): retry one by one so a
+            # single bad event cannot fail every concurrent caller.
+            logger.warning(
+                "Group commit of %s events failed (%s); retrying individually", len(group), exc
+            )
+            errors = []
+            for pending in group:
+                try:
+                    with self._store._write_lock:
+                        self._store._append_event_locked(pending.event)
+                    errors.append(None)
+                except Exception as single_exc:
+                    errors.append(single_exc)
+
+        committed = 0
+        for pending, error in zip(group, errors):
+            pending.error = error
+            if error is None:
+                committed += 1
+            pending.done.set()
+
+        self.groups_committed += 1
+        self.events_committed += committed
+
+
 class EventStore:
     """
     Event Store implementation using SQLite
@@ -42,22 +233,134 @@ class EventStore:
     Events are immutable once written.
 
     Uses a persistent connection to avoid connection overhead per operation.
+    Bulk writers should prefer append_events() (one commit per batch); concurrent
+    single writers can opt into group commit via enable_group_commit().
+    Rows read back were validated when they were appended, so they are decoded
+    without running pydantic validation again (Event.from_db_row(trusted=True)).
+
+    Archived events keep their sequence and are merged back into every read.
+    The latest event of an aggregate is never archived, so version checks and
+    get_latest_version() only ever consult the hot table.
     """
 
-    def __init__(self, db_path: str = "./data/events.db"):
+    # Maximum number of bound parameters per IN (...) lookup (SQLite default limit is 999)
+    IN_QUERY_CHUNK_SIZE = 500
+
+    # How long a caller waits for the group-commit worker before giving up
+    GROUP_COMMIT_WAIT_TIMEOUT = 30.0
+
+    # Maximum number of events moved into one segment file by archive_segment()
+    SEGMENT_MAX_EVENTS = 50_000
+
+    _INSERT_SQL = """INSERT INTO events
+                     (event_id, event_type, aggregate_id, aggregate_type,
+                      event_data, metadata, version, created_at)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    _SEGMENT_CATALOG_SQL = """CREATE TABLE IF NOT EXISTS event_segments (
+                                  segment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                  path TEXT NOT NULL UNIQUE,
+                                  first_sequence INTEGER NOT NULL,
+                                  last_sequence INTEGER NOT NULL,
+                                  first_created_at DATETIME NOT NULL,
+                                  last_created_at DATETIME NOT NULL,
+                                  event_count INTEGER NOT NULL,
+                                  compression TEXT NOT NULL,
+                                  created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                              )"""
+
+    # Segment and sequence of every archived event, so lookups by id read one block
+    _ARCHIVED_EVENTS_SQL = """CREATE TABLE IF NOT EXISTS archived_events (
+                                  event_id TEXT PRIMARY KEY,
+                                  segment_id INTEGER NOT NULL,
+                                  sequence INTEGER NOT NULL
+                              ) WITHOUT ROWID"""
+
+    def __init__(
+        self,
+        db_path: str = "./data/events.db",
+        event_data_codec: str = "json",
+        segment_dir: str | None = None,
+        segment_compression: str = "auto",
+    ):
         """
         Initialize EventStore
 
         Args:
             db_path: Path to SQLite database file
+            event_data_codec: Codec for newly written event_data ("json" or
+                "msgpack"); rows written with either codec are always readable
+            segment_dir: Directory for new segment files (defaults to
+                "segments" next to the database). Existing segments are found
+                through the catalog wherever they were written.
+            segment_compression: "auto", "zstd" or "zlib" for new segments
+
+        Raises:
+            ValueError: If the codec or segment compression is unknown
+            ImportError: If the codec's package is not installed
         """
         self.db_path = Path(db_path)
+        get_codec(event_data_codec)
+        self.event_data_codec = event_data_codec
+        self.segment_dir = Path(segment_dir) if segment_dir else self.db_path.parent / "segments"
+        self.segment_compression = resolve_compression(segment_compression)
+        self._segment_readers: dict[str, SegmentReader] = {}
+        self._segment_readers_lock = threading.Lock()
         self.new_event_signal = asyncio.Event()
+        self._new_event_subscribers: weakref.WeakSet[asyncio.Event] = weakref.WeakSet()
+        self._signal_loop = self._running_loop()
         self._conn: Optional[sqlite3.Connection] = None
         self._conn_lock = threading.Lock()
         self._write_lock = threading.Lock()  # Serializes write operations for thread safety
+        self._group_committer: Optional[_GroupCommitter] = None
         self._ensure_db_exists()
 
+    @staticmethod
+    def _running_loop() -> asyncio.AbstractEventLoop | None:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def subscribe_new_events(self) -> asyncio.Event:
+        """
+        Get a new-event signal of the caller's own
+
+        Every append sets all subscribed Events, so each consumer can clear
+        its signal after waking without hiding new events from the others
+        (new_event_signal is shared by everyone who waits on it). A
+        subscription lasts as long as the caller keeps the Event referenced.
+
+        Returns:
+            An asyncio.Event set after every committed append
+        """
+        self._signal_loop = self._running_loop() or self._signal_loop
+        signal = asyncio.Event()
+        self._new_event_subscribers.add(signal)
+        return signal
+
+    def _set_new_event_signals(self) -> None:
+        self.new_event_signal.set()
+        for signal in list(self._new_event_subscribers):
+            signal.set()
+
+    def _notify_new_events(self) -> None:
+        """
+        Set the new-event signals from whichever thread committed the events.
+
+        asyncio.Event is not thread-safe: appends committed by the group-commit
+        thread or from asyncio.to_thread() hand the set() calls to the loop
+        the store was created (or last subscribed to, or group commit enabled)
+        on.
+        """
+        loop = self._signal_loop
+        if loop is None or loop.is_closed() or self._running_loop() is loop:
+            self._set_new_event_signals()
+            return
+        # RuntimeError: the loop closed since the check, so nobody is waiting
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._set_new_event_signals)
+
     def _ensure_db_exists(self):
         """Ensure database file and directory exist"""
         try:
@@ -108,24 +411,41 @@ class EventStore:
                 self._conn.execute("PRAGMA foreign_keys = ON")
                 # Enable WAL mode for better concurrent read/write performance
                 self._conn.execute("PRAGMA journal_mode = WAL")
+                self._ensure_segment_catalog(self._conn)
                 logger.debug("EventStore: Created persistent connection to %s", self.db_path)
             return self._conn
 
+    def _ensure_segment_catalog(self, conn: sqlite3.Connection) -> None:
+        """Create the segment catalog tables next to an existing events table."""
+        try:
+            table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+            ).fetchone()
+            if table is not None:
+                conn.execute(self._SEGMENT_CATALOG_SQL)
+                conn.execute(self._ARCHIVED_EVENTS_SQL)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to create event segment catalog: {e}")
+
     def close(self) -> None:
         """
         Close the persistent database connection.
 
         Should be called when shutting down the application to ensure
-        proper cleanup of database resources.
+        proper cleanup of database resources. Waits for a write still running
+        on another thread (e.g. archive_segment() via asyncio.to_thread).
         """
-        if self._conn is not None:
-            try:
-                self._conn.close()
-                logger.debug("EventStore: Closed persistent connection")
-            except Exception as exc:
-                logger.warning("EventStore: Error closing connection: %s", exc)
-            finally:
-                self._conn = None
+        self.disable_group_commit()
+        with self._write_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                    logger.debug("EventStore: Closed persistent connection")
+                except Exception as exc:
+                    logger.warning("EventStore: Error closing connection: %s", exc)
+                finally:
+                    self._conn = None
 
     def append_event(self, event: Event) -> bool:
         """
@@ -140,105 +460,319 @@ class EventStore:
         Raises:
             DuplicateEventError: If event_id already exists
             VersionConflictError: If version conflicts with existing version
+            AppendOutcomeUnknownError: If a group commit timed out mid-commit
+                and the event is not (yet) visible
 
         Thread-safe: Uses a write lock to serialize concurrent write operations.
+        When group commit is enabled, the event is handed to the background
+        committer and this call blocks until its group is durable, so code on
+        the event loop must call it via asyncio.to_thread() (otherwise the
+        loop is frozen for the whole window and no other append can join).
         """
+        committer = self._group_committer
+        if committer is not None:
+            try:
+                return committer.submit(event, timeout=self.GROUP_COMMIT_WAIT_TIMEOUT)
+            except AppendOutcomeUnknownError:
+                if self.get_event_sequence(event.event_id) is not None:
+                    return True
+                raise
+
         with self._write_lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            return self._append_event_locked(event)
 
+    def _begin_immediate(self, conn: sqlite3.Connection) -> None:
+        """Start an IMMEDIATE transaction, translating lock failures to EventStoreError."""
+        try:
+            # Use IMMEDIATE transaction to acquire write lock early
+            # This prevents race conditions in version checking
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            # Don't close the shared connection - just rollback if needed
             try:
-                # Use IMMEDIATE transaction to acquire write lock early
-                # This prevents race conditions in version checking
-                conn.execute("BEGIN IMMEDIATE")
-            except sqlite3.OperationalError as e:
-                # Don't close the shared connection - just rollback if needed
-                try:
-                    conn.rollback()
-                except Exception:
-                    pass
-                raise EventStoreError(f"Failed to begin transaction: {e}")
+                conn.rollback()
+            except Exception:
+                pass
+            raise EventStoreError(f"Failed to begin transaction: {e}")
 
-            try:
-                # Check for duplicate event_id
-                cursor.execute(
-                    "SELECT event_id FROM events WHERE event_id = ?",
-                    (event.event_id,)
+    def _append_event_locked(self, event: Event) -> bool:
+        """Append a single event. Caller must hold ``_write_lock``."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        self._begin_immediate(conn)
+
+        try:
+            # Check for duplicate event_id, including events archived to segments
+            cursor.execute(
+                """SELECT event_id FROM events WHERE event_id = ?
+                   UNION ALL
+                   SELECT event_id FROM archived_events WHERE event_id = ?""",
+                (event.event_id, event.event_id)
+            )
+            if cursor.fetchone():
+                raise DuplicateEventError(f"Event {event.event_id} already exists")
+
+            # Check for version conflict
+            cursor.execute(
+                """SELECT MAX(version) as max_version FROM events
+                   WHERE aggregate_id = ?""",
+                (event.aggregate_id,)
+            )
+            row = cursor.fetchone()
+            max_version = row[0] if row[0] is not None else 0
+
+            if event.version != max_version + 1:
+                raise VersionConflictError(
+                    f"Version conflict: expected {max_version + 1}, got {event.version}"
                 )
-                if cursor.fetchone():
-                    raise DuplicateEventError(f"Event {event.event_id} already exists")
 
-                # Check for version conflict
+            # Insert event
+            cursor.execute(self._INSERT_SQL, self._to_insert_params(event))
+
+            conn.commit()
+            logger.info(f"Event {event.event_id} appended successfully")
+
+            # Signal that a new event has been added
+            self._notify_new_events()
+
+            return True
+
+        except (DuplicateEventError, VersionConflictError):
+            conn.rollback()
+            raise
+
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            # Check if this is a UNIQUE constraint violation on (aggregate_id, version)
+            error_msg = str(e).lower()
+            if "unique" in error_msg and "aggregate" in error_msg:
+                # Get the expected version for better error message
                 cursor.execute(
-                    """SELECT MAX(version) as max_version FROM events
-                       WHERE aggregate_id = ?""",
+                    "SELECT MAX(version) as max_version FROM events WHERE aggregate_id = ?",
                     (event.aggregate_id,)
                 )
                 row = cursor.fetchone()
                 max_version = row[0] if row[0] is not None else 0
+                raise VersionConflictError(
+                    f"Version conflict: expected {max_version + 1}, got {event.version}"
+                )
+            else:
+                # Other integrity error (e.g., foreign key)
+                logger.error(f"Integrity error appending event: {e}")
+                raise EventStoreError(f"Integrity constraint violation: {e}")
 
-                if event.version != max_version + 1:
-                    raise VersionConflictError(
-                        f"Version conflict: expected {max_version + 1}, got {event.version}"
-                    )
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error appending event: {e}")
+            raise EventStoreError(f"Failed to append event: {e}")
 
-                # Convert event to database format
-                db_dict = event.to_db_dict()
+    def append_events(
+        self, events: Iterable[Event], outbox_entries: Sequence[tuple] = ()
+    ) -> bool:
+        """
+        Append a batch of events atomically with a single commit (group commit)
 
-                # Insert event
-                cursor.execute(
-                    """INSERT INTO events
-                       (event_id, event_type, aggregate_id, aggregate_type,
-                        event_data, metadata, version, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        db_dict['event_id'],
-                        db_dict['event_type'],
-                        db_dict['aggregate_id'],
-                        db_dict['aggregate_type'],
-                        db_dict['event_data'],
-                        db_dict['metadata'],
-                        db_dict['version'],
-                        db_dict['created_at']
-                    )
-                )
+        Duplicate ids and current versions for every aggregate in the batch are
+        checked with one query each instead of per event, and the whole batch is
+        inserted with executemany and committed once. Events for the same
+        aggregate must appear in ascending version order within the batch.
 
-                conn.commit()
-                logger.info(f"Event {event.event_id} appended successfully")
+        Args:
+            events: Events to append
+            outbox_entries: Optional rows from Outbox.build_entries(), inserted
+                in the same transaction so events and their outbox work are
+                committed (or rolled back) together
 
-                # Signal that a new event has been added
-                self.new_event_signal.set()
+        Returns:
+            True if successful
 
-                return True
+        Raises:
+            DuplicateEventError: If any event_id already exists (nothing is written)
+            VersionConflictError: If any version conflicts (nothing is written)
+            EventStoreError: On other database errors
+        """
+        events = list(events)
+        if not events:
+            return True
 
-            except (DuplicateEventError, VersionConflictError):
-                conn.rollback()
-                raise
+        with self._write_lock:
+            self._write_batch(events, atomic=True, outbox_entries=outbox_entries)
+        return True
 
-            except sqlite3.IntegrityError as e:
-                conn.rollback()
-                # Check if this is a UNIQUE constraint violation on (aggregate_id, version)
-                error_msg = str(e).lower()
-                if "unique" in error_msg and "aggregate" in error_msg:
-                    # Get the expected version for better error message
-                    cursor.execute(
-                        "SELECT MAX(version) as max_version FROM events WHERE aggregate_id = ?",
-                        (event.aggregate_id,)
-                    )
-                    row = cursor.fetchone()
-                    max_version = row[0] if row[0] is not None else 0
-                    raise VersionConflictError(
-                        f"Version conflict: expected {max_version + 1}, got {event.version}"
-                    )
+    def _append_group(self, events: List[Event]) -> List[Optional[EventStoreError]]:
+        """
+        Commit a group of independent appends in one transaction.
+
+        Unlike append_events(), events that fail validation are skipped and
+        their error is returned in the matching slot of the result list.
+        """
+        with self._write_lock:
+            return self._write_batch(events, atomic=False)
+
+    def _write_batch(
+        self, events: List[Event], atomic: bool, outbox_entries: Sequence[tuple] = ()
+    ) -> List[Optional[EventStoreError]]:
+        """Validate and insert ``events`` in one transaction. Caller must hold ``_write_lock``."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        self._begin_immediate(conn)
+
+        try:
+            existing_ids = self._fetch_existing_event_ids(
+                cursor, [event.event_id for event in events]
+            )
+            versions = self._fetch_max_versions(
+                cursor, {event.aggregate_id for event in events}
+            )
+
+            errors: List[Optional[EventStoreError]] = []
+            accepted: List[Event] = []
+            for event in events:
+                error: Optional[EventStoreError] = None
+                if event.event_id in existing_ids:
+                    error = DuplicateEventError(f"Event {event.event_id} already exists")
                 else:
-                    # Other integrity error (e.g., foreign key)
-                    logger.error(f"Integrity error appending event: {e}")
-                    raise EventStoreError(f"Integrity constraint violation: {e}")
+                    expected = versions.get(event.aggregate_id, 0) + 1
+                    if event.version != expected:
+                        error = VersionConflictError(
+                            f"Version conflict: expected {expected}, got {event.version}"
+                        )
+
+                if error is not None:
+                    if atomic:
+                        raise error
+                    errors.append(error)
+                    continue
+
+                existing_ids.add(event.event_id)
+                versions[event.aggregate_id] = event.version
+                accepted.append(event)
+                errors.append(None)
+
+            if accepted:
+                cursor.executemany(
+                    self._INSERT_SQL, [self._to_insert_params(event) for event in accepted]
+                )
+            if outbox_entries:
+                cursor.executemany(Outbox.INSERT_SQL, outbox_entries)
 
-            except Exception as e:
-                conn.rollback()
-                logger.error(f"Error appending event: {e}")
-                raise EventStoreError(f"Failed to append event: {e}")
+            conn.commit()
+
+        except (DuplicateEventError, VersionConflictError):
+            conn.rollback()
+            raise
+
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            logger.error(f"Integrity error appending event batch: {e}")
+            raise EventStoreError(f"Integrity constraint violation: {e}")
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error appending event batch: {e}")
+            raise EventStoreError(f"Failed to append event batch: {e}")
+
+        if accepted:
+            logger.info(f"Appended {len(accepted)} event(s) in one commit")
+            # Signal that new events have been added
+            self._notify_new_events()
+
+        return errors
+
+    def _fetch_existing_event_ids(self, cursor: sqlite3.Cursor, event_ids: List[str]) -> set:
+        """
+        Return the subset of ``event_ids`` already stored, using chunked IN queries.
+
+        Both the events table and archived_events are checked, so an id whose
+        event was moved into a segment cannot be appended again.
+        """
+        existing = set()
+        unique_ids = list(dict.fromkeys(event_ids))
+        for start in range(0, len(unique_ids), self.IN_QUERY_CHUNK_SIZE):
+            chunk = unique_ids[start:start + self.IN_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            for table in ("events", "archived_events"):
+                cursor.execute(
+                    f"SELECT event_id FROM {table} WHERE event_id IN ({placeholders})", chunk
+                )
+                existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    def _fetch_max_versions(self, cursor: sqlite3.Cursor, aggregate_ids: set) -> dict[str, int]:
+        """Return ``{aggregate_id: max_version}`` for aggregates that have events."""
+        versions: dict[str, int] = {}
+        ids = list(aggregate_ids)
+        for start in range(0, len(ids), self.IN_QUERY_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"""SELECT aggregate_id, MAX(version) FROM events
+                    WHERE aggregate_id IN ({placeholders})
+                    GROUP BY aggregate_id""",
+                chunk,
+            )
+            versions.update({row[0]: row[1] for row in cursor.fetchall()})
+        return versions
+
+    def _to_insert_params(self, event: Event) -> tuple:
+        """Convert an event to the positional parameters of ``_INSERT_SQL``."""
+        db_dict = event.to_db_dict(self.event_data_codec)
+        return (
+            db_dict['event_id'],
+            db_dict['event_type'],
+            db_dict['aggregate_id'],
+            db_dict['aggregate_type'],
+            db_dict['event_data'],
+            db_dict['metadata'],
+            db_dict['version'],
+            db_dict['created_at'],
+        )
+
+    def enable_group_commit(self, window_ms: float = 2.0, max_batch_size: int = 256) -> None:
+        """
+        Merge concurrent append_event() calls into shared transactions
+
+        Appends arriving within ``window_ms`` of each other (up to
+        ``max_batch_size``) are committed together, so N concurrent writers
+        pay for one fsync instead of N. Each caller still blocks until its own
+        event is durable and still receives its own DuplicateEventError or
+        VersionConflictError.
+
+        Args:
+            window_ms: How long to wait for more appends after the first one
+            max_batch_size: Maximum events per group
+        """
+        if window_ms < 0:
+            raise ValueError(f"window_ms must be non-negative, got {window_ms}")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        if self._group_committer is not None:
+            return
+        self._signal_loop = self._running_loop() or self._signal_loop
+        self._group_committer = _GroupCommitter(self, window_ms / 1000.0, max_batch_size)
+        logger.info(
+            "EventStore: group commit enabled (window=%sms, max_batch=%s)",
+            window_ms,
+            max_batch_size,
+        )
+
+    def disable_group_commit(self) -> None:
+        """Flush pending group-commit appends and return to per-call commits."""
+        committer = self._group_committer
+        if committer is None:
+            return
+        self._group_committer = None
+        committer.stop()
+        logger.info(
+            "EventStore: group commit disabled (%s events in %s groups)",
+            committer.events_committed,
+            committer.groups_committed,
+        )
+
+    @property
+    def group_commit_enabled(self) -> bool:
+        """Whether concurrent appends are currently being group-committed."""
+        return self._group_committer is not None
 
     def get_events_by_aggregate(
         self, aggregate_id: str, from_version: int | None = None
@@ -274,12 +808,19 @@ class EventStore:
 
             rows = cursor.fetchall()
 
+            # Versions below the oldest hot one were archived into segments
+            floor = max(from_version or 1, 1)
+            if rows and rows[0]["version"] > floor:
+                rows = self._archived_rows_for_aggregate(
+                    aggregate_id, floor, rows[0]["version"]
+                ) + rows
+
             # Parse events with specific error handling for corrupted JSON
             events = []
             skipped_corrupted = 0
             for row in rows:
                 try:
-                    events.append(Event.from_db_row(tuple(row)))
+                    events.append(Event.from_db_row(tuple(row), trusted=True))
                 except (json.JSONDecodeError, ValueError) as e:
                     skipped_corrupted += 1
                     logger.error(
@@ -313,6 +854,9 @@ class EventStore:
         """
         Get all events with optional filtering
 
+        OFFSET pagination rescans every skipped row; consumers that poll the log
+        incrementally should use iter_events_after() instead.
+
         Args:
             limit: Maximum number of events to return (must be >= 0)
             offset: Number of events to skip (must be >= 0)
@@ -346,23 +890,46 @@ class EventStore:
 
             query += " ORDER BY created_at ASC"
 
-            if limit is not None:
-                query += " LIMIT ?"
-                params.append(limit)
+            segments = self._list_segments()
+            if segments:
+                # Page over the merged stream; the hot table only has to
+                # supply the first offset + limit rows of its share, and the
+                # segments are only decompressed as far as the page reaches
+                start = offset or 0
+                end = None if limit is None else start + limit
+                if end is not None:
+                    query += " LIMIT ?"
+                    params.append(end)
+                cursor.execute(query, params)
+                hot = cursor.fetchall()
+                skipped, archived = self._archived_rows_by_created_at(
+                    segments, event_type, start, hot[0]["created_at"] if hot else None
+                )
+                rows = list(
+                    islice(
+                        self._merge_by_created_at(archived, hot),
+                        start - skipped,
+                        None if end is None else end - skipped,
+                    )
+                )
+            else:
+                if limit is not None:
+                    query += " LIMIT ?"
+                    params.append(limit)
 
-            if offset:
-                query += " OFFSET ?"
-                params.append(offset)
+                if offset:
+                    query += " OFFSET ?"
+                    params.append(offset)
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
 
             # Parse events with specific error handling for corrupted JSON (Bug #3 fix)
             events = []
             skipped_corrupted = 0
             for row in rows:
                 try:
-                    events.append(Event.from_db_row(tuple(row)))
+                    events.append(Event.from_db_row(tuple(row), trusted=True))
                 except json.JSONDecodeError as e:
                     skipped_corrupted += 1
                     logger.error(
@@ -391,6 +958,213 @@ class EventStore:
             logger.error(f"Unexpected error fetching all events: {e}", exc_info=True)
             raise EventStoreError(f"Unexpected error fetching all events: {e}")
 
+    def iter_events_after(
+        self,
+        after_sequence: int = 0,
+        limit: int | None = None,
+        event_type: str | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[tuple[int, Event]]:
+        """
+        Stream events in append order using a keyset cursor on the SQLite rowid
+
+        Each page is fetched with ``WHERE rowid > ? ORDER BY rowid LIMIT ?``, so
+        resuming from a stored sequence costs O(page) regardless of how many
+        events precede it (unlike get_all_events' OFFSET pagination). Rows are
+        decoded into Event objects lazily, one per iteration step, and no cursor
+        is held open between pages.
+
+        Archived events keep their sequence and are merged in from the
+        segments that cover ``after_sequence`` onwards.
+
+        Note: the sequence is the implicit rowid of the append-only events
+        table. It is monotonic as long as rows are never deleted from the tail
+        (archive_segment() never archives the newest event) and the file is
+        not rebuilt with VACUUM.
+
+        Args:
+            after_sequence: Exclusive lower bound; 0 starts from the beginning
+            limit: Maximum number of events to yield (None for all)
+            event_type: Optional filter by event type
+            batch_size: Rows fetched per page
+
+        Yields:
+            Tuples of (sequence, event) in ascending sequence order
+
+        Raises:
+            EventStoreError: If a page cannot be read
+        """
+        if after_sequence is None or after_sequence < 0:
+            after_sequence = 0
+        if limit is not None and limit <= 0:
+            return
+        batch_size = max(1, batch_size)
+
+        page_size = batch_size if limit is None else min(batch_size, limit)
+        remaining = limit
+        for row in self._iter_rows_after(after_sequence, page_size, event_type):
+            sequence = row[SEQUENCE]
+            try:
+                event = Event.from_db_row(row[1:], trusted=True)
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.error(
+                    "Failed to deserialize event %s at sequence %s: %s. Skipping row.",
+                    row[EVENT_ID],
+                    sequence,
+                    e,
+                )
+                continue
+
+            yield sequence, event
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    return
+
+    def _iter_rows_after(
+        self, after_sequence: int, page_size: int, event_type: str | None
+    ) -> Iterator[tuple]:
+        """Raw rows (sequence first) after ``after_sequence``, hot and archived, in order."""
+        hot = self._iter_hot_rows_after(after_sequence, page_size, event_type)
+        segments = [s for s in self._list_segments() if s["last_sequence"] > after_sequence]
+        if not segments:
+            yield from hot
+            return
+
+        archived = self._iter_archived_rows(segments, after_sequence)
+        if event_type:
+            archived = (row for row in archived if row[EVENT_TYPE] == event_type)
+
+        # A row being archived concurrently can show up in both streams
+        last_sequence = None
+        for row in heapq.merge(archived, hot, key=itemgetter(SEQUENCE)):
+            if row[SEQUENCE] != last_sequence:
+                last_sequence = row[SEQUENCE]
+                yield row
+
+    def _iter_hot_rows_after(
+        self, after_sequence: int, page_size: int, event_type: str | None
+    ) -> Iterator[tuple]:
+        """Page through the hot table with the rowid keyset cursor."""
+        cursor_position = after_sequence
+        while True:
+            rows = self._fetch_page_after(cursor_position, page_size, event_type)
+            for row in rows:
+                yield tuple(row)
+            if len(rows) < page_size:
+                return
+            cursor_position = rows[-1][0]
+
+    def _fetch_page_after(
+        self, after_sequence: int, page_size: int, event_type: str | None
+    ) -> list[sqlite3.Row]:
+        """Fetch one keyset page of raw rows (rowid first) after ``after_sequence``."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        query = "SELECT rowid AS sequence, * FROM events WHERE rowid > ?"
+        params: list = [after_sequence]
+        if event_type:
+            query += " AND event_type = ?"
+            params.append(event_type)
+        query += " ORDER BY rowid ASC LIMIT ?"
+        params.append(page_size)
+
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Database error streaming events after {after_sequence}: {e}")
+            raise EventStoreError(f"Failed to stream events: {e}")
+
+    def get_last_sequence(self) -> int:
+        """
+        Get the sequence (rowid) of the most recently appended event
+
+        Returns:
+            Highest sequence in the store, or 0 if it is empty
+
+        Raises:
+            EventStoreError: If the sequence cannot be read
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT MAX(rowid) FROM events")
+            row = cursor.fetchone()
+            return row[0] if row and row[0] is not None else 0
+        except sqlite3.Error as e:
+            logger.error(f"Database error reading last event sequence: {e}")
+            raise EventStoreError(f"Failed to read last sequence: {e}")
+
+    def get_projected_sequence(self, projection_name: str = "neo4j") -> int:
+        """
+        Get the highest sequence up to which every event has been projected
+
+        Events with an unfinished outbox entry (pending, processing or failed)
+        for ``projection_name`` are not yet visible in that store, so a read
+        model loaded from it must start its cursor before the first of them.
+        Without an outbox table this is get_last_sequence().
+
+        Args:
+            projection_name: Outbox projection the read model scans
+
+        Returns:
+            Sequence just before the oldest unprojected event, or the last sequence
+
+        Raises:
+            EventStoreError: If the sequence cannot be read
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'outbox'"
+            )
+            if cursor.fetchone() is not None:
+                cursor.execute(
+                    """SELECT MIN(e.rowid) FROM outbox o
+                       JOIN events e ON e.event_id = o.event_id
+                       WHERE o.status IN ('pending', 'processing', 'failed')
+                         AND o.projection_name = ?""",
+                    (projection_name,)
+                )
+                row = cursor.fetchone()
+                if row and row[0] is not None:
+                    return row[0] - 1
+        except sqlite3.Error as e:
+            logger.error(f"Database error reading projected event sequence: {e}")
+            raise EventStoreError(f"Failed to read projected sequence: {e}")
+
+        return self.get_last_sequence()
+
+    def get_event_sequence(self, event_id: str) -> Optional[int]:
+        """
+        Get the stream sequence (rowid) of an event
+
+        Args:
+            event_id: Event ID to look up
+
+        Returns:
+            Sequence number if found, None otherwise
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT rowid FROM events WHERE event_id = ?", (event_id,))
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+            archived = self._find_archived_rows({event_id})
+            return archived[event_id][SEQUENCE] if event_id in archived else None
+
+        except Exception as e:
+            logger.error(f"Error fetching event sequence: {e}")
+            return None
+
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
         """
         Get specific event by ID
@@ -409,17 +1183,65 @@ class EventStore:
             row = cursor.fetchone()
 
             if row:
-                return Event.from_db_row(tuple(row))
+                return Event.from_db_row(tuple(row), trusted=True)
+            archived = self._find_archived_rows({event_id})
+            if event_id in archived:
+                return Event.from_db_row(archived[event_id][1:], trusted=True)
             return None
 
         except Exception as e:
             logger.error(f"Error fetching event by ID: {e}")
             return None
 
+    def get_events_by_ids(self, event_ids: List[str]) -> dict[str, Event]:
+        """
+        Get many events by ID with chunked IN queries
+
+        Args:
+            event_ids: Event IDs to fetch
+
+        Returns:
+            Mapping of event_id to Event; unknown or corrupted ids are omitted
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        events: dict[str, Event] = {}
+
+        try:
+            unique_ids = list(dict.fromkeys(event_ids))
+            for start in range(0, len(unique_ids), self.IN_QUERY_CHUNK_SIZE):
+                chunk = unique_ids[start:start + self.IN_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT * FROM events WHERE event_id IN ({placeholders})", chunk
+                )
+                for row in cursor.fetchall():
+                    try:
+                        events[row["event_id"]] = Event.from_db_row(tuple(row), trusted=True)
+                    except Exception as e:
+                        logger.error(f"Skipping corrupted event {row['event_id']}: {e}")
+
+            missing = set(unique_ids) - events.keys()
+            if missing:
+                for event_id, row in self._find_archived_rows(missing).items():
+                    try:
+                        events[event_id] = Event.from_db_row(row[1:], trusted=True)
+                    except Exception as e:
+                        logger.error(f"Skipping corrupted archived event {event_id}: {e}")
+
+            return events
+
+        except Exception as e:
+            logger.error(f"Error retrieving events by ids: {e}")
+            raise EventStoreError(f"Failed to retrieve events: {e}")
+
     def get_latest_version(self, aggregate_id: str) -> int:
         """
         Get latest version number for an aggregate
 
+        The latest event of an aggregate is never archived, so this only
+        reads the hot table.
+
         Args:
             aggregate_id: ID of the aggregate
 
@@ -473,8 +1295,377 @@ class EventStore:
                 params.append(event_type)
 
             cursor.execute(query, params)
-            return cursor.fetchone()[0]
+            return cursor.fetchone()[0] + self._count_archived(aggregate_id, event_type)
 
         except Exception as e:
             logger.error(f"Error counting events: {e}")
             return 0
+
+    def archive_segment(
+        self, older_than_seconds: float, max_events: int = SEGMENT_MAX_EVENTS
+    ) -> int:
+        """
+        Move events behind their aggregate's snapshot into a new segment file
+
+        An event is archived when it is older than ``older_than_seconds``, its
+        aggregate has a snapshot at a later version, and no outbox row still
+        references it (Outbox.archive_completed() clears completed rows).
+        The hot table therefore keeps every event the repository replays on
+        top of a snapshot, and its size tracks the live working set instead
+        of the whole history.
+
+        The segment file is written and fsynced before the rows are deleted
+        in one transaction; if the delete fails the file is removed again.
+
+        Args:
+            older_than_seconds: Minimum event age
+            max_events: Maximum events moved into this segment (must be > 0)
+
+        Returns:
+            Number of events archived (0 if nothing qualified)
+
+        Raises:
+            ValueError: If max_events is not positive
+            EventStoreError: If the segment cannot be written or committed
+        """
+        if max_events <= 0:
+            raise ValueError(f"max_events must be positive, got {max_events}")
+
+        conn = self._get_connection()
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+                " AND name IN ('aggregate_snapshots', 'outbox', 'event_segments',"
+                " 'archived_events')"
+            )
+        }
+        if not {"aggregate_snapshots", "event_segments", "archived_events"} <= tables:
+            return 0
+
+        query = """SELECT e.rowid AS sequence, e.* FROM events e
+                   JOIN aggregate_snapshots s ON s.aggregate_id = e.aggregate_id
+                   WHERE e.version < s.version AND e.created_at < ?"""
+        if "outbox" in tables:
+            query += " AND NOT EXISTS (SELECT 1 FROM outbox o WHERE o.event_id = e.event_id)"
+        query += " ORDER BY e.rowid ASC LIMIT ?"
+        cutoff = (datetime.now() - timedelta(seconds=older_than_seconds)).isoformat()
+
+        try:
+            rows = [tuple(row) for row in conn.execute(query, (cutoff, max_events))]
+        except sqlite3.Error as e:
+            logger.error(f"Database error selecting events to archive: {e}")
+            raise EventStoreError(f"Failed to select events to archive: {e}")
+        if not rows:
+            return 0
+
+        summary = row_summary(rows)
+        path = self.segment_dir / segment_file_name(
+            summary["first_sequence"], summary["last_sequence"]
+        )
+        try:
+            write_segment(path, rows, self.segment_compression)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error writing event segment {path}: {e}")
+            raise EventStoreError(f"Failed to write event segment: {e}")
+
+        with self._write_lock:
+            try:
+                self._begin_immediate(conn)
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "DELETE FROM events WHERE rowid = ?", [(row[SEQUENCE],) for row in rows]
+                )
+                if cursor.rowcount != len(rows):
+                    raise EventStoreError(
+                        f"{len(rows) - cursor.rowcount} event(s) vanished during archival"
+                    )
+                cursor.execute(
+                    """INSERT INTO event_segments
+                       (path, first_sequence, last_sequence, first_created_at,
+                        last_created_at, event_count, compression)
+                       VALUES (:path, :first_sequence, :last_sequence, :first_created_at,
+                               :last_created_at, :event_count, :compression)""",
+                    {
+                        **summary,
+                        "path": self._catalog_path(path),
+                        "compression": self.segment_compression,
+                    },
+                )
+                segment_id = cursor.lastrowid
+                cursor.executemany(
+                    "INSERT INTO archived_events (event_id, segment_id, sequence)"
+                    " VALUES (?, ?, ?)",
+                    [(row[EVENT_ID], segment_id, row[SEQUENCE]) for row in rows],
+                )
+                conn.commit()
+            except Exception as e:
+                # Includes outbox rows added for an old event in the meantime
+                # (foreign key violation): leave the events hot, drop the file
+                conn.rollback()
+                path.unlink(missing_ok=True)
+                logger.error(f"Error archiving events into {path}: {e}")
+                raise EventStoreError(f"Failed to archive events: {e}")
+            self._reclaim_space(conn)
+
+        logger.info(
+            "Archived %s event(s) (sequences %s-%s) into %s",
+            len(rows),
+            summary["first_sequence"],
+            summary["last_sequence"],
+            path,
+        )
+        return len(rows)
+
+    def get_segment_stats(self) -> dict[str, int]:
+        """
+        Get the number of segment files and the events archived in them
+
+        Returns:
+            Dictionary with "segments" and "archived_events"
+        """
+        segments = self._list_segments()
+        return {
+            "segments": len(segments),
+            "archived_events": sum(s["event_count"] for s in segments),
+        }
+
+    def _catalog_path(self, path: Path) -> str:
+        """Path as stored in the catalog: relative to the database directory if inside it."""
+        try:
+            return str(path.resolve().relative_to(self.db_path.parent.resolve()))
+        except ValueError:
+            return str(path.resolve())
+
+    def _reclaim_space(self, conn: sqlite3.Connection) -> None:
+        """
+        Hand pages freed by archival back to the file system and fold the WAL
+        into the database, so neither grows with the archived history.
+        incremental_vacuum is a no-op unless the database was created with
+        auto_vacuum = INCREMENTAL (scripts/init_database.py does).
+        """
+        try:
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not reclaim space after archival: {e}")
+
+    def _list_segments(self) -> list[sqlite3.Row]:
+        """Catalog rows of all segments, oldest first (empty without a catalog)."""
+        conn = self._get_connection()
+        try:
+            return conn.execute(
+                "SELECT * FROM event_segments ORDER BY first_sequence ASC"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+
+    def _segment_reader(self, segment: sqlite3.Row) -> SegmentReader:
+        """Shared reader for a catalogued segment (footers are read once per file)."""
+        with self._segment_readers_lock:
+            reader = self._segment_readers.get(segment["path"])
+            if reader is None:
+                path = Path(segment["path"])
+                if not path.is_absolute():
+                    path = self.db_path.parent / path
+                reader = self._segment_readers[segment["path"]] = SegmentReader(path)
+            return reader
+
+    @staticmethod
+    def _merge_lanes(
+        segments: Sequence[sqlite3.Row],
+        first: str,
+        last: str,
+        open_segment: Callable[[sqlite3.Row], Iterator[tuple]],
+        key: Callable[[tuple], object],
+    ) -> Iterator[tuple]:
+        """
+        Merge per-segment row streams lazily.
+
+        Segments whose catalog ranges (``first``..``last`` columns) do not
+        overlap are chained into one lane, and only the lanes are merged, so
+        heapq.merge opens one segment per lane at a time instead of all of
+        them up front. ``segments`` must be sorted by ``first``.
+        """
+        lanes: list[list[sqlite3.Row]] = []
+        for segment in segments:
+            for lane in lanes:
+                if lane[-1][last] <= segment[first]:
+                    lane.append(segment)
+                    break
+            else:
+                lanes.append([segment])
+        streams = [chain.from_iterable(map(open_segment, lane)) for lane in lanes]
+        return heapq.merge(*streams, key=key)
+
+    def _iter_archived_rows(
+        self, segments: list[sqlite3.Row], after_sequence: int = 0
+    ) -> Iterator[tuple]:
+        """Archived rows (sequence first) after ``after_sequence``, merged in sequence order."""
+        merged = self._merge_lanes(
+            segments,
+            "first_sequence",
+            "last_sequence",
+            lambda segment: self._segment_reader(segment).iter_rows(after_sequence),
+            itemgetter(SEQUENCE),
+        )
+        try:
+            yield from merged
+        except SegmentError as e:
+            logger.error(f"Error reading archived events: {e}")
+            raise EventStoreError(f"Failed to read archived events: {e}")
+
+    def _archived_rows_for_aggregate(
+        self, aggregate_id: str, from_version: int, below_version: int
+    ) -> list[tuple]:
+        """Archived rows (without sequence) of one aggregate in a version range, by version."""
+        rows = []
+        try:
+            for segment in self._list_segments():
+                for row in self._segment_reader(segment).rows_for_aggregate(aggregate_id):
+                    if from_version <= row[VERSION] < below_version:
+                        rows.append(row[1:])
+        except SegmentError as e:
+            logger.error(f"Error reading archived events of {aggregate_id}: {e}")
+            raise EventStoreError(f"Failed to read archived events: {e}")
+        rows.sort(key=itemgetter(VERSION - 1))
+        return rows
+
+    def _archived_rows_by_created_at(
+        self,
+        segments: list[sqlite3.Row],
+        event_type: str | None,
+        offset: int,
+        hot_first_created_at: str | None,
+    ) -> tuple[int, Iterator[tuple]]:
+        """
+        Archived rows (without sequence), optionally of one type, by created_at.
+
+        Uses the catalog's created_at range of each segment: a leading segment
+        that ends before every remaining segment and the first hot row fills
+        the first positions of the merged stream outright, so while ``offset``
+        covers it the segment is skipped without being read. The rest are
+        merged lazily and decompressed only when the merge reaches them.
+
+        Returns:
+            Number of rows skipped and the stream of the remaining rows
+        """
+        try:
+            if event_type:
+                counts = [
+                    self._segment_reader(s).footer.event_types.get(event_type, 0)
+                    for s in segments
+                ]
+            else:
+                counts = [s["event_count"] for s in segments]
+        except SegmentError as e:
+            logger.error(f"Error reading archived events: {e}")
+            raise EventStoreError(f"Failed to read archived events: {e}") from e
+        candidates = sorted(
+            (s["first_created_at"], s["first_sequence"], s["last_created_at"], count, s)
+            for s, count in zip(segments, counts, strict=True)
+            if count
+        )
+
+        skipped = 0
+        while candidates and skipped + candidates[0][3] <= offset:
+            # Candidates are sorted by first_created_at, so the next one starts
+            # no earlier than any other remaining segment
+            last_created_at = candidates[0][2]
+            if len(candidates) > 1 and last_created_at >= candidates[1][0]:
+                break
+            if hot_first_created_at is not None and last_created_at >= hot_first_created_at:
+                break
+            skipped += candidates.pop(0)[3]
+
+        return skipped, self._merge_lanes(
+            [c[4] for c in candidates],
+            "first_created_at",
+            "last_created_at",
+            lambda segment: self._segment_rows_by_created_at(segment, event_type),
+            itemgetter(CREATED_AT - 1),
+        )
+
+    def _segment_rows_by_created_at(
+        self, segment: sqlite3.Row, event_type: str | None
+    ) -> Iterator[tuple]:
+        """One segment's rows (without sequence), optionally of one type, by created_at."""
+        try:
+            rows = [
+                row[1:]
+                for row in self._segment_reader(segment).iter_rows()
+                if not event_type or row[EVENT_TYPE] == event_type
+            ]
+        except SegmentError as e:
+            logger.error(f"Error reading archived events: {e}")
+            raise EventStoreError(f"Failed to read archived events: {e}") from e
+        rows.sort(key=itemgetter(CREATED_AT - 1))
+        yield from rows
+
+    @staticmethod
+    def _merge_by_created_at(archived: Iterator[tuple], hot: list[sqlite3.Row]) -> Iterator[tuple]:
+        seen = set()
+        key = itemgetter(CREATED_AT - 1)
+        for row in heapq.merge(archived, (tuple(row) for row in hot), key=key):
+            if row[EVENT_ID - 1] not in seen:
+                seen.add(row[EVENT_ID - 1])
+                yield row
+
+    def _find_archived_rows(self, event_ids: set[str]) -> dict[str, tuple]:
+        """
+        Look up archived rows (sequence first) by event id.
+
+        The archived_events table gives each id's segment and sequence, and
+        the segment's sparse index the block holding it, so a lookup
+        decompresses only the blocks it needs and a miss reads none.
+        """
+        conn = self._get_connection()
+        ids = list(event_ids)
+        by_segment: dict[int, list[int]] = {}
+        try:
+            for start in range(0, len(ids), self.IN_QUERY_CHUNK_SIZE):
+                chunk = ids[start:start + self.IN_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                for segment_id, sequence in conn.execute(
+                    "SELECT segment_id, sequence FROM archived_events"
+                    f" WHERE event_id IN ({placeholders})",
+                    chunk,
+                ):
+                    by_segment.setdefault(segment_id, []).append(sequence)
+        except sqlite3.OperationalError:
+            return {}
+        if not by_segment:
+            return {}
+
+        segments = {s["segment_id"]: s for s in self._list_segments()}
+        found: dict[str, tuple] = {}
+        try:
+            for segment_id, wanted in by_segment.items():
+                for row in self._segment_reader(segments[segment_id]).rows_at(wanted):
+                    found[row[EVENT_ID]] = row
+        except SegmentError as e:
+            logger.error(f"Error reading archived events: {e}")
+            raise EventStoreError(f"Failed to read archived events: {e}") from e
+        return found
+
+    def _count_archived(self, aggregate_id: str | None, event_type: str | None) -> int:
+        """Count archived events, from the segment footers where possible."""
+        total = 0
+        try:
+            for segment in self._list_segments():
+                if not aggregate_id and not event_type:
+                    total += segment["event_count"]
+                    continue
+                reader = self._segment_reader(segment)
+                count = reader.footer.count(aggregate_id, event_type)
+                if count is None:
+                    count = sum(
+                        1
+                        for row in reader.rows_for_aggregate(aggregate_id)
+                        if row[EVENT_TYPE] == event_type
+                    )
+                total += count
+        except SegmentError as e:
+            logger.error(f"Error counting archived events: {e}")
+            raise EventStoreError(f"Failed to count archived events: {e}")
+        return total
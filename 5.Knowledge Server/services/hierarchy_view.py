@@ -0,0 +1,157 @@
+"""
+Materialized area/topic/subtopic hierarchy maintained from the event stream.
+
+list_hierarchy and list_areas used to aggregate every live Concept node in
+Neo4j and cache the result for five minutes. HierarchyView instead keeps the
+placement of each live concept and a counter per (area, topic, subtopic),
+loaded from a Neo4j placement scan and advanced from ConceptCreated /
+ConceptUpdated / ConceptDeleted events (see services/read_model.py).
+Placements are keyed by concept_id, so applying an event twice is harmless.
+"""
+
+from typing import Any
+
+from models.events import Event
+from services.read_model import EventFedReadModel
+
+
+# One row per live concept; the view aggregates the counters itself
+PLACEMENT_QUERY = """
+MATCH (c:Concept)
+WHERE (c.deleted IS NULL OR c.deleted = false)
+RETURN c.concept_id AS concept_id, c.area AS area, c.topic AS topic, c.subtopic AS subtopic
+"""
+
+_PLACEMENT_FIELDS = ("area", "topic", "subtopic")
+
+Placement = tuple[Any, Any, Any]
+
+
+class HierarchyView(EventFedReadModel):
+    """
+    In-memory concept counts per area/topic/subtopic.
+
+    Example:
+        ```python
+        view = HierarchyView()
+        if view.needs_rebuild:
+            sequence = event_store.get_projected_sequence()
+            view.load(neo4j.execute_read(PLACEMENT_QUERY), sequence)
+        view.catch_up(event_store)
+        records = view.get_records()  # [{"area", "topic", "subtopic", "count"}, ...]
+        ```
+    """
+
+    label = "Hierarchy view"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._placements: dict[str, Placement] = {}
+        self._counts: dict[Placement, int] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Changes whenever the counters change (for memoizing responses)."""
+        return self._version
+
+    @property
+    def total_concepts(self) -> int:
+        """Number of live concepts tracked by the view."""
+        return len(self._placements)
+
+    def _rebuild(self, records: list[dict[str, Any]]) -> None:
+        # records are rows of PLACEMENT_QUERY (concept_id, area, topic, subtopic)
+        self._placements = {}
+        self._counts = {}
+        for record in records:
+            concept_id = record.get("concept_id")
+            if concept_id:
+                self._place(concept_id, tuple(record.get(f) for f in _PLACEMENT_FIELDS))
+        self._version += 1
+
+    def _describe(self) -> str:
+        return f"{len(self._placements)} concepts in {len(self._counts)} subtopics"
+
+    def apply_event(self, event: Event) -> bool:
+        """
+        Adjust counters for one event.
+
+        Returns:
+            True if the event changed the counters
+        """
+        concept_id = event.aggregate_id
+        data = event.event_data or {}
+
+        with self._lock:
+            current = self._placements.get(concept_id)
+
+            if event.event_type == "ConceptCreated":
+                placement = tuple(data.get(f) for f in _PLACEMENT_FIELDS)
+            elif event.event_type == "ConceptUpdated":
+                if current is None or not any(f in data for f in _PLACEMENT_FIELDS):
+                    return False
+                placement = tuple(
+                    data[f] if f in data else value for f, value in zip(_PLACEMENT_FIELDS, current)
+                )
+            elif event.event_type == "ConceptDeleted":
+                if current is None:
+                    return False
+                self._unplace(concept_id)
+                self._version += 1
+                self.events_applied += 1
+                return True
+            else:
+                return False
+
+            if placement == current:
+                return False
+            if current is not None:
+                self._unplace(concept_id)
+            self._place(concept_id, placement)
+            self._version += 1
+            self.events_applied += 1
+            return True
+
+    def get_records(self) -> list[dict[str, Any]]:
+        """
+        Return counters in the shape of the Neo4j hierarchy aggregation.
+
+        Returns:
+            List of {"area", "topic", "subtopic", "count"} dicts
+        """
+        with self._lock:
+            return [
+                {"area": area, "topic": topic, "subtopic": subtopic, "count": count}
+                for (area, topic, subtopic), count in self._counts.items()
+            ]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get view size and maintenance counters."""
+        return {
+            "loaded": self._loaded,
+            "concepts": len(self._placements),
+            "subtopics": len(self._counts),
+            "last_sequence": self._last_sequence,
+            "rebuilds": self.rebuilds,
+            "events_applied": self.events_applied,
+        }
+
+    def _place(self, concept_id: str, placement: Placement) -> None:
+        previous = self._placements.get(concept_id)
+        if previous is not None:
+            self._decrement(previous)
+        self._placements[concept_id] = placement
+        self._counts[placement] = self._counts.get(placement, 0) + 1
+
+    def _unplace(self, concept_id: str) -> None:
+        placement = self._placements.pop(concept_id, None)
+        if placement is not None:
+            self._decrement(placement)
+
+    def _decrement(self, placement: Placement) -> None:
+        remaining = self._counts.get(placement, 0) - 1
+        if remaining > 0:
+            self._counts[placement] = remaining
+        else:
+            self._counts.pop(placement, None)
@@ -0,0 +1,275 @@
+"""
+In-process BM25 index over concept names and explanations.
+
+search_concepts_semantic only asked Chroma for nearest vectors, which misses
+concepts whose exact terms appear in the query but whose embeddings sit
+further away, and search_concepts_exact ran ``toLower(c.name) CONTAINS`` as a
+full label scan in Neo4j. LexicalIndex keeps two in-memory structures:
+
+    postings:  term ─> {concept_id: weighted term frequency}   (BM25)
+               name tokens count NAME_BOOST times, explanation tokens once
+    trigrams:  3-gram of the lowercased name ─> {concept_id}   (substring match)
+
+The index is an event-fed read model (services/read_model.py): loaded from
+a Neo4j scan and advanced from ConceptCreated/Updated/Deleted events.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from models.events import Event
+from services.read_model import EventFedReadModel
+
+
+# One row per live concept with the text and placement the index needs
+LEXICAL_QUERY = """
+MATCH (c:Concept)
+WHERE (c.deleted IS NULL OR c.deleted = false)
+RETURN c.concept_id AS concept_id, c.name AS name, c.explanation AS explanation,
+       c.area AS area, c.topic AS topic, c.subtopic AS subtopic
+"""
+
+# BM25 parameters and the name-field weight (BM25F-style repetition)
+BM25_K1 = 1.2
+BM25_B = 0.75
+NAME_BOOST = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "into",
+    "is", "it", "of", "on", "or", "that", "the", "this", "to", "was", "what", "when",
+    "where", "which", "who", "why", "with",
+})
+_INDEXED_FIELDS = ("name", "explanation", "area", "topic", "subtopic")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass
+class _Document:
+    name: str
+    explanation: str
+    area: Any
+    topic: Any
+    subtopic: Any
+    terms: Counter
+    length: int
+
+
+class LexicalIndex(EventFedReadModel):
+    """
+    Event-maintained BM25 and name-substring index over live concepts.
+
+    Example:
+        ```python
+        index = LexicalIndex()
+        if index.needs_rebuild:
+            sequence = event_store.get_projected_sequence()
+            index.load(neo4j.execute_read(LEXICAL_QUERY), sequence)
+        index.catch_up(event_store)
+        index.search("python list comprehension", limit=20, area="Programming")
+        index.name_matches("loop")  # concept ids whose name contains "loop"
+        ```
+    """
+
+    label = "Lexical index"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rebuild([])
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def total_concepts(self) -> int:
+        """Number of live concepts in the index."""
+        return len(self._docs)
+
+    def _rebuild(self, records: list[dict[str, Any]]) -> None:
+        # records are rows of LEXICAL_QUERY
+        self._docs: dict[str, _Document] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+        self._total_length = 0
+        for record in records:
+            if record.get("concept_id"):
+                self._upsert(record["concept_id"], record)
+
+    def _describe(self) -> str:
+        return f"{len(self._docs)} concepts, {len(self._postings)} terms"
+
+    def apply_event(self, event: Event) -> bool:
+        """
+        Update the index for one event (idempotent).
+
+        Returns:
+            True if the event changed the index
+        """
+        data = event.event_data or {}
+        with self._lock:
+            if event.event_type == "ConceptCreated":
+                changed = self._upsert(event.aggregate_id, data)
+            elif event.event_type == "ConceptUpdated":
+                doc = self._docs.get(event.aggregate_id)
+                if doc is None or not any(field in data for field in _INDEXED_FIELDS):
+                    return False
+                fields = {field: getattr(doc, field) for field in _INDEXED_FIELDS}
+                fields.update({field: data[field] for field in _INDEXED_FIELDS if field in data})
+                changed = self._upsert(event.aggregate_id, fields)
+            elif event.event_type == "ConceptDeleted":
+                changed = self._remove(event.aggregate_id)
+            else:
+                return False
+            if changed:
+                self.events_applied += 1
+            return changed
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _upsert(self, concept_id: str, fields: dict[str, Any]) -> bool:
+        name = fields.get("name") or ""
+        explanation = fields.get("explanation") or ""
+        existing = self._docs.get(concept_id)
+        if existing is not None and (
+            existing.name,
+            existing.explanation,
+            existing.area,
+            existing.topic,
+            existing.subtopic,
+        ) == (name, explanation, fields.get("area"), fields.get("topic"), fields.get("subtopic")):
+            return False
+        self._remove(concept_id)
+
+        terms = Counter(tokenize(explanation))
+        for token in tokenize(name):
+            terms[token] += NAME_BOOST
+        doc = _Document(
+            name=name,
+            explanation=explanation,
+            area=fields.get("area"),
+            topic=fields.get("topic"),
+            subtopic=fields.get("subtopic"),
+            terms=terms,
+            length=sum(terms.values()),
+        )
+        self._docs[concept_id] = doc
+        self._total_length += doc.length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[concept_id] = frequency
+        for trigram in _trigrams(name.lower()):
+            self._trigrams.setdefault(trigram, set()).add(concept_id)
+        return True
+
+    def _remove(self, concept_id: str) -> bool:
+        doc = self._docs.pop(concept_id, None)
+        if doc is None:
+            return False
+        self._total_length -= doc.length
+        for term in doc.terms:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(concept_id, None)
+                if not posting:
+                    del self._postings[term]
+        for trigram in _trigrams(doc.name.lower()):
+            holders = self._trigrams.get(trigram)
+            if holders is not None:
+                holders.discard(concept_id)
+                if not holders:
+                    del self._trigrams[trigram]
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        area: str | None = None,
+        topic: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank live concepts by BM25 against ``query``.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+            area: Only return concepts in this area
+            topic: Only return concepts in this topic
+
+        Returns:
+            (concept_id, score) pairs, best first
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._docs)
+            if not terms or not doc_count:
+                return []
+            avg_length = self._total_length / doc_count or 1.0
+
+            scores: dict[str, float] = {}
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1.0 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for concept_id, frequency in posting.items():
+                    doc = self._docs[concept_id]
+                    if (area and doc.area != area) or (topic and doc.topic != topic):
+                        continue
+                    norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc.length / avg_length)
+                    scores[concept_id] = scores.get(concept_id, 0.0) + idf * (
+                        frequency * (BM25_K1 + 1.0) / (frequency + norm)
+                    )
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+
+    def name_matches(self, substring: str, max_results: int = 1000) -> list[str] | None:
+        """
+        Concept ids whose lowercased name contains ``substring``.
+
+        Candidates come from intersecting name trigrams and are verified with
+        a plain substring test, so the result matches
+        ``toLower(c.name) CONTAINS toLower($name)``.
+
+        Returns:
+            Matching ids, or None when more than ``max_results`` concepts
+            match (the caller should let Neo4j filter instead)
+        """
+        needle = substring.lower()
+        with self._lock:
+            if len(needle) < 3:
+                candidates = self._docs.keys()
+            else:
+                postings = sorted(
+                    (self._trigrams.get(trigram, set()) for trigram in _trigrams(needle)),
+                    key=len,
+                )
+                candidates = set.intersection(*postings) if postings[0] else set()
+
+            matches = []
+            for concept_id in candidates:
+                if needle in self._docs[concept_id].name.lower():
+                    matches.append(concept_id)
+                    if len(matches) > max_results:
+                        return None
+        return sorted(matches)
@@ -48,6 +48,62 @@ class Neo4jConfig(BaseModel):
     )
 
 
+def serialize_neo4j_types(obj: Any) -> Any:
+    """
+    Recursively serialize Neo4j types to JSON-compatible format.
+
+    Handles:
+    - Temporal types: DateTime, Date, Time, Duration
+    - Spatial types: CartesianPoint, WGS84Point
+    - Graph types: Node, Relationship, Path
+    - Collections: dict, list, tuple
+
+    Raises:
+        TypeError: If unknown non-serializable type encountered
+    """
+    # Handle Neo4j temporal types
+    if isinstance(obj, (DateTime, Date, Time)):
+        return obj.iso_format()
+    elif isinstance(obj, Duration):
+        return {
+            "months": obj.months,
+            "days": obj.days,
+            "seconds": obj.seconds,
+            "nanoseconds": obj.nanoseconds,
+        }
+
+    # Handle Neo4j spatial types
+    elif isinstance(obj, (CartesianPoint, WGS84Point)):
+        return {"x": obj.x, "y": obj.y, "z": getattr(obj, "z", None), "srid": obj.srid}
+
+    # Handle Neo4j graph types
+    elif isinstance(obj, Node):
+        # Serialize node properties directly (maintain compatibility with dict(node) behavior)
+        return {k: serialize_neo4j_types(v) for k, v in dict(obj).items()}
+    elif isinstance(obj, Relationship):
+        # Serialize relationship properties directly (maintain compatibility with dict(relationship) behavior)
+        return {k: serialize_neo4j_types(v) for k, v in dict(obj).items()}
+    elif isinstance(obj, Path):
+        return {
+            "nodes": [serialize_neo4j_types(n) for n in obj.nodes],
+            "relationships": [serialize_neo4j_types(r) for r in obj.relationships],
+        }
+
+    # Recursively handle collections
+    elif isinstance(obj, dict):
+        return {k: serialize_neo4j_types(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [serialize_neo4j_types(item) for item in obj]
+
+    # Pass through JSON-safe primitives
+    elif isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+
+    # Strict: raise error for unknown types
+    else:
+        raise TypeError(f"Cannot serialize type {type(obj).__name__}: {obj}")
+
+
 class Neo4jService:
     """Service for managing Neo4j database connections and operations."""
 
@@ -252,59 +308,8 @@ class Neo4jService:
                 raise
 
     def _serialize_neo4j_types(self, obj: Any) -> Any:
-        """
-        Recursively serialize Neo4j types to JSON-compatible format.
-
-        Handles:
-        - Temporal types: DateTime, Date, Time, Duration
-        - Spatial types: CartesianPoint, WGS84Point
-        - Graph types: Node, Relationship, Path
-        - Collections: dict, list, tuple
-
-        Raises:
-            TypeError: If unknown non-serializable type encountered
-        """
-        # Handle Neo4j temporal types
-        if isinstance(obj, (DateTime, Date, Time)):
-            return obj.iso_format()
-        elif isinstance(obj, Duration):
-            return {
-                "months": obj.months,
-                "days": obj.days,
-                "seconds": obj.seconds,
-                "nanoseconds": obj.nanoseconds,
-            }
-
-        # Handle Neo4j spatial types
-        elif isinstance(obj, (CartesianPoint, WGS84Point)):
-            return {"x": obj.x, "y": obj.y, "z": getattr(obj, "z", None), "srid": obj.srid}
-
-        # Handle Neo4j graph types
-        elif isinstance(obj, Node):
-            # Serialize node properties directly (maintain compatibility with dict(node) behavior)
-            return {k: self._serialize_neo4j_types(v) for k, v in dict(obj).items()}
-        elif isinstance(obj, Relationship):
-            # Serialize relationship properties directly (maintain compatibility with dict(relationship) behavior)
-            return {k: self._serialize_neo4j_types(v) for k, v in dict(obj).items()}
-        elif isinstance(obj, Path):
-            return {
-                "nodes": [self._serialize_neo4j_types(n) for n in obj.nodes],
-                "relationships": [self._serialize_neo4j_types(r) for r in obj.relationships],
-            }
-
-        # Recursively handle collections
-        elif isinstance(obj, dict):
-            return {k: self._serialize_neo4j_types(v) for k, v in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [self._serialize_neo4j_types(item) for item in obj]
-
-        # Pass through JSON-safe primitives
-        elif isinstance(obj, (str, int, float, bool, type(None))):
-            return obj
-
-        # Strict: raise error for unknown types
-        else:
-            raise TypeError(f"Cannot serialize type {type(obj).__name__}: {obj}")
+        """Recursively serialize Neo4j types to JSON-compatible format."""
+        return serialize_neo4j_types(obj)
 
     def execute_read(
         self,
@@ -413,6 +418,47 @@ class Neo4jService:
             logger.error(f"Unexpected error in write query: {e}")
             raise
 
+    def execute_write_records(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a write query on Neo4j and return its result records.
+
+        Used by bulk (UNWIND) writes that report which input rows matched.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name
+
+        Returns:
+            List of result records as dictionaries
+        """
+        if not self.driver or not self._connected:
+            raise RuntimeError("Not connected to Neo4j. Call connect() first.")
+
+        parameters = parameters or {}
+
+        try:
+            with self.session(database=database) as session:
+                result = session.run(query, parameters)
+                return [self._serialize_neo4j_types(dict(record)) for record in result]
+        except TransientError as e:
+            logger.warning(f"Transient error in write query, retrying: {e}")
+            # Retry once for transient errors (the failed transaction was rolled back)
+            with self.session(database=database) as session:
+                result = session.run(query, parameters)
+                return [self._serialize_neo4j_types(dict(record)) for record in result]
+        except DatabaseError as e:
+            logger.error(f"Database error in write query: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in write query: {e}")
+            raise
+
     def __enter__(self):
         """Context manager entry - connect to Neo4j."""
         self.connect()
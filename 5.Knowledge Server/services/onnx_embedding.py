@@ -0,0 +1,209 @@
+"""
+Quantized ONNX sentence encoder for the ``onnx`` EmbeddingService backend.
+
+The sentence-transformers backend imports PyTorch (seconds of startup) and
+runs fp32 inference, which dominate both cold start and per-query latency on
+CPU-only nodes. scripts/export_onnx_model.py exports the transformer of the
+configured model once, quantizes its weights to int8 and writes:
+
+    <model_dir>/
+        model_quantized.onnx   int8 weights (dynamic quantization)
+        model.onnx             fp32 export the quantized model was built from
+        tokenizer.json         fast (Rust) tokenizer
+        onnx_config.json       pooling, max_seq_length, dimension, normalize
+
+OnnxSentenceEncoder runs the export with onnxruntime and the ``tokenizers``
+library only (no PyTorch, no transformers). It mirrors the part of
+``SentenceTransformer.encode`` that EmbeddingService calls, so the backend
+shares the single/batch generation paths, normalization and _shared_model
+reuse of the sentence-transformers backend.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+FP32_MODEL_FILE = "model.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+CONFIG_FILE = "onnx_config.json"
+
+POOLING_MODES = ("mean", "cls")
+
+
+def default_model_dir(base_dir: str | Path, model_name: str) -> Path:
+    """Directory the export script writes ``model_name`` to under ``base_dir``."""
+    return Path(base_dir) / model_name.replace("/", "__")
+
+
+class OnnxSentenceEncoder:
+    """
+    Sentence encoder backed by an exported ONNX transformer.
+
+    Example:
+        ```python
+        encoder = OnnxSentenceEncoder.load("data/onnx/all-MiniLM-L6-v2")
+        vectors = encoder.encode(["closures", "decorators"], normalize_embeddings=True)
+        vectors.shape  # (2, 384)
+        ```
+    """
+
+    def __init__(self, session: Any, tokenizer: Any, config: dict[str, Any]) -> None:
+        self._session = session
+        self._tokenizer = tokenizer
+        self._config = config
+        self._input_names = {node.name for node in session.get_inputs()}
+        self._pooling = config.get("pooling", "mean")
+        if self._pooling not in POOLING_MODES:
+            raise ValueError(f"Unsupported pooling mode '{self._pooling}'")
+
+        tokenizer.enable_truncation(max_length=self.max_seq_length)
+        tokenizer.enable_padding(
+            pad_id=config.get("pad_token_id", 0), pad_token=config.get("pad_token", "[PAD]")
+        )
+
+    @classmethod
+    def load(
+        cls, model_dir: str | Path, quantized: bool = True, intra_op_threads: int = 0
+    ) -> "OnnxSentenceEncoder":
+        """
+        Load an export written by scripts/export_onnx_model.py.
+
+        Args:
+            model_dir: Export directory
+            quantized: Load the int8 model (False loads the fp32 export)
+            intra_op_threads: onnxruntime intra-op threads (0 = one per core)
+
+        Raises:
+            FileNotFoundError: If the export is incomplete
+        """
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_dir = Path(model_dir)
+        model_path = model_dir / (QUANTIZED_MODEL_FILE if quantized else FP32_MODEL_FILE)
+        for path in (model_path, model_dir / TOKENIZER_FILE, model_dir / CONFIG_FILE):
+            if not path.exists():
+                raise FileNotFoundError(
+                    f"ONNX export incomplete, missing {path}. "
+                    "Run scripts/export_onnx_model.py first."
+                )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        tokenizer = Tokenizer.from_file(str(model_dir / TOKENIZER_FILE))
+        config = json.loads((model_dir / CONFIG_FILE).read_text())
+
+        logger.debug(f"ONNX encoder loaded: {model_path} ({config.get('dimension')} dims)")
+        return cls(session, tokenizer, config)
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension."""
+        return int(self._config["dimension"])
+
+    @property
+    def max_seq_length(self) -> int:
+        """Token limit; longer inputs are truncated."""
+        return int(self._config.get("max_seq_length", 256))
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+        **_: Any,
+    ) -> np.ndarray:
+        """
+        Embed one text or a list of texts.
+
+        Texts are encoded longest first so each batch pads to similar lengths,
+        and returned in input order.
+
+        Returns:
+            float32 array of shape (dimension,) for a string, else (len(sentences), dimension)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            embeddings[indices] = self._encode_batch([texts[i] for i in indices])
+
+        if (normalize_embeddings or self._config.get("normalize")) and len(texts):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.asarray([encoding.ids for encoding in encodings], dtype=np.int64)
+        attention_mask = np.asarray(
+            [encoding.attention_mask for encoding in encodings], dtype=np.int64
+        )
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.asarray(
+                [encoding.type_ids for encoding in encodings], dtype=np.int64
+            )
+
+        hidden = self._session.run(None, feeds)[0]
+        if self._pooling == "cls":
+            return hidden[:, 0]
+        mask = attention_mask[:, :, None].astype(np.float32)
+        return (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+
+def parity_report(reference: np.ndarray, candidate: np.ndarray, top_k: int = 5) -> dict[str, float]:
+    """
+    Compare candidate embeddings with reference embeddings of the same texts.
+
+    Args:
+        reference: (n, dim) embeddings from the fp32 model
+        candidate: (n, dim) embeddings from the quantized model
+        top_k: Neighbours compared per text for the ranking agreement
+
+    Returns:
+        min/mean cosine similarity between matching rows and the mean overlap
+        of each text's top_k nearest neighbours under both models
+    """
+    reference = reference / np.maximum(np.linalg.norm(reference, axis=1, keepdims=True), 1e-12)
+    candidate = candidate / np.maximum(np.linalg.norm(candidate, axis=1, keepdims=True), 1e-12)
+    cosine = (reference * candidate).sum(axis=1)
+
+    k = min(top_k, len(reference) - 1)
+    overlap = 1.0
+    if k > 0:
+        overlaps = []
+        reference_sim, candidate_sim = reference @ reference.T, candidate @ candidate.T
+        np.fill_diagonal(reference_sim, -np.inf)
+        np.fill_diagonal(candidate_sim, -np.inf)
+        for row in range(len(reference)):
+            expected = set(np.argsort(-reference_sim[row])[:k])
+            actual = set(np.argsort(-candidate_sim[row])[:k])
+            overlaps.append(len(expected & actual) / k)
+        overlap = float(np.mean(overlaps))
+
+    return {
+        "texts": len(reference),
+        "min_cosine": float(cosine.min()),
+        "mean_cosine": float(cosine.mean()),
+        "top_k": k,
+        "neighbour_overlap": overlap,
+    }
@@ -1,12 +1,29 @@
 """
 Outbox pattern implementation for reliable async event processing
+
+Rows move pending -> processing -> completed (or back to pending / failed).
+A claim takes a time-limited lease on its rows, identified by a lease id;
+rows whose lease expires (crashed or stalled worker) count as a failed
+attempt and become claimable again. Completing or failing a row with its
+lease id only succeeds while that lease is still the row's current one.
+Partial indexes cover only pending, failed and leased rows, and
+archive_completed() moves completed rows into zlib-compressed batches in
+outbox_history, so pending lookups cost O(backlog) rather than O(history).
+
+One connection is shared by the event loop and worker threads (drain,
+archiver, asyncio.to_thread writes), so every operation holds the outbox
+lock from its first statement through commit or rollback.
 """
 
+import functools
+import json
 import logging
 import sqlite3
 import uuid
+import zlib
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 import threading
 from typing import Any, Dict, List, Optional
@@ -14,6 +31,38 @@ from typing import Any, Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
+def _serialized(method):
+    """Run an Outbox method under the connection lock, transaction included."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._conn_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+# Idempotent DDL applied to existing outbox tables. The partial indexes only
+# hold rows a worker still has to look at; queries must repeat the literal
+# status (not a bound parameter) for SQLite to use them. The leading status
+# column makes them outrank idx_status(status, projection_name) without ANALYZE.
+OUTBOX_SCHEMA_UPGRADES = (
+    """CREATE INDEX IF NOT EXISTS idx_outbox_pending
+       ON outbox(status, created_at) WHERE status = 'pending'""",
+    """CREATE INDEX IF NOT EXISTS idx_outbox_failed
+       ON outbox(status, created_at) WHERE status = 'failed'""",
+    """CREATE INDEX IF NOT EXISTS idx_outbox_leased
+       ON outbox(status, lease_expires_at) WHERE status = 'processing'""",
+    """CREATE TABLE IF NOT EXISTS outbox_history (
+           batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+           archived_at DATETIME NOT NULL,
+           row_count INTEGER NOT NULL,
+           first_created_at DATETIME,
+           last_created_at DATETIME,
+           rows BLOB NOT NULL
+       )""",
+)
+
+
 @dataclass
 class OutboxItem:
     """Represents an item in the outbox queue"""
@@ -26,6 +75,8 @@ class OutboxItem:
     last_attempt: datetime | None
     error_message: str | None
     created_at: datetime
+    lease_expires_at: datetime | None = None
+    lease_id: str | None = None
 
 
 class OutboxError(Exception):
@@ -53,16 +104,55 @@ class Outbox:
     # Retry configuration
     MAX_ATTEMPTS = 3
 
-    def __init__(self, db_path: str = "./data/events.db"):
+    # How long a claim may hold its rows before they are handed out again
+    DEFAULT_LEASE_SECONDS = 300.0
+
+    # Appended to an UPDATE's WHERE clause when the caller passes its lease id
+    _HOLDS_LEASE_SQL = " AND status = 'processing' AND lease_id = ?"
+
+    # Parameters: last_attempt, error_message, MAX_ATTEMPTS, STATUS_FAILED,
+    # STATUS_PENDING, outbox_id
+    _MARK_FAILED_SQL = """UPDATE outbox
+                          SET attempts = attempts + 1,
+                              last_attempt = ?,
+                              error_message = ?,
+                              lease_expires_at = NULL,
+                              lease_id = NULL,
+                              status = CASE
+                                WHEN attempts + 1 >= ? THEN ?
+                                ELSE ?
+                              END
+                          WHERE outbox_id = ?"""
+
+    # Completed rows moved into one outbox_history batch
+    ARCHIVE_BATCH_SIZE = 5000
+
+    _OUTBOX_COLUMNS = (
+        "outbox_id", "event_id", "projection_name", "status", "attempts",
+        "last_attempt", "error_message", "created_at",
+    )
+
+    # Row layout produced by build_entries(); also used by EventStore.append_events
+    INSERT_SQL = """INSERT INTO outbox
+                    (outbox_id, event_id, projection_name, status, attempts, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)"""
+
+    def __init__(
+        self, db_path: str = "./data/events.db", lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ):
         """
         Initialize Outbox
 
         Args:
             db_path: Path to SQLite database file
+            lease_seconds: How long claimed rows stay reserved for their worker
         """
+        if lease_seconds <= 0:
+            raise ValueError(f"lease_seconds must be positive, got {lease_seconds}")
         self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
         self._conn: Optional[sqlite3.Connection] = None
-        self._conn_lock = threading.Lock()
+        self._conn_lock = threading.RLock()
         self._ensure_db_exists()
 
     def _ensure_db_exists(self):
@@ -106,15 +196,45 @@ class Outbox:
                 self._conn.execute("PRAGMA foreign_keys = ON")
                 # Enable WAL mode for better concurrent read/write performance
                 self._conn.execute("PRAGMA journal_mode = WAL")
+                self._ensure_schema(self._conn)
                 logger.debug("Outbox: Created persistent connection to %s", self.db_path)
             return self._conn
 
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Bring an existing outbox table up to date (lease columns, partial
+        indexes, history table). Databases without an outbox table are left
+        to scripts/init_database.py.
+        """
+        table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'outbox'"
+        ).fetchone()
+        if table is None:
+            return
+
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(outbox)")}
+            if "lease_expires_at" not in columns:
+                conn.execute("ALTER TABLE outbox ADD COLUMN lease_expires_at DATETIME")
+                logger.info("Outbox: added lease_expires_at column")
+            if "lease_id" not in columns:
+                conn.execute("ALTER TABLE outbox ADD COLUMN lease_id TEXT")
+                logger.info("Outbox: added lease_id column")
+            for statement in OUTBOX_SCHEMA_UPGRADES:
+                conn.execute(statement)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Failed to upgrade outbox schema: {e}")
+
+    @_serialized
     def close(self) -> None:
         """
         Close the persistent database connection.
 
         Should be called when shutting down the application to ensure
-        proper cleanup of database resources.
+        proper cleanup of database resources. Waits for an operation still
+        running on another thread (e.g. archive_completed() via asyncio.to_thread).
         """
         if self._conn is not None:
             try:
@@ -125,6 +245,7 @@ class Outbox:
             finally:
                 self._conn = None
 
+    @_serialized
     def add_to_outbox(self, event_id: str, projection_name: str) -> str:
         """
         Add event to outbox for async processing
@@ -143,21 +264,10 @@ class Outbox:
         cursor = conn.cursor()
 
         try:
-            outbox_id = str(uuid.uuid4())
+            entry = self.build_entries([event_id], [projection_name])[0]
+            outbox_id = entry[0]
 
-            cursor.execute(
-                """INSERT INTO outbox
-                   (outbox_id, event_id, projection_name, status, attempts, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    outbox_id,
-                    event_id,
-                    projection_name,
-                    self.STATUS_PENDING,
-                    0,
-                    datetime.now().isoformat(),
-                ),
-            )
+            cursor.execute(self.INSERT_SQL, entry)
 
             conn.commit()
             logger.info(f"Added event {event_id} to outbox for {projection_name}")
@@ -168,6 +278,31 @@ class Outbox:
             logger.error(f"Error adding to outbox: {e}")
             raise OutboxError(f"Failed to add to outbox: {e}")
 
+    def build_entries(
+        self, event_ids: list[str], projection_names: list[str]
+    ) -> list[tuple]:
+        """
+        Build pending outbox rows without writing them
+
+        Lets callers insert outbox rows in the same transaction as their
+        events (see EventStore.append_events).
+
+        Args:
+            event_ids: IDs of the events to process
+            projection_names: Projections each event should be sent to
+
+        Returns:
+            Rows matching INSERT_SQL, one per (event, projection), in
+            event order; the first element of each row is the outbox ID
+        """
+        created_at = datetime.now().isoformat()
+        return [
+            (str(uuid.uuid4()), event_id, projection_name, self.STATUS_PENDING, 0, created_at)
+            for event_id in event_ids
+            for projection_name in projection_names
+        ]
+
+    @_serialized
     def get_pending(
         self, projection_name: str | None = None, limit: int | None = None
     ) -> list[OutboxItem]:
@@ -193,8 +328,8 @@ class Outbox:
 
         try:
             query = """SELECT * FROM outbox
-                       WHERE status = ? AND attempts < ?"""
-            params = [self.STATUS_PENDING, self.MAX_ATTEMPTS]
+                       WHERE status = 'pending' AND attempts < ?"""
+            params: list[Any] = [self.MAX_ATTEMPTS]
 
             if projection_name:
                 query += " AND projection_name = ?"
@@ -223,57 +358,310 @@ class Outbox:
             logger.error(f"Unexpected error fetching pending items: {e}", exc_info=True)
             raise
 
-    def mark_processing(self, outbox_id: str) -> bool:
+    @_serialized
+    def claim_pending(
+        self, limit: int, projection_name: str | None = None
+    ) -> list[OutboxItem]:
         """
-        Mark outbox item as processing
+        Atomically claim up to ``limit`` pending items under a lease
+
+        Expired leases are released first (counting as a failed attempt), then
+        the oldest pending items are moved to processing by a single
+        ``UPDATE ... RETURNING``, so concurrent workers never claim the same
+        row. A claim that outlives ``lease_seconds`` may be handed to another
+        worker; projections must tolerate the resulting redelivery.
+
+        All rows of one claim share a lease id (OutboxItem.lease_id); pass it
+        to mark_processed_many()/mark_failed_many() so a worker whose lease
+        was taken over cannot overwrite the new holder's result.
+
+        Args:
+            limit: Maximum number of items to claim (must be > 0)
+            projection_name: Optional filter by projection name
+
+        Returns:
+            Claimed outbox items, oldest first, with status "processing"
+
+        Raises:
+            ValueError: If limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            claimed_at = datetime.now()
+            self._release_expired_leases(cursor, claimed_at)
+
+            subquery = """SELECT outbox_id FROM outbox
+                          WHERE status = 'pending' AND attempts < ?"""
+            params: list[Any] = [
+                claimed_at.isoformat(),
+                (claimed_at + timedelta(seconds=self.lease_seconds)).isoformat(),
+                uuid.uuid4().hex,
+                self.MAX_ATTEMPTS,
+            ]
+            if projection_name:
+                subquery += " AND projection_name = ?"
+                params.append(projection_name)
+            subquery += " ORDER BY created_at ASC, rowid ASC LIMIT ?"
+            params.append(limit)
+
+            cursor.execute(
+                f"""UPDATE outbox
+                    SET status = 'processing', last_attempt = ?, lease_expires_at = ?,
+                        lease_id = ?
+                    WHERE outbox_id IN ({subquery})
+                    RETURNING rowid AS claim_order, *""",
+                params,
+            )
+            rows = sorted(cursor.fetchall(), key=lambda row: (row["created_at"], row["claim_order"]))
+            conn.commit()
+            return [self._row_to_outbox_item(row) for row in rows]
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error claiming pending items: {e}")
+            raise OutboxError(f"Failed to claim pending items: {e}")
+
+    def _release_expired_leases(self, cursor: sqlite3.Cursor, now: datetime) -> int:
+        """
+        Return processing rows whose lease has run out to pending (or failed
+        once MAX_ATTEMPTS is reached). Rows left processing by a version
+        without leases have no expiry and are released too.
+
+        Must run inside the caller's write transaction.
+        """
+        cursor.execute(
+            """UPDATE outbox
+               SET attempts = attempts + 1,
+                   error_message = 'Lease expired before the item was processed',
+                   lease_expires_at = NULL,
+                   lease_id = NULL,
+                   status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END
+               WHERE status = 'processing'
+                 AND (lease_expires_at IS NULL OR lease_expires_at < ?)""",
+            (self.MAX_ATTEMPTS, now.isoformat()),
+        )
+        if cursor.rowcount > 0:
+            logger.warning(f"Released {cursor.rowcount} outbox item(s) with expired leases")
+        return cursor.rowcount
+
+    @_serialized
+    def mark_processed_many(self, outbox_ids: list[str], lease_id: str | None = None) -> int:
+        """
+        Mark several outbox items as completed in one transaction
+
+        Args:
+            outbox_ids: IDs of outbox items
+            lease_id: Lease id of the claim the items came from; items no
+                longer held under it are left alone
+
+        Returns:
+            Number of items updated
+        """
+        if not outbox_ids:
+            return 0
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        query = """UPDATE outbox SET status = ?, lease_expires_at = NULL, lease_id = NULL
+                   WHERE outbox_id = ?"""
+        if lease_id is not None:
+            query += self._HOLDS_LEASE_SQL
+
+        try:
+            cursor.executemany(
+                query,
+                [
+                    (self.STATUS_COMPLETED, outbox_id)
+                    + (() if lease_id is None else (lease_id,))
+                    for outbox_id in outbox_ids
+                ],
+            )
+            conn.commit()
+            self._warn_lost_leases(len(outbox_ids) - cursor.rowcount, "completed")
+            return cursor.rowcount
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error marking items as processed: {e}")
+            return 0
+
+    @_serialized
+    def mark_failed_many(
+        self, failures: list[tuple[str, str]], lease_id: str | None = None
+    ) -> int:
+        """
+        Record failures for several outbox items in one transaction
+
+        Same retry semantics as mark_failed(): items go back to pending until
+        MAX_ATTEMPTS is reached.
+
+        Args:
+            failures: (outbox_id, error_message) pairs
+            lease_id: Lease id of the claim the items came from; items no
+                longer held under it are left alone
+
+        Returns:
+            Number of items updated
+        """
+        if not failures:
+            return 0
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        query = self._MARK_FAILED_SQL
+        if lease_id is not None:
+            query += self._HOLDS_LEASE_SQL
+
+        try:
+            now = datetime.now().isoformat()
+            cursor.executemany(
+                query,
+                [
+                    (
+                        now,
+                        error_message,
+                        self.MAX_ATTEMPTS,
+                        self.STATUS_FAILED,
+                        self.STATUS_PENDING,
+                        outbox_id,
+                    )
+                    + (() if lease_id is None else (lease_id,))
+                    for outbox_id, error_message in failures
+                ],
+            )
+            conn.commit()
+            logger.warning(f"Marked {cursor.rowcount} outbox item(s) as failed")
+            self._warn_lost_leases(len(failures) - cursor.rowcount, "failed")
+            return cursor.rowcount
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error marking items as failed: {e}")
+            return 0
+
+    @_serialized
+    def get_backlog_stats(self) -> Dict[str, Any]:
+        """
+        Get size and age of the pending backlog
+
+        Returns:
+            Dictionary with "pending" (retryable pending items) and
+            "oldest_pending_age_seconds" (0.0 when the backlog is empty)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """SELECT COUNT(*) AS pending, MIN(created_at) AS oldest
+                   FROM outbox
+                   WHERE status = 'pending' AND attempts < ?""",
+                (self.MAX_ATTEMPTS,),
+            )
+            row = cursor.fetchone()
+            age = 0.0
+            if row["oldest"]:
+                age = (datetime.now() - datetime.fromisoformat(row["oldest"])).total_seconds()
+            return {"pending": row["pending"], "oldest_pending_age_seconds": max(age, 0.0)}
+
+        except Exception as e:
+            logger.error(f"Error getting backlog stats: {e}")
+            return {"pending": 0, "oldest_pending_age_seconds": 0.0}
+
+    @_serialized
+    def mark_processing(self, outbox_id: str) -> str | None:
+        """
+        Take a fresh lease on one outbox item and mark it as processing
+
+        Only a pending or failed item, or one whose lease has run out, can be
+        taken; an item under another live lease is left alone. If the item is
+        still processing when the new lease runs out, the next claim_pending()
+        returns it to pending as a failed attempt.
 
         Args:
             outbox_id: ID of outbox item
 
         Returns:
-            True if successful
+            The lease id to pass to mark_processed()/mark_failed(), or None if
+            the item is unknown, completed or leased by someone else
         """
         conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
+            now = datetime.now()
+            lease_id = uuid.uuid4().hex
             cursor.execute(
                 """UPDATE outbox
-                   SET status = ?, last_attempt = ?
-                   WHERE outbox_id = ?""",
-                (self.STATUS_PROCESSING, datetime.now().isoformat(), outbox_id),
+                   SET status = ?, last_attempt = ?, lease_expires_at = ?, lease_id = ?
+                   WHERE outbox_id = ?
+                     AND (status IN (?, ?)
+                          OR (status = ?
+                              AND (lease_expires_at IS NULL OR lease_expires_at < ?)))""",
+                (
+                    self.STATUS_PROCESSING,
+                    now.isoformat(),
+                    (now + timedelta(seconds=self.lease_seconds)).isoformat(),
+                    lease_id,
+                    outbox_id,
+                    self.STATUS_PENDING,
+                    self.STATUS_FAILED,
+                    self.STATUS_PROCESSING,
+                    now.isoformat(),
+                ),
             )
 
             conn.commit()
-            return True
+            if cursor.rowcount == 0:
+                logger.warning(f"Outbox item {outbox_id} is not available for processing")
+                return None
+            return lease_id
 
         except Exception as e:
             conn.rollback()
             logger.error(f"Error marking as processing: {e}")
-            return False
+            return None
 
-    def mark_processed(self, outbox_id: str) -> bool:
+    @_serialized
+    def mark_processed(self, outbox_id: str, lease_id: str | None = None) -> bool:
         """
         Mark outbox item as successfully processed
 
         Args:
             outbox_id: ID of outbox item
+            lease_id: Lease id from mark_processing()/claim_pending(); when
+                given, the item is only updated while that lease still holds it
 
         Returns:
-            True if successful
+            True if the item was updated
         """
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        query = """UPDATE outbox
+                   SET status = ?, lease_expires_at = NULL, lease_id = NULL
+                   WHERE outbox_id = ?"""
+        params: tuple = (self.STATUS_COMPLETED, outbox_id)
+        if lease_id is not None:
+            query += self._HOLDS_LEASE_SQL
+            params += (lease_id,)
+
         try:
-            cursor.execute(
-                """UPDATE outbox
-                   SET status = ?
-                   WHERE outbox_id = ?""",
-                (self.STATUS_COMPLETED, outbox_id),
-            )
+            cursor.execute(query, params)
 
             conn.commit()
+            if cursor.rowcount == 0:
+                if lease_id is not None:
+                    self._warn_lost_leases(1, "completed")
+                return False
             logger.info(f"Marked outbox item {outbox_id} as completed")
             return True
 
@@ -282,10 +670,12 @@ class Outbox:
             logger.error(f"Error marking as processed: {e}")
             return False
 
+    @_serialized
     def mark_failed(
         self,
         outbox_id: str,
-        error_message: str
+        error_message: str,
+        lease_id: str | None = None,
     ) -> bool:
         """
         Mark outbox item as failed
@@ -293,36 +683,37 @@ class Outbox:
         Args:
             outbox_id: ID of outbox item
             error_message: Error message describing the failure
+            lease_id: Lease id from mark_processing()/claim_pending(); when
+                given, the item is only updated while that lease still holds it
 
         Returns:
-            True if successful
+            True if the item was updated
         """
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        query = self._MARK_FAILED_SQL
+        params: tuple = (
+            datetime.now().isoformat(),
+            error_message,
+            self.MAX_ATTEMPTS,
+            self.STATUS_FAILED,
+            self.STATUS_PENDING,
+            outbox_id,
+        )
+        if lease_id is not None:
+            query += self._HOLDS_LEASE_SQL
+            params += (lease_id,)
+
         try:
             # Increment attempts
-            cursor.execute(
-                """UPDATE outbox
-                   SET attempts = attempts + 1,
-                       last_attempt = ?,
-                       error_message = ?,
-                       status = CASE
-                         WHEN attempts + 1 >= ? THEN ?
-                         ELSE ?
-                       END
-                   WHERE outbox_id = ?""",
-                (
-                    datetime.now().isoformat(),
-                    error_message,
-                    self.MAX_ATTEMPTS,
-                    self.STATUS_FAILED,
-                    self.STATUS_PENDING,
-                    outbox_id,
-                ),
-            )
+            cursor.execute(query, params)
 
             conn.commit()
+            if cursor.rowcount == 0:
+                if lease_id is not None:
+                    self._warn_lost_leases(1, "failed")
+                return False
             logger.warning(f"Marked outbox item {outbox_id} as failed: {error_message}")
             return True
 
@@ -331,6 +722,13 @@ class Outbox:
             logger.error(f"Error marking as failed: {e}")
             return False
 
+    def _warn_lost_leases(self, count: int, outcome: str) -> None:
+        if count > 0:
+            logger.warning(
+                f"{count} outbox item(s) not marked {outcome}: lease expired or taken over"
+            )
+
+    @_serialized
     def increment_attempts(self, outbox_id: str) -> bool:
         """
         Increment attempt counter for outbox item
@@ -361,6 +759,7 @@ class Outbox:
             logger.error(f"Error incrementing attempts: {e}")
             return False
 
+    @_serialized
     def get_failed_items(
         self,
         projection_name: Optional[str] = None
@@ -378,8 +777,8 @@ class Outbox:
         cursor = conn.cursor()
 
         try:
-            query = "SELECT * FROM outbox WHERE status = ?"
-            params = [self.STATUS_FAILED]
+            query = "SELECT * FROM outbox WHERE status = 'failed'"
+            params: list[Any] = []
 
             if projection_name:
                 query += " AND projection_name = ?"
@@ -396,6 +795,7 @@ class Outbox:
             logger.error(f"Error fetching failed items: {e}")
             return []
 
+    @_serialized
     def retry_failed(self, outbox_id: str) -> bool:
         """
         Reset a failed item to pending for retry
@@ -428,6 +828,7 @@ class Outbox:
             logger.error(f"Error retrying failed item: {e}")
             return False
 
+    @_serialized
     def count_by_status(self, projection_name: Optional[str] = None) -> Dict[str, int]:
         """
         Count outbox items by status
@@ -460,7 +861,111 @@ class Outbox:
             logger.error(f"Error counting by status: {e}")
             return {}
 
-    def _row_to_outbox_item(self, row: sqlite3.Row) -> OutboxItem:
+    @_serialized
+    def archive_completed(
+        self, older_than_seconds: float = 0.0, batch_size: int = ARCHIVE_BATCH_SIZE
+    ) -> int:
+        """
+        Move completed items into outbox_history
+
+        Completed rows are only kept for auditing but would otherwise grow the
+        outbox table (and every index over it) without bound. Each batch of
+        up to ``batch_size`` rows becomes one zlib-compressed JSON blob in
+        outbox_history and is deleted from outbox in the same transaction.
+
+        Args:
+            older_than_seconds: Only archive items completed at least this long ago
+            batch_size: Maximum rows per history batch (must be > 0)
+
+        Returns:
+            Number of items archived
+
+        Raises:
+            ValueError: If batch_size is not positive
+            OutboxError: If a batch cannot be archived
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        cutoff = (datetime.now() - timedelta(seconds=older_than_seconds)).isoformat()
+        columns = ", ".join(self._OUTBOX_COLUMNS)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        archived = 0
+
+        try:
+            while True:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(
+                    f"""SELECT rowid, {columns} FROM outbox
+                        WHERE status = 'completed'
+                          AND COALESCE(last_attempt, created_at) <= ?
+                        ORDER BY created_at ASC, rowid ASC
+                        LIMIT ?""",
+                    (cutoff, batch_size),
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    conn.commit()
+                    break
+
+                values = [tuple(row)[1:] for row in rows]
+                blob = zlib.compress(json.dumps(values, separators=(",", ":")).encode())
+                cursor.execute(
+                    """INSERT INTO outbox_history
+                       (archived_at, row_count, first_created_at, last_created_at, rows)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (
+                        datetime.now().isoformat(),
+                        len(rows),
+                        rows[0]["created_at"],
+                        rows[-1]["created_at"],
+                        blob,
+                    ),
+                )
+                cursor.executemany(
+                    "DELETE FROM outbox WHERE rowid = ?", [(row["rowid"],) for row in rows]
+                )
+                conn.commit()
+                archived += len(rows)
+                if len(rows) < batch_size:
+                    break
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error archiving completed items: {e}")
+            raise OutboxError(f"Failed to archive completed items: {e}")
+
+        if archived:
+            logger.info(f"Archived {archived} completed outbox item(s)")
+        return archived
+
+    def iter_history(self) -> Iterator[OutboxItem]:
+        """
+        Iterate over archived items, oldest batch first
+
+        Yields:
+            OutboxItem for every row moved by archive_completed()
+        """
+        # One batch per locked read, so the lock is never held across a yield
+        batch_id = 0
+        while True:
+            with self._conn_lock:
+                row = self._get_connection().execute(
+                    "SELECT batch_id, rows FROM outbox_history WHERE batch_id > ? "
+                    "ORDER BY batch_id ASC LIMIT 1",
+                    (batch_id,),
+                ).fetchone()
+            if row is None:
+                return
+            batch_id, blob = row
+            for values in json.loads(zlib.decompress(blob)):
+                row = dict(zip(self._OUTBOX_COLUMNS, values, strict=True))
+                row["lease_expires_at"] = None
+                row["lease_id"] = None
+                yield self._row_to_outbox_item(row)
+
+    def _row_to_outbox_item(self, row: sqlite3.Row | dict[str, Any]) -> OutboxItem:
         """Convert database row to OutboxItem"""
         return OutboxItem(
             outbox_id=row["outbox_id"],
@@ -473,4 +978,10 @@ class Outbox:
             ),
             error_message=row["error_message"],
             created_at=datetime.fromisoformat(row["created_at"]),
+            lease_expires_at=(
+                datetime.fromisoformat(row["lease_expires_at"])
+                if row["lease_expires_at"]
+                else None
+            ),
+            lease_id=row["lease_id"],
         )
@@ -0,0 +1,311 @@
+"""
+Batched outbox drain worker.
+
+Replaces the one-entry-at-a-time loop in
+DualStorageRepository.process_pending_outbox for background draining:
+
+    claim N rows (one transaction) → load events (one query)
+        → group by projection → project_events() per lane
+        → mark processed / failed (one transaction each)
+
+Each projection is a lane. Lanes run concurrently, and inside a lane at most
+``max_in_flight`` sub-batches are projected at the same time. Events that
+touch the same concept (directly or through a relationship) always land in
+the same sub-batch, so their relative order is preserved.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from models.events import Event
+from projections.base_projection import BaseProjection
+from services.event_store import EventStore
+from services.outbox import Outbox, OutboxItem
+from services.tracing import traced
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LaneStats:
+    """Counters for a single projection lane."""
+
+    processed: int = 0
+    failed: int = 0
+    sub_batches: int = 0
+    busy_seconds: float = 0.0
+
+
+@dataclass
+class OutboxWorkerStats:
+    """Cumulative worker counters used to derive throughput metrics."""
+
+    batches: int = 0
+    claimed: int = 0
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    last_batch_size: int = 0
+    last_batch_seconds: float = 0.0
+    lanes: dict[str, LaneStats] = field(default_factory=dict)
+
+
+class OutboxWorker:
+    """
+    Drain the outbox in batches with concurrent per-projection lanes.
+
+    Example:
+        ```python
+        worker = OutboxWorker(
+            outbox=outbox,
+            event_store=event_store,
+            projections={"neo4j": neo4j_projection, "chromadb": chromadb_projection},
+        )
+        stats = await worker.drain_once()
+        metrics = worker.get_metrics()
+        ```
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        event_store: EventStore,
+        projections: dict[str, BaseProjection],
+        batch_size: int = 200,
+        sub_batch_size: int = 100,
+        max_in_flight: int = 2,
+    ) -> None:
+        """
+        Initialize OutboxWorker.
+
+        Args:
+            outbox: Outbox to drain
+            event_store: Event store holding the referenced events
+            projections: Projection per outbox projection_name
+            batch_size: Rows claimed per drain cycle
+            sub_batch_size: Events per project_events() call
+            max_in_flight: Concurrent project_events() calls per lane
+        """
+        if batch_size <= 0 or sub_batch_size <= 0 or max_in_flight <= 0:
+            raise ValueError("batch_size, sub_batch_size and max_in_flight must be positive")
+
+        self.outbox = outbox
+        self.event_store = event_store
+        self.projections = projections
+        self.batch_size = batch_size
+        self.sub_batch_size = sub_batch_size
+        self.max_in_flight = max_in_flight
+        self._stats = OutboxWorkerStats(lanes={name: LaneStats() for name in projections})
+
+    @traced("outbox.drain")
+    async def drain_once(self) -> dict[str, int]:
+        """
+        Claim and process one batch of pending outbox rows.
+
+        Returns:
+            Dictionary with counts: {'processed', 'failed', 'total'}
+        """
+        started = time.perf_counter()
+        items = self.outbox.claim_pending(self.batch_size)
+        if not items:
+            return {"processed": 0, "failed": 0, "total": 0}
+        # One claim, one lease: results only land while this worker still holds it
+        lease_id = items[0].lease_id
+
+        failures: list[tuple[str, str]] = []
+        try:
+            events = self.event_store.get_events_by_ids([item.event_id for item in items])
+        except Exception as e:
+            logger.error(f"Failed to load events for outbox batch: {e}", exc_info=True)
+            events = {}
+            failures = [(item.outbox_id, f"Failed to load event: {e}") for item in items]
+            items = []
+
+        lanes: dict[str, list[tuple[OutboxItem, Event]]] = {}
+        for item in items:
+            event = events.get(item.event_id)
+            if event is None:
+                logger.error(f"Event {item.event_id} not found for outbox entry {item.outbox_id}")
+                failures.append((item.outbox_id, "Event not found in event store"))
+            elif item.projection_name not in self.projections:
+                failures.append((item.outbox_id, f"Unknown projection {item.projection_name}"))
+            else:
+                lanes.setdefault(item.projection_name, []).append((item, event))
+
+        lane_results = await asyncio.gather(
+            *(self._run_lane(name, entries) for name, entries in lanes.items())
+        )
+
+        processed_ids: list[str] = []
+        for succeeded, lane_failures in lane_results:
+            processed_ids.extend(succeeded)
+            failures.extend(lane_failures)
+
+        self.outbox.mark_processed_many(processed_ids, lease_id=lease_id)
+        self.outbox.mark_failed_many(failures, lease_id=lease_id)
+
+        elapsed = time.perf_counter() - started
+        total = len(processed_ids) + len(failures)
+        self._stats.batches += 1
+        self._stats.claimed += total
+        self._stats.processed += len(processed_ids)
+        self._stats.failed += len(failures)
+        self._stats.busy_seconds += elapsed
+        self._stats.last_batch_size = total
+        self._stats.last_batch_seconds = elapsed
+
+        logger.info(
+            f"Outbox batch drained: {len(processed_ids)} processed, {len(failures)} failed "
+            f"in {elapsed * 1000:.1f}ms"
+        )
+        return {"processed": len(processed_ids), "failed": len(failures), "total": total}
+
+    async def drain(self, max_batches: int | None = None) -> dict[str, int]:
+        """
+        Drain batches until the outbox is empty (or ``max_batches`` is reached).
+
+        Returns:
+            Summed counts over all drained batches
+        """
+        totals = {"processed": 0, "failed": 0, "total": 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            stats = await self.drain_once()
+            if not stats["total"]:
+                break
+            for key in totals:
+                totals[key] += stats[key]
+            batches += 1
+        return totals
+
+    async def _run_lane(
+        self, name: str, entries: list[tuple[OutboxItem, Event]]
+    ) -> tuple[list[str], list[tuple[str, str]]]:
+        """Project one lane's entries with at most ``max_in_flight`` concurrent sub-batches."""
+        projection = self.projections[name]
+        lane_stats = self._stats.lanes.setdefault(name, LaneStats())
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async def apply(sub_batch: list[tuple[OutboxItem, Event]]) -> list[bool | str]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    outcome: list[bool | str] = list(
+                        await asyncio.to_thread(
+                            projection.project_events, [event for _, event in sub_batch]
+                        )
+                    )
+                    if len(outcome) != len(sub_batch):
+                        raise ValueError(
+                            f"project_events returned {len(outcome)} results "
+                            f"for {len(sub_batch)} events"
+                        )
+                except Exception as e:
+                    logger.error(f"{name} lane projection error: {e}", exc_info=True)
+                    outcome = [f"Projection error: {e}"] * len(sub_batch)
+                lane_stats.sub_batches += 1
+                lane_stats.busy_seconds += time.perf_counter() - started
+                return outcome
+
+        sub_batches = self._partition(entries)
+        outcomes = await asyncio.gather(*(apply(sub_batch) for sub_batch in sub_batches))
+
+        succeeded: list[str] = []
+        failures: list[tuple[str, str]] = []
+        for sub_batch, outcome in zip(sub_batches, outcomes, strict=True):
+            for (item, _), result in zip(sub_batch, outcome, strict=True):
+                if result is True:
+                    succeeded.append(item.outbox_id)
+                else:
+                    failures.append(
+                        (item.outbox_id, result if isinstance(result, str) else "Projection failed")
+                    )
+
+        lane_stats.processed += len(succeeded)
+        lane_stats.failed += len(failures)
+        return succeeded, failures
+
+    def _partition(
+        self, entries: list[tuple[OutboxItem, Event]]
+    ) -> list[list[tuple[OutboxItem, Event]]]:
+        """
+        Split a lane into independent sub-batches.
+
+        Entries touching a common concept are kept together (union-find over
+        aggregate and relationship endpoint ids) in their original order;
+        groups are then packed into sub-batches of about ``sub_batch_size``.
+        """
+        parent: dict[str, str] = {}
+
+        def find(key: str) -> str:
+            while parent.setdefault(key, key) != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        entry_keys = []
+        for _, event in entries:
+            keys = [event.aggregate_id]
+            for field_name in ("from_concept_id", "to_concept_id"):
+                concept_id = event.event_data.get(field_name)
+                if concept_id:
+                    keys.append(concept_id)
+            for key in keys[1:]:
+                parent[find(key)] = find(keys[0])
+            entry_keys.append(keys[0])
+
+        groups: dict[str, list[tuple[OutboxItem, Event]]] = {}
+        for entry, key in zip(entries, entry_keys, strict=True):
+            groups.setdefault(find(key), []).append(entry)
+
+        sub_batches: list[list[tuple[OutboxItem, Event]]] = []
+        current: list[tuple[OutboxItem, Event]] = []
+        for group in groups.values():
+            if current and len(current) + len(group) > self.sub_batch_size:
+                sub_batches.append(current)
+                current = []
+            current.extend(group)
+        if current:
+            sub_batches.append(current)
+        return sub_batches
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get throughput and backlog metrics.
+
+        Returns:
+            Dictionary with cumulative counters, events/second while busy,
+            per-lane counters and the current backlog size/age
+        """
+        stats = self._stats
+        backlog = self.outbox.get_backlog_stats()
+        return {
+            "batches": stats.batches,
+            "claimed": stats.claimed,
+            "processed": stats.processed,
+            "failed": stats.failed,
+            "throughput_per_second": (
+                round(stats.claimed / stats.busy_seconds, 2) if stats.busy_seconds else 0.0
+            ),
+            "last_batch_size": stats.last_batch_size,
+            "last_batch_ms": round(stats.last_batch_seconds * 1000, 2),
+            "lanes": {
+                name: {
+                    "processed": lane.processed,
+                    "failed": lane.failed,
+                    "sub_batches": lane.sub_batches,
+                    "throughput_per_second": (
+                        round((lane.processed + lane.failed) / lane.busy_seconds, 2)
+                        if lane.busy_seconds
+                        else 0.0
+                    ),
+                }
+                for name, lane in stats.lanes.items()
+            },
+            "backlog_pending": backlog["pending"],
+            "backlog_oldest_age_seconds": round(backlog["oldest_pending_age_seconds"], 3),
+        }
@@ -0,0 +1,131 @@
+"""
+Shared lifecycle of the in-process read models fed by the event log.
+
+HierarchyView, RelationshipGraph and LexicalIndex each keep a projection of
+Neo4j in memory and keep it fresh the same way:
+
+    cold start:  Neo4j scan ─> load(records, sequence)
+    every read:  event_store.iter_events_after(last_sequence) ─> apply_event()
+
+``sequence`` is read from the event store *before* the scan and stops short of
+the oldest event Neo4j has not projected yet (EventStore.get_projected_sequence),
+so events that race with the scan or still wait in the outbox are replayed by
+the next catch_up(). Subclasses make apply_event() idempotent, which makes that
+replay harmless. mark_stale() (after a failed consistency check, and
+periodically from the server) forces a rescan on the next read.
+
+A subclass implements:
+
+    _rebuild(records)   reset its structures and fill them from a scan
+    apply_event(event)  fold one event in, returning True if anything changed
+    _describe()         size summary for the "loaded" log line
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any
+
+from models.events import Event
+from services.event_store import EventStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class EventFedReadModel(ABC):
+    """
+    Base class for read models loaded from Neo4j and advanced from the event log.
+
+    Example:
+        ```python
+        if model.needs_rebuild:
+            sequence = event_store.get_projected_sequence()
+            model.load(neo4j.execute_read(QUERY), sequence)
+        model.catch_up(event_store)
+        ```
+    """
+
+    # Name used in log messages
+    label = "Read model"
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._last_sequence = 0
+        self._loaded = False
+        self.rebuilds = 0
+        self.events_applied = 0
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """True before the first load and after mark_stale()."""
+        return not self._loaded
+
+    @property
+    def last_sequence(self) -> int:
+        """Event store sequence the model has caught up to."""
+        return self._last_sequence
+
+    def mark_stale(self) -> None:
+        """Force a Neo4j rescan before the model is used again."""
+        with self._lock:
+            self._loaded = False
+        logger.info(f"{self.label} marked stale; Neo4j will be rescanned on next read")
+
+    def load(self, records: Any, sequence: int) -> None:
+        """
+        Replace the model with a Neo4j scan.
+
+        Args:
+            records: Rows of the subclass's scan query
+            sequence: Projected event store sequence read *before* the scan;
+                events after it are applied by the next catch_up()
+        """
+        with self._lock:
+            self._rebuild(records)
+            self._last_sequence = sequence
+            self._loaded = True
+            self.rebuilds += 1
+            description = self._describe()
+
+        logger.info(f"{self.label} loaded: {description} (sequence {sequence})")
+
+    def catch_up(self, event_store: EventStore) -> int:
+        """
+        Apply events appended since the last call.
+
+        Returns:
+            Number of events read from the event store
+        """
+        read = 0
+        with self._lock:
+            for sequence, event in event_store.iter_events_after(self._last_sequence):
+                self.apply_event(event)
+                self._last_sequence = sequence
+                read += 1
+        return read
+
+    # ------------------------------------------------------------------
+    # Subclass hooks
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def apply_event(self, event: Event) -> bool:
+        """
+        Update the model for one event (idempotent).
+
+        Returns:
+            True if the event changed the model
+        """
+
+    @abstractmethod
+    def _rebuild(self, records: Any) -> None:
+        """Reset all structures and fill them from a scan (called under the lock)."""
+
+    @abstractmethod
+    def _describe(self) -> str:
+        """Size summary for the log line written after a load."""
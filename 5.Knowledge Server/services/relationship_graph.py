@@ -0,0 +1,487 @@
+"""
+In-process adjacency index for relationship traversal tools.
+
+get_related_concepts, get_prerequisites and get_concept_chain used to run
+variable-length Cypher patterns (``-[r*1..N]-``, ``shortestPath``) for every
+call. RelationshipGraph keeps the concept graph in compact arrays instead:
+
+    concept ids ──intern──> node index (0..N-1), names, live flags
+    edge slots:  src[], dst[], type[], strength[], alive[]
+    CSR:         out_offsets[N+1] / out_slots[E]   (edges by source)
+                 in_offsets[N+1]  / in_slots[E]    (edges by target)
+
+Edges added since the last compaction sit in a small per-node delta list and
+deleted edges are tombstoned; both are folded into fresh CSR arrays once the
+delta grows past a fraction of the indexed edges.
+
+The index is an event-fed read model (services/read_model.py): loaded from
+Neo4j and advanced from ConceptCreated/Updated/Deleted and
+RelationshipCreated/Deleted events. Soft-deleted concepts keep their edges,
+matching the Neo4j projection: they can be traversed through but are never
+returned.
+"""
+
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from models.events import Event
+from services.event_store import EventStore
+from services.read_model import EventFedReadModel
+
+
+CONCEPTS_QUERY = """
+MATCH (c:Concept)
+RETURN c.concept_id AS concept_id, c.name AS name,
+       coalesce(c.deleted, false) AS deleted
+"""
+
+RELATIONSHIPS_QUERY = """
+MATCH (a:Concept)-[r]->(b:Concept)
+RETURN r.relationship_id AS relationship_id,
+       a.concept_id AS source_id,
+       b.concept_id AS target_id,
+       type(r) AS relationship_type,
+       coalesce(r.strength, 1.0) AS strength
+"""
+
+# Compact once the delta exceeds this many edges or this fraction of the index
+_MIN_COMPACT_EDGES = 256
+_COMPACT_FRACTION = 0.25
+
+
+class RelationshipGraph(EventFedReadModel):
+    """
+    Compact, event-maintained adjacency index over concepts.
+
+    Example:
+        ```python
+        graph = RelationshipGraph()
+        graph.load(concept_rows, relationship_rows, sequence)
+        graph.catch_up(event_store)
+        graph.related("concept-001", direction="both", max_depth=2)
+        graph.prerequisites("concept-010", max_depth=5)
+        graph.shortest_path("concept-001", "concept-010")
+        ```
+    """
+
+    label = "Relationship graph"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.compactions = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        # Nodes
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self._names: list[str | None] = []
+        self._live = bytearray()
+
+        # Relationship types interned to small codes
+        self._type_names: list[str] = []
+        self._type_codes: dict[str, int] = {}
+
+        # Edge slots
+        self._edge_src = array("i")
+        self._edge_dst = array("i")
+        self._edge_type = array("B")
+        self._edge_strength = array("f")
+        self._edge_alive = bytearray()
+        self._slot_by_rel: dict[str, int] = {}
+        self._dead_edges = 0
+
+        # CSR over slots [0, _indexed_edges); later slots live in the delta lists
+        self._indexed_edges = 0
+        self._out_offsets = array("i", [0])
+        self._out_slots = array("i")
+        self._in_offsets = array("i", [0])
+        self._in_slots = array("i")
+        self._delta_out: dict[int, list[int]] = {}
+        self._delta_in: dict[int, list[int]] = {}
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        concepts: list[dict[str, Any]],
+        relationships: list[dict[str, Any]],
+        sequence: int,
+    ) -> None:
+        """
+        Replace the index with a Neo4j scan.
+
+        Args:
+            concepts: Rows of CONCEPTS_QUERY (concept_id, name, deleted)
+            relationships: Rows of RELATIONSHIPS_QUERY
+            sequence: Event store sequence read *before* the scan
+        """
+        super().load((concepts, relationships), sequence)
+
+    def _rebuild(self, records: tuple[list[dict[str, Any]], list[dict[str, Any]]]) -> None:
+        concepts, relationships = records
+        self._reset()
+        for row in concepts:
+            if row.get("concept_id"):
+                self._upsert_node(row["concept_id"], row.get("name"), not row.get("deleted"))
+        for row in relationships:
+            self._add_edge(
+                row.get("relationship_id"),
+                row.get("source_id"),
+                row.get("target_id"),
+                row.get("relationship_type") or "RELATES_TO",
+                row.get("strength"),
+            )
+        self._compact()
+
+    def _describe(self) -> str:
+        return f"{len(self._ids)} concepts, {self._indexed_edges} relationships"
+
+    def catch_up(self, event_store: EventStore) -> int:
+        """Apply events appended since the last call, then compact if the delta grew."""
+        with self._lock:
+            read = super().catch_up(event_store)
+            self._maybe_compact()
+        return read
+
+    def apply_event(self, event: Event) -> bool:
+        """
+        Update the index for one event (idempotent).
+
+        Returns:
+            True if the event changed the index
+        """
+        data = event.event_data or {}
+        with self._lock:
+            if event.event_type == "ConceptCreated":
+                changed = self._upsert_node(event.aggregate_id, data.get("name"), True)
+            elif event.event_type == "ConceptUpdated":
+                node = self._index.get(event.aggregate_id)
+                if node is None or "name" not in data or self._names[node] == data["name"]:
+                    return False
+                self._names[node] = data["name"]
+                changed = True
+            elif event.event_type == "ConceptDeleted":
+                node = self._index.get(event.aggregate_id)
+                if node is None or not self._live[node]:
+                    return False
+                self._live[node] = 0
+                changed = True
+            elif event.event_type == "RelationshipCreated":
+                changed = self._add_edge(
+                    event.aggregate_id,
+                    data.get("from_concept_id"),
+                    data.get("to_concept_id"),
+                    data.get("relationship_type") or "RELATES_TO",
+                    data.get("strength"),
+                )
+            elif event.event_type == "RelationshipDeleted":
+                changed = self._remove_edge(event.aggregate_id)
+            else:
+                return False
+
+            if changed:
+                self.events_applied += 1
+            return changed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size and maintenance counters."""
+        return {
+            "loaded": self._loaded,
+            "concepts": len(self._ids),
+            "relationships": len(self._slot_by_rel),
+            "indexed_edges": self._indexed_edges,
+            "delta_edges": len(self._edge_src) - self._indexed_edges,
+            "dead_edges": self._dead_edges,
+            "last_sequence": self._last_sequence,
+            "rebuilds": self.rebuilds,
+            "compactions": self.compactions,
+            "events_applied": self.events_applied,
+        }
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_concept(self, concept_id: str) -> dict[str, Any] | None:
+        """Return {"concept_id", "name"} for a live concept, else None."""
+        node = self._index.get(concept_id)
+        if node is None or not self._live[node]:
+            return None
+        return {"concept_id": concept_id, "name": self._names[node]}
+
+    def related(
+        self,
+        concept_id: str,
+        relationship_type: str | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        Breadth-first traversal from a concept.
+
+        Each reachable live concept is reported once, at its shortest distance,
+        with the type and strength of the first relationship on that path.
+
+        Args:
+            concept_id: Starting concept
+            relationship_type: Optional Neo4j type (e.g. "PREREQUISITE") every hop must have
+            direction: "outgoing", "incoming" or "both"
+            max_depth: Maximum hops
+            limit: Maximum rows returned
+
+        Returns:
+            Rows with concept_id, name, relationship_type, strength, distance,
+            ordered by distance then name
+        """
+        with self._lock:
+            start = self._index.get(concept_id)
+            if start is None or not self._live[start]:
+                return []
+            type_code = self._type_filter(relationship_type)
+            if type_code == -1:
+                return []
+
+            first_edge = {start: -1}
+            frontier = [start]
+            rows = []
+            for distance in range(1, max_depth + 1):
+                next_frontier = []
+                for node in frontier:
+                    for other, slot in self._neighbors(node, direction, type_code):
+                        if other in first_edge:
+                            continue
+                        first_edge[other] = slot if node == start else first_edge[node]
+                        next_frontier.append(other)
+                        if self._live[other]:
+                            edge = first_edge[other]
+                            rows.append(
+                                {
+                                    "concept_id": self._ids[other],
+                                    "name": self._names[other],
+                                    "relationship_type": self._type_names[self._edge_type[edge]],
+                                    "strength": float(self._edge_strength[edge]),
+                                    "distance": distance,
+                                }
+                            )
+                frontier = next_frontier
+                if not frontier:
+                    break
+
+        rows.sort(key=lambda row: (row["distance"], row["name"] is None, row["name"] or ""))
+        return rows[:limit]
+
+    def prerequisites(self, concept_id: str, max_depth: int = 5) -> list[dict[str, Any]]:
+        """
+        Prerequisite closure of a concept (incoming PREREQUISITE edges).
+
+        Like the Cypher pattern it replaces, a prerequisite reachable through
+        chains of different lengths is reported once per depth.
+
+        Returns:
+            Rows with concept_id, name, depth ordered by depth (deepest first) then name
+        """
+        with self._lock:
+            target = self._index.get(concept_id)
+            if target is None or not self._live[target]:
+                return []
+            type_code = self._type_codes.get("PREREQUISITE")
+            if type_code is None:
+                return []
+
+            rows = []
+            frontier = {target}
+            for depth in range(1, max_depth + 1):
+                next_frontier = set()
+                for node in frontier:
+                    for other, _ in self._neighbors(node, "incoming", type_code):
+                        next_frontier.add(other)
+                for node in next_frontier:
+                    if self._live[node]:
+                        rows.append(
+                            {
+                                "concept_id": self._ids[node],
+                                "name": self._names[node],
+                                "depth": depth,
+                            }
+                        )
+                frontier = next_frontier
+                if not frontier:
+                    break
+
+        rows.sort(key=lambda row: (-row["depth"], row["name"] is None, row["name"] or ""))
+        return rows
+
+    def shortest_path(
+        self, start_id: str, end_id: str, relationship_type: str | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Shortest undirected path between two live concepts through live concepts.
+
+        Returns:
+            {"path": [{"concept_id", "name"}, ...], "length": int}, or None if
+            either concept is unknown/deleted or no path exists
+        """
+        with self._lock:
+            start = self._index.get(start_id)
+            end = self._index.get(end_id)
+            if start is None or end is None or not self._live[start] or not self._live[end]:
+                return None
+            type_code = self._type_filter(relationship_type)
+            if type_code == -1:
+                return None
+
+            parent = {start: start}
+            frontier = [start]
+            while frontier and end not in parent:
+                next_frontier = []
+                for node in frontier:
+                    for other, _ in self._neighbors(node, "both", type_code):
+                        if other in parent or not self._live[other]:
+                            continue
+                        parent[other] = node
+                        next_frontier.append(other)
+                frontier = next_frontier
+
+            if end not in parent:
+                return None
+
+            nodes = [end]
+            while nodes[-1] != start:
+                nodes.append(parent[nodes[-1]])
+            nodes.reverse()
+            return {
+                "path": [{"concept_id": self._ids[n], "name": self._names[n]} for n in nodes],
+                "length": len(nodes) - 1,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _type_filter(self, relationship_type: str | None) -> int | None:
+        """Map a type filter to its code: None for no filter, -1 for an unseen type."""
+        if relationship_type is None:
+            return None
+        return self._type_codes.get(relationship_type, -1)
+
+    def _neighbors(
+        self, node: int, direction: str, type_code: int | None
+    ) -> Iterator[tuple[int, int]]:
+        """Yield (neighbor, edge slot) for live edges of a node."""
+        if direction in ("outgoing", "both"):
+            yield from self._scan(
+                node, self._out_offsets, self._out_slots, self._delta_out, self._edge_dst, type_code
+            )
+        if direction in ("incoming", "both"):
+            yield from self._scan(
+                node, self._in_offsets, self._in_slots, self._delta_in, self._edge_src, type_code
+            )
+
+    def _scan(self, node, offsets, slots, delta, other_end, type_code):
+        if node + 1 < len(offsets):
+            for i in range(offsets[node], offsets[node + 1]):
+                slot = slots[i]
+                if self._edge_alive[slot] and (
+                    type_code is None or self._edge_type[slot] == type_code
+                ):
+                    yield other_end[slot], slot
+        for slot in delta.get(node, ()):
+            if self._edge_alive[slot] and (type_code is None or self._edge_type[slot] == type_code):
+                yield other_end[slot], slot
+
+    def _upsert_node(self, concept_id: str, name: str | None, live: bool) -> bool:
+        node = self._index.get(concept_id)
+        if node is None:
+            self._index[concept_id] = len(self._ids)
+            self._ids.append(concept_id)
+            self._names.append(name)
+            self._live.append(1 if live else 0)
+            return True
+        changed = self._names[node] != name or self._live[node] != (1 if live else 0)
+        self._names[node] = name
+        self._live[node] = 1 if live else 0
+        return changed
+
+    def _add_edge(self, relationship_id, source_id, target_id, relationship_type, strength) -> bool:
+        source = self._index.get(source_id)
+        target = self._index.get(target_id)
+        if source is None or target is None:
+            # The Neo4j projection MATCHes both endpoints, so it skips these too
+            return False
+
+        if relationship_id is not None and relationship_id in self._slot_by_rel:
+            if self._edge_alive[self._slot_by_rel[relationship_id]]:
+                return False
+
+        type_code = self._type_codes.get(relationship_type)
+        if type_code is None:
+            type_code = len(self._type_names)
+            self._type_codes[relationship_type] = type_code
+            self._type_names.append(relationship_type)
+
+        slot = len(self._edge_src)
+        self._edge_src.append(source)
+        self._edge_dst.append(target)
+        self._edge_type.append(type_code)
+        self._edge_strength.append(1.0 if strength is None else float(strength))
+        self._edge_alive.append(1)
+        if relationship_id is not None:
+            self._slot_by_rel[relationship_id] = slot
+        self._delta_out.setdefault(source, []).append(slot)
+        self._delta_in.setdefault(target, []).append(slot)
+        return True
+
+    def _remove_edge(self, relationship_id: str) -> bool:
+        slot = self._slot_by_rel.pop(relationship_id, None)
+        if slot is None or not self._edge_alive[slot]:
+            return False
+        self._edge_alive[slot] = 0
+        self._dead_edges += 1
+        return True
+
+    def _maybe_compact(self) -> None:
+        pending = len(self._edge_src) - self._indexed_edges + self._dead_edges
+        if pending > max(_MIN_COMPACT_EDGES, int(self._indexed_edges * _COMPACT_FRACTION)):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop dead edge slots and rebuild both CSR directions (counting sort)."""
+        alive = [slot for slot in range(len(self._edge_src)) if self._edge_alive[slot]]
+        remap = {old: new for new, old in enumerate(alive)}
+
+        self._edge_src = array("i", (self._edge_src[s] for s in alive))
+        self._edge_dst = array("i", (self._edge_dst[s] for s in alive))
+        self._edge_type = array("B", (self._edge_type[s] for s in alive))
+        self._edge_strength = array("f", (self._edge_strength[s] for s in alive))
+        self._edge_alive = bytearray(b"\x01" * len(alive))
+        self._slot_by_rel = {
+            rel: remap[slot] for rel, slot in self._slot_by_rel.items() if slot in remap
+        }
+
+        node_count = len(self._ids)
+        self._out_offsets, self._out_slots = self._build_csr(self._edge_src, node_count)
+        self._in_offsets, self._in_slots = self._build_csr(self._edge_dst, node_count)
+        self._delta_out = {}
+        self._delta_in = {}
+        self._indexed_edges = len(alive)
+        self._dead_edges = 0
+        self.compactions += 1
+
+    @staticmethod
+    def _build_csr(keys: array, node_count: int) -> tuple[array, array]:
+        offsets = array("i", [0] * (node_count + 1))
+        for key in keys:
+            offsets[key + 1] += 1
+        for i in range(node_count):
+            offsets[i + 1] += offsets[i]
+        cursor = array("i", offsets[:-1])
+        slots = array("i", [0] * len(keys))
+        for slot, key in enumerate(keys):
+            slots[cursor[key]] = slot
+            cursor[key] += 1
+        return offsets, slots
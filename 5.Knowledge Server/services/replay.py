@@ -0,0 +1,423 @@
+"""
+Projection rebuild engine.
+
+Recreates the Neo4j and ChromaDB read models from the event log:
+
+    stream events (keyset cursor, sequence order) → fold per aggregate
+        → synthesize net-state events → project_events() in large batches
+
+Only each aggregate's final state is written: a concept that was created,
+updated twenty times and retuned twice is projected as one ConceptCreated,
+one coalesced ConceptUpdated and one ConceptTauUpdated. Relationships that
+were deleted are never written at all.
+
+Progress is checkpointed to a JSON file after every batch. The checkpoint
+pins the sequence the rebuild folded up to, so a resumed run folds exactly
+the same events, rebuilds the same (deterministically ordered) plan and
+skips the batches that were already written.
+
+The target stores are expected to be empty (see scripts/cleanup_databases.py);
+writes are idempotent MERGE/upsert operations, so replaying a partially
+written batch after a crash is safe.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from models.events import ConceptDeleted, ConceptTauUpdated, ConceptUpdated, Event
+from projections.base_projection import BaseProjection
+from services.event_store import EventStore
+
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CHECKPOINT_PATH = _PROJECT_ROOT / "data" / "rebuild_checkpoint.json"
+
+# Projections that only hold concept documents (no graph, tau or relationships)
+DOCUMENT_PROJECTIONS = frozenset({"chromadb"})
+
+
+@dataclass
+class ConceptState:
+    """Net state of a concept aggregate after folding its events."""
+
+    created: Event | None = None
+    updates: dict[str, Any] = field(default_factory=dict)
+    last_update: Event | None = None
+    tau: int | None = None
+    tau_event: Event | None = None
+    deleted: bool = False
+    delete_event: Event | None = None
+
+
+@dataclass
+class RelationshipState:
+    """Net state of a relationship aggregate after folding its events."""
+
+    created: Event | None = None
+    deleted: bool = False
+
+
+@dataclass
+class RebuildCheckpoint:
+    """Persisted progress of a rebuild.
+
+    ``target_sequence`` is the last event sequence included in the fold;
+    ``written`` counts plan events already sent to each projection.
+    """
+
+    target_sequence: int = 0
+    written: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, int] = field(default_factory=dict)
+    completed: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target_sequence": self.target_sequence,
+            "written": self.written,
+            "failed": self.failed,
+            "completed": self.completed,
+        }
+
+    @classmethod
+    def from_file(cls, path: Path) -> RebuildCheckpoint | None:
+        try:
+            with path.open("r", encoding="utf-8") as fp:
+                raw = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Failed to read rebuild checkpoint %s: %s", path, exc)
+            return None
+
+        return cls(
+            target_sequence=int(raw.get("target_sequence", 0)),
+            written={name: int(count) for name, count in raw.get("written", {}).items()},
+            failed={name: int(count) for name, count in raw.get("failed", {}).items()},
+            completed=bool(raw.get("completed", False)),
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as fp:
+            json.dump(self.to_dict(), fp)
+        temp_path.replace(path)
+
+
+@dataclass
+class RebuildReport:
+    """Outcome and throughput of a rebuild."""
+
+    target_sequence: int = 0
+    events_replayed: int = 0
+    concepts: int = 0
+    deleted_concepts: int = 0
+    relationships: int = 0
+    orphaned_events: int = 0
+    written: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, int] = field(default_factory=dict)
+    resumed: bool = False
+    fold_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Replayed events per second over the whole rebuild."""
+        elapsed = self.fold_seconds + self.write_seconds
+        return self.events_replayed / elapsed if elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target_sequence": self.target_sequence,
+            "events_replayed": self.events_replayed,
+            "concepts": self.concepts,
+            "deleted_concepts": self.deleted_concepts,
+            "relationships": self.relationships,
+            "orphaned_events": self.orphaned_events,
+            "written": dict(self.written),
+            "failed": dict(self.failed),
+            "resumed": self.resumed,
+            "fold_seconds": round(self.fold_seconds, 3),
+            "write_seconds": round(self.write_seconds, 3),
+            "events_per_second": round(self.events_per_second, 2),
+        }
+
+
+class ProjectionRebuilder:
+    """
+    Rebuild projections from the event log using each aggregate's net state.
+
+    Example:
+        ```python
+        rebuilder = ProjectionRebuilder(
+            event_store=event_store,
+            projections={"neo4j": neo4j_projection, "chromadb": chromadb_projection},
+        )
+        report = rebuilder.rebuild(resume=True)
+        print(report.events_per_second)
+        ```
+    """
+
+    def __init__(
+        self,
+        event_store: EventStore,
+        projections: dict[str, BaseProjection],
+        batch_size: int = 1000,
+        read_batch_size: int = 5000,
+        checkpoint_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize ProjectionRebuilder.
+
+        Args:
+            event_store: Event store to replay
+            projections: Target projection per name; names in
+                DOCUMENT_PROJECTIONS receive live concepts only
+            batch_size: Events per project_events() call
+            read_batch_size: Rows per event-store page while folding
+            checkpoint_path: Checkpoint file (defaults to data/rebuild_checkpoint.json)
+        """
+        if batch_size <= 0 or read_batch_size <= 0:
+            raise ValueError("batch_size and read_batch_size must be positive")
+
+        self.event_store = event_store
+        self.projections = projections
+        self.batch_size = batch_size
+        self.read_batch_size = read_batch_size
+        self.checkpoint_path = checkpoint_path or DEFAULT_CHECKPOINT_PATH
+
+    def fold(
+        self, target_sequence: int
+    ) -> tuple[dict[str, ConceptState], dict[str, RelationshipState], int, int]:
+        """
+        Fold all events up to ``target_sequence`` into per-aggregate state.
+
+        Returns:
+            (concepts, relationships, events_replayed, orphaned_events); the
+            dictionaries keep first-seen order, which makes plans deterministic
+        """
+        concepts: dict[str, ConceptState] = {}
+        relationships: dict[str, RelationshipState] = {}
+        replayed = 0
+        orphaned = 0
+
+        if target_sequence <= 0:
+            return concepts, relationships, replayed, orphaned
+
+        for sequence, event in self.event_store.iter_events_after(
+            0, batch_size=self.read_batch_size
+        ):
+            if sequence > target_sequence:
+                break
+            replayed += 1
+            event_type = event.event_type
+
+            if event.aggregate_type == "Relationship":
+                rel_state = relationships.setdefault(event.aggregate_id, RelationshipState())
+                if event_type == "RelationshipCreated":
+                    rel_state.created = event
+                    rel_state.deleted = False
+                elif event_type == "RelationshipDeleted":
+                    rel_state.deleted = True
+                continue
+
+            state = concepts.get(event.aggregate_id)
+            if event_type == "ConceptCreated":
+                # A (re)creation starts the aggregate over
+                concepts[event.aggregate_id] = ConceptState(created=event)
+            elif state is None or state.created is None:
+                orphaned += 1
+                logger.warning(
+                    f"Skipping {event_type} event {event.event_id}: "
+                    f"concept {event.aggregate_id} has no ConceptCreated event"
+                )
+            elif event_type == "ConceptUpdated":
+                state.updates.update(event.event_data)
+                state.last_update = event
+            elif event_type == "ConceptTauUpdated":
+                tau = event.event_data.get("tau")
+                if tau is not None:
+                    state.tau = max(1, int(tau))
+                    state.tau_event = event
+            elif event_type == "ConceptDeleted":
+                state.deleted = True
+                state.delete_event = event
+            else:
+                logger.warning(
+                    f"No fold rule for event type: {event_type}. Event ID: {event.event_id}"
+                )
+
+        return concepts, relationships, replayed, orphaned
+
+    def build_plan(
+        self,
+        projection_name: str,
+        concepts: dict[str, ConceptState],
+        relationships: dict[str, RelationshipState],
+    ) -> list[Event]:
+        """
+        Build the net-state events to write to one projection.
+
+        Graph projections receive phase-ordered events (all creations, then
+        updates, tau values, deletions and finally relationships), so each
+        batch maps onto a handful of UNWIND queries and relationships always
+        find their endpoints. Document projections receive each live concept's
+        creation directly followed by its coalesced update.
+        """
+        if projection_name in DOCUMENT_PROJECTIONS:
+            plan: list[Event] = []
+            for concept_id, state in concepts.items():
+                if state.deleted:
+                    continue
+                plan.append(state.created)
+                if state.last_update is not None:
+                    plan.append(self._coalesced_update(concept_id, state))
+            return plan
+
+        created: list[Event] = []
+        updated: list[Event] = []
+        retuned: list[Event] = []
+        deleted: list[Event] = []
+        for concept_id, state in concepts.items():
+            created.append(state.created)
+            if state.last_update is not None:
+                updated.append(self._coalesced_update(concept_id, state))
+            if state.tau_event is not None:
+                retuned.append(
+                    ConceptTauUpdated(
+                        aggregate_id=concept_id,
+                        tau=state.tau,
+                        version=state.tau_event.version,
+                        created_at=state.tau_event.created_at,
+                    )
+                )
+            if state.deleted:
+                deleted.append(
+                    ConceptDeleted(
+                        aggregate_id=concept_id,
+                        version=state.delete_event.version,
+                        created_at=state.delete_event.created_at,
+                    )
+                )
+
+        linked = [
+            rel_state.created
+            for rel_state in relationships.values()
+            if rel_state.created is not None and not rel_state.deleted
+        ]
+        return created + updated + retuned + deleted + linked
+
+    @staticmethod
+    def _coalesced_update(concept_id: str, state: ConceptState) -> Event:
+        """Merge every update of a concept into one ConceptUpdated event."""
+        return ConceptUpdated(
+            aggregate_id=concept_id,
+            updates=dict(state.updates),
+            version=state.last_update.version,
+            created_at=state.last_update.created_at,
+        )
+
+    def rebuild(self, resume: bool = False) -> RebuildReport:
+        """
+        Replay the event log into every projection.
+
+        Args:
+            resume: Continue from the checkpoint file if it holds an
+                unfinished rebuild; otherwise a new rebuild is started
+
+        Returns:
+            RebuildReport with counts and events/second
+        """
+        checkpoint = RebuildCheckpoint.from_file(self.checkpoint_path) if resume else None
+        report = RebuildReport()
+
+        if checkpoint is not None and not checkpoint.completed:
+            report.resumed = True
+            logger.info(
+                f"Resuming rebuild up to sequence {checkpoint.target_sequence} "
+                f"(written so far: {checkpoint.written})"
+            )
+        else:
+            checkpoint = RebuildCheckpoint(target_sequence=self.event_store.get_last_sequence())
+            checkpoint.save(self.checkpoint_path)
+
+        report.target_sequence = checkpoint.target_sequence
+
+        started = time.perf_counter()
+        concepts, relationships, replayed, orphaned = self.fold(checkpoint.target_sequence)
+        report.fold_seconds = time.perf_counter() - started
+        report.events_replayed = replayed
+        report.orphaned_events = orphaned
+        report.concepts = len(concepts)
+        report.deleted_concepts = sum(1 for state in concepts.values() if state.deleted)
+        report.relationships = sum(
+            1
+            for rel_state in relationships.values()
+            if rel_state.created is not None and not rel_state.deleted
+        )
+        logger.info(
+            f"Folded {replayed} events into {report.concepts} concepts and "
+            f"{report.relationships} relationships in {report.fold_seconds:.2f}s"
+        )
+
+        started = time.perf_counter()
+        for name, projection in self.projections.items():
+            plan = self.build_plan(name, concepts, relationships)
+            self._write_plan(name, projection, plan, checkpoint)
+        report.write_seconds = time.perf_counter() - started
+
+        checkpoint.completed = True
+        checkpoint.save(self.checkpoint_path)
+        report.written = dict(checkpoint.written)
+        report.failed = dict(checkpoint.failed)
+
+        logger.info(
+            f"Rebuild complete: {replayed} events replayed at "
+            f"{report.events_per_second:.0f} events/s (written: {report.written}, "
+            f"failed: {report.failed})"
+        )
+        return report
+
+    def _write_plan(
+        self,
+        name: str,
+        projection: BaseProjection,
+        plan: list[Event],
+        checkpoint: RebuildCheckpoint,
+    ) -> None:
+        """Write ``plan`` in batches, checkpointing after each one."""
+        position = checkpoint.written.get(name, 0)
+        checkpoint.written.setdefault(name, position)
+        checkpoint.failed.setdefault(name, 0)
+        if position:
+            logger.info(f"{name}: skipping {position}/{len(plan)} events already written")
+
+        while position < len(plan):
+            batch = plan[position : position + self.batch_size]
+            try:
+                results = projection.project_events(batch)
+            except Exception as e:
+                logger.error(f"{name} rebuild batch failed: {e}", exc_info=True)
+                results = [False] * len(batch)
+
+            failed = sum(1 for result in results if result is not True)
+            position += len(batch)
+            checkpoint.written[name] = position
+            checkpoint.failed[name] += failed
+            checkpoint.save(self.checkpoint_path)
+
+            logger.debug(f"{name}: wrote {position}/{len(plan)} events ({failed} failed)")
+
+        logger.info(
+            f"{name}: rebuilt from {len(plan)} net-state events "
+            f"({checkpoint.failed[name]} failed)"
+        )
@@ -27,10 +27,13 @@ from models.events import ConceptCreated, ConceptDeleted, ConceptUpdated, Event
 from projections.chromadb_projection import ChromaDBProjection
 from projections.neo4j_projection import Neo4jProjection
 from services.compensation import CompensationManager
+from services.embedding_batcher import EmbeddingBatcher
 from services.embedding_cache import EmbeddingCache
 from services.embedding_service import EmbeddingService
 from services.event_store import EventStore
 from services.outbox import Outbox
+from services.snapshot_store import AggregateSnapshot, SnapshotStore, apply_concept_event
+from services.tracing import span, traced
 
 
 logger = logging.getLogger(__name__)
@@ -65,6 +68,21 @@ class LRUVersionCache:
             if len(self._cache) > self._maxsize:
                 self._cache.popitem(last=False)
 
+    def set_many(self, versions: dict[str, int]) -> None:
+        """Set several versions at once, evicting oldest entries beyond capacity."""
+        with self._lock:
+            for concept_id, version in versions.items():
+                if concept_id in self._cache:
+                    self._cache.move_to_end(concept_id)
+                self._cache[concept_id] = version
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached entries."""
+        return self._maxsize
+
     def invalidate(self, concept_id: str) -> None:
         """Remove a specific entry from the cache."""
         with self._lock:
@@ -151,6 +169,8 @@ class DualStorageRepository:
         embedding_service: EmbeddingService,
         embedding_cache: EmbeddingCache | None = None,
         compensation_manager: CompensationManager | None = None,
+        snapshot_store: SnapshotStore | None = None,
+        snapshot_interval: int = 50,
     ) -> None:
         """
         Initialize DualStorageRepository.
@@ -163,6 +183,8 @@ class DualStorageRepository:
             embedding_service: Service for generating embeddings
             embedding_cache: Optional cache for embeddings (recommended for performance)
             compensation_manager: Optional compensation manager for immediate rollback on failures
+            snapshot_store: Optional store for aggregate snapshots (speeds up state loads)
+            snapshot_interval: Snapshot a concept every N versions (0 disables automatic snapshots)
         """
         self.event_store = event_store
         self.outbox = outbox
@@ -171,6 +193,8 @@ class DualStorageRepository:
         self.embedding_service = embedding_service
         self.embedding_cache = embedding_cache
         self.compensation_manager = compensation_manager
+        self.snapshot_store = snapshot_store
+        self.snapshot_interval = max(0, snapshot_interval)
 
         # Version tracking for optimistic locking
         self._version_cache = LRUVersionCache(maxsize=10000)
@@ -178,7 +202,8 @@ class DualStorageRepository:
         logger.info(
             "DualStorageRepository initialized with "
             f"embedding_cache={'enabled' if embedding_cache else 'disabled'}, "
-            f"compensation={'enabled' if compensation_manager else 'disabled'}"
+            f"compensation={'enabled' if compensation_manager else 'disabled'}, "
+            f"snapshots={'enabled' if snapshot_store else 'disabled'}"
         )
 
     def create_concept(self, concept_data: dict[str, Any]) -> tuple[bool, str | None, str | None]:
@@ -236,7 +261,9 @@ class DualStorageRepository:
             )
 
             # 4. Persist event to EventStore (source of truth)
-            if not self.event_store.append_event(event):
+            with span("event_store.append") as stage:
+                stage.error = not self.event_store.append_event(event)
+            if stage.error:
                 error_msg = f"Failed to persist event to event store for concept {concept_id}"
                 logger.error(error_msg)
                 return False, error_msg, None
@@ -244,76 +271,180 @@ class DualStorageRepository:
             logger.debug(f"Event {event.event_id} persisted for concept {concept_id}")
 
             # 5. Add outbox entries for reliable processing
-            neo4j_outbox_id = self.outbox.add_to_outbox(event.event_id, "neo4j")
-            chromadb_outbox_id = self.outbox.add_to_outbox(event.event_id, "chromadb")
+            with span("outbox.enqueue"):
+                neo4j_outbox_id = self.outbox.add_to_outbox(event.event_id, "neo4j")
+                chromadb_outbox_id = self.outbox.add_to_outbox(event.event_id, "chromadb")
 
             logger.debug(
                 f"Outbox entries created: neo4j={neo4j_outbox_id}, "
                 f"chromadb={chromadb_outbox_id}"
             )
 
-            # 6. Process projections synchronously
-            neo4j_success = self._process_projection(event, self.neo4j_projection, neo4j_outbox_id)
-            chromadb_success = self._process_projection(
-                event, self.chromadb_projection, chromadb_outbox_id
-            )
-
-            # 7. Handle partial failure with compensation
-            if neo4j_success and not chromadb_success:
-                logger.warning(
-                    f"Neo4j succeeded but ChromaDB failed for {concept_id}. "
-                    f"Attempting immediate compensation."
-                )
-                if self.compensation_manager:
-                    compensation_success = self.compensation_manager.rollback_neo4j(event)
-                    if compensation_success:
-                        logger.info(f"Successfully rolled back Neo4j for {concept_id}")
-                    else:
-                        logger.error(f"Failed to roll back Neo4j for {concept_id}")
-
-            elif chromadb_success and not neo4j_success:
-                logger.warning(
-                    f"ChromaDB succeeded but Neo4j failed for {concept_id}. "
-                    f"Attempting immediate compensation."
-                )
-                if self.compensation_manager:
-                    compensation_success = self.compensation_manager.rollback_chromadb(event)
-                    if compensation_success:
-                        logger.info(f"Successfully rolled back ChromaDB for {concept_id}")
-                    else:
-                        logger.error(f"Failed to roll back ChromaDB for {concept_id}")
+            # 6-7. Process projections synchronously, compensating partial failures
+            result = self._project_created_concept(event, neo4j_outbox_id, chromadb_outbox_id)
 
             # 8. Update version cache
             self._version_cache.set(concept_id, 1)
 
-            # Check results
-            if neo4j_success and chromadb_success:
-                logger.info(f"Concept {concept_id} created successfully in both databases")
-                return True, None, concept_id
-            elif neo4j_success or chromadb_success:
-                logger.warning(
-                    f"Concept {concept_id} created partially. "
-                    f"Neo4j: {neo4j_success}, ChromaDB: {chromadb_success}. "
-                    f"Compensation attempted, failed projections will retry via outbox."
-                )
-                return (
-                    True,
-                    "Partial success - compensation attempted, failed projections will retry via outbox",
-                    concept_id,
-                )
-            else:
-                logger.error(f"Concept {concept_id} failed to create in both databases")
-                return (
-                    False,
-                    "Failed to create in both databases - will retry via outbox",
-                    concept_id,
-                )
+            return result
 
         except Exception as e:
             error_msg = f"Unexpected error creating concept: {e}"
             logger.error(error_msg, exc_info=True)
             return False, error_msg, None
 
+    def create_concepts_bulk(
+        self, concepts: list[dict[str, Any]], process_projections: bool = True
+    ) -> list[tuple[bool, str | None, str | None]]:
+        """
+        Create many concepts with one embedding pass and one event-store commit.
+
+        Process:
+        1. Generate concept_ids where not provided
+        2. Deduplicate concept texts, probe the embedding cache in one batch and
+           send all misses through EmbeddingService.generate_batch in one call
+        3. Persist all ConceptCreated events and their outbox entries in a
+           single transaction
+        4. Optionally process projections synchronously (otherwise the outbox
+           worker picks them up)
+
+        Args:
+            concepts: List of concept dictionaries (same fields as create_concept)
+            process_projections: Project each event immediately; set False for
+                large imports that should be drained by the outbox worker
+
+        Returns:
+            List of (success, error_message, concept_id) tuples aligned with
+            ``concepts``. If the batch cannot be persisted, every entry fails.
+        """
+        if not concepts:
+            return []
+
+        try:
+            # 1. Assign concept IDs
+            for concept_data in concepts:
+                concept_data["concept_id"] = concept_data.get("concept_id", str(uuid.uuid4()))
+
+            # 2. Generate embeddings for all unique texts in one batch
+            self._generate_embeddings_batch(
+                [self._build_embedding_text(concept_data) for concept_data in concepts]
+            )
+
+            # 3. Persist events and outbox entries atomically
+            events = [
+                ConceptCreated(
+                    aggregate_id=concept_data["concept_id"],
+                    concept_data=concept_data,
+                    version=1,
+                )
+                for concept_data in concepts
+            ]
+            projection_names = ["neo4j", "chromadb"]
+            outbox_entries = self.outbox.build_entries(
+                [event.event_id for event in events], projection_names
+            )
+            with span("event_store.append_batch"):
+                self.event_store.append_events(events, outbox_entries=outbox_entries)
+
+            logger.info(f"Persisted {len(events)} ConceptCreated events in one transaction")
+
+        except Exception as e:
+            error_msg = f"Failed to create concepts in bulk: {e}"
+            logger.error(error_msg, exc_info=True)
+            return [(False, error_msg, None) for _ in concepts]
+
+        results: list[tuple[bool, str | None, str | None]] = []
+        for index, event in enumerate(events):
+            self._version_cache.set(event.aggregate_id, 1)
+
+            if not process_projections:
+                results.append((True, None, event.aggregate_id))
+                continue
+
+            # Entries are laid out per event in projection_names order
+            neo4j_outbox_id = outbox_entries[index * 2][0]
+            chromadb_outbox_id = outbox_entries[index * 2 + 1][0]
+            try:
+                results.append(
+                    self._project_created_concept(event, neo4j_outbox_id, chromadb_outbox_id)
+                )
+            except Exception as e:
+                error_msg = f"Unexpected error projecting concept {event.aggregate_id}: {e}"
+                logger.error(error_msg, exc_info=True)
+                results.append((False, error_msg, event.aggregate_id))
+
+        return results
+
+    def _project_created_concept(
+        self, event: Event, neo4j_outbox_id: str, chromadb_outbox_id: str
+    ) -> tuple[bool, str | None, str | None]:
+        """
+        Project a persisted ConceptCreated event to both databases.
+
+        Rolls back the successful side if exactly one projection fails; failed
+        projections stay in the outbox for retry.
+
+        Returns:
+            Tuple of (success, error_message, concept_id) as for create_concept
+        """
+        concept_id = event.aggregate_id
+
+        # Process projections synchronously
+        neo4j_success = self._process_projection(event, self.neo4j_projection, neo4j_outbox_id)
+        chromadb_success = self._process_projection(
+            event, self.chromadb_projection, chromadb_outbox_id
+        )
+
+        # Handle partial failure with compensation (None = deferred to the outbox worker)
+        if neo4j_success and chromadb_success is False:
+            logger.warning(
+                f"Neo4j succeeded but ChromaDB failed for {concept_id}. "
+                f"Attempting immediate compensation."
+            )
+            if self.compensation_manager:
+                with span("compensation.neo4j"):
+                    compensation_success = self.compensation_manager.rollback_neo4j(event)
+                if compensation_success:
+                    logger.info(f"Successfully rolled back Neo4j for {concept_id}")
+                else:
+                    logger.error(f"Failed to roll back Neo4j for {concept_id}")
+
+        elif chromadb_success and neo4j_success is False:
+            logger.warning(
+                f"ChromaDB succeeded but Neo4j failed for {concept_id}. "
+                f"Attempting immediate compensation."
+            )
+            if self.compensation_manager:
+                with span("compensation.chromadb"):
+                    compensation_success = self.compensation_manager.rollback_chromadb(event)
+                if compensation_success:
+                    logger.info(f"Successfully rolled back ChromaDB for {concept_id}")
+                else:
+                    logger.error(f"Failed to roll back ChromaDB for {concept_id}")
+
+        # Check results
+        if neo4j_success is not False and chromadb_success is not False:
+            logger.info(f"Concept {concept_id} created successfully in both databases")
+            return True, None, concept_id
+        elif neo4j_success is not False or chromadb_success is not False:
+            logger.warning(
+                f"Concept {concept_id} created partially. "
+                f"Neo4j: {neo4j_success}, ChromaDB: {chromadb_success}. "
+                f"Compensation attempted, failed projections will retry via outbox."
+            )
+            return (
+                True,
+                "Partial success - compensation attempted, failed projections will retry via outbox",
+                concept_id,
+            )
+        else:
+            logger.error(f"Concept {concept_id} failed to create in both databases")
+            return (
+                False,
+                "Failed to create in both databases - will retry via outbox",
+                concept_id,
+            )
+
     def update_concept(self, concept_id: str, updates: dict[str, Any]) -> tuple[bool, str | None]:
         """
         Update concept in both Neo4j and ChromaDB.
@@ -362,7 +493,9 @@ class DualStorageRepository:
             event = ConceptUpdated(aggregate_id=concept_id, updates=updates, version=new_version)
 
             # 4. Persist event to EventStore
-            if not self.event_store.append_event(event):
+            with span("event_store.append") as stage:
+                stage.error = not self.event_store.append_event(event)
+            if stage.error:
                 error_msg = f"Failed to persist update event for concept {concept_id}"
                 logger.error(error_msg)
                 return False, error_msg
@@ -370,8 +503,9 @@ class DualStorageRepository:
             logger.debug(f"Update event {event.event_id} persisted for concept {concept_id}")
 
             # 5. Add outbox entries
-            neo4j_outbox_id = self.outbox.add_to_outbox(event.event_id, "neo4j")
-            chromadb_outbox_id = self.outbox.add_to_outbox(event.event_id, "chromadb")
+            with span("outbox.enqueue"):
+                neo4j_outbox_id = self.outbox.add_to_outbox(event.event_id, "neo4j")
+                chromadb_outbox_id = self.outbox.add_to_outbox(event.event_id, "chromadb")
 
             # 6. Process projections synchronously
             neo4j_success = self._process_projection(event, self.neo4j_projection, neo4j_outbox_id)
@@ -380,7 +514,7 @@ class DualStorageRepository:
             )
 
             # 7. Handle partial failure with compensation
-            if neo4j_success and not chromadb_success:
+            if neo4j_success and chromadb_success is False:
                 logger.warning(
                     f"Neo4j succeeded but ChromaDB failed for update of {concept_id}. "
                     f"Compensation noted (updates are hard to roll back)."
@@ -392,7 +526,7 @@ class DualStorageRepository:
                         f"Update rollback is complex - relying on outbox retry for {concept_id}"
                     )
 
-            elif chromadb_success and not neo4j_success:
+            elif chromadb_success and neo4j_success is False:
                 logger.warning(
                     f"ChromaDB succeeded but Neo4j failed for update of {concept_id}. "
                     f"Compensation noted (updates are hard to roll back)."
@@ -404,12 +538,13 @@ class DualStorageRepository:
 
             # 8. Update version cache
             self._version_cache.set(concept_id, new_version)
+            self._maybe_snapshot(concept_id, new_version)
 
-            # Check results
-            if neo4j_success and chromadb_success:
+            # Check results (a deferred projection is the outbox worker's to finish)
+            if neo4j_success is not False and chromadb_success is not False:
                 logger.info(f"Concept {concept_id} updated successfully in both databases")
                 return True, None
-            elif neo4j_success or chromadb_success:
+            elif neo4j_success is not False or chromadb_success is not False:
                 logger.warning(
                     f"Concept {concept_id} updated partially. "
                     f"Failed projections will retry via outbox."
@@ -460,7 +595,9 @@ class DualStorageRepository:
             event = ConceptDeleted(aggregate_id=concept_id, version=new_version)
 
             # 3. Persist event to EventStore
-            if not self.event_store.append_event(event):
+            with span("event_store.append") as stage:
+                stage.error = not self.event_store.append_event(event)
+            if stage.error:
                 error_msg = f"Failed to persist delete event for concept {concept_id}"
                 logger.error(error_msg)
                 return False, error_msg
@@ -468,8 +605,9 @@ class DualStorageRepository:
             logger.debug(f"Delete event {event.event_id} persisted for concept {concept_id}")
 
             # 4. Add outbox entries
-            neo4j_outbox_id = self.outbox.add_to_outbox(event.event_id, "neo4j")
-            chromadb_outbox_id = self.outbox.add_to_outbox(event.event_id, "chromadb")
+            with span("outbox.enqueue"):
+                neo4j_outbox_id = self.outbox.add_to_outbox(event.event_id, "neo4j")
+                chromadb_outbox_id = self.outbox.add_to_outbox(event.event_id, "chromadb")
 
             # 5. Process projections (soft delete in Neo4j, hard delete in ChromaDB)
             neo4j_success = self._process_projection(event, self.neo4j_projection, neo4j_outbox_id)
@@ -478,7 +616,7 @@ class DualStorageRepository:
             )
 
             # 6. Handle partial failure with compensation
-            if neo4j_success and not chromadb_success:
+            if neo4j_success and chromadb_success is False:
                 logger.warning(
                     f"Neo4j succeeded but ChromaDB failed for delete of {concept_id}. "
                     f"Compensation noted (deletes are hard to restore)."
@@ -490,7 +628,7 @@ class DualStorageRepository:
                         f"Delete rollback is not possible - relying on outbox retry for {concept_id}"
                     )
 
-            elif chromadb_success and not neo4j_success:
+            elif chromadb_success and neo4j_success is False:
                 logger.warning(
                     f"ChromaDB succeeded but Neo4j failed for delete of {concept_id}. "
                     f"Compensation noted (deletes are hard to restore)."
@@ -502,12 +640,13 @@ class DualStorageRepository:
 
             # 7. Update version cache
             self._version_cache.set(concept_id, new_version)
+            self._maybe_snapshot(concept_id, new_version)
 
-            # Check results
-            if neo4j_success and chromadb_success:
+            # Check results (a deferred projection is the outbox worker's to finish)
+            if neo4j_success is not False and chromadb_success is not False:
                 logger.info(f"Concept {concept_id} deleted successfully from both databases")
                 return True, None
-            elif neo4j_success or chromadb_success:
+            elif neo4j_success is not False or chromadb_success is not False:
                 logger.warning(
                     f"Concept {concept_id} deleted partially. "
                     f"Failed projections will retry via outbox."
@@ -524,15 +663,20 @@ class DualStorageRepository:
             logger.error(error_msg, exc_info=True)
             return False, error_msg
 
-    def get_concept(self, concept_id: str) -> dict[str, Any] | None:
+    def get_concept(
+        self, concept_id: str, include_history: bool = False
+    ) -> dict[str, Any] | None:
         """
         Get concept from Neo4j (source of truth for concept data).
 
         Note: This queries Neo4j directly, not the event store.
         Neo4j contains the current state after all events are applied.
+        Explanation history only exists in the event log, so it is loaded
+        from the latest snapshot plus the events after it.
 
         Args:
             concept_id: ID of concept to retrieve
+            include_history: Add an explanation_history list to the result
 
         Returns:
             Concept data dictionary or None if not found
@@ -566,6 +710,12 @@ class DualStorageRepository:
                     )
                     # Keep as string if deserialization fails
 
+            if include_history:
+                state = self.load_concept_state(concept_id)
+                concept_data["explanation_history"] = (
+                    state.get("explanation_history", []) if state else []
+                )
+
             logger.debug(f"Retrieved concept {concept_id} from Neo4j")
             return concept_data
 
@@ -578,7 +728,10 @@ class DualStorageRepository:
         Process pending outbox entries to retry failed projections.
 
         This method should be called periodically (e.g., by a background worker)
-        to ensure eventual consistency for failed projections.
+        to ensure eventual consistency for failed projections. Entries are
+        taken with Outbox.claim_pending(), so concurrent callers never work
+        on the same entry, and results are only recorded while the claim's
+        lease still holds it.
 
         Args:
             limit: Maximum number of outbox entries to process
@@ -594,21 +747,23 @@ class DualStorageRepository:
 
         processed_count = 0
         failed_count = 0
-        pending_entries = self.outbox.get_pending(limit=limit)
+        if limit <= 0:
+            return {"processed": 0, "failed": 0, "total": 0}
+        pending_entries = self.outbox.claim_pending(limit)
         total_count = len(pending_entries)
 
         for entry in pending_entries:
+            lease_id = entry.lease_id
             try:
-                # Mark as processing
-                self.outbox.mark_processing(entry.outbox_id)
-
                 # Retrieve original event from event store
                 event = self.event_store.get_event_by_id(entry.event_id)
                 if not event:
                     logger.error(
                         f"Event {entry.event_id} not found for outbox entry {entry.outbox_id}"
                     )
-                    self.outbox.mark_failed(entry.outbox_id, "Event not found in event store")
+                    self.outbox.mark_failed(
+                        entry.outbox_id, "Event not found in event store", lease_id=lease_id
+                    )
                     failed_count += 1
                     continue
 
@@ -623,14 +778,16 @@ class DualStorageRepository:
                 success = projection.project_event(event)
 
                 if success:
-                    self.outbox.mark_processed(entry.outbox_id)
+                    self.outbox.mark_processed(entry.outbox_id, lease_id=lease_id)
                     processed_count += 1
                     logger.info(
                         f"Successfully processed outbox entry {entry.outbox_id} "
                         f"for {entry.projection_name}"
                     )
                 else:
-                    self.outbox.mark_failed(entry.outbox_id, "Projection failed")
+                    self.outbox.mark_failed(
+                        entry.outbox_id, "Projection failed", lease_id=lease_id
+                    )
                     failed_count += 1
                     logger.warning(
                         f"Failed to process outbox entry {entry.outbox_id} "
@@ -640,7 +797,7 @@ class DualStorageRepository:
             except Exception as e:
                 error_msg = f"Error processing outbox entry {entry.outbox_id}: {e}"
                 logger.error(error_msg, exc_info=True)
-                self.outbox.mark_failed(entry.outbox_id, error_msg)
+                self.outbox.mark_failed(entry.outbox_id, error_msg, lease_id=lease_id)
                 failed_count += 1
 
         logger.info(
@@ -650,6 +807,7 @@ class DualStorageRepository:
 
         return {"processed": processed_count, "failed": failed_count, "total": total_count}
 
+    @traced("embedding")
     def _generate_embedding_for_concept(self, concept_data: dict[str, Any]) -> list[float]:
         """
         Generate embedding for concept text.
@@ -664,18 +822,7 @@ class DualStorageRepository:
             384-dimensional embedding vector
         """
         try:
-            # Build text for embedding: name + explanation
-            name = concept_data.get("name", "").strip()
-            explanation = concept_data.get("explanation", "").strip()
-
-            # Build text parts
-            text_parts = []
-            if name:
-                text_parts.append(name)
-            if explanation:
-                text_parts.append(explanation)
-
-            text = ". ".join(text_parts)
+            text = self._build_embedding_text(concept_data)
 
             if not text:
                 logger.warning("Empty text for embedding generation, returning zero vector")
@@ -683,7 +830,7 @@ class DualStorageRepository:
 
             # Try cache first
             if self.embedding_cache:
-                model_name = self.embedding_service.config.model_name
+                model_name = self.embedding_service.config.cache_key
                 cached_embedding = self.embedding_cache.get_cached(text, model_name)
 
                 if cached_embedding:
@@ -695,7 +842,7 @@ class DualStorageRepository:
 
             # Store in cache
             if self.embedding_cache:
-                model_name = self.embedding_service.config.model_name
+                model_name = self.embedding_service.config.cache_key
                 self.embedding_cache.store(text, model_name, embedding)
                 logger.debug(f"Stored embedding in cache for text (len={len(text)})")
 
@@ -706,6 +853,128 @@ class DualStorageRepository:
             # Return zero vector as fallback
             return [0.0] * 384
 
+    @staticmethod
+    def _build_embedding_text(concept_data: dict[str, Any]) -> str:
+        """Build the text embedded for a concept: name + explanation."""
+        name = concept_data.get("name", "").strip()
+        explanation = concept_data.get("explanation", "").strip()
+
+        # Build text parts
+        text_parts = []
+        if name:
+            text_parts.append(name)
+        if explanation:
+            text_parts.append(explanation)
+
+        return ". ".join(text_parts)
+
+    @staticmethod
+    def _build_update_embedding_text(updates: dict[str, Any]) -> str:
+        """Build the text embedded for an update from the name/explanation it changes."""
+        text_parts = []
+
+        if "name" in updates:
+            text_parts.append(updates["name"])
+        if "explanation" in updates:
+            text_parts.append(updates["explanation"])
+
+        return ". ".join(text_parts).strip()
+
+    async def prefetch_embeddings(
+        self,
+        batcher: EmbeddingBatcher,
+        concept_data: dict[str, Any] | None = None,
+        updates: dict[str, Any] | None = None,
+    ) -> int:
+        """
+        Embed the text of an upcoming create/update through a micro-batcher.
+
+        The vectors are stored in the embedding cache, so the synchronous
+        create_concept/update_concept call that follows gets a cache hit
+        instead of running the model on the event loop.
+
+        Args:
+            batcher: Shared micro-batcher (coalesces concurrent tool calls)
+            concept_data: Data of a concept about to be created
+            updates: Updates about to be applied to a concept
+
+        Returns:
+            Number of texts embedded (0 if cached, empty, or no cache is configured)
+        """
+        if not self.embedding_cache:
+            return 0
+
+        texts = []
+        if concept_data is not None:
+            texts.append(self._build_embedding_text(concept_data))
+        if updates is not None:
+            texts.append(self._build_update_embedding_text(updates))
+        texts = list(dict.fromkeys(text for text in texts if text))
+        if not texts:
+            return 0
+
+        model_name = self.embedding_service.config.cache_key
+        cached = self.embedding_cache.get_many(texts, model_name)
+        missing = [text for text, embedding in zip(texts, cached) if embedding is None]
+        if not missing:
+            return 0
+
+        embeddings = await batcher.embed_many(missing)
+        self.embedding_cache.store_many(missing, model_name, embeddings)
+        return len(missing)
+
+    @traced("embedding.batch")
+    def _generate_embeddings_batch(self, texts: list[str]) -> dict[str, list[float]]:
+        """
+        Generate embeddings for many texts with one model call.
+
+        Texts are deduplicated, looked up in the cache with a single batch
+        probe, and all misses are embedded together via generate_batch.
+
+        Args:
+            texts: Texts to embed (empty strings are skipped)
+
+        Returns:
+            Mapping of text to embedding vector
+        """
+        unique_texts = list(dict.fromkeys(text for text in texts if text))
+        embeddings: dict[str, list[float]] = {}
+        if not unique_texts:
+            return embeddings
+
+        try:
+            model_name = self.embedding_service.config.cache_key
+            missing = unique_texts
+
+            # Try cache first
+            if self.embedding_cache:
+                cached = self.embedding_cache.get_many(unique_texts, model_name)
+                missing = []
+                for text, embedding in zip(unique_texts, cached):
+                    if embedding is None:
+                        missing.append(text)
+                    else:
+                        embeddings[text] = embedding
+                logger.debug(
+                    f"Batch embedding cache probe: {len(embeddings)} hits, {len(missing)} misses"
+                )
+
+            if missing:
+                # Generate all misses in one forward pass
+                generated = self.embedding_service.generate_batch(missing)
+                embeddings.update(zip(missing, generated))
+
+                # Store in cache unless the service already wrote through to it
+                service_cache = getattr(self.embedding_service, "cache", None)
+                if self.embedding_cache and service_cache is not self.embedding_cache:
+                    self.embedding_cache.store_many(missing, model_name, generated)
+
+        except Exception as e:
+            logger.error(f"Error generating batch embeddings: {e}", exc_info=True)
+
+        return embeddings
+
+    @traced("embedding")
     def _generate_embedding_from_updates(self, updates: dict[str, Any]) -> list[float]:
         """
         Generate embedding from update data.
@@ -716,15 +985,7 @@ class DualStorageRepository:
         Returns:
             384-dimensional embedding vector
         """
-        # For updates, generate embedding if we have enough text
-        text_parts = []
-
-        if "name" in updates:
-            text_parts.append(updates["name"])
-        if "explanation" in updates:
-            text_parts.append(updates["explanation"])
-
-        text = ". ".join(text_parts).strip()
+        text = self._build_update_embedding_text(updates)
 
         if not text:
             logger.debug("No text in updates, skipping embedding generation")
@@ -732,7 +993,7 @@ class DualStorageRepository:
 
         # Try cache first
         if self.embedding_cache:
-            model_name = self.embedding_service.config.model_name
+            model_name = self.embedding_service.config.cache_key
             cached_embedding = self.embedding_cache.get_cached(text, model_name)
 
             if cached_embedding:
@@ -744,12 +1005,12 @@ class DualStorageRepository:
 
         # Store in cache
         if self.embedding_cache:
-            model_name = self.embedding_service.config.model_name
+            model_name = self.embedding_service.config.cache_key
             self.embedding_cache.store(text, model_name, embedding)
 
         return embedding
 
-    def _process_projection(self, event: Event, projection: Any, outbox_id: str) -> bool:
+    def _process_projection(self, event: Event, projection: Any, outbox_id: str) -> bool | None:
         """
         Process event through a projection and update outbox status.
 
@@ -759,27 +1020,34 @@ class DualStorageRepository:
             outbox_id: ID of outbox entry
 
         Returns:
-            True if projection succeeded, False otherwise
+            True if projection succeeded, False if it failed, None if it was
+            deferred: the entry is leased by an outbox worker, which projects
+            it, so callers must neither compensate nor report a failure
         """
+        lease_id = None
         try:
-            # Mark outbox entry as processing
-            self.outbox.mark_processing(outbox_id)
+            # Take the outbox entry's lease
+            lease_id = self.outbox.mark_processing(outbox_id)
+            if lease_id is None:
+                logger.info(f"Outbox entry {outbox_id} is leased by a worker; projection deferred")
+                return None
 
             # Execute projection
             success = projection.project_event(event)
 
             # Update outbox status
             if success:
-                self.outbox.mark_processed(outbox_id)
+                self.outbox.mark_processed(outbox_id, lease_id=lease_id)
                 return True
             else:
-                self.outbox.mark_failed(outbox_id, "Projection returned False")
+                self.outbox.mark_failed(outbox_id, "Projection returned False", lease_id=lease_id)
                 return False
 
         except Exception as e:
             error_msg = f"Projection error: {e}"
             logger.error(error_msg, exc_info=True)
-            self.outbox.mark_failed(outbox_id, error_msg)
+            if lease_id is not None:
+                self.outbox.mark_failed(outbox_id, error_msg, lease_id=lease_id)
             return False
 
     def _get_current_version(self, concept_id: str) -> int:
@@ -808,6 +1076,106 @@ class DualStorageRepository:
 
         return version
 
+    def load_concept_state(self, concept_id: str) -> dict[str, Any] | None:
+        """
+        Reconstruct a concept's state from the event store.
+
+        Starts from the latest snapshot (if any) and folds only the events
+        appended after it. When more than ``snapshot_interval`` events had to
+        be folded, a fresh snapshot is stored for the next read.
+
+        Args:
+            concept_id: ID of concept
+
+        Returns:
+            Folded state (see snapshot_store.apply_concept_event), including
+            deleted concepts, or None if the concept has no events
+        """
+        snapshot = self.snapshot_store.get(concept_id) if self.snapshot_store else None
+        from_version = snapshot.version + 1 if snapshot else None
+
+        events = self.event_store.get_events_by_aggregate(concept_id, from_version=from_version)
+        state = snapshot.state if snapshot else None
+        for event in events:
+            state = apply_concept_event(state, event)
+
+        if state is None:
+            return None
+
+        if self.snapshot_store and self.snapshot_interval and len(events) > self.snapshot_interval:
+            self._save_snapshot(concept_id, state)
+
+        return state
+
+    def snapshot_concept(self, concept_id: str) -> AggregateSnapshot | None:
+        """
+        Store a snapshot of a concept's current state on demand.
+
+        Args:
+            concept_id: ID of concept
+
+        Returns:
+            The stored snapshot, or None if snapshots are disabled, the concept
+            has no events or the write failed
+        """
+        if not self.snapshot_store:
+            return None
+
+        state = self.load_concept_state(concept_id)
+        if state is None:
+            return None
+        return self._save_snapshot(concept_id, state)
+
+    def _save_snapshot(self, concept_id: str, state: dict[str, Any]) -> AggregateSnapshot | None:
+        """Persist a folded concept state; failures are logged, not raised."""
+        snapshot = AggregateSnapshot(
+            aggregate_id=concept_id,
+            aggregate_type="Concept",
+            version=state["version"],
+            state=state,
+        )
+        try:
+            self.snapshot_store.save(snapshot)
+        except Exception as e:
+            logger.warning(f"Failed to snapshot concept {concept_id}: {e}")
+            return None
+
+        logger.debug(f"Snapshotted concept {concept_id} at version {snapshot.version}")
+        return snapshot
+
+    def _maybe_snapshot(self, concept_id: str, version: int) -> None:
+        """Snapshot a concept every ``snapshot_interval`` versions."""
+        if not self.snapshot_store or not self.snapshot_interval:
+            return
+        if version % self.snapshot_interval == 0:
+            self.snapshot_concept(concept_id)
+
+    def warm_version_cache(self, limit: int | None = None) -> int:
+        """
+        Load current versions of recently snapshotted concepts into the version cache.
+
+        Uses one query over the snapshot version index (plus the events
+        appended after each snapshot) instead of a MAX(version) lookup per
+        concept on first write.
+
+        Args:
+            limit: Maximum concepts to load (defaults to the cache capacity)
+
+        Returns:
+            Number of versions loaded
+        """
+        if not self.snapshot_store:
+            return 0
+
+        if limit is None:
+            limit = self._version_cache.maxsize
+        versions = self.snapshot_store.load_current_versions(limit=limit, aggregate_type="Concept")
+        # Oldest first, so the most recently snapshotted concepts are the last to be evicted
+        self._version_cache.set_many(dict(reversed(list(versions.items()))))
+
+        logger.info(f"Warmed version cache with {len(versions)} concept versions")
+        return len(versions)
+
     def get_repository_stats(self) -> dict[str, Any]:
         """
         Get repository statistics for monitoring.
@@ -830,6 +1198,8 @@ class DualStorageRepository:
 
             return {
                 "version_cache_size": len(self._version_cache),
+                "snapshots_enabled": self.snapshot_store is not None,
+                "snapshot_count": self.snapshot_store.count() if self.snapshot_store else 0,
                 "outbox_pending": outbox_stats.get("pending", 0),
                 "outbox_processing": outbox_stats.get("processing", 0),
                 "outbox_completed": outbox_stats.get("completed", 0),
@@ -0,0 +1,378 @@
+"""
+Aggregate snapshot store.
+
+Persists the folded state of an aggregate at a given version so that
+reconstructing it only needs the snapshot plus the events appended after
+it, instead of every event since creation:
+
+    state(v_n) = fold(snapshot(v_k), events[k+1..n])
+
+Snapshots live in the event store database (``aggregate_snapshots`` table)
+and are overwritten in place; a snapshot is never replaced by an older one.
+The ``(aggregate_id, version)`` index makes version lookups index-only, which
+is what the repository uses to warm its version cache in bulk at startup.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from models.events import Event
+
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotStoreError(Exception):
+    """Base exception for snapshot store errors"""
+
+    pass
+
+
+@dataclass
+class AggregateSnapshot:
+    """Folded state of an aggregate as of ``version``."""
+
+    aggregate_id: str
+    aggregate_type: str
+    version: int
+    state: dict[str, Any] = field(default_factory=dict)
+    created_at: str | None = None
+
+
+def apply_concept_event(state: dict[str, Any] | None, event: Event) -> dict[str, Any]:
+    """
+    Fold one Concept event into its state dictionary.
+
+    The state holds the concept fields plus ``version``, ``deleted``,
+    ``created_at``/``last_modified`` and an ``explanation_history`` list with
+    one ``{"version", "explanation", "changed_at"}`` entry per explanation
+    the concept has had.
+
+    Args:
+        state: State folded so far (None before the first event)
+        event: Next Concept event, in version order
+
+    Returns:
+        The new state (``state`` is not modified)
+    """
+    timestamp = event.created_at.isoformat()
+
+    if event.event_type == "ConceptCreated":
+        new_state = dict(event.event_data)
+        new_state.update(
+            concept_id=event.aggregate_id,
+            deleted=False,
+            created_at=timestamp,
+            last_modified=timestamp,
+            explanation_history=[],
+        )
+    else:
+        new_state = dict(state or {"concept_id": event.aggregate_id, "explanation_history": []})
+        new_state["explanation_history"] = list(new_state.get("explanation_history", []))
+
+        if event.event_type == "ConceptUpdated":
+            new_state.update(event.event_data)
+            new_state["last_modified"] = timestamp
+        elif event.event_type == "ConceptTauUpdated":
+            new_state["retention_tau"] = event.event_data.get("tau")
+        elif event.event_type == "ConceptDeleted":
+            new_state["deleted"] = True
+            new_state["deleted_at"] = timestamp
+
+    if event.event_type in ("ConceptCreated", "ConceptUpdated") and (
+        event.event_data.get("explanation") is not None
+    ):
+        new_state["explanation_history"].append(
+            {
+                "version": event.version,
+                "explanation": event.event_data["explanation"],
+                "changed_at": timestamp,
+            }
+        )
+
+    new_state["version"] = event.version
+    return new_state
+
+
+class SnapshotStore:
+    """
+    SQLite-backed store of the latest snapshot per aggregate.
+
+    Example:
+        ```python
+        snapshots = SnapshotStore(db_path="./data/events.db")
+
+        state = None
+        for event in event_store.get_events_by_aggregate("concept_001"):
+            state = apply_concept_event(state, event)
+        snapshots.save(AggregateSnapshot("concept_001", "Concept", state["version"], state))
+
+        snapshot = snapshots.get("concept_001")
+        ```
+    """
+
+    # Maximum number of ids bound per IN (...) lookup (SQLite default limit is 999)
+    IN_QUERY_CHUNK_SIZE = 500
+
+    _UPSERT_SQL = """
+        INSERT INTO aggregate_snapshots
+            (aggregate_id, aggregate_type, version, state, created_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(aggregate_id) DO UPDATE SET
+            aggregate_type = excluded.aggregate_type,
+            version = excluded.version,
+            state = excluded.state,
+            created_at = excluded.created_at
+        WHERE excluded.version >= aggregate_snapshots.version
+    """
+
+    def __init__(self, db_path: str = "./data/events.db") -> None:
+        """
+        Initialize SnapshotStore.
+
+        Args:
+            db_path: Path to the event store SQLite database
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+
+        self._ensure_table()
+        logger.info(f"SnapshotStore initialized with database: {db_path}")
+
+    def _ensure_table(self) -> None:
+        """Create the aggregate_snapshots table and its version index if missing."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS aggregate_snapshots (
+                        aggregate_id TEXT PRIMARY KEY,
+                        aggregate_type TEXT NOT NULL,
+                        version INTEGER NOT NULL,
+                        state TEXT NOT NULL,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_snapshot_version
+                    ON aggregate_snapshots(aggregate_id, version)
+                """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to ensure aggregate_snapshots table exists: {e}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the persistent database connection, creating it lazily.
+
+        Callers must hold ``_conn_lock`` while using the connection.
+        """
+        with self._conn_lock:
+            need_new_connection = self._conn is None
+            if not need_new_connection:
+                try:
+                    self._conn.execute("SELECT 1")
+                except sqlite3.ProgrammingError:
+                    need_new_connection = True
+                    self._conn = None
+
+            if need_new_connection:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+                self._conn.row_factory = sqlite3.Row
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                logger.debug("SnapshotStore: Created persistent connection to %s", self.db_path)
+            return self._conn
+
+    def close(self) -> None:
+        """Close the persistent database connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception as exc:
+                    logger.warning("SnapshotStore: Error closing connection: %s", exc)
+                finally:
+                    self._conn = None
+
+    def save(self, snapshot: AggregateSnapshot) -> bool:
+        """
+        Store a snapshot unless a newer one already exists.
+
+        Returns:
+            True if the snapshot was written
+        """
+        return self.save_many([snapshot]) == 1
+
+    def save_many(self, snapshots: Iterable[AggregateSnapshot]) -> int:
+        """
+        Store several snapshots in one transaction.
+
+        Returns:
+            Number of snapshots written (older-than-stored ones are skipped)
+
+        Raises:
+            SnapshotStoreError: If the write fails
+        """
+        rows = [
+            (s.aggregate_id, s.aggregate_type, s.version, json.dumps(s.state)) for s in snapshots
+        ]
+        if not rows:
+            return 0
+
+        with self._conn_lock:
+            conn = self._get_connection()
+            try:
+                before = conn.total_changes
+                conn.executemany(self._UPSERT_SQL, rows)
+                conn.commit()
+                return conn.total_changes - before
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.error(f"Database error saving {len(rows)} snapshots: {e}")
+                raise SnapshotStoreError(f"Failed to save snapshots: {e}")
+
+    def get(self, aggregate_id: str) -> AggregateSnapshot | None:
+        """
+        Get the latest snapshot of an aggregate.
+
+        Returns:
+            The snapshot, or None if none exists or it cannot be decoded
+        """
+        with self._conn_lock:
+            conn = self._get_connection()
+            try:
+                row = conn.execute(
+                    """SELECT aggregate_id, aggregate_type, version, state, created_at
+                       FROM aggregate_snapshots WHERE aggregate_id = ?""",
+                    (aggregate_id,),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Database error reading snapshot for {aggregate_id}: {e}")
+                return None
+
+        if row is None:
+            return None
+
+        try:
+            state = json.loads(row["state"])
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.error(f"Corrupted snapshot for {aggregate_id}: {e}. Ignoring snapshot.")
+            return None
+
+        return AggregateSnapshot(
+            aggregate_id=row["aggregate_id"],
+            aggregate_type=row["aggregate_type"],
+            version=row["version"],
+            state=state,
+            created_at=row["created_at"],
+        )
+
+    def get_versions(self, aggregate_ids: list[str]) -> dict[str, int]:
+        """
+        Get snapshot versions for several aggregates (index-only lookups).
+
+        Returns:
+            Mapping of aggregate_id to snapshot version for those that have one
+        """
+        versions: dict[str, int] = {}
+        with self._conn_lock:
+            conn = self._get_connection()
+            for start in range(0, len(aggregate_ids), self.IN_QUERY_CHUNK_SIZE):
+                chunk = aggregate_ids[start : start + self.IN_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                try:
+                    rows = conn.execute(
+                        f"""SELECT aggregate_id, version FROM aggregate_snapshots
+                            WHERE aggregate_id IN ({placeholders})""",
+                        chunk,
+                    ).fetchall()
+                except sqlite3.Error as e:
+                    logger.error(f"Database error reading snapshot versions: {e}")
+                    continue
+                versions.update({row[0]: row[1] for row in rows})
+        return versions
+
+    def load_current_versions(
+        self, limit: int | None = None, aggregate_type: str | None = None
+    ) -> dict[str, int]:
+        """
+        Get the current version of the most recently snapshotted aggregates.
+
+        Each snapshot version is brought up to date with the events appended
+        after it, found through the events ``(aggregate_id, version)`` index,
+        so the whole lookup is a single query that never reads event payloads.
+
+        Args:
+            limit: Maximum aggregates to return, newest snapshots first
+            aggregate_type: Optional filter by aggregate type
+
+        Returns:
+            Mapping of aggregate_id to latest version
+        """
+        query = """
+            SELECT s.aggregate_id,
+                   COALESCE(
+                       (SELECT MAX(e.version) FROM events e
+                        WHERE e.aggregate_id = s.aggregate_id AND e.version > s.version),
+                       s.version
+                   ) AS version
+            FROM aggregate_snapshots s
+        """
+        params: list[Any] = []
+        if aggregate_type:
+            query += " WHERE s.aggregate_type = ?"
+            params.append(aggregate_type)
+        query += " ORDER BY s.created_at DESC, s.rowid DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._conn_lock:
+            conn = self._get_connection()
+            try:
+                rows = conn.execute(query, params).fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Database error loading snapshot versions: {e}")
+                return {}
+        return {row[0]: row[1] for row in rows}
+
+    def delete(self, aggregate_id: str) -> bool:
+        """
+        Delete the snapshot of an aggregate.
+
+        Returns:
+            True if a snapshot was deleted
+        """
+        with self._conn_lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.execute(
+                    "DELETE FROM aggregate_snapshots WHERE aggregate_id = ?", (aggregate_id,)
+                )
+                conn.commit()
+                return cursor.rowcount > 0
+            except sqlite3.Error as e:
+                logger.error(f"Database error deleting snapshot for {aggregate_id}: {e}")
+                return False
+
+    def count(self) -> int:
+        """Get the number of stored snapshots."""
+        with self._conn_lock:
+            conn = self._get_connection()
+            try:
+                return conn.execute("SELECT COUNT(*) FROM aggregate_snapshots").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.error(f"Error counting snapshots: {e}")
+                return 0
@@ -0,0 +1,161 @@
+"""
+Staged server startup: per-service readiness gates and phase timings.
+
+initialize() used to bring every service up in sequence (event store, outbox,
+Neo4j with retries, ChromaDB, then a blocking embedding model load), and the
+FastMCP lifespan did not yield until all of it was done, so even ``ping`` had
+to wait for the slowest dependency. In staged mode the lifespan yields at
+once and initialize() runs in the background:
+
+    storage ─────────┐
+    neo4j ──┐        │  (concurrent)
+    chromadb┴────────┼─> repository ─> workers
+    embedding_model ─┘  (background load)
+
+Each phase opens the gates of the container attributes it assigns.
+``requires_services`` waits on the gates of the services a tool needs, so a
+tool is served as soon as its own dependencies are ready, and
+``get_tool_availability`` reports the phase timings.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupState:
+    """
+    Readiness gates and timings for one initialize() run.
+
+    Example:
+        ```python
+        startup = StartupState(mode="staged")
+        startup.expect("neo4j_service", "repository")
+
+        with startup.phase("neo4j"):
+            container.neo4j_service = await connect_neo4j()
+        startup.ready("neo4j_service")
+
+        # elsewhere, in a tool call
+        await startup.wait_for(["neo4j_service"], timeout=30)
+        ```
+    """
+
+    def __init__(self, mode: str = "staged") -> None:
+        self.mode = mode
+        self.error: str | None = None
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._phases: dict[str, dict[str, Any]] = {}
+        self._gates: dict[str, asyncio.Event] = {}
+
+    @property
+    def complete(self) -> bool:
+        """True once initialize() has returned or failed."""
+        return self._finished is not None
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since startup began (frozen once complete)."""
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return round((end - self._started) * 1000.0, 3)
+
+    # ------------------------------------------------------------------
+    # Gates
+    # ------------------------------------------------------------------
+
+    def expect(self, *services: str) -> None:
+        """Register services that are not ready yet."""
+        for service in services:
+            self._gates.setdefault(service, asyncio.Event())
+
+    def ready(self, *services: str) -> None:
+        """Open the gates of services that are now assigned on the container."""
+        for service in services:
+            self._gates.setdefault(service, asyncio.Event()).set()
+
+    def is_pending(self, service: str) -> bool:
+        """True while a registered service is still starting."""
+        gate = self._gates.get(service)
+        return gate is not None and not gate.is_set()
+
+    def pending_services(self) -> list[str]:
+        """Registered services whose gates are still closed."""
+        return sorted(name for name, gate in self._gates.items() if not gate.is_set())
+
+    async def wait_for(self, services: Iterable[str], timeout: float) -> bool:
+        """
+        Wait until the given services are ready or startup has finished.
+
+        Services without a gate are treated as ready.
+
+        Returns:
+            False if the timeout expired first
+        """
+        gates = [self._gates[name] for name in services if self.is_pending(name)]
+        if not gates:
+            return True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(gate.wait() for gate in gates)), timeout=timeout
+            )
+        except TimeoutError:
+            return False
+        return True
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """
+        Mark startup as done and release every waiter.
+
+        Services that never became ready stay None on the container, so
+        waiting tools fall through to their SERVICE_UNAVAILABLE response.
+        """
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self._finished = time.perf_counter()
+        for gate in self._gates.values():
+            gate.set()
+
+    # ------------------------------------------------------------------
+    # Phases
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time one startup phase; an exception marks it failed and propagates."""
+        started = time.perf_counter()
+        record: dict[str, Any] = {
+            "status": "running",
+            "started_ms": round((started - self._started) * 1000.0, 3),
+            "duration_ms": None,
+        }
+        self._phases[name] = record
+        try:
+            yield
+        except BaseException as exc:
+            record["status"] = "cancelled" if isinstance(exc, asyncio.CancelledError) else "failed"
+            record["error"] = f"{type(exc).__name__}: {exc}"
+            raise
+        else:
+            record["status"] = "ready"
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+            logger.info(
+                f"Startup phase '{name}' {record['status']} in {record['duration_ms']:.1f}ms"
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Phase timings and readiness for get_tool_availability."""
+        return {
+            "mode": self.mode,
+            "complete": self.complete,
+            "elapsed_ms": self.elapsed_ms(),
+            "error": self.error,
+            "pending_services": self.pending_services(),
+            "phases": {name: dict(record) for name, record in self._phases.items()},
+        }
@@ -0,0 +1,333 @@
+"""
+Lightweight latency tracing for MCP tools and their internal stages.
+
+Tool handlers are wrapped with ``traced_tool``; the repository, projections,
+outbox worker and read paths mark their stages with ``span`` or ``traced``.
+Every observation is recorded in an HDR-style histogram keyed by tool or
+stage name, so percentiles stay within ~3% from microseconds to minutes while
+recording costs two clock reads and a few integer operations under a lock.
+
+    @mcp.tool()
+    @traced_tool
+    async def get_concept(...): ...
+
+    with span("chromadb.query"):
+        results = collection.query(**params)
+
+Snapshots are served by the ``get_tool_metrics`` MCP tool and rendered into
+Prometheus text by ``prometheus_lines`` (also used by the resource monitor).
+"""
+
+import functools
+import inspect
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any
+
+
+# Bucket bounds used when exporting to Prometheus and in snapshot() bucket counts
+EXPORT_BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class HdrHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Latencies are recorded in microseconds. Every power of two is split into
+    ``2 ** sub_bucket_bits`` linear sub-buckets, which bounds the relative
+    error of a reported percentile by ``2 ** -sub_bucket_bits``. Values above
+    ``max_value_us`` land in the top bucket (``max_ms`` stays exact).
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5, max_value_us: int = 3_600_000_000) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_value_us = max_value_us
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self.counts = [0] * (self._index(max_value_us) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def _index(self, value_us: int) -> int:
+        if value_us < self._sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - 1 - self.sub_bucket_bits
+        return ((shift + 1) << self.sub_bucket_bits) + (value_us >> shift) - self._sub_bucket_count
+
+    def _highest_equivalent_us(self, index: int) -> int:
+        """Largest value recorded into bucket ``index``."""
+        if index < self._sub_bucket_count:
+            return index
+        shift = (index >> self.sub_bucket_bits) - 1
+        mantissa = (index & (self._sub_bucket_count - 1)) + self._sub_bucket_count
+        return ((mantissa + 1) << shift) - 1
+
+    def _reported_us(self, index: int) -> int:
+        """Value reported for bucket ``index``: its upper edge, capped at the recorded max."""
+        if index == len(self.counts) - 1:
+            return self.max_us  # the top bucket also holds clamped out-of-range values
+        return min(self._highest_equivalent_us(index), self.max_us)
+
+    def record(self, latency_us: int, error: bool = False) -> None:
+        """Record one latency in microseconds."""
+        latency_us = max(latency_us, 0)
+        self.counts[self._index(min(latency_us, self.max_value_us))] += 1
+        self.count += 1
+        self.total_us += latency_us
+        if latency_us > self.max_us:
+            self.max_us = latency_us
+        if error:
+            self.errors += 1
+
+    def percentiles(self, *percentiles: float) -> list[float]:
+        """
+        Latencies in ms at the given percentiles (0-100), in one pass.
+
+        Each value is the upper edge of the bucket holding that rank, capped
+        at the recorded maximum.
+        """
+        if self.count == 0:
+            return [0.0] * len(percentiles)
+        ranks = sorted(
+            (max(1, math.ceil(self.count * p / 100.0)), position)
+            for position, p in enumerate(percentiles)
+        )
+        values = [self.max_us / 1000.0] * len(percentiles)
+        pending = 0
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while pending < len(ranks) and seen >= ranks[pending][0]:
+                values[ranks[pending][1]] = self._reported_us(index) / 1000.0
+                pending += 1
+            if pending == len(ranks):
+                break
+        return values
+
+    def percentile(self, percentile: float) -> float:
+        """Latency in ms at ``percentile`` (0-100)."""
+        return self.percentiles(percentile)[0]
+
+    def bucket_counts(self, bounds_ms: tuple[float, ...] = EXPORT_BUCKETS_MS) -> list[int]:
+        """Observations per ``bounds_ms`` bucket plus a trailing overflow bucket."""
+        counts = [0] * (len(bounds_ms) + 1)
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                value_ms = self._reported_us(index) / 1000.0
+                counts[bisect_left(bounds_ms, value_ms)] += bucket_count
+        return counts
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return summary statistics and counts per export bucket."""
+        p50, p95, p99, p999 = self.percentiles(50, 95, 99, 99.9)
+        labels = [f"le_{bound:g}ms" for bound in EXPORT_BUCKETS_MS] + ["overflow"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_us / 1000.0, 3),
+            "avg_ms": round(self.total_us / self.count / 1000.0, 3) if self.count else 0.0,
+            "max_ms": self.max_us / 1000.0,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+            "p999_ms": p999,
+            "buckets": dict(zip(labels, self.bucket_counts(), strict=True)),
+        }
+
+
+class TraceRecorder:
+    """Thread-safe registry of per-tool and per-stage latency histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tools: dict[str, HdrHistogram] = {}
+        self._stages: dict[str, HdrHistogram] = {}
+        self._started = time.monotonic()
+
+    @staticmethod
+    def _record(
+        histograms: dict[str, HdrHistogram], name: str, latency_us: int, error: bool
+    ) -> None:
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = HdrHistogram()
+        histogram.record(latency_us, error)
+
+    def observe_tool(self, name: str, latency_us: int, error: bool = False) -> None:
+        """Record one tool call."""
+        with self._lock:
+            self._record(self._tools, name, latency_us, error)
+
+    def observe_stage(self, name: str, latency_us: int, error: bool = False) -> None:
+        """Record one stage execution."""
+        with self._lock:
+            self._record(self._stages, name, latency_us, error)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Histogram snapshots per tool and stage, with throughput since the last reset."""
+        with self._lock:
+            uptime = max(time.monotonic() - self._started, 1e-9)
+
+            def summarize(histograms: dict[str, HdrHistogram]) -> dict[str, Any]:
+                return {
+                    name: {
+                        **histogram.snapshot(),
+                        "throughput_per_s": round(histogram.count / uptime, 3),
+                    }
+                    for name, histogram in sorted(histograms.items())
+                }
+
+            return {
+                "uptime_seconds": round(uptime, 3),
+                "tools": summarize(self._tools),
+                "stages": summarize(self._stages),
+            }
+
+    def reset(self) -> None:
+        """Drop all histograms and restart the throughput window."""
+        with self._lock:
+            self._tools.clear()
+            self._stages.clear()
+            self._started = time.monotonic()
+
+
+_recorder = TraceRecorder()
+
+
+def get_trace_recorder() -> TraceRecorder:
+    """Return the process-wide trace recorder."""
+    return _recorder
+
+
+class _Span:
+    """Context manager timing one stage; set ``error`` to flag a handled failure."""
+
+    __slots__ = ("_started", "error", "stage")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self.error = False
+
+    def __enter__(self) -> "_Span":
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed_us = (time.perf_counter_ns() - self._started) // 1000
+        _recorder.observe_stage(self.stage, elapsed_us, self.error or exc_type is not None)
+
+
+def span(stage: str) -> _Span:
+    """Time a block as ``stage``; raised exceptions count as errors."""
+    return _Span(stage)
+
+
+def traced(stage: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator timing every call of a sync or async function as ``stage``.
+
+    A raised exception or a ``False`` return value (the projections'
+    failure signal) is counted as an error.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter_ns()
+                error = True
+                try:
+                    result = await func(*args, **kwargs)
+                    error = result is False
+                    return result
+                finally:
+                    elapsed_us = (time.perf_counter_ns() - started) // 1000
+                    _recorder.observe_stage(stage, elapsed_us, error)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter_ns()
+            error = True
+            try:
+                result = func(*args, **kwargs)
+                error = result is False
+                return result
+            finally:
+                elapsed_us = (time.perf_counter_ns() - started) // 1000
+                _recorder.observe_stage(stage, elapsed_us, error)
+
+        return wrapper
+
+    return decorator
+
+
+def traced_tool(func: Callable) -> Callable:
+    """
+    Decorator recording the latency of an async MCP tool handler.
+
+    Place it directly below ``@mcp.tool()``. Calls that raise or return a
+    response with ``success: False`` are counted as errors.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter_ns()
+        error = True
+        try:
+            result = await func(*args, **kwargs)
+            error = isinstance(result, dict) and result.get("success") is False
+            return result
+        finally:
+            elapsed_us = (time.perf_counter_ns() - started) // 1000
+            _recorder.observe_tool(name, elapsed_us, error)
+
+    return wrapper
+
+
+def _histogram_lines(prefix: str, label: str, histograms: dict[str, Any]) -> list[str]:
+    metric = f"{prefix}_latency_seconds"
+    lines = [f"# HELP {metric} Latency per {label}", f"# TYPE {metric} histogram"]
+    for name, stats in histograms.items():
+        cumulative = 0
+        for bound, bucket_count in zip(EXPORT_BUCKETS_MS, stats["buckets"].values(), strict=False):
+            cumulative += bucket_count
+            lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound / 1000:g}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{label}="{name}",le="+Inf"}} {stats["count"]}')
+        lines.append(f'{metric}_sum{{{label}="{name}"}} {stats["total_ms"] / 1000:g}')
+        lines.append(f'{metric}_count{{{label}="{name}"}} {stats["count"]}')
+
+    quantiles = f"{prefix}_latency_quantile_seconds"
+    lines.append(f"# HELP {quantiles} HDR latency percentiles per {label}")
+    lines.append(f"# TYPE {quantiles} gauge")
+    for name, stats in histograms.items():
+        for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+            lines.append(
+                f'{quantiles}{{{label}="{name}",quantile="{quantile}"}} {stats[key] / 1000:g}'
+            )
+
+    errors = f"{prefix}_errors_total"
+    lines.append(f"# HELP {errors} Failed calls per {label}")
+    lines.append(f"# TYPE {errors} counter")
+    for name, stats in histograms.items():
+        lines.append(f'{errors}{{{label}="{name}"}} {stats["errors"]}')
+    return lines
+
+
+def prometheus_lines(snapshot: dict[str, Any]) -> list[str]:
+    """Render a ``TraceRecorder.snapshot()`` as Prometheus text-format lines."""
+    lines: list[str] = []
+    if snapshot.get("tools"):
+        lines.extend(_histogram_lines("mcp_tool", "tool", snapshot["tools"]))
+    if snapshot.get("stages"):
+        lines.extend(_histogram_lines("mcp_stage", "stage", snapshot["stages"]))
+    return lines
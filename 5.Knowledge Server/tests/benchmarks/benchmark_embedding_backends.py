@@ -0,0 +1,174 @@
+"""
+Per-batch embedding throughput: fp32 sentence-transformers vs int8 ONNX.
+
+Loads the configured model both ways and times encode() on batches cut from
+the parity fixture corpus:
+
+    python scripts/export_onnx_model.py            # once, writes the ONNX export
+    python -m tests.benchmarks.benchmark_embedding_backends --batch-sizes 1 8 32 128
+
+For each backend it reports the load time, then per batch size the P50/P95
+latency per batch and the throughput in texts per second. ``--model`` also
+accepts a local sentence-transformers directory.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config.settings import get_settings
+from scripts.export_onnx_model import DEFAULT_CORPUS, load_corpus
+from services.onnx_embedding import OnnxSentenceEncoder, default_model_dir
+
+
+def benchmark_encoder(
+    encode: Callable[[list[str], int], Any],
+    texts: list[str],
+    batch_sizes: list[int],
+    iterations: int = 20,
+    warmup: int = 2,
+) -> dict[str, dict[str, float]]:
+    """
+    Time ``encode(batch, batch_size)`` for each batch size.
+
+    Batches cycle through ``texts`` so every size sees the same mix of lengths.
+
+    Returns:
+        {batch_size: {p50_ms, p95_ms, mean_ms, texts_per_s}}
+    """
+    results = {}
+    for batch_size in batch_sizes:
+        batch = [texts[i % len(texts)] for i in range(batch_size)]
+        for _ in range(warmup):
+            encode(batch, batch_size)
+
+        latencies = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            encode(batch, batch_size)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+
+        mean_ms = float(np.mean(latencies))
+        results[str(batch_size)] = {
+            "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 3),
+            "mean_ms": round(mean_ms, 3),
+            "texts_per_s": round(batch_size / (mean_ms / 1000.0), 1),
+        }
+    return results
+
+
+def _timed_load(load: Callable[[], Any]) -> tuple[Any, float]:
+    started = time.perf_counter()
+    model = load()
+    return model, round((time.perf_counter() - started) * 1000.0, 1)
+
+
+def run_benchmark(
+    model_name: str,
+    onnx_dir: Path,
+    batch_sizes: list[int],
+    iterations: int,
+    texts: list[str],
+) -> dict[str, Any]:
+    """Benchmark the int8 ONNX export, then the fp32 sentence-transformers model."""
+    results: dict[str, Any] = {"model": model_name, "batch_sizes": batch_sizes, "backends": {}}
+
+    # ONNX first: once PyTorch is imported its import cost no longer shows in load times
+    onnx_model, load_ms = _timed_load(lambda: OnnxSentenceEncoder.load(onnx_dir))
+    results["backends"]["onnx-int8"] = {
+        "load_ms": load_ms,
+        "batches": benchmark_encoder(
+            lambda batch, size: onnx_model.encode(
+                batch, batch_size=size, normalize_embeddings=True
+            ),
+            texts,
+            batch_sizes,
+            iterations,
+        ),
+    }
+
+    def load_sentence_transformer():
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(model_name, device="cpu")
+
+    st_model, load_ms = _timed_load(load_sentence_transformer)
+    results["backends"]["sentence-transformers-fp32"] = {
+        "load_ms": load_ms,
+        "batches": benchmark_encoder(
+            lambda batch, size: st_model.encode(
+                batch, batch_size=size, normalize_embeddings=True, show_progress_bar=False
+            ),
+            texts,
+            batch_sizes,
+            iterations,
+        ),
+    }
+    return results
+
+
+def format_report(results: dict[str, Any]) -> str:
+    lines = [
+        f"Model: {results['model']}",
+        f"{'backend':<28} {'batch':>6} {'p50 ms':>9} {'p95 ms':>9} {'texts/s':>10}",
+    ]
+    for backend, stats in results["backends"].items():
+        lines.append(f"{backend:<28} load {stats['load_ms']:.0f} ms")
+        for batch_size, batch in stats["batches"].items():
+            lines.append(
+                f"{'':<28} {batch_size:>6} {batch['p50_ms']:>9.2f} {batch['p95_ms']:>9.2f} "
+                f"{batch['texts_per_s']:>10.1f}"
+            )
+
+    baseline = results["backends"].get("sentence-transformers-fp32")
+    candidate = results["backends"].get("onnx-int8")
+    if baseline and candidate:
+        speedups = ", ".join(
+            f"{size}: {batch['texts_per_s'] / baseline['batches'][size]['texts_per_s']:.2f}x"
+            for size, batch in candidate["batches"].items()
+        )
+        lines.append(f"ONNX int8 throughput vs fp32 by batch size: {speedups}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=settings.embedding.model)
+    parser.add_argument(
+        "--onnx-dir", type=Path, help="ONNX export (default: EMBEDDING_ONNX_DIR/<model>)"
+    )
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--iterations", type=int, default=20, help="Timed batches per size")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--output", type=Path, help="Also write the results JSON here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    onnx_dir = args.onnx_dir or default_model_dir(get_settings().embedding.onnx_dir, args.model)
+
+    results = run_benchmark(
+        args.model, onnx_dir, args.batch_sizes, args.iterations, load_corpus(args.corpus)
+    )
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
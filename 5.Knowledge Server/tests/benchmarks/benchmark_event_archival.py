@@ -0,0 +1,136 @@
+"""
+Hot-database growth with and without event-log segment archival.
+
+Simulates a store where every round appends new versions to a fixed set of
+concepts and snapshots them, then reports per round the hot row count, the
+database file size and the time of a WAL checkpoint:
+
+    python -m tests.benchmarks.benchmark_event_archival --rounds 10 --events 20000
+
+With archival the hot table keeps only the events at or after each snapshot,
+so size and checkpoint time stay flat while the archived total grows.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from models.events import ConceptCreated, ConceptUpdated
+from scripts.init_database import init_event_store
+from services.event_store import EventStore
+from services.snapshot_store import AggregateSnapshot, SnapshotStore
+
+
+EXPLANATION = "Closures capture variables from the enclosing scope. " * 8
+
+
+def _checkpoint_ms(db_path: Path) -> float:
+    with sqlite3.connect(db_path) as conn:
+        started = time.perf_counter()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return (time.perf_counter() - started) * 1000.0
+
+
+def run_scenario(workdir: Path, rounds: int, events_per_round: int, archive: bool) -> list:
+    """Per-round {hot_events, archived_events, db_bytes, wal_bytes, checkpoint_ms}."""
+    db_path = workdir / ("archived.db" if archive else "plain.db")
+    with contextlib.redirect_stdout(io.StringIO()):
+        init_event_store(db_path)
+
+    store = EventStore(str(db_path), segment_dir=str(workdir / "segments"))
+    snapshots = SnapshotStore(str(db_path))
+    concepts = max(1, events_per_round // 10)
+    versions = dict.fromkeys(range(concepts), 0)
+    results = []
+
+    for _ in range(rounds):
+        batch = []
+        for i in range(events_per_round):
+            concept = i % concepts
+            versions[concept] += 1
+            version = versions[concept]
+            data = {"name": f"Concept {concept}", "explanation": EXPLANATION}
+            cls = ConceptCreated if version == 1 else ConceptUpdated
+            batch.append(cls(f"concept-{concept}", data, version=version))
+        store.append_events(batch)
+        snapshots.save_many(
+            AggregateSnapshot(f"concept-{c}", "Concept", v, {"version": v})
+            for c, v in versions.items()
+        )
+
+        if archive:
+            while store.archive_segment(older_than_seconds=0) >= store.SEGMENT_MAX_EVENTS:
+                pass
+
+        wal = db_path.with_name(db_path.name + "-wal")
+        results.append(
+            {
+                "hot_events": store.count_events() - store.get_segment_stats()["archived_events"],
+                "archived_events": store.get_segment_stats()["archived_events"],
+                "wal_bytes": wal.stat().st_size if wal.exists() else 0,
+                "checkpoint_ms": round(_checkpoint_ms(db_path), 2),
+                "db_bytes": db_path.stat().st_size,
+            }
+        )
+
+    store.close()
+    snapshots.close()
+    return results
+
+
+def run_benchmark(rounds: int, events_per_round: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        return {
+            "rounds": rounds,
+            "events_per_round": events_per_round,
+            "without_archival": run_scenario(Path(tmp), rounds, events_per_round, False),
+            "with_archival": run_scenario(Path(tmp), rounds, events_per_round, True),
+        }
+
+
+def format_report(results: dict[str, Any]) -> str:
+    lines = [f"{results['events_per_round']} events per round"]
+    for scenario in ("without_archival", "with_archival"):
+        lines.append(scenario.replace("_", " "))
+        lines.append(
+            f"{'round':>6} {'hot':>9} {'archived':>9} {'db MB':>8} {'wal MB':>8} "
+            f"{'ckpt ms':>8}"
+        )
+        for i, row in enumerate(results[scenario], 1):
+            lines.append(
+                f"{i:>6} {row['hot_events']:>9} {row['archived_events']:>9} "
+                f"{row['db_bytes'] / 2**20:>8.1f} {row['wal_bytes'] / 2**20:>8.1f} "
+                f"{row['checkpoint_ms']:>8.2f}"
+            )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--events", type=int, default=20_000, help="Events appended per round")
+    parser.add_argument("--output", type=Path, help="Also write the results JSON here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmark(args.rounds, args.events)
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Encode/decode micro-benchmark for event payload codecs.
+
+Builds N concept events with realistic payloads and times each stage of the
+event store path:
+
+    python -m tests.benchmarks.benchmark_event_codec --events 100000
+
+    create          Event construction incl. validation (encodes payloads to check them)
+    encode          to_db_dict() for the store's event_data codec
+    decode          Event.from_db_row() with pydantic validation
+    decode_trusted  Event.from_db_row(trusted=True), as EventStore reads do
+
+Codecs: "json" (orjson when installed), "json-stdlib" (the same codec with
+orjson disabled) and "msgpack" when installed.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from models import event_codec
+from models.events import ConceptCreated, Event
+
+
+def build_payloads(count: int) -> list[dict[str, Any]]:
+    """Concept payloads shaped like the ones create_concept writes."""
+    return [
+        {
+            "concept_id": f"concept-{i}",
+            "name": f"Concept {i}",
+            "explanation": "Closures capture variables from the enclosing scope. " * 4,
+            "area": "Programming",
+            "topic": "JavaScript",
+            "subtopic": "Functions",
+            "source_urls": [{"url": f"https://example.com/{i}", "title": "Reference"}],
+            "confidence_score": 0.5 + (i % 50) / 100,
+            "created_at": "2025-01-01T00:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+@contextmanager
+def _stdlib_json() -> Iterator[None]:
+    saved = event_codec.orjson
+    event_codec.orjson = None
+    try:
+        yield
+    finally:
+        event_codec.orjson = saved
+
+
+def _timed(fn) -> tuple[Any, float]:
+    # Like timeit: collection passes over the growing result lists would
+    # otherwise dominate and make the stages incomparable
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def benchmark_codec(codec: str, payloads: list[dict[str, Any]]) -> dict[str, float]:
+    """Seconds per stage for ``payloads`` stored with ``codec``."""
+    store_codec = "json" if codec == "json-stdlib" else codec
+    events, create_s = _timed(
+        lambda: [ConceptCreated(p["concept_id"], p, metadata={"source": "bench"}) for p in payloads]
+    )
+
+    def encode():
+        rows = []
+        for event in events:
+            db = event.to_db_dict(store_codec)
+            rows.append((
+                db["event_id"], db["event_type"], db["aggregate_id"], db["aggregate_type"],
+                db["event_data"], db["metadata"], db["version"], db["created_at"],
+            ))
+        return rows
+
+    rows, encode_s = _timed(encode)
+    _, decode_s = _timed(lambda: [Event.from_db_row(row) for row in rows])
+    _, trusted_s = _timed(lambda: [Event.from_db_row(row, trusted=True) for row in rows])
+
+    payload_bytes = sum(len(row[4]) for row in rows)
+    return {
+        "create_s": round(create_s, 3),
+        "encode_s": round(encode_s, 3),
+        "decode_s": round(decode_s, 3),
+        "decode_trusted_s": round(trusted_s, 3),
+        "avg_event_data_bytes": round(payload_bytes / max(len(rows), 1), 1),
+    }
+
+
+def run_benchmark(count: int) -> dict[str, Any]:
+    payloads = build_payloads(count)
+    results: dict[str, Any] = {"events": count, "json_backend": event_codec.JsonCodec.backend}
+
+    with _stdlib_json():
+        results["json-stdlib"] = benchmark_codec("json-stdlib", payloads)
+    if event_codec.orjson is not None:
+        results["json"] = benchmark_codec("json", payloads)
+    if event_codec.msgpack is not None:
+        results["msgpack"] = benchmark_codec("msgpack", payloads)
+    return results
+
+
+def format_report(results: dict[str, Any]) -> str:
+    count = results["events"]
+    lines = [
+        f"{count} events",
+        f"{'codec':<12} {'create':>9} {'encode':>9} {'decode':>9} {'trusted':>9} {'bytes':>7}",
+    ]
+    for codec in ("json-stdlib", "json", "msgpack"):
+        stats = results.get(codec)
+        if stats is None:
+            continue
+        lines.append(
+            f"{codec:<12} {stats['create_s']:>8.2f}s {stats['encode_s']:>8.2f}s "
+            f"{stats['decode_s']:>8.2f}s {stats['decode_trusted_s']:>8.2f}s "
+            f"{stats['avg_event_data_bytes']:>7.0f}"
+        )
+    baseline = results["json-stdlib"]
+    for codec in ("json", "msgpack"):
+        if codec in results:
+            stats = results[codec]
+            lines.append(
+                f"{codec}: write path {_speedup(baseline, stats, 'create_s', 'encode_s')}, "
+                f"store reads {baseline['decode_s'] / max(stats['decode_trusted_s'], 1e-9):.1f}x "
+                "faster than the validated stdlib baseline"
+            )
+    return "\n".join(lines)
+
+
+def _speedup(baseline: dict[str, float], stats: dict[str, float], *stages: str) -> str:
+    before = sum(baseline[stage] for stage in stages)
+    after = sum(stats[stage] for stage in stages)
+    return f"{before / max(after, 1e-9):.1f}x"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--output", type=Path, help="Also write the results JSON here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmark(args.events)
+    print(format_report(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+Reproducible benchmark suite for the MCP Knowledge Server.
+
+Runs entirely on local stand-ins (see stand_ins.py), so it needs no Neo4j,
+no model download and no network:
+
+    python -m tests.benchmarks.benchmark_suite --sizes 1000 10000
+    python -m tests.benchmarks.benchmark_suite --sizes 1000 --update-baseline
+
+For each synthetic graph size it measures throughput and P50/P95/P99 latency
+for every MCP tool registered in mcp_server.py, the outbox drain that seeds
+the graph, and batch confidence recalculation. Results are compared with a
+stored baseline; the exit status is 1 if any metric regressed past the
+threshold or any tool call failed.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import mcp_server
+from services.confidence.composite_calculator import CompositeCalculator
+from services.confidence.retention_calculator import RetentionCalculator
+from services.confidence.understanding_calculator import UnderstandingCalculator
+from services.container import reset_container, set_container
+from tests.benchmarks.stand_ins import (
+    BenchmarkEnvironment,
+    PrefetchedConfidenceData,
+    SyntheticGraph,
+    build_environment,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Latency changes smaller than this are noise, whatever the relative change
+DEFAULT_MIN_DELTA_MS = 1.0
+
+# Tools that change state run first, in this order, each iteration acting on
+# the concept created by create_concept in the same iteration
+MUTATING_TOOLS = (
+    "create_concept",
+    "update_concept",
+    "create_relationship",
+    "delete_relationship",
+    "delete_concept",
+)
+
+RECALC_BATCH_SIZE = 100
+
+
+def summarize(samples: list[float], items: int | None = None) -> dict[str, float]:
+    """
+    Latency percentiles and throughput for a list of durations (seconds).
+
+    Args:
+        samples: Duration of each operation
+        items: Units of work covered by the samples (defaults to one per sample)
+    """
+    if not samples:
+        return {"count": 0}
+    latencies = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    total = float(np.sum(samples))
+    items = len(samples) if items is None else items
+    return {
+        "count": len(samples),
+        "throughput_per_s": items / total if total > 0 else 0.0,
+        "mean_ms": float(latencies.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+    }
+
+
+class ToolBenchmark:
+    """Calls every registered MCP tool through FastMCP with generated arguments."""
+
+    def __init__(self, graph: SyntheticGraph, seed: int = 7):
+        self.graph = graph
+        self.rng = random.Random(seed)
+        self.created: list[str] = []
+
+    def _concept_id(self) -> str:
+        return self.rng.choice(self.graph.concept_ids)
+
+    def _concept(self) -> dict[str, Any]:
+        return self.rng.choice(self.graph.concepts)
+
+    def arguments(self, tool: str, iteration: int) -> dict[str, Any]:
+        """Arguments for one call of ``tool``."""
+        if tool == "create_concept":
+            template = self._concept()
+            return {
+                "name": f"Benchmark concept {iteration}",
+                "explanation": template["explanation"],
+                "area": template["area"],
+                "topic": template["topic"],
+            }
+        if tool == "update_concept":
+            return {
+                "concept_id": self.created[iteration],
+                "explanation": self._concept()["explanation"],
+            }
+        if tool in ("create_relationship", "delete_relationship"):
+            return {
+                "source_id": self.created[iteration],
+                "target_id": self.graph.concept_ids[iteration % self.graph.size],
+                "relationship_type": "relates_to",
+            }
+        if tool == "delete_concept":
+            return {"concept_id": self.created[iteration]}
+        if tool == "get_concept":
+            return {"concept_id": self._concept_id()}
+        if tool == "search_concepts_semantic":
+            return {"query": " ".join(self._concept()["explanation"].split()[:8]), "limit": 10}
+        if tool == "search_concepts_exact":
+            template = self._concept()
+            return {"name": template["name"].split()[0], "area": template["area"], "limit": 20}
+        if tool == "get_recent_concepts":
+            return {"days": 7, "limit": 20}
+        if tool == "get_related_concepts":
+            return {"concept_id": self._concept_id(), "direction": "both", "max_depth": 2}
+        if tool == "get_prerequisites":
+            return {"concept_id": self._concept_id(), "max_depth": 5}
+        if tool == "get_concept_chain":
+            return {"start_id": self._concept_id(), "end_id": self._concept_id()}
+        if tool == "get_concepts_by_confidence":
+            low = self.rng.randrange(0, 80)
+            return {"min_confidence": low, "max_confidence": low + 20, "limit": 20}
+        return {}
+
+    def record(self, tool: str, result: dict[str, Any]) -> None:
+        if tool == "create_concept" and result.get("success"):
+            self.created.append(result["data"]["concept_id"])
+
+
+async def _timed(call: Callable[[], Awaitable[Any]]) -> tuple[float, Any]:
+    started = time.perf_counter()
+    result = await call()
+    return time.perf_counter() - started, result
+
+
+async def bench_tools(graph: SyntheticGraph, iterations: int, warmup: int) -> dict[str, Any]:
+    """Benchmark every MCP tool; reads run after the mutating tools."""
+    tools = await mcp_server.mcp.get_tools()
+    bench = ToolBenchmark(graph)
+    order = [name for name in MUTATING_TOOLS if name in tools]
+    order += sorted(name for name in tools if name not in MUTATING_TOOLS)
+
+    results = {}
+    for name in order:
+        tool = tools[name]
+        if name not in MUTATING_TOOLS:
+            for i in range(warmup):
+                await tool.run(bench.arguments(name, i))
+
+        samples, errors = [], []
+        for i in range(iterations):
+            args = bench.arguments(name, i)
+            elapsed, outcome = await _timed(lambda tool=tool, args=args: tool.run(args))
+            content = outcome.structured_content or {}
+            bench.record(name, content)
+            if content.get("success", True) is False:
+                errors.append(content.get("error") or content.get("message"))
+            samples.append(elapsed)
+
+        results[name] = summarize(samples)
+        results[name]["errors"] = len(errors)
+        if errors:
+            logger.warning(f"{name}: {len(errors)} failed calls, first: {errors[0]}")
+    return results
+
+
+async def bench_outbox_drain(env: BenchmarkEnvironment, graph: SyntheticGraph) -> dict[str, Any]:
+    """Seed the graph through the outbox and time each drained batch."""
+    rows = env.seed_outbox(graph)
+    samples, processed, failed = [], 0, 0
+    while True:
+        elapsed, stats = await _timed(env.outbox_worker.drain_once)
+        if not stats["total"]:
+            break
+        samples.append(elapsed)
+        processed += stats["processed"]
+        failed += stats["failed"]
+
+    result = summarize(samples, items=processed)
+    result.update(rows=rows, errors=failed)
+    return result
+
+
+async def bench_confidence_recalc(graph: SyntheticGraph, iterations: int) -> dict[str, Any]:
+    """Batch composite scoring over prefetched inputs, RECALC_BATCH_SIZE concepts per call."""
+    data = PrefetchedConfidenceData(graph.confidence_inputs())
+    calculator = CompositeCalculator(
+        UnderstandingCalculator(data, None), RetentionCalculator(data, None)
+    )
+    ids = graph.concept_ids
+    batches = [
+        ids[start : start + RECALC_BATCH_SIZE] for start in range(0, len(ids), RECALC_BATCH_SIZE)
+    ]
+
+    samples, scored = [], 0
+    for i in range(max(iterations, len(batches))):
+        batch = batches[i % len(batches)]
+        elapsed, scores = await _timed(lambda batch=batch: calculator.calculate_composite_scores(batch))
+        samples.append(elapsed)
+        scored += len(scores)
+
+    return summarize(samples, items=scored)
+
+
+async def run_size(size: int, iterations: int, warmup: int, seed: int) -> dict[str, Any]:
+    """Build, seed and benchmark one graph size in a fresh temporary directory."""
+    graph = SyntheticGraph(size, seed=seed)
+    with tempfile.TemporaryDirectory(prefix=f"ks-bench-{size}-") as workdir:
+        env = build_environment(Path(workdir))
+        await env.container.embedding_service.initialize()
+        set_container(env.container)
+        try:
+            logger.info(f"[{size}] seeding {size} concepts through the outbox")
+            outbox_drain = await bench_outbox_drain(env, graph)
+            env.warm_read_models()
+            logger.info(f"[{size}] benchmarking tools")
+            tools = await bench_tools(graph, iterations, warmup)
+            logger.info(f"[{size}] benchmarking confidence recalculation")
+            recalc = await bench_confidence_recalc(graph, iterations)
+        finally:
+            reset_container()
+            await env.close()
+
+    return {
+        "tools": tools,
+        "outbox_drain": outbox_drain,
+        "confidence_recalc": recalc,
+        "neo4j_queries": dict(env.neo4j.query_counts),
+    }
+
+
+async def run_suite(sizes: list[int], iterations: int, warmup: int, seed: int) -> dict[str, Any]:
+    results = {
+        "generated_at": datetime.now().isoformat(),
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "iterations": iterations,
+        "seed": seed,
+        "sizes": {},
+    }
+    for size in sizes:
+        results["sizes"][str(size)] = await run_size(size, iterations, warmup, seed)
+    return results
+
+
+def flatten_metrics(results: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Map "size/area/name" to its stats dict, e.g. "1000/tools/get_concept"."""
+    metrics = {}
+    for size, sections in results.get("sizes", {}).items():
+        for tool, stats in sections.get("tools", {}).items():
+            metrics[f"{size}/tools/{tool}"] = stats
+        for section in ("outbox_drain", "confidence_recalc"):
+            if section in sections:
+                metrics[f"{size}/{section}"] = sections[section]
+    return metrics
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[str]:
+    """
+    List regressions against a baseline run.
+
+    A metric regresses when its P95 latency grows by more than ``threshold``
+    (relative) and ``min_delta_ms`` (absolute), or its throughput drops by
+    more than ``threshold``. Metrics missing from either run are skipped.
+    """
+    regressions = []
+    previous = flatten_metrics(baseline)
+    for key, stats in flatten_metrics(results).items():
+        if stats.get("errors"):
+            regressions.append(f"{key}: {stats['errors']} failed calls")
+        old = previous.get(key)
+        if not old or not stats.get("count") or not old.get("count"):
+            continue
+
+        p95, old_p95 = stats["p95_ms"], old["p95_ms"]
+        if p95 > old_p95 * (1 + threshold) and p95 - old_p95 > min_delta_ms:
+            regressions.append(f"{key}: p95 {old_p95:.2f}ms -> {p95:.2f}ms")
+
+        rate, old_rate = stats["throughput_per_s"], old["throughput_per_s"]
+        if rate < old_rate * (1 - threshold) and stats["mean_ms"] - old["mean_ms"] > min_delta_ms:
+            regressions.append(f"{key}: throughput {old_rate:.1f}/s -> {rate:.1f}/s")
+    return regressions
+
+
+def format_report(results: dict[str, Any]) -> str:
+    lines = [f"{'metric':<48} {'count':>6} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for key, stats in flatten_metrics(results).items():
+        if not stats.get("count"):
+            lines.append(f"{key:<48} {'-':>6}")
+            continue
+        lines.append(
+            f"{key:<48} {stats['count']:>6} {stats['throughput_per_s']:>10.1f} "
+            f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10000],
+        help="Synthetic graph sizes in concepts (add 100000 for the large run)",
+    )
+    parser.add_argument("--iterations", type=int, default=100, help="Timed calls per tool")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per read tool")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic graph seed")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Allowed relative regression (0.25 = 25%%)",
+    )
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the results as the new baseline"
+    )
+    parser.add_argument("--output", type=Path, help="Also write the full results JSON here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    # Tool handlers log every call; keep that out of the measurements
+    logging.getLogger().setLevel(logging.WARNING)
+    logger.setLevel(logging.INFO)
+
+    results = asyncio.run(run_suite(args.sizes, args.iterations, args.warmup, args.seed))
+    print(format_report(results))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        logger.info(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        logger.warning(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        failures = compare_to_baseline(results, {}, args.threshold, args.min_delta_ms)
+    else:
+        baseline = json.loads(args.baseline.read_text())
+        failures = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms)
+
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,788 @@
+"""
+Local stand-ins for benchmarking the MCP Knowledge Server without containers.
+
+Everything the tools talk to is either real and embedded or a deterministic
+in-process double:
+
+- EventStore, Outbox, projections, repository, read models: real code
+- ChromaDB: real embedded PersistentClient in a temporary directory, with a
+  feature-hashing embedding function instead of the downloaded ONNX model
+- Neo4j: InMemoryNeo4jService, a dict-backed double that answers the Cypher
+  statements issued by the tools and projections
+- Embeddings: StubEmbeddingService, feature hashing in place of
+  sentence-transformers
+
+SyntheticGraph generates a reproducible concept graph of any size.
+"""
+
+import asyncio
+import contextlib
+import io
+import random
+import re
+import sqlite3
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import chromadb
+import numpy as np
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from chromadb.config import Settings
+
+from config.domains import PREDEFINED_AREAS
+from config.settings import get_settings
+from models.events import ConceptCreated, Event, RelationshipCreated
+from projections.chromadb_projection import ChromaDBProjection
+from projections.neo4j_projection import Neo4jProjection
+from scripts.init_database import init_event_store
+from services.chromadb_service import ChromaDbService
+from services.compensation import CompensationManager
+from services.confidence.models import (
+    ConceptData,
+    ConfidenceInputs,
+    RelationshipData,
+    ReviewData,
+    Success,
+)
+from services.container import ServiceContainer
+from services.embedding_batcher import EmbeddingBatcher
+from services.embedding_cache import EmbeddingCache
+from services.embedding_service import EmbeddingService
+from services.event_store import EventStore
+from services.hierarchy_view import PLACEMENT_QUERY, HierarchyView
+from services.lexical_index import LEXICAL_QUERY, LexicalIndex
+from services.outbox import Outbox
+from services.outbox_worker import OutboxWorker
+from services.relationship_graph import CONCEPTS_QUERY, RELATIONSHIPS_QUERY, RelationshipGraph
+from services.repository import DualStorageRepository
+from services.snapshot_store import SnapshotStore
+
+
+EMBEDDING_DIM = 384
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def hashed_embedding(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Deterministic bag-of-words embedding (signed feature hashing, unit length).
+
+    Texts sharing words get a positive cosine similarity, so semantic search
+    over synthetic data returns meaningful neighbours.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        digest = zlib.crc32(token.encode("utf-8"))
+        vector[digest % dim] += 1.0 if digest & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+class HashingEncoder:
+    """Stand-in for a SentenceTransformer model (only encode() is used)."""
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+        self.max_seq_length = 256
+
+    def encode(self, sentences, normalize_embeddings: bool = True, **kwargs) -> np.ndarray:
+        if isinstance(sentences, str):
+            return hashed_embedding(sentences, self.dim)
+        if not sentences:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([hashed_embedding(text, self.dim) for text in sentences])
+
+
+class StubEmbeddingService(EmbeddingService):
+    """EmbeddingService whose model is a HashingEncoder (no download, no GPU)."""
+
+    async def _initialize_sentence_transformers(self) -> None:
+        # Deliberately bypasses EmbeddingService._shared_model so a real
+        # service created later in the same process never reuses the stub
+        self.model = HashingEncoder(self._embedding_dim)
+
+
+class HashingEmbeddingFunction(EmbeddingFunction[Documents]):
+    """ChromaDB embedding function matching StubEmbeddingService."""
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+
+    def __call__(self, input: Documents) -> Embeddings:  # noqa: A002 - Chroma protocol
+        return [hashed_embedding(text, self.dim) for text in input]
+
+    @staticmethod
+    def name() -> str:
+        return "benchmark-hashing"
+
+    def get_config(self) -> dict[str, Any]:
+        return {"dim": self.dim}
+
+    @staticmethod
+    def build_from_config(config: dict[str, Any]) -> "HashingEmbeddingFunction":
+        return HashingEmbeddingFunction(config.get("dim", EMBEDDING_DIM))
+
+
+class HashingChromaDbService(ChromaDbService):
+    """ChromaDbService whose collection embeds documents with feature hashing."""
+
+    def connect(self) -> bool:
+        persist_path = Path(self.config.persist_directory)
+        persist_path.mkdir(parents=True, exist_ok=True)
+
+        self.client = chromadb.PersistentClient(
+            path=str(persist_path),
+            settings=Settings(anonymized_telemetry=False, allow_reset=False),
+        )
+        self.collection = self.client.get_or_create_collection(
+            name=self.config.collection_name,
+            metadata={
+                "hnsw:space": self.config.distance_function,
+                "hnsw:construction_ef": self.config.hnsw_construction_ef,
+                "hnsw:search_ef": self.config.hnsw_search_ef,
+                "hnsw:M": self.config.hnsw_m,
+            },
+            embedding_function=HashingEmbeddingFunction(),
+        )
+        self._connected = True
+        return True
+
+
+def _normalize_cypher(query: str) -> str:
+    return " ".join(query.split())
+
+
+def _alive(node: dict) -> bool:
+    return not node.get("deleted")
+
+
+def _write_counters(**counts: int) -> dict[str, int]:
+    counters = dict.fromkeys(
+        (
+            "nodes_created",
+            "nodes_deleted",
+            "relationships_created",
+            "relationships_deleted",
+            "properties_set",
+            "labels_added",
+            "labels_removed",
+            "indexes_added",
+            "indexes_removed",
+            "constraints_added",
+            "constraints_removed",
+        ),
+        0,
+    )
+    counters.update(counts)
+    return counters
+
+
+_BY_ID = (
+    "MATCH (c:Concept {concept_id: $concept_id}) WHERE c.deleted IS NULL OR c.deleted = false"
+)
+_RELATIONSHIP_MERGE = re.compile(r"MERGE \(from\)-\[r:(\w+)\]->\(to\)")
+
+
+class InMemoryNeo4jService:
+    """
+    Dict-backed double for Neo4jService.
+
+    Statements are routed on fragments of their (whitespace-normalized) text.
+    Only the statements issued by the tools, projections and read-model
+    rebuilds are understood; anything else raises NotImplementedError so a
+    benchmark never silently measures a no-op. Variable-length path queries
+    are not supported: the relationship tools answer those from the warm
+    RelationshipGraph.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, dict[str, Any]] = {}
+        # relationship_id -> (source_id, target_id, type, properties)
+        self.relationships: dict[str, tuple[str, str, str, dict[str, Any]]] = {}
+        self._edges: dict[tuple[str, str, str], str] = {}
+        self._connected = False
+        self.query_counts: Counter[str] = Counter()
+
+        self._exact_reads = {
+            _normalize_cypher(PLACEMENT_QUERY): self._read_placements,
+            _normalize_cypher(CONCEPTS_QUERY): self._read_concepts,
+            _normalize_cypher(RELATIONSHIPS_QUERY): self._read_relationships,
+            _normalize_cypher(LEXICAL_QUERY): self._read_lexical,
+        }
+        self._reads = [
+            ("ORDER BY c.confidence_score DESC, c.created_at DESC", self._read_search_exact),
+            ("c.last_modified >= $cutoff", self._read_recent),
+            ("<= $max_confidence", self._read_by_confidence),
+            ("MATCH (c:Concept {name: $name})", self._read_duplicate),
+            ("c.concept_id IN [$source_id, $target_id]", self._read_existing),
+            ("WHERE type(r) = $rel_type", self._read_relationship_id),
+            ("c.certainty_score IS NOT NULL", self._read_unmigrated),
+            (f"{_BY_ID} RETURN c.concept_id as concept_id, c.name as name", self._read_concept_name),
+            (f"{_BY_ID} RETURN c", self._read_concept_node),
+        ]
+        self._writes = [
+            ("MERGE (from)-[r:", self._merge_relationship),
+            ("DELETE r", self._delete_relationship),
+            ("MERGE (c:Concept {concept_id: $concept_id})", self._merge_concept),
+            ("SET c.deleted = true", self._soft_delete_concept),
+            ("SET c.retention_tau", self._set_tau),
+            ("SET c += $", self._update_concept),
+        ]
+
+    # Connection lifecycle (mirrors Neo4jService)
+
+    def connect(self) -> bool:
+        self._connected = True
+        return True
+
+    def close(self) -> None:
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def health_check(self) -> dict[str, Any]:
+        return {"status": "healthy" if self._connected else "unhealthy", "latency_ms": 0.0}
+
+    # Query entry points
+
+    def execute_read(
+        self, query: str, parameters: dict[str, Any] | None = None, database: str = "neo4j"
+    ) -> list[dict[str, Any]]:
+        normalized = _normalize_cypher(query)
+        parameters = parameters or {}
+
+        handler = self._exact_reads.get(normalized)
+        if handler is None:
+            handler = self._route(self._reads, normalized)
+        self.query_counts[handler.__name__] += 1
+        return handler(normalized, parameters)
+
+    def execute_write(
+        self, query: str, parameters: dict[str, Any] | None = None, database: str = "neo4j"
+    ) -> dict[str, Any]:
+        normalized = _normalize_cypher(query)
+        handler = self._route(self._writes, normalized)
+        self.query_counts[handler.__name__] += 1
+        return handler(normalized, parameters or {})
+
+    def execute_write_records(
+        self, query: str, parameters: dict[str, Any] | None = None, database: str = "neo4j"
+    ) -> list[dict[str, Any]]:
+        """Apply an UNWIND statement row by row as its single-row equivalent."""
+        normalized = _normalize_cypher(query)
+        prefix = "UNWIND $rows AS row "
+        suffix = " RETURN DISTINCT row.idx AS idx"
+        if not (normalized.startswith(prefix) and normalized.endswith(suffix)):
+            raise NotImplementedError(f"Unsupported bulk Cypher statement: {normalized[:120]}")
+
+        statement = normalized[len(prefix) : -len(suffix)].replace("row.", "$")
+        handler = self._route(self._writes, statement)
+        self.query_counts[handler.__name__] += 1
+
+        applied = []
+        for row in (parameters or {}).get("rows", []):
+            counters = handler(statement, row)
+            if any(counters.values()):
+                applied.append({"idx": row["idx"]})
+        return applied
+
+    @staticmethod
+    def _route(routes, normalized: str):
+        for fragment, handler in routes:
+            if fragment in normalized:
+                return handler
+        raise NotImplementedError(f"Unsupported Cypher statement: {normalized[:120]}")
+
+    def _live_nodes(self):
+        return (node for node in self.nodes.values() if _alive(node))
+
+    # Read handlers
+
+    def _read_placements(self, query, params):
+        return [
+            {key: node.get(key) for key in ("concept_id", "area", "topic", "subtopic")}
+            for node in self._live_nodes()
+        ]
+
+    def _read_concepts(self, query, params):
+        return [
+            {
+                "concept_id": node["concept_id"],
+                "name": node.get("name"),
+                "deleted": bool(node.get("deleted", False)),
+            }
+            for node in self.nodes.values()
+        ]
+
+    def _read_lexical(self, query, params):
+        return [
+            {
+                key: node.get(key)
+                for key in ("concept_id", "name", "explanation", "area", "topic", "subtopic")
+            }
+            for node in self._live_nodes()
+        ]
+
+    def _read_relationships(self, query, params):
+        return [
+            {
+                "relationship_id": relationship_id,
+                "source_id": source_id,
+                "target_id": target_id,
+                "relationship_type": rel_type,
+                "strength": properties.get("strength", 1.0),
+            }
+            for relationship_id, (source_id, target_id, rel_type, properties)
+            in self.relationships.items()
+        ]
+
+    def _read_concept_node(self, query, params):
+        node = self.nodes.get(params["concept_id"])
+        return [{"c": dict(node)}] if node and _alive(node) else []
+
+    def _read_concept_name(self, query, params):
+        node = self.nodes.get(params["concept_id"])
+        if node is None or not _alive(node):
+            return []
+        return [{"concept_id": node["concept_id"], "name": node.get("name")}]
+
+    def _read_duplicate(self, query, params):
+        matches = [
+            node
+            for node in self._live_nodes()
+            if node.get("name") == params["name"]
+            and node.get("area") == params.get("area")
+            and node.get("topic") == params.get("topic")
+        ]
+        matches.sort(key=lambda node: node.get("created_at") or "")
+        return [
+            {"concept_id": node["concept_id"], "created_at": node.get("created_at")}
+            for node in matches[:1]
+        ]
+
+    def _read_existing(self, query, params):
+        return [
+            {"concept_id": concept_id}
+            for concept_id in {params["source_id"], params["target_id"]}
+            if concept_id in self.nodes and _alive(self.nodes[concept_id])
+        ]
+
+    def _read_relationship_id(self, query, params):
+        relationship_id = self._edges.get(
+            (params["source_id"], params["target_id"], params["rel_type"])
+        )
+        return [{"relationship_id": relationship_id}] if relationship_id else []
+
+    @staticmethod
+    def _summary(node: dict, *extra: str) -> dict[str, Any]:
+        row = {
+            key: node.get(key)
+            for key in ("concept_id", "name", "area", "topic", "subtopic", "created_at", *extra)
+        }
+        row["confidence_score"] = node.get("confidence_score") or 0.0
+        return row
+
+    def _read_search_exact(self, query, params):
+        name = params.get("name", "").lower()
+        concept_ids = set(params.get("concept_ids") or ())
+        min_confidence = params.get("min_confidence")
+        matches = [
+            node
+            for node in self._live_nodes()
+            if (not name or name in node.get("name", "").lower())
+            and ("concept_ids" not in params or node["concept_id"] in concept_ids)
+            and all(
+                node.get(key) == params[key] for key in ("area", "topic", "subtopic") if key in params
+            )
+            and (min_confidence is None or (node.get("confidence_score") or 0.0) >= min_confidence)
+        ]
+        matches.sort(key=lambda node: node.get("created_at") or "", reverse=True)
+        matches.sort(key=lambda node: node.get("confidence_score") or 0.0, reverse=True)
+        return [self._summary(node) for node in matches[: params["limit"]]]
+
+    def _read_recent(self, query, params):
+        matches = [
+            node for node in self._live_nodes() if (node.get("last_modified") or "") >= params["cutoff"]
+        ]
+        matches.sort(key=lambda node: node["last_modified"], reverse=True)
+        return [self._summary(node, "last_modified") for node in matches[: params["limit"]]]
+
+    def _read_by_confidence(self, query, params):
+        matches = [
+            node
+            for node in self._live_nodes()
+            if params["min_confidence"]
+            <= (node.get("confidence_score") or 0.0)
+            <= params["max_confidence"]
+        ]
+        matches.sort(key=lambda node: node.get("name") or "")
+        matches.sort(
+            key=lambda node: node.get("confidence_score") or 0.0,
+            reverse="confidence_score DESC" in query,
+        )
+        return [self._summary(node) for node in matches[: params["limit"]]]
+
+    def _read_unmigrated(self, query, params):
+        return [{"unmigrated_count": 0}]
+
+    # Write handlers
+
+    def _merge_concept(self, query, params):
+        concept_id = params["concept_id"]
+        created = concept_id not in self.nodes
+        node = self.nodes.setdefault(concept_id, {"concept_id": concept_id})
+        return _write_counters(
+            nodes_created=int(created), properties_set=self._set_properties(node, params["properties"])
+        )
+
+    def _update_concept(self, query, params):
+        node = self.nodes.get(params["concept_id"])
+        if node is None:
+            return _write_counters()
+        updates = params["updates"] if "updates" in params else params["properties"]
+        return _write_counters(properties_set=self._set_properties(node, updates))
+
+    def _soft_delete_concept(self, query, params):
+        node = self.nodes.get(params["concept_id"])
+        if node is None:
+            return _write_counters()
+        node["deleted"] = True
+        node["deleted_at"] = params["deleted_at"]
+        return _write_counters(properties_set=2)
+
+    def _set_tau(self, query, params):
+        node = self.nodes.get(params["concept_id"])
+        if node is None:
+            return _write_counters()
+        node["retention_tau"] = params["tau"]
+        node["retention_tau_updated_at"] = params["updated_at"]
+        return _write_counters(properties_set=2)
+
+    def _merge_relationship(self, query, params):
+        source_id, target_id = params["from_id"], params["to_id"]
+        if source_id not in self.nodes or target_id not in self.nodes:
+            return _write_counters()
+
+        rel_type = _RELATIONSHIP_MERGE.search(query).group(1)
+        key = (source_id, target_id, rel_type)
+        existing_id = self._edges.get(key)
+        properties = {}
+        if existing_id is not None:
+            properties = self.relationships.pop(existing_id)[3]
+        properties_set = self._set_properties(properties, params["properties"])
+
+        relationship_id = properties.get("relationship_id", existing_id)
+        self.relationships[relationship_id] = (source_id, target_id, rel_type, properties)
+        self._edges[key] = relationship_id
+        return _write_counters(
+            relationships_created=int(existing_id is None), properties_set=properties_set
+        )
+
+    def _delete_relationship(self, query, params):
+        removed = self.relationships.pop(params["relationship_id"], None)
+        if removed is None:
+            return _write_counters()
+        self._edges.pop(removed[:3], None)
+        return _write_counters(relationships_deleted=1)
+
+    @staticmethod
+    def _set_properties(target: dict, properties: dict) -> int:
+        """SET x += $map semantics: null values remove the property."""
+        for key, value in properties.items():
+            if value is None:
+                target.pop(key, None)
+            else:
+                target[key] = value
+        return len(properties)
+
+
+_WORDS = (
+    "graph memory vector index cache query stream batch schema token model network "
+    "recursion closure iterator pointer thread process kernel buffer latency throughput "
+    "gradient tensor embedding attention transformer decoder encoder loss optimizer "
+    "habit focus review recall spacing practice feedback retention motivation "
+    "market revenue pricing funnel channel audience story narrative energy momentum "
+    "entropy field wave particle quantum relativity orbit force mass history empire"
+).split()
+
+_RELATIONSHIP_TYPES = ("PREREQUISITE", "RELATES_TO", "INCLUDES", "CONTAINS")
+
+
+@dataclass
+class SyntheticGraph:
+    """
+    Reproducible concept graph.
+
+    Concept ``i`` gets one PREREQUISITE edge from a recent earlier concept
+    (forming chains for get_prerequisites / get_concept_chain) and, for most
+    concepts, one extra edge of another type to a random earlier concept.
+    """
+
+    size: int
+    seed: int = 42
+    # created_at values are spread over the 60 days before this instant
+    now: datetime = field(default_factory=datetime.now)
+    concepts: list[dict[str, Any]] = field(init=False)
+    relationships: list[dict[str, Any]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        rng = random.Random(self.seed)
+        areas = [area.slug for area in PREDEFINED_AREAS[:8]]
+
+        self.concepts = []
+        for i in range(self.size):
+            words = rng.sample(_WORDS, 3)
+            area = areas[i % len(areas)]
+            created_at = self.now - timedelta(minutes=rng.randrange(60 * 24 * 60))
+            self.concepts.append({
+                "concept_id": f"bench-{i:06d}",
+                "name": f"{words[0].title()} {words[1]} {i}",
+                "explanation": " ".join(rng.choices(_WORDS, k=rng.randint(20, 60))) + ".",
+                "area": area,
+                "topic": f"Topic {rng.randrange(20)}",
+                "subtopic": f"Subtopic {rng.randrange(5)}" if rng.random() < 0.7 else None,
+                "confidence_score": round(rng.uniform(0, 100), 1),
+                "created_at": created_at,
+            })
+
+        self.relationships = []
+        for i in range(1, self.size):
+            source = rng.randrange(max(0, i - 25), i)
+            self._add_relationship(source, i, "PREREQUISITE", 1.0)
+            if i > 1 and rng.random() < 0.8:
+                self._add_relationship(
+                    rng.randrange(i - 1),
+                    i,
+                    rng.choice(_RELATIONSHIP_TYPES[1:]),
+                    round(rng.uniform(0.1, 1.0), 2),
+                )
+
+    def _add_relationship(self, source: int, target: int, rel_type: str, strength: float) -> None:
+        self.relationships.append({
+            "relationship_id": f"bench-rel-{len(self.relationships):07d}",
+            "source_id": self.concepts[source]["concept_id"],
+            "target_id": self.concepts[target]["concept_id"],
+            "relationship_type": rel_type,
+            "strength": strength,
+        })
+
+    @property
+    def concept_ids(self) -> list[str]:
+        return [concept["concept_id"] for concept in self.concepts]
+
+    def events(self) -> list[Event]:
+        """ConceptCreated events followed by RelationshipCreated events."""
+        events: list[Event] = []
+        for concept in self.concepts:
+            data = {key: value for key, value in concept.items() if value is not None}
+            concept_id = data.pop("concept_id")
+            created_at = data.pop("created_at")
+            events.append(ConceptCreated(concept_id, data, created_at=created_at))
+        for relationship in self.relationships:
+            events.append(
+                RelationshipCreated(
+                    relationship["relationship_id"],
+                    {
+                        "relationship_type": relationship["relationship_type"],
+                        "from_concept_id": relationship["source_id"],
+                        "to_concept_id": relationship["target_id"],
+                        "strength": relationship["strength"],
+                    },
+                    created_at=self.now,
+                )
+            )
+        return events
+
+
+    def confidence_inputs(self) -> dict[str, ConfidenceInputs]:
+        """Scoring inputs per concept, as DataAccessLayer would fetch them."""
+        rng = random.Random(self.seed + 1)
+        now = self.now
+        neighbours: dict[str, list[str]] = {concept_id: [] for concept_id in self.concept_ids}
+        types: dict[str, Counter[str]] = {concept_id: Counter() for concept_id in self.concept_ids}
+        for relationship in self.relationships:
+            for own, other in (
+                (relationship["source_id"], relationship["target_id"]),
+                (relationship["target_id"], relationship["source_id"]),
+            ):
+                neighbours[own].append(other)
+                types[own][relationship["relationship_type"]] += 1
+
+        inputs = {}
+        for concept in self.concepts:
+            concept_id = concept["concept_id"]
+            days = rng.randrange(120)
+            inputs[concept_id] = ConfidenceInputs(
+                concept=ConceptData(
+                    id=concept_id,
+                    name=concept["name"],
+                    explanation=concept["explanation"],
+                    created_at=concept["created_at"],
+                    area=concept["area"],
+                    topic=concept["topic"],
+                    subtopic=concept["subtopic"],
+                ),
+                relationships=RelationshipData(
+                    total_relationships=len(neighbours[concept_id]),
+                    relationship_types=dict(types[concept_id]),
+                    connected_concept_ids=neighbours[concept_id],
+                ),
+                review=ReviewData(
+                    last_reviewed_at=now - timedelta(days=days),
+                    days_since_review=days,
+                    review_count=rng.randrange(10),
+                ),
+                tau=rng.choice((7, 14, 30, 60)),
+            )
+        return inputs
+
+
+class PrefetchedConfidenceData:
+    """DataAccessLayer stand-in serving precomputed ConfidenceInputs."""
+
+    def __init__(self, inputs: dict[str, ConfidenceInputs]):
+        self.inputs = inputs
+
+    async def get_confidence_inputs_batch(self, concept_ids: list[str]) -> Success:
+        return Success({concept_id: self.inputs[concept_id] for concept_id in concept_ids})
+
+
+@dataclass
+class BenchmarkEnvironment:
+    """Services wired the way mcp_server.initialize() wires them."""
+
+    workdir: Path
+    container: ServiceContainer
+    neo4j: InMemoryNeo4jService
+    outbox_worker: OutboxWorker
+    _connections: list[sqlite3.Connection] = field(default_factory=list)
+
+    def seed_outbox(self, graph: SyntheticGraph, batch_size: int = 5000) -> int:
+        """
+        Append the graph's events with their outbox rows, as the repository does.
+
+        Concepts go to both projections and relationships to Neo4j only.
+
+        Returns:
+            Number of outbox rows written
+        """
+        event_store = self.container.event_store
+        outbox = self.container.outbox
+        events = graph.events()
+        rows = 0
+        for start in range(0, len(events), batch_size):
+            chunk = events[start : start + batch_size]
+            entries = []
+            for event in chunk:
+                projections = (
+                    ["neo4j", "chromadb"] if event.aggregate_type == "Concept" else ["neo4j"]
+                )
+                entries.extend(outbox.build_entries([event.event_id], projections))
+            event_store.append_events(chunk, outbox_entries=entries)
+            rows += len(entries)
+        return rows
+
+    def warm_read_models(self) -> None:
+        """
+        Load the hierarchy view, relationship graph and lexical index, as a
+        running server has after its first tool calls (the tools otherwise
+        fall back to variable-length Cypher, which InMemoryNeo4jService does
+        not answer).
+        """
+        container = self.container
+        sequence = container.event_store.get_projected_sequence()
+        container.hierarchy_view.load(self.neo4j.execute_read(PLACEMENT_QUERY), sequence)
+        container.relationship_graph.load(
+            self.neo4j.execute_read(CONCEPTS_QUERY),
+            self.neo4j.execute_read(RELATIONSHIPS_QUERY),
+            sequence,
+        )
+        container.lexical_index.load(self.neo4j.execute_read(LEXICAL_QUERY), sequence)
+
+    async def close(self) -> None:
+        container = self.container
+        if container.embedding_batcher:
+            await container.embedding_batcher.close()
+        for connection in self._connections:
+            connection.close()
+        container.chromadb_service.close()
+        container.event_store.close()
+        container.outbox.close()
+        await asyncio.sleep(0)
+
+
+def build_environment(workdir: Path) -> BenchmarkEnvironment:
+    """
+    Create an empty server environment in ``workdir``.
+
+    Mirrors mcp_server.initialize() with the stand-ins; the caller sets it as
+    the global container and seeds it (see BenchmarkEnvironment.seed_outbox).
+    """
+    settings = get_settings()
+    workdir.mkdir(parents=True, exist_ok=True)
+    db_path = str(workdir / "events.db")
+    with contextlib.redirect_stdout(io.StringIO()):
+        init_event_store(Path(db_path))
+
+    neo4j = InMemoryNeo4jService()
+    neo4j.connect()
+    chromadb_service = HashingChromaDbService(persist_directory=str(workdir / "chroma"))
+    chromadb_service.connect()
+
+    container = ServiceContainer(
+        event_store=EventStore(db_path=db_path),
+        outbox=Outbox(db_path=db_path),
+        neo4j_service=neo4j,
+        chromadb_service=chromadb_service,
+        embedding_service=StubEmbeddingService(),
+        snapshot_store=SnapshotStore(db_path=db_path),
+        hierarchy_view=HierarchyView(),
+        relationship_graph=RelationshipGraph(),
+        lexical_index=LexicalIndex(),
+    )
+    container.embedding_batcher = EmbeddingBatcher(
+        container.embedding_service,
+        max_batch_size=settings.embedding.microbatch_max_size,
+        max_wait_ms=settings.embedding.microbatch_max_wait_ms,
+    )
+
+    neo4j_projection = Neo4jProjection(neo4j)
+    chromadb_projection = ChromaDBProjection(chromadb_service)
+    compensation_connection = sqlite3.connect(db_path)
+    container.repository = DualStorageRepository(
+        event_store=container.event_store,
+        outbox=container.outbox,
+        neo4j_projection=neo4j_projection,
+        chromadb_projection=chromadb_projection,
+        embedding_service=container.embedding_service,
+        embedding_cache=EmbeddingCache(db_path=db_path),
+        compensation_manager=CompensationManager(
+            neo4j_service=neo4j,
+            chromadb_service=chromadb_service,
+            connection=compensation_connection,
+        ),
+        snapshot_store=container.snapshot_store,
+        snapshot_interval=settings.snapshot_interval,
+    )
+    container.outbox_worker = OutboxWorker(
+        outbox=container.outbox,
+        event_store=container.event_store,
+        projections={"neo4j": neo4j_projection, "chromadb": chromadb_projection},
+        batch_size=settings.outbox_worker_batch_size,
+        max_in_flight=settings.outbox_worker_max_in_flight,
+    )
+
+    return BenchmarkEnvironment(
+        workdir=workdir,
+        container=container,
+        neo4j=neo4j,
+        outbox_worker=container.outbox_worker,
+        _connections=[compensation_connection],
+    )
@@ -74,6 +74,7 @@ def mock_embedding_service():
     # Mock config
     mock_config = Mock()
     mock_config.model_name = "all-MiniLM-L6-v2"
+    mock_config.cache_key = "all-MiniLM-L6-v2"
     mock.config = mock_config
 
     # Mock embedding generation (384-dimensional zero vector)
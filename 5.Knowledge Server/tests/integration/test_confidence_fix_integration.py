@@ -88,7 +88,7 @@ async def test_relationship_created_updates_both_concepts():
     )
 
     # Setup event store to return this event
-    event_store.get_all_events.return_value = [event]
+    event_store.iter_events_after.return_value = [(1, event)]
 
     # Setup calculator to return different scores for each concept
     calculator.calculate_composite_score.side_effect = [
@@ -182,7 +182,7 @@ async def test_relationship_deleted_updates_both_concepts():
     )
 
     # Setup event store
-    event_store.get_all_events.return_value = [event]
+    event_store.iter_events_after.return_value = [(1, event)]
 
     # Setup calculator
     calculator.calculate_composite_score.side_effect = [
@@ -247,7 +247,7 @@ async def test_missing_concept_ids_handled_gracefully():
         version=1,
     )
 
-    event_store.get_all_events.return_value = [event]
+    event_store.iter_events_after.return_value = [(1, event)]
 
     # Process events
     stats = await listener.process_pending_events()
@@ -293,7 +293,7 @@ async def test_calculation_errors_queue_for_retry():
         version=1,
     )
 
-    event_store.get_all_events.return_value = [event]
+    event_store.iter_events_after.return_value = [(1, event)]
 
     # First concept fails - second should still be attempted (queue-and-continue behavior)
     calculator.calculate_composite_score.side_effect = [
@@ -66,6 +66,7 @@ def build_components(score=0.75, *, batch_window=5.0):
         cache_manager=cache,  # type: ignore[arg-type]
         redis_client=redis_client,  # type: ignore[arg-type]
         batch_window_seconds=batch_window,
+        queue_path=":memory:",
     )
     retention = FakeRetentionCalculator()
     processor = EventProcessor(  # type: ignore[arg-type]
@@ -0,0 +1,101 @@
+"""
+Integration tests: get_related_concepts returns the same rows from the
+in-memory RelationshipGraph and from the Cypher fallback (requires Neo4j).
+"""
+
+import pytest
+
+from config import Config
+from services.container import ServiceContainer, reset_container, set_container
+from services.neo4j_service import Neo4jService
+from services.relationship_graph import CONCEPTS_QUERY, RELATIONSHIPS_QUERY, RelationshipGraph
+from tools.relationship_tools import _query_related_concepts
+
+
+PREFIX = "test-parity-"
+
+# a -> b -> d -> e, a -> c -> d, a -> e (RELATES_TO), so d is reached through
+# two paths of length 2 and e through paths of length 1 and 3
+RELATIONSHIPS = [
+    ("a", "b", "PREREQUISITE", 0.9),
+    ("a", "c", "PREREQUISITE", 0.9),
+    ("b", "d", "PREREQUISITE", 0.5),
+    ("c", "d", "RELATES_TO", 0.4),
+    ("d", "e", "PREREQUISITE", 0.7),
+    ("a", "e", "RELATES_TO", 0.3),
+]
+
+
+@pytest.fixture
+def neo4j_graph():
+    """Small diamond-shaped concept graph in Neo4j, loaded into the container."""
+    try:
+        config = Config()
+        service = Neo4jService(
+            uri=config.NEO4J_URI, user=config.NEO4J_USER, password=config.NEO4J_PASSWORD
+        )
+        service.connect()
+        if not service.is_connected():
+            pytest.skip("Neo4j not available for integration tests")
+    except Exception as e:
+        pytest.skip(f"Neo4j not available: {e}")
+
+    cleanup_query = f"MATCH (c:Concept) WHERE c.concept_id STARTS WITH '{PREFIX}' DETACH DELETE c"
+    service.execute_write(cleanup_query, {})
+    for name in "abcde":
+        service.execute_write(
+            "CREATE (:Concept {concept_id: $concept_id, name: $name, deleted: false})",
+            {"concept_id": PREFIX + name, "name": name.upper()},
+        )
+    for index, (source, target, rel_type, strength) in enumerate(RELATIONSHIPS):
+        service.execute_write(
+            f"""MATCH (a:Concept {{concept_id: $source}}), (b:Concept {{concept_id: $target}})
+                CREATE (a)-[:{rel_type} {{relationship_id: $rid, strength: $strength}}]->(b)""",
+            {
+                "source": PREFIX + source,
+                "target": PREFIX + target,
+                "rid": f"{PREFIX}r{index}",
+                "strength": strength,
+            },
+        )
+
+    set_container(ServiceContainer(neo4j_service=service))
+    yield service
+
+    reset_container()
+    service.execute_write(cleanup_query, {})
+    service.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("direction", ["outgoing", "incoming", "both"])
+@pytest.mark.parametrize("max_depth", [1, 2, 3])
+async def test_cypher_fallback_matches_relationship_graph(neo4j_graph, direction, max_depth):
+    graph = RelationshipGraph()
+    graph.load(
+        neo4j_graph.execute_read(CONCEPTS_QUERY, {}),
+        neo4j_graph.execute_read(RELATIONSHIPS_QUERY, {}),
+        sequence=0,
+    )
+    start = PREFIX + ("a" if direction != "incoming" else "e")
+
+    cypher_rows = await _query_related_concepts(start, None, direction, max_depth)
+    graph_rows = graph.related(start, direction=direction, max_depth=max_depth)
+
+    def distances(rows):
+        return [(row["concept_id"], row["distance"]) for row in rows]
+
+    assert distances(cypher_rows) == distances(graph_rows)
+    assert len({row["concept_id"] for row in cypher_rows}) == len(cypher_rows)
+
+
+@pytest.mark.asyncio
+async def test_cypher_fallback_reports_first_relationship_of_shortest_path(neo4j_graph):
+    rows = await _query_related_concepts(PREFIX + "a", None, "outgoing", 3)
+
+    by_id = {row["concept_id"]: row for row in rows}
+    assert by_id[PREFIX + "e"]["distance"] == 1
+    assert by_id[PREFIX + "e"]["relationship_type"] == "RELATES_TO"
+    assert by_id[PREFIX + "e"]["strength"] == pytest.approx(0.3)
+    assert by_id[PREFIX + "d"]["relationship_type"] == "PREREQUISITE"
+    assert by_id[PREFIX + "d"]["strength"] == pytest.approx(0.9)
@@ -8,6 +8,8 @@ from unittest.mock import Mock
 import pytest
 
 from config import PREDEFINED_AREAS
+from models.events import ConceptCreated, ConceptUpdated
+from services.hierarchy_view import HierarchyView
 from tools import analytics_tools
 
 # Number of predefined areas (used in tests)
@@ -830,3 +832,67 @@ class TestListAreas:
 
         empty_area = next(a for a in result["data"]["areas"] if a["name"] == "CustomEmptyArea")
         assert empty_area["concept_count"] == 0
+
+
+class TestHierarchyViewPath:
+    """Tests for list_hierarchy / list_areas served from the HierarchyView"""
+
+    @pytest.fixture
+    def view_services(self, setup_services, configured_container):
+        analytics_tools._view_responses.clear()
+        configured_container.hierarchy_view = HierarchyView()
+        pending_events = []
+
+        def iter_events_after(after_sequence):
+            events = [(seq, e) for seq, e in pending_events if seq > after_sequence]
+            return iter(events)
+
+        configured_container.event_store.get_projected_sequence = Mock(return_value=10)
+        configured_container.event_store.iter_events_after = Mock(side_effect=iter_events_after)
+        setup_services["neo4j"].execute_read = Mock(return_value=[
+            {"concept_id": "c1", "area": "coding-development", "topic": "Python",
+             "subtopic": "Functions"},
+        ])
+        return {**setup_services, "view": configured_container.hierarchy_view,
+                "events": pending_events}
+
+    @pytest.mark.asyncio
+    async def test_cold_start_scans_neo4j_once(self, view_services):
+        """The first call loads placements; later calls do not touch Neo4j"""
+        result1 = await analytics_tools.list_hierarchy()
+        result2 = await analytics_tools.list_hierarchy()
+
+        assert result1["success"] is True
+        assert result1["data"]["total_concepts"] == 1
+        assert result1 == result2
+        assert view_services["neo4j"].execute_read.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_new_events_are_visible_immediately(self, view_services):
+        """Events appended after the scan update counts without a rescan"""
+        await analytics_tools.list_hierarchy()
+
+        view_services["events"].extend([
+            (11, ConceptCreated(aggregate_id="c2", concept_data={
+                "name": "Closures", "area": "coding-development", "topic": "Python"})),
+            (12, ConceptUpdated(aggregate_id="c1", updates={"area": "learning"}, version=2)),
+        ])
+
+        hierarchy = await analytics_tools.list_hierarchy()
+        areas = await analytics_tools.list_areas()
+
+        assert view_services["neo4j"].execute_read.call_count == 1
+        assert hierarchy["data"]["total_concepts"] == 2
+        counts = {a["name"]: a["concept_count"] for a in areas["data"]["areas"]}
+        assert counts["coding-development"] == 1
+        assert counts["learning"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_view_rescans_neo4j(self, view_services):
+        """mark_stale() (e.g. after a failed consistency check) triggers a rescan"""
+        await analytics_tools.list_areas()
+        view_services["view"].mark_stale()
+
+        await analytics_tools.list_areas()
+
+        assert view_services["neo4j"].execute_read.call_count == 2
@@ -0,0 +1,205 @@
+"""
+Unit tests for AsyncNeo4jService
+
+Tests cover:
+- Connection through AsyncGraphDatabase with the tuned pool settings
+- Managed read/write transactions and result serialization
+- Per-query latency trace stages and in-flight counters
+- execute_neo4j_read fallback to the sync service
+"""
+
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from services.async_neo4j_service import AsyncNeo4jService
+from services.container import ServiceContainer
+from services.tracing import get_trace_recorder
+from tools.service_utils import execute_neo4j_read
+
+
+class _FakeResult:
+    """Async-iterable stand-in for neo4j.AsyncResult."""
+
+    def __init__(self, records, summary=None):
+        self._records = records
+        self._summary = summary
+
+    def __aiter__(self):
+        self._iter = iter(self._records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def consume(self):
+        return self._summary
+
+
+def _mock_driver(records=None, summary=None, error=None):
+    """Build an async driver mock whose sessions run the transaction function."""
+    tx = Mock()
+    tx.run = AsyncMock(return_value=_FakeResult(records or [], summary))
+
+    async def run_work(work):
+        if error is not None:
+            raise error
+        return await work(tx)
+
+    session = MagicMock()
+    session.execute_read = AsyncMock(side_effect=run_work)
+    session.execute_write = AsyncMock(side_effect=run_work)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+
+    driver = Mock()
+    driver.session = Mock(return_value=session)
+    driver.verify_connectivity = AsyncMock()
+    driver.close = AsyncMock()
+    return driver, tx
+
+
+@pytest.fixture(autouse=True)
+def reset_recorder():
+    get_trace_recorder().reset()
+    yield
+    get_trace_recorder().reset()
+
+
+@pytest.fixture
+def connected_service():
+    def _build(**kwargs):
+        service = AsyncNeo4jService()
+        service.driver, tx = _mock_driver(**kwargs)
+        service._connected = True
+        return service, tx
+
+    return _build
+
+
+class TestAsyncNeo4jService:
+    """Test AsyncNeo4jService functionality."""
+
+    @patch("services.async_neo4j_service.AsyncGraphDatabase.driver")
+    async def test_connect_uses_tuned_pool(self, mock_driver_factory):
+        driver, _ = _mock_driver()
+        mock_driver_factory.return_value = driver
+
+        service = AsyncNeo4jService(max_pool_size=64, connection_acquisition_timeout=2.5)
+        assert await service.connect() is True
+
+        kwargs = mock_driver_factory.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 64
+        assert kwargs["connection_acquisition_timeout"] == 2.5
+        assert service.is_connected()
+
+    @patch("services.async_neo4j_service.AsyncGraphDatabase.driver")
+    async def test_connect_service_unavailable(self, mock_driver_factory):
+        driver, _ = _mock_driver()
+        driver.verify_connectivity.side_effect = ServiceUnavailable("down")
+        mock_driver_factory.return_value = driver
+
+        service = AsyncNeo4jService()
+        assert await service.connect() is False
+        assert not service.is_connected()
+
+    async def test_execute_read_not_connected(self):
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await AsyncNeo4jService().execute_read("RETURN 1")
+
+    async def test_execute_read_returns_serialized_records(self, connected_service):
+        service, tx = connected_service(records=[{"id": "c1", "tags": ("a", "b")}])
+
+        results = await service.execute_read(
+            "MATCH (c) RETURN c", {"limit": 5}, query_name="search"
+        )
+
+        assert results == [{"id": "c1", "tags": ["a", "b"]}]
+        tx.run.assert_awaited_once_with("MATCH (c) RETURN c", {"limit": 5})
+
+    async def test_execute_write_returns_counters(self, connected_service):
+        summary = Mock()
+        summary.counters = Mock(nodes_created=1, properties_set=3)
+        service, _ = connected_service(summary=summary)
+
+        stats = await service.execute_write("CREATE (n)")
+
+        assert stats["nodes_created"] == 1
+        assert stats["properties_set"] == 3
+        service.driver.session.return_value.execute_write.assert_awaited_once()
+
+    async def test_latency_recorded_per_query_name(self, connected_service):
+        service, _ = connected_service(records=[])
+
+        await service.execute_read("RETURN 1", query_name="list_areas")
+        await service.execute_read("RETURN 1", query_name="list_areas")
+        await service.execute_read("RETURN 1", query_name="get_prerequisites")
+
+        stats = service.get_stats()
+        assert set(stats["queries"]) == {"list_areas", "get_prerequisites"}
+        assert stats["queries"]["list_areas"]["count"] == 2
+        assert stats["queries"]["get_prerequisites"]["count"] == 1
+        assert stats["peak_in_flight"] == 1
+        assert stats["in_flight"] == 0
+
+    async def test_failed_query_recorded_as_error(self, connected_service):
+        service, _ = connected_service(error=ServiceUnavailable("down"))
+
+        with pytest.raises(ServiceUnavailable):
+            await service.execute_read("RETURN 1", query_name="list_areas")
+
+        assert service.get_stats()["queries"]["list_areas"]["errors"] == 1
+        assert service.get_stats()["in_flight"] == 0
+
+    async def test_close(self, connected_service):
+        service, _ = connected_service()
+        driver = service.driver
+
+        await service.close()
+
+        driver.close.assert_awaited_once()
+        assert not service.is_connected()
+
+
+class TestExecuteNeo4jRead:
+    """Test the tool-facing read helper."""
+
+    async def test_prefers_async_service(self):
+        container = ServiceContainer()
+        container.neo4j_service = Mock()
+        container.async_neo4j_service = Mock()
+        container.async_neo4j_service.execute_read = AsyncMock(return_value=[{"n": 1}])
+
+        results = await execute_neo4j_read(
+            "RETURN 1 AS n", {}, query_name="ping", container=container
+        )
+
+        assert results == [{"n": 1}]
+        container.async_neo4j_service.execute_read.assert_awaited_once_with(
+            "RETURN 1 AS n", {}, query_name="ping"
+        )
+        container.neo4j_service.execute_read.assert_not_called()
+
+    async def test_async_read_is_recorded_once(self, connected_service):
+        container = ServiceContainer()
+        container.async_neo4j_service, _ = connected_service(records=[])
+
+        await execute_neo4j_read("RETURN 1", query_name="ping", container=container)
+
+        stages = get_trace_recorder().snapshot()["stages"]
+        assert {name: s["count"] for name, s in stages.items()} == {"neo4j.query.ping": 1}
+
+    async def test_falls_back_to_sync_service(self):
+        container = ServiceContainer()
+        container.neo4j_service = Mock()
+        container.neo4j_service.execute_read.return_value = [{"n": 1}]
+
+        results = await execute_neo4j_read("RETURN 1 AS n", {"x": 1}, container=container)
+
+        assert results == [{"n": 1}]
+        container.neo4j_service.execute_read.assert_called_once_with("RETURN 1 AS n", {"x": 1})
+        assert get_trace_recorder().snapshot()["stages"]["neo4j.query.read"]["count"] == 1
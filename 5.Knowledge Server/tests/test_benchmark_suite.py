@@ -0,0 +1,75 @@
+"""
+Smoke tests for the local-stand-in benchmark suite (tests/benchmarks)
+"""
+
+from datetime import datetime
+
+import pytest
+
+import mcp_server
+from tests.benchmarks.benchmark_suite import compare_to_baseline, run_size, summarize
+from tests.benchmarks.stand_ins import InMemoryNeo4jService, SyntheticGraph
+
+
+def _results(p95_ms, throughput=100.0, mean_ms=10.0, errors=0):
+    stats = {
+        "count": 10,
+        "throughput_per_s": throughput,
+        "mean_ms": mean_ms,
+        "p50_ms": p95_ms / 2,
+        "p95_ms": p95_ms,
+        "p99_ms": p95_ms,
+        "errors": errors,
+    }
+    return {"sizes": {"1000": {"tools": {"get_concept": stats}}}}
+
+
+class TestBenchmarkSuite:
+    """Tests for the benchmark run and baseline comparison"""
+
+    def test_synthetic_graph_is_reproducible(self):
+        now = datetime(2026, 1, 1)
+        first, second = SyntheticGraph(50, seed=3, now=now), SyntheticGraph(50, seed=3, now=now)
+
+        assert first.concepts == second.concepts
+        assert first.relationships == second.relationships
+        assert len(first.relationships) >= 49
+
+    async def test_small_run_covers_every_tool_without_errors(self):
+        results = await run_size(40, iterations=2, warmup=1, seed=1)
+
+        tools = await mcp_server.mcp.get_tools()
+        assert set(results["tools"]) == set(tools)
+        for name, stats in results["tools"].items():
+            assert stats["count"] == 2, name
+            assert stats["errors"] == 0, name
+        assert results["outbox_drain"]["errors"] == 0
+        assert results["confidence_recalc"]["count"] >= 1
+
+    def test_summarize_percentiles(self):
+        stats = summarize([0.001 * i for i in range(1, 101)])
+
+        assert stats["count"] == 100
+        assert stats["p50_ms"] == pytest.approx(50.5)
+        assert stats["p99_ms"] == pytest.approx(99.01)
+
+    def test_p95_regression_past_threshold_is_reported(self):
+        regressions = compare_to_baseline(_results(20.0), _results(10.0), threshold=0.25)
+
+        assert regressions == ["1000/tools/get_concept: p95 10.00ms -> 20.00ms"]
+
+    def test_small_absolute_change_is_ignored(self):
+        regressions = compare_to_baseline(_results(0.2), _results(0.1), threshold=0.25)
+
+        assert regressions == []
+
+    def test_failed_calls_are_reported_without_baseline(self):
+        regressions = compare_to_baseline(_results(1.0, errors=3), {}, threshold=0.25)
+
+        assert regressions == ["1000/tools/get_concept: 3 failed calls"]
+
+    def test_unknown_cypher_is_rejected(self):
+        neo4j = InMemoryNeo4jService()
+
+        with pytest.raises(NotImplementedError):
+            neo4j.execute_read("MATCH (n) RETURN count(n)")
@@ -422,3 +422,98 @@ class TestEdgeCases:
         assert result is True
         call_args = mock_collection.add.call_args
         assert call_args[1]["metadatas"][0]["name"] == ""
+
+
+class TestBulkProjection:
+    """Test project_events batched upsert/delete."""
+
+    def test_creates_share_one_upsert(self, projection, mock_collection):
+        """Test a batch of creates becomes one upsert call."""
+        events = [
+            ConceptCreated(
+                aggregate_id=f"c{i}",
+                concept_data={"name": str(i), "explanation": f"e{i}"},
+                version=1,
+            )
+            for i in range(3)
+        ]
+
+        results = projection.project_events(events)
+
+        assert results == [True, True, True]
+        mock_collection.upsert.assert_called_once()
+        kwargs = mock_collection.upsert.call_args.kwargs
+        assert kwargs["ids"] == ["c0", "c1", "c2"]
+        assert kwargs["documents"] == ["e0", "e1", "e2"]
+        mock_collection.get.assert_not_called()
+        mock_collection.delete.assert_not_called()
+
+    def test_updates_coalesce_per_concept(self, projection, mock_collection):
+        """Test several updates to one concept produce a single merged write."""
+        mock_collection.get.return_value = {
+            "ids": ["c1"],
+            "documents": ["old doc"],
+            "metadatas": [{"name": "Old", "area": "Math"}],
+        }
+        events = [
+            ConceptUpdated(aggregate_id="c1", updates={"name": "New"}, version=2),
+            ConceptUpdated(aggregate_id="c1", updates={"topic": "Algebra"}, version=3),
+            ConceptUpdated(aggregate_id="c1", updates={"explanation": "new doc"}, version=4),
+        ]
+
+        results = projection.project_events(events)
+
+        assert results == [True, True, True]
+        mock_collection.get.assert_called_once_with(ids=["c1"])
+        kwargs = mock_collection.upsert.call_args.kwargs
+        assert kwargs["ids"] == ["c1"]
+        assert kwargs["documents"] == ["new doc"]
+        metadata = kwargs["metadatas"][0]
+        assert metadata["name"] == "New"
+        assert metadata["area"] == "Math"
+        assert metadata["topic"] == "Algebra"
+
+    def test_update_of_missing_concept_fails(self, projection, mock_collection):
+        """Test updates for unknown concepts fail individually."""
+        events = [
+            ConceptCreated(aggregate_id="c1", concept_data={"name": "a"}, version=1),
+            ConceptUpdated(aggregate_id="c2", updates={"name": "b"}, version=2),
+            ConceptUpdated(aggregate_id="c1", updates={"name": "a2"}, version=2),
+        ]
+
+        results = projection.project_events(events)
+
+        assert results == [True, False, True]
+        assert mock_collection.upsert.call_args.kwargs["metadatas"][0]["name"] == "a2"
+
+    def test_deletes_batched_and_recreate_wins(self, projection, mock_collection):
+        """Test deletes go in one call and a later create supersedes a delete."""
+        events = [
+            ConceptDeleted(aggregate_id="c1", version=2),
+            ConceptDeleted(aggregate_id="c2", version=2),
+            ConceptDeleted(aggregate_id="c3", version=2),
+            ConceptCreated(aggregate_id="c3", concept_data={"name": "c"}, version=3),
+        ]
+
+        results = projection.project_events(events)
+
+        assert results == [True, True, True, True]
+        mock_collection.delete.assert_called_once_with(ids=["c1", "c2"])
+        assert mock_collection.upsert.call_args.kwargs["ids"] == ["c3"]
+
+    def test_write_failure_fails_affected_events(self, projection, mock_collection):
+        """Test an upsert error fails upserted concepts but not deletes."""
+        mock_collection.upsert.side_effect = RuntimeError("disk full")
+        events = [
+            ConceptCreated(aggregate_id="c1", concept_data={"name": "a"}, version=1),
+            ConceptDeleted(aggregate_id="c2", version=2),
+        ]
+
+        assert projection.project_events(events) == [False, True]
+
+    def test_not_connected(self, projection, mock_chromadb_service):
+        """Test every event fails when ChromaDB is not connected."""
+        mock_chromadb_service.is_connected.return_value = False
+        events = [ConceptDeleted(aggregate_id="c1", version=2)]
+
+        assert projection.project_events(events) == [False]
@@ -115,6 +115,7 @@ def mock_services():
     embedding_service.model.encode = Mock(return_value=[[0.1] * 384])
     embedding_service.config = Mock()
     embedding_service.config.model_name = "test-model"
+    embedding_service.config.cache_key = "test-model"
 
     return neo4j_service, chromadb_service, embedding_service
 
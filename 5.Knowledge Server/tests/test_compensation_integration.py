@@ -128,6 +128,7 @@ def test_embedding_service():
     service.model.encode = Mock(return_value=[[0.1] * 384])
     service.config = Mock()
     service.config.model_name = "test-model"
+    service.config.cache_key = "test-model"
     return service
 
 
@@ -13,6 +13,7 @@ from unittest.mock import Mock
 import pytest
 
 from services.consistency_checker import ConsistencyChecker, ConsistencyReport
+from services.hierarchy_view import HierarchyView
 
 
 @pytest.fixture
@@ -384,3 +385,241 @@ class TestConsistencyReport:
         assert "❌ INCONSISTENT" in report_str
         assert "Neo4j only" in report_str
         assert "Mismatched" in report_str
+
+
+class FakeNeo4jStore:
+    """In-memory stand-in answering the incremental checker's Cypher queries."""
+
+    BUCKET_FIELDS = (
+        "concept_id", "content_digest", "last_event_version", "name", "area", "topic", "subtopic"
+    )
+
+    def __init__(self, nodes):
+        self.nodes = {node["concept_id"]: dict(node) for node in nodes}
+        self.queries = []
+
+    def execute_read(self, query, parameters):
+        self.queries.append(query)
+        live = [n for n in self.nodes.values() if not n.get("deleted")]
+        if "LIMIT $limit" in query:
+            missing = [n for n in live if n.get("content_digest") is None]
+            return missing[: parameters["limit"]]
+        if "substring" in query:
+            buckets = {}
+            for node in live:
+                bucket = node["concept_id"][: parameters["prefix_length"]]
+                row = buckets.setdefault(
+                    bucket, {"bucket": bucket, "count": 0, "digest_sum": 0, "version_sum": 0}
+                )
+                row["count"] += 1
+                row["digest_sum"] += node.get("content_digest") or 0
+                row["version_sum"] += node.get("last_event_version") or 0
+            return list(buckets.values())
+        if "STARTS WITH" in query:
+            return [
+                {key: n.get(key) for key in self.BUCKET_FIELDS}
+                for n in live
+                if n["concept_id"].startswith(parameters["prefix"])
+            ]
+        raise AssertionError(f"Unexpected query: {query}")
+
+    def execute_write(self, query, parameters):
+        for row in parameters["rows"]:
+            self.nodes[row["concept_id"]]["content_digest"] = row["digest"]
+        return {"properties_set": len(parameters["rows"])}
+
+
+class FakeChromaCollection:
+    """In-memory stand-in for the ChromaDB collection API used by the checker."""
+
+    def __init__(self, metadatas):
+        self.metadatas = {cid: dict(metadata) for cid, metadata in metadatas.items()}
+        self.updated = []
+
+    def get(self, include=None, limit=None, offset=0, where=None):
+        ids = sorted(self.metadatas)
+        if where:
+            bucket = where["digest_bucket"]
+            ids = [cid for cid in ids if self.metadatas[cid].get("digest_bucket") == bucket]
+        else:
+            ids = ids[offset : offset + limit]
+        return {"ids": ids, "metadatas": [self.metadatas[cid] for cid in ids]}
+
+    def update(self, ids, metadatas):
+        self.updated.extend(ids)
+        for cid, metadata in zip(ids, metadatas):
+            self.metadatas[cid] = metadata
+
+
+def _concept(concept_id, version=1, **fields):
+    from services.concept_digest import stamp_concept_digest
+
+    properties = {"concept_id": concept_id, "name": concept_id, **fields}
+    return stamp_concept_digest(properties, concept_id, version)
+
+
+def _build_checker(neo4j_nodes, chroma_metadatas, db_path=None):
+    neo4j = FakeNeo4jStore(neo4j_nodes)
+    collection = FakeChromaCollection(chroma_metadatas)
+    chromadb = Mock()
+    chromadb.get_collection = Mock(return_value=collection)
+    return ConsistencyChecker(neo4j, chromadb, db_path), neo4j, collection
+
+
+def _chroma_view(node):
+    return {k: v for k, v in node.items() if k != "concept_id"}
+
+
+class TestIncrementalConsistency:
+    """Test digest-bucket incremental checks."""
+
+    def test_consistent_stores_skip_drill_down(self):
+        """Test equal bucket summaries need no per-concept reads"""
+        nodes = [_concept(f"{p}{i}", area="Math") for p in ("aa", "ab", "ba") for i in range(3)]
+        chroma = {n["concept_id"]: _chroma_view(n) for n in nodes}
+        checker, neo4j, _ = _build_checker(nodes, chroma)
+
+        report = checker.check_incremental(save_snapshot=False)
+
+        assert report.is_consistent
+        assert report.neo4j_count == report.chromadb_count == 9
+        assert report.buckets_checked == 3 and report.mismatched_buckets == []
+        assert not any("STARTS WITH" in q for q in neo4j.queries)
+
+    def test_only_mismatched_bucket_is_drilled_into(self):
+        """Test a field difference is found by reading a single bucket"""
+        nodes = [_concept("aa1", area="Math"), _concept("ab1", area="Math")]
+        chroma = {n["concept_id"]: _chroma_view(n) for n in nodes}
+        chroma["ab1"] = _chroma_view(_concept("ab1", area="Physics"))
+        checker, neo4j, _ = _build_checker(nodes, chroma)
+
+        found = []
+        report = checker.check_incremental(save_snapshot=False, on_discrepancy=found.append)
+
+        assert report.mismatched_buckets == ["ab"]
+        assert report.mismatched_count == 1 and report.samples["mismatched"] == ["ab1"]
+        assert found[0]["differences"] == [
+            {"field": "area", "neo4j": "Math", "chromadb": "Physics"}
+        ]
+        assert sum("STARTS WITH" in q for q in neo4j.queries) == 1
+
+    def test_version_lag_and_missing_concepts(self):
+        """Test version lag, store-only concepts and soft deletes"""
+        nodes = [
+            _concept("aa1", version=3),
+            _concept("ab1"),
+            {**_concept("ac1"), "deleted": True},
+        ]
+        chroma = {
+            "aa1": _chroma_view(_concept("aa1", version=2)),
+            "ad1": _chroma_view(_concept("ad1")),
+        }
+        checker, _, _ = _build_checker(nodes, chroma)
+
+        discrepancies = list(checker.iter_incremental_discrepancies())
+
+        assert {(d["kind"], d["concept_id"]) for d in discrepancies} == {
+            ("mismatched", "aa1"),
+            ("neo4j_only", "ab1"),
+            ("chromadb_only", "ad1"),
+        }
+        lag = next(d for d in discrepancies if d["concept_id"] == "aa1")
+        assert lag["differences"] == [
+            {"field": "last_event_version", "neo4j": 3, "chromadb": 2}
+        ]
+
+    def test_missing_digests_are_refreshed_and_backfilled(self):
+        """Test cleared Neo4j digests and legacy ChromaDB metadata are filled in"""
+        node = _concept("aa1", area="Math")
+        stale = {**node, "content_digest": None}
+        legacy = {"name": "aa1", "area": "Math", "last_event_version": 1}
+        checker, neo4j, collection = _build_checker([stale], {"aa1": legacy})
+
+        report = checker.check_incremental(save_snapshot=False)
+
+        assert report.is_consistent
+        assert report.digests_refreshed == 2
+        assert neo4j.nodes["aa1"]["content_digest"] == node["content_digest"]
+        assert collection.updated == ["aa1"]
+        assert collection.metadatas["aa1"]["digest_bucket"] == "aa"
+
+    def test_chromadb_is_paged(self):
+        """Test ChromaDB metadata is summarised page by page"""
+        nodes = [_concept(f"c{i:03d}") for i in range(25)]
+        chroma = {n["concept_id"]: _chroma_view(n) for n in nodes}
+        checker, _, _ = _build_checker(nodes, chroma)
+
+        summaries, backfilled = checker.get_chromadb_bucket_summaries(page_size=10)
+
+        assert sum(s.count for s in summaries.values()) == 25
+        assert backfilled == 0
+
+    def test_incremental_report_snapshot(self, temp_db):
+        """Test incremental reports are saved like full reports"""
+        checker, _, _ = _build_checker([_concept("aa1")], {}, db_path=temp_db)
+
+        report = checker.check_incremental()
+        snapshot = checker.get_latest_snapshot()
+
+        assert not report.is_consistent
+        assert "❌ INCONSISTENT" in str(report)
+        assert snapshot["status"] == "inconsistent"
+        assert "aa1" in snapshot["discrepancies"]
+
+
+class TestHierarchyViewInvalidation:
+    """Test that failed checks force a hierarchy view rescan."""
+
+    def _loaded_view(self, concept_ids):
+        view = HierarchyView()
+        view.load(
+            [{"concept_id": cid, "area": "Testing", "topic": None, "subtopic": None}
+             for cid in concept_ids],
+            sequence=0,
+        )
+        return view
+
+    def test_inconsistent_check_marks_view_stale(
+        self, mock_neo4j_service, mock_chromadb_service, temp_db
+    ):
+        """A concept only in Neo4j makes the view rescan on next read."""
+        mock_neo4j_service.execute_read = Mock(return_value=[
+            {"concept_id": "concept_001", "name": "Test", "area": "Testing", "topic": None,
+             "subtopic": None, "confidence_score": 90, "deleted": False}
+        ])
+        view = self._loaded_view(["concept_001"])
+
+        checker = ConsistencyChecker(
+            mock_neo4j_service, mock_chromadb_service, temp_db, hierarchy_view=view
+        )
+        report = checker.check_consistency(save_snapshot=False)
+
+        assert report.is_consistent is False
+        assert view.needs_rebuild is True
+
+    def test_count_drift_marks_view_stale(
+        self, mock_neo4j_service, mock_chromadb_service, temp_db
+    ):
+        """A consistent check whose live count differs from the view still rescans."""
+        view = self._loaded_view(["concept_001"])
+
+        checker = ConsistencyChecker(
+            mock_neo4j_service, mock_chromadb_service, temp_db, hierarchy_view=view
+        )
+        report = checker.check_consistency(save_snapshot=False)
+
+        assert report.is_consistent is True
+        assert view.needs_rebuild is True
+
+    def test_matching_view_left_loaded(
+        self, mock_neo4j_service, mock_chromadb_service, temp_db
+    ):
+        """A consistent check with matching totals keeps the view."""
+        view = self._loaded_view([])
+
+        checker = ConsistencyChecker(
+            mock_neo4j_service, mock_chromadb_service, temp_db, hierarchy_view=view
+        )
+        checker.check_consistency(save_snapshot=False)
+
+        assert view.needs_rebuild is False
@@ -0,0 +1,133 @@
+"""
+Unit tests for EmbeddingBatcher (micro-batching in front of EmbeddingService)
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from services.embedding_batcher import EmbeddingBatcher
+
+
+def _fake_service(dimensions: int = 3):
+    """Embedding service whose vectors encode the text length."""
+    service = Mock()
+    service.calls = []
+    service.threads = []
+
+    def generate_batch(texts):
+        service.calls.append(list(texts))
+        service.threads.append(threading.get_ident())
+        return [[float(len(text))] * dimensions for text in texts]
+
+    service.generate_batch = Mock(side_effect=generate_batch)
+    return service
+
+
+class TestEmbeddingBatcher:
+    """Tests for request coalescing and future resolution"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service, max_batch_size=32, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("bb"), batcher.embed("ccc")
+        )
+
+        assert results == [[1.0] * 3, [2.0] * 3, [3.0] * 3]
+        assert service.calls == [["a", "bb", "ccc"]]
+        assert batcher.get_stats()["batches"] == 1
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_inference_runs_off_the_event_loop_thread(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service, max_wait_ms=0)
+
+        await batcher.embed("text")
+
+        assert service.threads[0] != threading.get_ident()
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service, max_batch_size=2, max_wait_ms=60_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=5
+        )
+
+        assert results == [[1.0] * 3, [2.0] * 3]
+        assert service.calls == [["a", "bb"]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_never_exceed_max_size(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service, max_batch_size=4, max_wait_ms=5)
+
+        texts = [f"text-{i}" for i in range(10)]
+        results = await batcher.embed_many(texts)
+
+        assert len(results) == 10
+        assert all(len(call) <= 4 for call in service.calls)
+        assert sum(len(call) for call in service.calls) == 10
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service, max_wait_ms=10)
+
+        first, second = await asyncio.gather(batcher.embed("same"), batcher.embed("same"))
+
+        assert first == second
+        assert service.calls == [["same"]]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_every_caller(self):
+        service = Mock()
+        service.generate_batch = Mock(side_effect=RuntimeError("model unavailable"))
+        batcher = EmbeddingBatcher(service, max_wait_ms=10)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.get_stats()["failed_batches"] == 1
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_input_returns_without_model_call(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service)
+
+        assert await batcher.embed_many([]) == []
+        assert service.generate_batch.call_count == 0
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_batcher_rejects_requests(self):
+        batcher = EmbeddingBatcher(_fake_service())
+        await batcher.close()
+
+        with pytest.raises(RuntimeError):
+            await batcher.embed("late")
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_requests(self):
+        service = _fake_service()
+        batcher = EmbeddingBatcher(service, max_wait_ms=60_000)
+
+        pending = asyncio.ensure_future(batcher.embed("queued"))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        assert await pending == [6.0] * 3
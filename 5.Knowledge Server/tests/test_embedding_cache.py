@@ -5,11 +5,13 @@ Tests cache operations, text normalization, hashing, statistics,
 and performance.
 """
 
+import json
 import sqlite3
 import tempfile
 import time
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from services.embedding_cache import CacheStats, EmbeddingCache
@@ -87,7 +89,7 @@ class TestCacheOperations:
         cached = cache.get_cached(text, model)
         assert cached is not None
         assert len(cached) == 384
-        assert cached == sample_embedding
+        assert cached == pytest.approx(sample_embedding)
 
     def test_cache_miss(self, cache):
         """Test cache miss for non-existent text."""
@@ -111,11 +113,11 @@ class TestCacheOperations:
 
         # Retrieve for model 1
         cached1 = cache.get_cached(text, model1)
-        assert cached1 == embedding1
+        assert cached1 == pytest.approx(embedding1)
 
         # Retrieve for model 2
         cached2 = cache.get_cached(text, model2)
-        assert cached2 == embedding2
+        assert cached2 == pytest.approx(embedding2)
 
     def test_update_existing_entry(self, cache, sample_embedding):
         """Test updating an existing cache entry."""
@@ -132,7 +134,7 @@ class TestCacheOperations:
 
         # Retrieve should get updated embedding
         cached = cache.get_cached(text, model)
-        assert cached == embedding2
+        assert cached == pytest.approx(embedding2)
 
 
 class TestTextNormalization:
@@ -399,6 +401,135 @@ class TestErrorHandling:
         assert cached is None or isinstance(cached, list)
 
 
+class TestBatchOperations:
+    """Test get_many/store_many."""
+
+    def test_store_many_and_get_many(self, cache):
+        """Test batch store followed by batch lookup preserves order and misses."""
+        model = "all-MiniLM-L6-v2"
+        texts = [f"text {i}" for i in range(5)]
+        embeddings = [[float(i)] * 384 for i in range(5)]
+
+        assert cache.store_many(texts, model, embeddings) == 5
+
+        results = cache.get_many(["text 3", "missing", "text 0", "TEXT 3"], model)
+        assert results[0] == pytest.approx(embeddings[3])
+        assert results[1] is None
+        assert results[2] == pytest.approx(embeddings[0])
+        assert results[3] == pytest.approx(embeddings[3])
+
+        stats = cache.get_cache_stats()
+        assert stats.cache_hits == 3
+        assert stats.cache_misses == 1
+
+    def test_get_many_spans_query_chunks(self, temp_db):
+        """Test lookups larger than one IN (...) chunk read from SQLite."""
+        model = "all-MiniLM-L6-v2"
+        texts = [f"text {i}" for i in range(1200)]
+        writer = EmbeddingCache(db_path=temp_db, memory_cache_size=0)
+        writer.store_many(texts, model, [[0.5] * 8] * len(texts))
+
+        reader = EmbeddingCache(db_path=temp_db, memory_cache_size=0)
+        results = reader.get_many(texts, model, as_arrays=True)
+
+        assert all(result is not None for result in results)
+        assert results[-1].dtype == np.float32
+        assert reader.get_cache_stats().disk_hits == 1200
+
+    def test_store_many_length_mismatch(self, cache):
+        """Test mismatched texts/embeddings are rejected."""
+        with pytest.raises(ValueError):
+            cache.store_many(["a", "b"], "all-MiniLM-L6-v2", [[0.1] * 4])
+
+
+class TestMemoryTier:
+    """Test the in-process LRU tier and BLOB storage."""
+
+    def test_memory_tier_serves_repeat_lookups(self, cache, sample_embedding):
+        """Test repeat lookups are served from memory."""
+        model = "all-MiniLM-L6-v2"
+        cache.store("hello world", model, sample_embedding)
+
+        cache.get_cached("hello world", model)
+        stats = cache.get_cache_stats()
+        assert stats.memory_hits == 1
+        assert stats.disk_hits == 0
+        assert stats.memory_entries == 1
+
+    def test_memory_tier_evicts_least_recently_used(self, temp_db):
+        """Test the LRU tier stays bounded."""
+        model = "all-MiniLM-L6-v2"
+        cache = EmbeddingCache(db_path=temp_db, memory_cache_size=2)
+        for text in ("a", "b", "c"):
+            cache.store(text, model, [0.1] * 4)
+
+        assert cache.get_cache_stats().memory_entries == 2
+        assert cache.get_cached("a", model) == pytest.approx([0.1] * 4)
+        assert cache.get_cache_stats().disk_hits == 1
+
+    def test_clear_cache_clears_memory_tier(self, cache, sample_embedding):
+        """Test clearing the cache also drops in-memory entries."""
+        model = "all-MiniLM-L6-v2"
+        cache.store("hello world", model, sample_embedding)
+        cache.clear_cache(model)
+
+        assert cache.get_cached("hello world", model) is None
+
+    def test_embeddings_stored_as_float32_blob(self, cache, sample_embedding):
+        """Test vectors are persisted as float32 BLOBs."""
+        cache.store("hello world", "all-MiniLM-L6-v2", sample_embedding)
+
+        conn = sqlite3.connect(cache.db_path)
+        kind, size = conn.execute(
+            "SELECT typeof(embedding), length(embedding) FROM embedding_cache"
+        ).fetchone()
+        conn.close()
+
+        assert kind == "blob"
+        assert size == 384 * 4
+
+    def test_get_cached_array_is_read_only(self, cache, sample_embedding):
+        """Test arrays handed out by the cache cannot be mutated."""
+        cache.store("hello world", "all-MiniLM-L6-v2", sample_embedding)
+        array = cache.get_cached_array("hello world", "all-MiniLM-L6-v2")
+
+        with pytest.raises(ValueError):
+            array[0] = 1.0
+
+
+class TestLegacyMigration:
+    """Test reading and converting legacy JSON rows."""
+
+    def _insert_legacy(self, cache, text, model, value):
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute(
+            "INSERT INTO embedding_cache (text_hash, model_name, embedding) VALUES (?, ?, ?)",
+            (cache._key_for(text), model, value),
+        )
+        conn.commit()
+        conn.close()
+
+    def test_legacy_json_rows_readable(self, cache):
+        """Test rows written as JSON text are still returned."""
+        self._insert_legacy(cache, "hello world", "all-MiniLM-L6-v2", json.dumps([0.25] * 4))
+
+        assert cache.get_cached("hello world", "all-MiniLM-L6-v2") == pytest.approx([0.25] * 4)
+        assert cache.get_cache_stats().legacy_entries == 1
+
+    def test_migrate_legacy_rows(self, cache):
+        """Test legacy rows are converted and corrupted rows dropped."""
+        model = "all-MiniLM-L6-v2"
+        self._insert_legacy(cache, "good", model, json.dumps([0.25] * 4))
+        self._insert_legacy(cache, "bad", model, "corrupted_json")
+
+        assert cache.migrate_legacy_rows(batch_size=1) == 1
+
+        stats = cache.get_cache_stats()
+        assert stats.legacy_entries == 0
+        assert stats.total_entries == 1
+        assert cache.get_cached("good", model) == pytest.approx([0.25] * 4)
+
+
 class TestCacheWorkflow:
     """Test complete cache workflows."""
 
@@ -419,7 +550,7 @@ class TestCacheWorkflow:
         # Second access: cache hit
         cached = cache.get_cached(text, model)
         assert cached is not None
-        assert cached == sample_embedding
+        assert cached == pytest.approx(sample_embedding)
         assert cache._cache_hits == 1
 
     def test_multiple_texts_workflow(self, cache, sample_embedding):
@@ -435,7 +566,7 @@ class TestCacheWorkflow:
         for text in texts:
             cached = cache.get_cached(text, model)
             assert cached is not None
-            assert cached == sample_embedding
+            assert cached == pytest.approx(sample_embedding)
 
         # Check stats
         stats = cache.get_cache_stats()
@@ -455,6 +586,6 @@ class TestCacheWorkflow:
         cached, text_hash = cache.get_cached_with_hash(text, model)
 
         assert cached is not None
-        assert cached == sample_embedding
+        assert cached == pytest.approx(sample_embedding)
         assert isinstance(text_hash, str)
         assert len(text_hash) == 64  # SHA256 produces 64-char hex string
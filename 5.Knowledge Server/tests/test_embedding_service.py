@@ -80,6 +80,14 @@ class TestEmbeddingServiceInitialization:
         assert service.config.batch_size == 16
         assert service.config.max_text_length == 500
 
+    def test_cache_key_separates_backends(self):
+        """Test that onnx vectors are cached apart from sentence-transformers ones."""
+        default = EmbeddingConfig()
+        onnx = EmbeddingConfig(backend="onnx", onnx_model_dir="data/onnx/all-MiniLM-L6-v2")
+
+        assert default.cache_key == "all-MiniLM-L6-v2"
+        assert onnx.cache_key == "all-MiniLM-L6-v2@onnx"
+
     @pytest.mark.asyncio
     async def test_initialize_success(self):
         """Test successful model initialization."""
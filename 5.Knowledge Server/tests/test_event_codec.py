@@ -0,0 +1,139 @@
+"""
+Tests for the event payload codecs (models/event_codec.py) and the Event
+serialization paths built on them
+"""
+
+import json
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+
+from models.event_codec import JsonCodec, decode_column, get_codec
+from models.events import ConceptCreated, Event
+from services.event_store import EventStore
+
+
+CREATED_AT = "2025-01-01T12:00:00"
+
+
+def _row(event: Event, codec: str = "json") -> tuple:
+    db = event.to_db_dict(codec)
+    return (
+        db["event_id"], db["event_type"], db["aggregate_id"], db["aggregate_type"],
+        db["event_data"], db["metadata"], db["version"], db["created_at"],
+    )
+
+
+class TestJsonCodec:
+    """Tests for the default JSON codec"""
+
+    def test_round_trip_keeps_large_integers_exact(self):
+        codec = get_codec("json")
+        payload = {"big": 2**70, "negative": -(10**19), "nested": {"list": [1, 2.5, None]}}
+
+        assert codec.decode(codec.encode(payload)) == payload
+
+    def test_reads_rows_written_by_stdlib_json(self):
+        legacy = json.dumps({"score": float("nan"), "name": "Ünïcode"})
+
+        decoded = decode_column(legacy)
+
+        assert decoded["name"] == "Ünïcode"
+        assert decoded["score"] != decoded["score"]  # NaN
+
+    def test_rejects_values_stdlib_json_rejects(self):
+        with pytest.raises(TypeError):
+            JsonCodec().encode({"when": datetime(2025, 1, 1, tzinfo=UTC)})
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown event codec"):
+            get_codec("pickle")
+
+
+class TestEventSerialization:
+    """Payload encoding and the trusted decode path"""
+
+    def test_payload_mutated_after_construction_is_written(self):
+        event = ConceptCreated("concept-1", {"name": "Closures"}, metadata={"source": "test"})
+
+        event.event_data["area"] = "JavaScript"
+        event.metadata["source"] = "import"
+
+        db = event.to_db_dict()
+        assert json.loads(db["event_data"]) == {"name": "Closures", "area": "JavaScript"}
+        assert json.loads(db["metadata"]) == {"source": "import"}
+        assert json.loads(event.to_json())["event_data"]["area"] == "JavaScript"
+
+    def test_payload_mutated_after_trusted_decode_is_written(self):
+        event = Event.from_db_row(_row(ConceptCreated("concept-1", {"name": "A"})), trusted=True)
+
+        event.event_data["name"] = "B"
+
+        assert json.loads(event.to_db_dict()["event_data"]) == {"name": "B"}
+
+    def test_to_json_round_trip(self):
+        event = ConceptCreated("concept-1", {"name": "Closures", "tags": ["js"]})
+
+        restored = Event.from_json(event.to_json())
+
+        assert restored == Event(**event.model_dump())
+        assert json.loads(event.to_json())["created_at"] == event.created_at.isoformat()
+
+    def test_trusted_decode_matches_validated_decode(self):
+        row = _row(ConceptCreated("concept-1", {"name": "Closures"}, metadata={"by": "test"}))
+
+        assert Event.from_db_row(row, trusted=True) == Event.from_db_row(row)
+
+    def test_trusted_decode_reads_stdlib_json(self):
+        legacy_json = json.dumps({"name": "Closures", "area": "JavaScript"})
+        row = ("e-1", "ConceptCreated", "c-1", "Concept", legacy_json, None, 1, CREATED_AT)
+
+        event = Event.from_db_row(row, trusted=True)
+
+        assert json.loads(event.to_db_dict()["event_data"]) == json.loads(legacy_json)
+
+    def test_replaced_payload_is_re_encoded(self):
+        event = Event.from_db_row(_row(ConceptCreated("concept-1", {"name": "A"})), trusted=True)
+
+        copy = event.model_copy(update={"event_data": {"name": "B"}})
+
+        assert json.loads(copy.to_db_dict()["event_data"]) == {"name": "B"}
+
+    def test_corrupted_row_raises_value_error(self):
+        row = ("e-1", "Test", "a-1", "Test", "{invalid json}", None, 1, CREATED_AT)
+
+        with pytest.raises(ValueError):
+            Event.from_db_row(row, trusted=True)
+
+
+class TestMsgpackEventData:
+    """EventStore with EVENT_DATA_CODEC=msgpack"""
+
+    @pytest.fixture(autouse=True)
+    def _require_msgpack(self):
+        pytest.importorskip("msgpack")
+
+    def test_events_round_trip_as_blobs(self, temp_event_db):
+        store = EventStore(temp_event_db, event_data_codec="msgpack")
+        event = ConceptCreated("concept-1", {"name": "Heaps", "score": 0.5})
+
+        store.append_event(event)
+
+        with sqlite3.connect(temp_event_db) as conn:
+            stored_type = conn.execute("SELECT typeof(event_data) FROM events").fetchone()[0]
+        assert stored_type == "blob"
+        assert store.get_events_by_aggregate("concept-1")[0].event_data == event.event_data
+        store.close()
+
+    def test_json_and_msgpack_rows_coexist(self, temp_event_db):
+        json_store = EventStore(temp_event_db)
+        json_store.append_event(ConceptCreated("concept-1", {"name": "v1"}))
+        json_store.close()
+
+        store = EventStore(temp_event_db, event_data_codec="msgpack")
+        store.append_events([ConceptCreated("concept-1", {"name": "v2"}, version=2)])
+
+        events = store.get_all_events()
+        assert [e.event_data["name"] for e in events] == ["v1", "v2"]
+        store.close()
@@ -0,0 +1,263 @@
+"""
+Tests for event-log segment archival (services/event_segments.py and
+EventStore.archive_segment)
+"""
+
+import sqlite3
+
+import pytest
+
+from models.events import ConceptCreated, ConceptUpdated
+from services.event_segments import (
+    SegmentError,
+    SegmentReader,
+    resolve_compression,
+    write_segment,
+)
+from services.event_store import DuplicateEventError, EventStore, EventStoreError
+from services.outbox import Outbox
+from services.snapshot_store import AggregateSnapshot, SnapshotStore
+
+
+def _rows(count: int, aggregate_id: str = "concept-1") -> list[tuple]:
+    return [
+        (
+            seq, f"e-{seq}", "ConceptUpdated", aggregate_id, "Concept",
+            f'{{"n": {seq}}}', None, seq, f"2025-01-01T00:00:{seq:02d}",
+        )
+        for seq in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def store(temp_event_db, tmp_path):
+    """EventStore with three concepts of four versions each and a snapshot at v3."""
+    store = EventStore(temp_event_db, segment_dir=str(tmp_path / "segments"))
+    for concept in ("c1", "c2", "c3"):
+        store.append_event(ConceptCreated(concept, {"name": concept}))
+        for version in range(2, 5):
+            store.append_event(
+                ConceptUpdated(concept, {"explanation": f"v{version}"}, version=version)
+            )
+
+    snapshots = SnapshotStore(temp_event_db)
+    for concept in ("c1", "c2"):
+        snapshots.save(AggregateSnapshot(concept, "Concept", 3, {"version": 3}))
+    snapshots.close()
+
+    yield store
+    store.close()
+
+
+def _hot_count(db_path: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+class TestSegmentFile:
+    """Segment format and sparse index"""
+
+    def test_round_trip_with_sparse_index(self, tmp_path):
+        rows = _rows(10)
+        rows[3] = (*rows[3][:5], b"\x81\xa1n\x04", *rows[3][6:])  # msgpack payload
+
+        footer = write_segment(tmp_path / "s.seg", rows, compression="zlib", block_size=4)
+        reader = SegmentReader(tmp_path / "s.seg")
+
+        assert [block[:2] for block in footer.blocks] == [[1, 4], [5, 8], [9, 10]]
+        assert list(reader.iter_rows()) == rows
+        assert [row[0] for row in reader.iter_rows(after_sequence=6)] == [7, 8, 9, 10]
+        assert reader.footer.blocks_after(6) == [1, 2]
+        assert reader.footer.count(aggregate_id="concept-1") == 10
+        assert not (tmp_path / "s.seg.tmp").exists()
+
+    def test_zstd_round_trip(self, tmp_path):
+        pytest.importorskip("zstandard")
+
+        write_segment(tmp_path / "s.seg", _rows(5), compression="zstd")
+
+        assert SegmentReader(tmp_path / "s.seg").footer.compression == "zstd"
+        assert list(SegmentReader(tmp_path / "s.seg").iter_rows()) == _rows(5)
+
+    def test_truncated_segment_raises(self, tmp_path):
+        path = tmp_path / "s.seg"
+        write_segment(path, _rows(5))
+        path.write_bytes(path.read_bytes()[:-3])
+
+        with pytest.raises(SegmentError, match="truncated"):
+            _ = SegmentReader(path).footer
+
+    def test_unknown_compression(self):
+        with pytest.raises(ValueError, match="Unknown segment compression"):
+            resolve_compression("lz4")
+
+
+class TestArchiveSegment:
+    """EventStore.archive_segment()"""
+
+    def test_archives_only_events_behind_a_snapshot(self, store, temp_event_db):
+        assert store.archive_segment(older_than_seconds=0) == 4
+
+        # c1/c2 keep v3 (the snapshot version) and v4 hot; c3 has no snapshot
+        assert _hot_count(temp_event_db) == 8
+        assert store.get_segment_stats() == {"segments": 1, "archived_events": 4}
+        assert len(list(store.segment_dir.glob("*.seg"))) == 1
+        assert store.archive_segment(older_than_seconds=0) == 0
+
+    def test_respects_age_and_outbox_references(self, store, temp_event_db):
+        assert store.archive_segment(older_than_seconds=3600) == 0
+
+        event = store.get_events_by_aggregate("c1")[0]
+        Outbox(temp_event_db).add_to_outbox(event.event_id, "neo4j")
+
+        assert store.archive_segment(older_than_seconds=0) == 3
+        assert store.get_event_sequence(event.event_id) is not None
+        assert _hot_count(temp_event_db) == 9
+
+    def test_missing_snapshot_table_archives_nothing(self, temp_event_db, tmp_path):
+        store = EventStore(temp_event_db, segment_dir=str(tmp_path))
+        store.append_event(ConceptCreated("c1", {"name": "c1"}))
+
+        assert store.archive_segment(older_than_seconds=0) == 0
+        store.close()
+
+    def test_rejects_non_positive_max_events(self, store):
+        with pytest.raises(ValueError):
+            store.archive_segment(older_than_seconds=0, max_events=0)
+
+
+class TestReadsSpanSegments:
+    """Reads return the same events before and after archival"""
+
+    def test_reads_are_unchanged_by_archival(self, store):
+        before = {
+            "aggregate": store.get_events_by_aggregate("c1"),
+            "from_version": store.get_events_by_aggregate("c2", from_version=2),
+            "all": store.get_all_events(),
+            "page": store.get_all_events(limit=5, offset=2),
+            "typed": store.get_all_events(event_type="ConceptCreated"),
+            "stream": list(store.iter_events_after(0)),
+            "stream_tail": list(store.iter_events_after(3, limit=4, batch_size=2)),
+            "counts": (
+                store.count_events(),
+                store.count_events(aggregate_id="c1"),
+                store.count_events(event_type="ConceptCreated"),
+                store.count_events(aggregate_id="c1", event_type="ConceptUpdated"),
+            ),
+        }
+
+        store.archive_segment(older_than_seconds=0)
+
+        assert store.get_events_by_aggregate("c1") == before["aggregate"]
+        assert store.get_events_by_aggregate("c2", from_version=2) == before["from_version"]
+        assert store.get_all_events() == before["all"]
+        assert store.get_all_events(limit=5, offset=2) == before["page"]
+        assert store.get_all_events(event_type="ConceptCreated") == before["typed"]
+        assert list(store.iter_events_after(0)) == before["stream"]
+        assert list(store.iter_events_after(3, limit=4, batch_size=2)) == before["stream_tail"]
+        assert (
+            store.count_events(),
+            store.count_events(aggregate_id="c1"),
+            store.count_events(event_type="ConceptCreated"),
+            store.count_events(aggregate_id="c1", event_type="ConceptUpdated"),
+        ) == before["counts"]
+
+    def test_lookups_by_id_find_archived_events(self, store):
+        sequence, first = next(store.iter_events_after(0))
+        store.archive_segment(older_than_seconds=0)
+
+        assert store.get_event_by_id(first.event_id) == first
+        assert store.get_events_by_ids([first.event_id, "unknown"]) == {first.event_id: first}
+        assert store.get_event_sequence(first.event_id) == sequence
+
+    def test_appends_continue_after_archival(self, store):
+        store.archive_segment(older_than_seconds=0)
+
+        assert store.get_latest_version("c1") == 4
+        store.append_event(ConceptUpdated("c1", {"explanation": "v5"}, version=5))
+
+        assert [e.version for e in store.get_events_by_aggregate("c1")] == [1, 2, 3, 4, 5]
+
+    def test_archived_event_ids_are_still_duplicates(self, store):
+        _, first = next(store.iter_events_after(0))
+        store.archive_segment(older_than_seconds=0)
+        replay = ConceptUpdated("c1", {"explanation": "v5"}, version=5, event_id=first.event_id)
+
+        with pytest.raises(DuplicateEventError):
+            store.append_event(replay)
+        with pytest.raises(DuplicateEventError):
+            store.append_events([replay])
+        assert store.get_latest_version("c1") == 4
+
+    def test_missing_segment_file_raises(self, store):
+        store.archive_segment(older_than_seconds=0)
+        for path in store.segment_dir.glob("*.seg"):
+            path.unlink()
+
+        with pytest.raises(EventStoreError):
+            store.get_events_by_aggregate("c1")
+
+
+class TestArchivedReadCost:
+    """Reads only decompress the segment blocks they need"""
+
+    @pytest.fixture
+    def block_reads(self, monkeypatch):
+        reads = []
+        read_blocks = SegmentReader.read_blocks
+
+        def recording(reader, numbers):
+            numbers = list(numbers)
+            reads.extend((reader.path.name, n) for n in numbers)
+            return read_blocks(reader, numbers)
+
+        monkeypatch.setattr(SegmentReader, "read_blocks", recording)
+        return reads
+
+    def test_pages_merge_several_segments_lazily(self, store, block_reads):
+        before = store.get_all_events()
+        while store.archive_segment(older_than_seconds=0, max_events=1):
+            pass
+        assert store.get_segment_stats()["segments"] == 4
+
+        for offset in range(len(before)):
+            assert store.get_all_events(limit=2, offset=offset) == before[offset:offset + 2]
+        assert store.get_all_events() == before
+
+        block_reads.clear()
+        store.get_all_events(limit=1)
+        assert len(block_reads) <= 1
+
+    def test_offset_past_archived_segments_skips_them(self, temp_event_db, tmp_path, block_reads):
+        store = EventStore(temp_event_db, segment_dir=str(tmp_path))
+        store.append_event(ConceptCreated("c1", {"name": "c1"}))
+        for version in range(2, 5):
+            store.append_event(ConceptUpdated("c1", {"explanation": f"v{version}"}, version=version))
+        snapshots = SnapshotStore(temp_event_db)
+        snapshots.save(AggregateSnapshot("c1", "Concept", 4, {"version": 4}))
+        snapshots.close()
+        for concept in ("c2", "c3", "c4"):
+            store.append_event(ConceptCreated(concept, {"name": concept}))
+        before = store.get_all_events()
+
+        # c1 v1-v3 are the three oldest events and end up in one segment
+        assert store.archive_segment(older_than_seconds=0) == 3
+        block_reads.clear()
+
+        assert store.get_all_events(limit=2, offset=3) == before[3:5]
+        assert block_reads == []
+        assert store.get_all_events(limit=2, offset=2) == before[2:4]
+        assert len(block_reads) == 1
+        store.close()
+
+    def test_lookup_by_id_reads_one_block(self, store, block_reads):
+        first = store.get_all_events()[0]
+        store.archive_segment(older_than_seconds=0)
+        block_reads.clear()
+
+        assert store.get_event_by_id(first.event_id) == first
+        assert len(block_reads) == 1
+
+        block_reads.clear()
+        assert store.get_event_by_id("unknown") is None
+        assert block_reads == []
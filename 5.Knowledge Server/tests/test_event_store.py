@@ -9,8 +9,10 @@ import pytest
 
 from models.events import ConceptCreated, ConceptUpdated
 from services.event_store import (
+    AppendOutcomeUnknownError,
     DuplicateEventError,
     EventStore,
+    EventStoreError,
     VersionConflictError,
 )
 
@@ -291,3 +293,269 @@ def test_count_events_by_type(temp_db):
 
     assert count_created == 3
     assert count_updated == 1
+
+
+def test_append_events_batch(temp_db):
+    """Test appending a batch of events across aggregates in one commit"""
+    store = EventStore(temp_db)
+    store.append_event(
+        ConceptCreated(aggregate_id="concept_000", concept_data={"name": "Existing"}, version=1)
+    )
+
+    batch = [
+        ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test 1"}, version=1),
+        ConceptUpdated(aggregate_id="concept_001", updates={"name": "Updated"}, version=2),
+        ConceptUpdated(aggregate_id="concept_000", updates={"name": "Updated"}, version=2),
+        ConceptCreated(aggregate_id="concept_002", concept_data={"name": "Test 2"}, version=1),
+    ]
+
+    assert store.append_events(batch) is True
+    assert store.count_events() == 5
+    assert store.get_latest_version("concept_000") == 2
+    assert store.get_latest_version("concept_001") == 2
+
+
+def test_append_events_version_conflict_is_atomic(temp_db):
+    """Test that a conflicting event rejects the whole batch"""
+    store = EventStore(temp_db)
+    store.append_event(
+        ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test"}, version=1)
+    )
+
+    batch = [
+        ConceptCreated(aggregate_id="concept_002", concept_data={"name": "Test 2"}, version=1),
+        ConceptUpdated(aggregate_id="concept_001", updates={"name": "Stale"}, version=1),
+    ]
+
+    with pytest.raises(VersionConflictError):
+        store.append_events(batch)
+
+    assert store.count_events() == 1
+
+
+def test_append_events_duplicate_in_batch(temp_db):
+    """Test that a duplicate event id within the batch is rejected"""
+    store = EventStore(temp_db)
+    event = ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test"}, version=1)
+
+    with pytest.raises(DuplicateEventError):
+        store.append_events([event, event])
+
+    assert store.count_events() == 0
+
+
+def test_append_events_writes_outbox_entries_in_same_transaction(temp_db):
+    """Test outbox rows are committed with the events, or not at all"""
+    import sqlite3
+
+    from services.outbox import Outbox
+
+    conn = sqlite3.connect(temp_db)
+    conn.execute(
+        """CREATE TABLE outbox (
+               outbox_id TEXT PRIMARY KEY, event_id TEXT NOT NULL,
+               projection_name TEXT NOT NULL, status TEXT NOT NULL,
+               attempts INTEGER DEFAULT 0, last_attempt DATETIME,
+               error_message TEXT, created_at DATETIME)"""
+    )
+    conn.commit()
+    conn.close()
+
+    store = EventStore(temp_db)
+    outbox = Outbox(temp_db)
+    events = [
+        ConceptCreated(aggregate_id=f"concept_{i}", concept_data={"name": str(i)}, version=1)
+        for i in range(3)
+    ]
+    entries = outbox.build_entries([e.event_id for e in events], ["neo4j", "chromadb"])
+
+    store.append_events(events, outbox_entries=entries)
+    assert outbox.count_by_status()["pending"] == 6
+
+    stale = [ConceptUpdated(aggregate_id="concept_0", updates={"name": "x"}, version=1)]
+    with pytest.raises(VersionConflictError):
+        store.append_events(
+            stale, outbox_entries=outbox.build_entries([stale[0].event_id], ["neo4j"])
+        )
+    assert outbox.count_by_status()["pending"] == 6
+
+
+def test_group_commit_merges_concurrent_appends(temp_db):
+    """Test that concurrent single appends are committed in shared groups"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = EventStore(temp_db)
+    store.enable_group_commit(window_ms=20, max_batch_size=64)
+    committer = store._group_committer
+
+    events = [
+        ConceptCreated(aggregate_id=f"concept_{i:03d}", concept_data={"name": f"T{i}"}, version=1)
+        for i in range(20)
+    ]
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(store.append_event, events))
+
+    store.disable_group_commit()
+
+    assert all(results)
+    assert store.count_events() == 20
+    assert committer.events_committed == 20
+    assert committer.groups_committed < 20
+    assert store.group_commit_enabled is False
+
+
+def test_group_commit_reports_per_event_errors(temp_db):
+    """Test that one conflicting append does not fail the rest of its group"""
+    store = EventStore(temp_db)
+    store.append_event(
+        ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test"}, version=1)
+    )
+    store.enable_group_commit(window_ms=5)
+
+    try:
+        with pytest.raises(VersionConflictError):
+            store.append_event(
+                ConceptUpdated(aggregate_id="concept_001", updates={"name": "X"}, version=5)
+            )
+        assert store.append_event(
+            ConceptUpdated(aggregate_id="concept_001", updates={"name": "Y"}, version=2)
+        )
+    finally:
+        store.close()
+
+    assert EventStore(temp_db).get_latest_version("concept_001") == 2
+
+
+def test_group_commit_timeout_withdraws_queued_append(temp_db):
+    """Test that an append the worker has not taken yet is dropped on timeout"""
+    store = EventStore(temp_db)
+    store.enable_group_commit(window_ms=300)
+    committer = store._group_committer
+    event = ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test"}, version=1)
+
+    with pytest.raises(EventStoreError) as excinfo:
+        committer.submit(event, timeout=0.05)
+    store.disable_group_commit()
+
+    assert not isinstance(excinfo.value, AppendOutcomeUnknownError)
+    assert store.get_event_sequence(event.event_id) is None
+    assert committer.events_committed == 0
+
+
+def test_group_commit_timeout_during_commit_reports_unknown_outcome(temp_db):
+    """Test that a timeout while the group is committing is not reported as a failure"""
+    store = EventStore(temp_db)
+    store.enable_group_commit(window_ms=1)
+    event = ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test"}, version=1)
+
+    # Hold the write lock so the worker blocks inside the commit
+    with store._write_lock, pytest.raises(AppendOutcomeUnknownError) as excinfo:
+        store._group_committer.submit(event, timeout=0.2)
+    store.disable_group_commit()
+
+    assert excinfo.value.event_id == event.event_id
+    assert store.get_event_sequence(event.event_id) is not None
+
+
+async def test_group_commit_batches_appends_from_the_event_loop(temp_db):
+    """Test loop-side appends via to_thread share groups and wake signal waiters"""
+    import asyncio
+
+    store = EventStore(temp_db)
+    store.enable_group_commit(window_ms=50, max_batch_size=64)
+    committer = store._group_committer
+    waiter = asyncio.create_task(store.new_event_signal.wait())
+
+    events = [
+        ConceptCreated(aggregate_id=f"concept_{i:03d}", concept_data={"name": f"T{i}"}, version=1)
+        for i in range(8)
+    ]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(store.append_event, event) for event in events)
+    )
+    await asyncio.wait_for(waiter, timeout=1.0)
+    store.close()
+
+    assert all(results)
+    assert committer.events_committed == 8
+    assert committer.groups_committed < 8
+
+
+def test_iter_events_after_resumes_from_sequence(temp_db):
+    """Test keyset streaming from a stored sequence"""
+    store = EventStore(temp_db)
+    events = [
+        ConceptCreated(aggregate_id=f"concept_{i:03d}", concept_data={"name": f"T{i}"}, version=1)
+        for i in range(7)
+    ]
+    store.append_events(events)
+
+    first_page = list(store.iter_events_after(0, limit=3))
+    assert [e.event_id for _, e in first_page] == [e.event_id for e in events[:3]]
+
+    last_sequence = first_page[-1][0]
+    rest = list(store.iter_events_after(last_sequence, batch_size=2))
+    assert [e.event_id for _, e in rest] == [e.event_id for e in events[3:]]
+
+    sequences = [seq for seq, _ in first_page + rest]
+    assert sequences == sorted(sequences)
+    assert store.get_event_sequence(events[3].event_id) == rest[0][0]
+
+
+def test_iter_events_after_is_lazy_and_filters(temp_db):
+    """Test that streaming is a generator and supports event_type filtering"""
+    store = EventStore(temp_db)
+    store.append_event(
+        ConceptCreated(aggregate_id="concept_001", concept_data={"name": "Test"}, version=1)
+    )
+    store.append_event(
+        ConceptUpdated(aggregate_id="concept_001", updates={"name": "Updated"}, version=2)
+    )
+
+    stream = store.iter_events_after(0, event_type="ConceptUpdated")
+    sequence, event = next(stream)
+
+    assert event.event_type == "ConceptUpdated"
+    assert sequence == 2
+    assert list(stream) == []
+    assert store.get_event_sequence("missing") is None
+
+
+def test_projected_sequence_stops_before_unprojected_events(temp_db):
+    """Test that read-model cursors start before events still in the outbox"""
+    import sqlite3
+
+    from services.outbox import Outbox
+
+    store = EventStore(temp_db)
+    events = [
+        ConceptCreated(aggregate_id=f"concept_{i}", concept_data={"name": str(i)}, version=1)
+        for i in range(4)
+    ]
+    store.append_events(events)
+    assert store.get_projected_sequence() == 4  # no outbox table
+
+    conn = sqlite3.connect(temp_db)
+    conn.execute(
+        """CREATE TABLE outbox (
+               outbox_id TEXT PRIMARY KEY, event_id TEXT NOT NULL,
+               projection_name TEXT NOT NULL, status TEXT NOT NULL,
+               attempts INTEGER DEFAULT 0, last_attempt DATETIME,
+               error_message TEXT, created_at DATETIME)"""
+    )
+    conn.commit()
+    outbox = Outbox(temp_db)
+    for event in events[1:]:
+        outbox.add_to_outbox(event.event_id, "neo4j")
+    outbox.add_to_outbox(events[0].event_id, "chromadb")
+    conn.execute(
+        "UPDATE outbox SET status = 'completed' WHERE event_id = ?", (events[1].event_id,)
+    )
+    conn.commit()
+    conn.close()
+
+    sequence = store.get_event_sequence(events[2].event_id)
+    assert store.get_projected_sequence("neo4j") == sequence - 1
+    assert store.get_projected_sequence("chromadb") == 0
+    outbox.close()
+    store.close()
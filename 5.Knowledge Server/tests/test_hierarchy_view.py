@@ -0,0 +1,138 @@
+"""
+Unit tests for HierarchyView (event-maintained hierarchy counters)
+"""
+
+from unittest.mock import Mock
+
+from models.events import ConceptCreated, ConceptDeleted, ConceptUpdated, RelationshipCreated
+from services.hierarchy_view import HierarchyView
+
+
+def _counts(view):
+    return {
+        (r["area"], r["topic"], r["subtopic"]): r["count"] for r in view.get_records()
+    }
+
+
+def _created(concept_id, area="coding-development", topic="Python", subtopic=None):
+    return ConceptCreated(
+        aggregate_id=concept_id,
+        concept_data={"name": concept_id, "area": area, "topic": topic, "subtopic": subtopic},
+    )
+
+
+class TestHierarchyView:
+    """Tests for loading and incremental maintenance"""
+
+    def test_new_view_needs_rebuild(self):
+        assert HierarchyView().needs_rebuild is True
+
+    def test_load_aggregates_placements(self):
+        view = HierarchyView()
+        view.load(
+            [
+                {"concept_id": "c1", "area": "learning", "topic": "Memory", "subtopic": None},
+                {"concept_id": "c2", "area": "learning", "topic": "Memory", "subtopic": None},
+                {"concept_id": "c3", "area": "physics", "topic": "Optics", "subtopic": "Lenses"},
+            ],
+            sequence=42,
+        )
+
+        assert view.needs_rebuild is False
+        assert view.last_sequence == 42
+        assert view.total_concepts == 3
+        assert _counts(view) == {
+            ("learning", "Memory", None): 2,
+            ("physics", "Optics", "Lenses"): 1,
+        }
+
+    def test_created_event_increments(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+
+        assert view.apply_event(_created("c1")) is True
+        assert _counts(view) == {("coding-development", "Python", None): 1}
+
+    def test_created_event_is_idempotent(self):
+        view = HierarchyView()
+        view.load(
+            [{"concept_id": "c1", "area": "coding-development", "topic": "Python",
+              "subtopic": None}],
+            sequence=0,
+        )
+
+        assert view.apply_event(_created("c1")) is False
+        assert view.total_concepts == 1
+
+    def test_update_moves_concept(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+        view.apply_event(_created("c1"))
+        version = view.version
+
+        view.apply_event(ConceptUpdated(aggregate_id="c1", updates={"topic": "Rust"}, version=2))
+
+        assert _counts(view) == {("coding-development", "Rust", None): 1}
+        assert view.version > version
+
+    def test_update_without_placement_fields_is_ignored(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+        view.apply_event(_created("c1"))
+        version = view.version
+
+        changed = view.apply_event(
+            ConceptUpdated(aggregate_id="c1", updates={"explanation": "new"}, version=2)
+        )
+
+        assert changed is False
+        assert view.version == version
+
+    def test_delete_removes_concept(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+        view.apply_event(_created("c1"))
+        view.apply_event(_created("c2"))
+
+        view.apply_event(ConceptDeleted(aggregate_id="c1", version=2))
+
+        assert view.total_concepts == 1
+        assert _counts(view) == {("coding-development", "Python", None): 1}
+
+    def test_delete_of_unknown_concept_is_ignored(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+
+        assert view.apply_event(ConceptDeleted(aggregate_id="missing", version=2)) is False
+
+    def test_non_concept_events_are_ignored(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+
+        event = RelationshipCreated(
+            aggregate_id="r1",
+            relationship_data={"from_concept_id": "a", "to_concept_id": "b"},
+        )
+
+        assert view.apply_event(event) is False
+
+    def test_catch_up_advances_cursor(self):
+        view = HierarchyView()
+        view.load([], sequence=10)
+        event_store = Mock()
+        event_store.iter_events_after = Mock(return_value=iter([(11, _created("c1")),
+                                                                (12, _created("c2"))]))
+
+        assert view.catch_up(event_store) == 2
+
+        event_store.iter_events_after.assert_called_once_with(10)
+        assert view.last_sequence == 12
+        assert view.total_concepts == 2
+
+    def test_mark_stale_requests_rebuild(self):
+        view = HierarchyView()
+        view.load([], sequence=0)
+
+        view.mark_stale()
+
+        assert view.needs_rebuild is True
@@ -0,0 +1,118 @@
+"""
+Unit tests for LexicalIndex (event-maintained BM25 and name-substring index)
+"""
+
+from unittest.mock import Mock
+
+from models.events import ConceptCreated, ConceptDeleted, ConceptUpdated
+from services.lexical_index import LexicalIndex, tokenize
+
+
+def _record(concept_id, name, explanation="", area="coding-development", topic="Python"):
+    return {
+        "concept_id": concept_id,
+        "name": name,
+        "explanation": explanation,
+        "area": area,
+        "topic": topic,
+        "subtopic": None,
+    }
+
+
+def _loaded_index():
+    index = LexicalIndex()
+    index.load(
+        [
+            _record("c1", "Python For Loops", "Iterate over a sequence with for"),
+            _record("c2", "List Comprehensions", "Build lists from loops in one expression"),
+            _record("c3", "Binary Search", "Halve a sorted array each step", area="algorithms",
+                    topic="Search"),
+        ],
+        sequence=5,
+    )
+    return index
+
+
+class TestLexicalIndex:
+    """Tests for loading, incremental maintenance and ranking"""
+
+    def test_tokenize_drops_stopwords(self):
+        assert tokenize("How to use the For-Loop in Python?") == ["use", "loop", "python"]
+
+    def test_new_index_needs_rebuild(self):
+        assert LexicalIndex().needs_rebuild is True
+
+    def test_load_sets_cursor(self):
+        index = _loaded_index()
+
+        assert index.needs_rebuild is False
+        assert index.last_sequence == 5
+        assert index.total_concepts == 3
+
+    def test_name_matches_rank_above_explanation_matches(self):
+        index = _loaded_index()
+
+        hits = index.search("loops")
+
+        assert [concept_id for concept_id, _ in hits] == ["c1", "c2"]
+        assert hits[0][1] > hits[1][1]
+
+    def test_search_applies_area_and_topic_filters(self):
+        index = _loaded_index()
+
+        assert index.search("search sorted", area="algorithms") != []
+        assert index.search("search sorted", area="coding-development") == []
+        assert index.search("loops", topic="Search") == []
+
+    def test_created_event_is_indexed_and_idempotent(self):
+        index = _loaded_index()
+        event = ConceptCreated(
+            aggregate_id="c4",
+            concept_data={"name": "Hash Maps", "explanation": "Key value lookup", "area": "x"},
+        )
+
+        assert index.apply_event(event) is True
+        assert index.apply_event(event) is False
+        assert index.search("hash")[0][0] == "c4"
+
+    def test_update_reindexes_changed_text(self):
+        index = _loaded_index()
+
+        index.apply_event(
+            ConceptUpdated(aggregate_id="c3", updates={"name": "Ternary Search"}, version=2)
+        )
+
+        assert index.search("binary") == []
+        assert index.search("ternary")[0][0] == "c3"
+        assert index.search("halve")[0][0] == "c3"
+        assert index.name_matches("ternary") == ["c3"]
+
+    def test_delete_removes_concept(self):
+        index = _loaded_index()
+
+        assert index.apply_event(ConceptDeleted(aggregate_id="c1", version=2)) is True
+        assert [concept_id for concept_id, _ in index.search("loops")] == ["c2"]
+        assert index.name_matches("python") == []
+
+    def test_name_matches_is_case_insensitive_substring(self):
+        index = _loaded_index()
+
+        assert index.name_matches("OR L") == ["c1"]
+        assert index.name_matches("ns") == ["c2"]
+        assert index.name_matches("zzz") == []
+
+    def test_name_matches_gives_up_past_max_results(self):
+        index = _loaded_index()
+
+        assert index.name_matches("s", max_results=1) is None
+
+    def test_catch_up_advances_cursor(self):
+        index = _loaded_index()
+        event_store = Mock()
+        event_store.iter_events_after = Mock(return_value=iter([
+            (6, ConceptCreated(aggregate_id="c4", concept_data={"name": "Hash Maps"})),
+        ]))
+
+        assert index.catch_up(event_store) == 1
+        assert index.last_sequence == 6
+        event_store.iter_events_after.assert_called_once_with(5)
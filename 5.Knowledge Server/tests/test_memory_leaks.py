@@ -291,11 +291,12 @@ class TestOutboxEdgeCases:
         outbox = Outbox(temp_event_db)
 
         # Try to mark non-existent item
+        # The update runs but affects 0 rows, which is reported as False
         result = outbox.mark_processed("nonexistent-id")
-        assert result is True  # Update succeeds but affects 0 rows
+        assert result is False
 
         result = outbox.mark_failed("nonexistent-id", "error")
-        assert result is True
+        assert result is False
 
         result = outbox.retry_failed("nonexistent-id")
         assert result is False  # This one checks rowcount
@@ -494,3 +494,99 @@ class TestProjectionIntegration:
 
         # Verify all events were projected
         assert mock_neo4j_service.execute_write.call_count == 3
+
+
+class TestBulkProjection:
+    """Test project_events bulk UNWIND projection."""
+
+    def _echo_rows(self, query, parameters):
+        """Pretend every row matched."""
+        return [{"idx": row["idx"]} for row in parameters["rows"]]
+
+    def test_consecutive_events_share_one_query(self, projection, mock_neo4j_service):
+        """Test a run of same-type events becomes one UNWIND query."""
+        mock_neo4j_service.execute_write_records = Mock(side_effect=self._echo_rows)
+        events = [
+            ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+            for i in range(5)
+        ]
+
+        results = projection.project_events(events)
+
+        assert results == [True] * 5
+        mock_neo4j_service.execute_write_records.assert_called_once()
+        query, = mock_neo4j_service.execute_write_records.call_args.args
+        rows = mock_neo4j_service.execute_write_records.call_args.kwargs["parameters"]["rows"]
+        assert "UNWIND $rows AS row" in query
+        assert [row["concept_id"] for row in rows] == ["c0", "c1", "c2", "c3", "c4"]
+        mock_neo4j_service.execute_write.assert_not_called()
+
+    def test_runs_preserve_order_and_relationship_type(self, projection, mock_neo4j_service):
+        """Test mixed batches split into ordered runs per type."""
+        mock_neo4j_service.execute_write_records = Mock(side_effect=self._echo_rows)
+        events = [
+            ConceptCreated(aggregate_id="a", concept_data={"name": "a"}, version=1),
+            ConceptCreated(aggregate_id="b", concept_data={"name": "b"}, version=1),
+            RelationshipCreated(
+                aggregate_id="r1",
+                relationship_data={
+                    "from_concept_id": "a",
+                    "to_concept_id": "b",
+                    "relationship_type": "PREREQUISITE",
+                },
+            ),
+            RelationshipCreated(
+                aggregate_id="r2",
+                relationship_data={"from_concept_id": "b", "to_concept_id": "a"},
+            ),
+            ConceptUpdated(aggregate_id="a", updates={"name": "a2"}, version=2),
+        ]
+
+        results = projection.project_events(events)
+
+        assert results == [True] * 5
+        queries = [call.args[0] for call in mock_neo4j_service.execute_write_records.call_args_list]
+        assert len(queries) == 4
+        assert "MERGE (c:Concept" in queries[0]
+        assert "[r:PREREQUISITE]" in queries[1]
+        assert "[r:RELATES_TO]" in queries[2]
+        assert "MATCH (c:Concept" in queries[3]
+
+    def test_unmatched_rows_report_failure(self, projection, mock_neo4j_service):
+        """Test per-event success follows the rows the query returned."""
+        mock_neo4j_service.execute_write_records = Mock(return_value=[{"idx": 1}])
+        events = [
+            ConceptUpdated(aggregate_id="missing", updates={"name": "x"}, version=2),
+            ConceptUpdated(aggregate_id="present", updates={"name": "y"}, version=2),
+        ]
+
+        assert projection.project_events(events) == [False, True]
+
+    def test_failed_run_does_not_stop_later_runs(self, projection, mock_neo4j_service):
+        """Test an error in one run only fails that run's events."""
+        mock_neo4j_service.execute_write_records = Mock(
+            side_effect=[ServiceUnavailable("down"), [{"idx": 1}]]
+        )
+        events = [
+            ConceptCreated(aggregate_id="a", concept_data={"name": "a"}, version=1),
+            ConceptDeleted(aggregate_id="b", version=2),
+        ]
+
+        assert projection.project_events(events) == [False, True]
+
+    def test_invalid_events_skipped(self, projection, mock_neo4j_service):
+        """Test unknown types and incomplete relationships fail without a query."""
+        mock_neo4j_service.execute_write_records = Mock(side_effect=self._echo_rows)
+        events = [
+            Event(
+                event_type="UnknownEvent",
+                aggregate_id="x",
+                aggregate_type="Test",
+                event_data={},
+                version=1,
+            ),
+            RelationshipCreated(aggregate_id="r", relationship_data={"from_concept_id": "a"}),
+        ]
+
+        assert projection.project_events(events) == [False, False]
+        mock_neo4j_service.execute_write_records.assert_not_called()
@@ -0,0 +1,162 @@
+"""
+Tests for the quantized ONNX embedding backend (services/onnx_embedding.py)
+
+A tiny randomly initialised BERT sentence-transformers model is built from the
+fixture corpus vocabulary and exported with scripts/export_onnx_model.py, so
+the tests need no model download.
+"""
+
+import re
+
+import numpy as np
+import pytest
+
+
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+torch = pytest.importorskip("torch")
+st_models = pytest.importorskip("sentence_transformers.models")
+
+from sentence_transformers import SentenceTransformer  # noqa: E402
+from transformers import BertConfig, BertModel, BertTokenizerFast  # noqa: E402
+
+from scripts.export_onnx_model import (  # noqa: E402
+    DEFAULT_MEAN_COSINE,
+    DEFAULT_MIN_COSINE,
+    check_parity,
+    export_onnx_model,
+    load_corpus,
+)
+from services.embedding_service import EmbeddingConfig, EmbeddingService  # noqa: E402
+from services.onnx_embedding import OnnxSentenceEncoder, parity_report  # noqa: E402
+
+
+HIDDEN_SIZE = 64
+
+
+@pytest.fixture(scope="module")
+def tiny_export(tmp_path_factory):
+    """(fp32 SentenceTransformer, export directory) for a tiny BERT model."""
+    workdir = tmp_path_factory.mktemp("onnx")
+    words = sorted({w for text in load_corpus() for w in re.findall(r"\w+|[^\w\s]", text.lower())})
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *words]
+    (workdir / "vocab.txt").write_text("\n".join(vocab))
+
+    torch.manual_seed(0)
+    bert = BertModel(
+        BertConfig(
+            vocab_size=len(vocab),
+            hidden_size=HIDDEN_SIZE,
+            num_hidden_layers=2,
+            num_attention_heads=4,
+            intermediate_size=128,
+            max_position_embeddings=128,
+        )
+    )
+    source = workdir / "source"
+    bert.save_pretrained(source)
+    BertTokenizerFast(vocab_file=str(workdir / "vocab.txt")).save_pretrained(source)
+
+    model = SentenceTransformer(
+        modules=[
+            st_models.Transformer(str(source), max_seq_length=64),
+            st_models.Pooling(HIDDEN_SIZE, "mean"),
+            st_models.Normalize(),
+        ],
+        device="cpu",
+    )
+    return model, export_onnx_model(model, workdir / "export", model_name="tiny-bert")
+
+
+@pytest.fixture
+def shared_model_reset():
+    yield
+    EmbeddingService._shared_model = None
+    EmbeddingService._shared_model_config = None
+
+
+class TestOnnxSentenceEncoder:
+    """Tests for the onnxruntime encoder"""
+
+    def test_encode_shapes_follow_sentence_transformers(self, tiny_export):
+        encoder = OnnxSentenceEncoder.load(tiny_export[1])
+
+        assert encoder.encode("binary search").shape == (HIDDEN_SIZE,)
+        assert encoder.encode(["a", "b", "c"]).shape == (3, HIDDEN_SIZE)
+        assert encoder.encode([]).shape == (0, HIDDEN_SIZE)
+
+    def test_batches_keep_input_order(self, tiny_export):
+        encoder = OnnxSentenceEncoder.load(tiny_export[1])
+        texts = ["loops", "Merge sort splits the input and merges both halves.", "DNS"]
+
+        batched = encoder.encode(texts, batch_size=2)
+        single = np.stack([encoder.encode(text) for text in texts])
+
+        # Dynamic quantization picks activation scales per batch, hence ~1e-4 noise
+        np.testing.assert_allclose(batched, single, atol=1e-3)
+        np.testing.assert_allclose(np.linalg.norm(batched, axis=1), 1.0, atol=1e-5)
+
+    def test_missing_export_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="export_onnx_model"):
+            OnnxSentenceEncoder.load(tmp_path)
+
+
+class TestParity:
+    """Quantized export against the fp32 sentence-transformers model"""
+
+    def test_quantized_model_matches_fp32_on_fixture_corpus(self, tiny_export):
+        model, export_dir = tiny_export
+
+        report = check_parity(model, export_dir, load_corpus())
+
+        assert report["texts"] == len(load_corpus())
+        assert report["min_cosine"] >= DEFAULT_MIN_COSINE
+        assert report["mean_cosine"] >= DEFAULT_MEAN_COSINE
+        assert report["neighbour_overlap"] >= 0.8
+
+    def test_fp32_export_is_numerically_equivalent(self, tiny_export):
+        model, export_dir = tiny_export
+        texts = load_corpus()
+
+        reference = model.encode(texts, normalize_embeddings=True)
+        exported = OnnxSentenceEncoder.load(export_dir, quantized=False).encode(texts)
+
+        assert parity_report(reference, exported)["min_cosine"] > 0.9999
+
+
+class TestEmbeddingServiceOnnxBackend:
+    """EmbeddingService with backend="onnx" """
+
+    async def test_initialize_and_generate(self, tiny_export, shared_model_reset):
+        config = EmbeddingConfig(
+            model_name="tiny-bert", backend="onnx", onnx_model_dir=str(tiny_export[1])
+        )
+        service = EmbeddingService(config=config)
+
+        assert await service.initialize() is True
+        single = service.generate_embedding("Closures capture variables")
+        batch = service.generate_batch(["Closures capture variables", "", "Heaps"])
+
+        assert service.get_embedding_dimension() == HIDDEN_SIZE
+        assert service.health_check()["device"] == "cpu"
+        assert len(single) == HIDDEN_SIZE
+        np.testing.assert_allclose(batch[0], single, atol=1e-3)
+        assert batch[1] == [0.0] * HIDDEN_SIZE
+
+    async def test_second_service_reuses_shared_model(self, tiny_export, shared_model_reset):
+        config = EmbeddingConfig(
+            model_name="tiny-bert", backend="onnx", onnx_model_dir=str(tiny_export[1])
+        )
+        first, second = EmbeddingService(config=config), EmbeddingService(config=config)
+
+        await first.initialize()
+        await second.initialize()
+
+        assert second.model is first.model
+
+    async def test_missing_export_degrades(self, tmp_path, shared_model_reset):
+        config = EmbeddingConfig(backend="onnx", onnx_model_dir=str(tmp_path))
+        service = EmbeddingService(config=config)
+
+        assert await service.initialize() is False
+        assert service.health_check()["status"] == "degraded"
@@ -105,9 +105,10 @@ def test_mark_processing(temp_db):
 
     outbox_id = outbox.add_to_outbox("event_001", "neo4j")
 
-    result = outbox.mark_processing(outbox_id)
+    lease_id = outbox.mark_processing(outbox_id)
 
-    assert result is True
+    assert lease_id
+    assert outbox.count_by_status() == {Outbox.STATUS_PROCESSING: 1}
 
 
 def test_mark_processed(temp_db):
@@ -258,3 +259,233 @@ def test_outbox_item_attributes(temp_db):
     assert item.projection_name == "neo4j"
     assert item.status == Outbox.STATUS_PENDING
     assert item.attempts == 0
+
+
+def test_claim_pending_marks_rows_processing(temp_db):
+    """Test claimed items are not returned by later claims"""
+    outbox = Outbox(temp_db)
+    for i in range(5):
+        outbox.add_to_outbox(f"event_{i:03d}", "neo4j")
+
+    first = outbox.claim_pending(3)
+    second = outbox.claim_pending(3)
+
+    assert [item.event_id for item in first] == ["event_000", "event_001", "event_002"]
+    assert all(item.status == Outbox.STATUS_PROCESSING for item in first)
+    assert [item.event_id for item in second] == ["event_003", "event_004"]
+    assert outbox.claim_pending(3) == []
+    assert outbox.count_by_status() == {Outbox.STATUS_PROCESSING: 5}
+
+
+def test_mark_many_updates_in_bulk(temp_db):
+    """Test bulk completion and failure keep mark_failed retry semantics"""
+    outbox = Outbox(temp_db)
+    ids = [outbox.add_to_outbox(f"event_{i:03d}", "neo4j") for i in range(3)]
+    outbox.claim_pending(3)
+
+    assert outbox.mark_processed_many(ids[:2]) == 2
+    assert outbox.mark_failed_many([(ids[2], "boom")]) == 1
+
+    counts = outbox.count_by_status()
+    assert counts[Outbox.STATUS_COMPLETED] == 2
+    assert counts[Outbox.STATUS_PENDING] == 1
+    assert outbox.get_pending()[0].error_message == "boom"
+
+
+def test_backlog_stats(temp_db):
+    """Test backlog size and age reporting"""
+    outbox = Outbox(temp_db)
+    assert outbox.get_backlog_stats() == {"pending": 0, "oldest_pending_age_seconds": 0.0}
+
+    outbox.add_to_outbox("event_001", "neo4j")
+    stats = outbox.get_backlog_stats()
+
+    assert stats["pending"] == 1
+    assert stats["oldest_pending_age_seconds"] >= 0.0
+
+
+def test_legacy_table_is_upgraded(temp_db):
+    """Test the lease column, partial indexes and history table are added in place"""
+    import sqlite3
+
+    Outbox(temp_db).add_to_outbox("event_001", "neo4j")
+
+    with sqlite3.connect(temp_db) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(outbox)")}
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert {"lease_expires_at", "lease_id"} <= columns
+    assert {"idx_outbox_pending", "idx_outbox_failed", "idx_outbox_leased"} <= names
+    assert "outbox_history" in names
+
+
+def test_pending_queries_use_partial_index(temp_db):
+    """Test pending lookups read the partial index instead of the full table"""
+    outbox = Outbox(temp_db)
+    conn = outbox._get_connection()
+
+    plan = " ".join(
+        row["detail"]
+        for row in conn.execute(
+            """EXPLAIN QUERY PLAN
+               SELECT outbox_id FROM outbox
+               WHERE status = 'pending' AND attempts < 3
+               ORDER BY created_at ASC, rowid ASC LIMIT 10"""
+        )
+    )
+    assert "idx_outbox_pending" in plan
+
+
+def test_claim_sets_lease(temp_db):
+    """Test claimed items carry a lease expiry"""
+    outbox = Outbox(temp_db, lease_seconds=60)
+    outbox.add_to_outbox("event_001", "neo4j")
+
+    (item,) = outbox.claim_pending(1)
+
+    assert 59 <= (item.lease_expires_at - item.last_attempt).total_seconds() <= 60
+
+
+def test_expired_lease_is_reclaimed(temp_db):
+    """Test rows of a stalled worker are handed out again as a failed attempt"""
+    import time
+
+    stalled = Outbox(temp_db, lease_seconds=0.05)
+    outbox_id = stalled.add_to_outbox("event_001", "neo4j")
+    stalled.claim_pending(1)
+    time.sleep(0.1)
+
+    (item,) = Outbox(temp_db).claim_pending(1)
+
+    assert item.outbox_id == outbox_id
+    assert item.attempts == 1
+    assert "Lease expired" in item.error_message
+
+
+def test_expired_leases_fail_after_max_attempts(temp_db):
+    """Test a row that keeps outliving its lease ends up failed"""
+    import time
+
+    outbox = Outbox(temp_db, lease_seconds=0.01)
+    outbox.add_to_outbox("event_001", "neo4j")
+
+    for _ in range(Outbox.MAX_ATTEMPTS):
+        assert len(outbox.claim_pending(1)) == 1
+        time.sleep(0.02)
+
+    assert outbox.claim_pending(1) == []
+    assert outbox.count_by_status() == {Outbox.STATUS_FAILED: 1}
+
+
+def test_unexpired_lease_is_not_reclaimed(temp_db):
+    """Test a second worker does not take rows under a live lease"""
+    first, second = Outbox(temp_db), Outbox(temp_db)
+    for i in range(4):
+        first.add_to_outbox(f"event_{i:03d}", "neo4j")
+
+    claimed_first = first.claim_pending(2)
+    claimed_second = second.claim_pending(10)
+
+    assert {i.outbox_id for i in claimed_first}.isdisjoint(i.outbox_id for i in claimed_second)
+    assert len(claimed_first) + len(claimed_second) == 4
+
+
+def test_mark_processing_skips_live_leases(temp_db):
+    """Test an item under a live lease cannot be taken, one with an expired lease can"""
+    import time
+
+    outbox = Outbox(temp_db, lease_seconds=0.05)
+    outbox_id = outbox.add_to_outbox("event_001", "neo4j")
+
+    first = outbox.mark_processing(outbox_id)
+    assert outbox.mark_processing(outbox_id) is None
+
+    time.sleep(0.1)
+    second = outbox.mark_processing(outbox_id)
+    assert second not in (None, first)
+
+    assert outbox.mark_processed(outbox_id, lease_id=second) is True
+    assert outbox.mark_processing(outbox_id) is None
+    assert outbox.mark_processing("unknown") is None
+
+
+def test_lost_lease_cannot_complete_or_fail(temp_db):
+    """Test a worker whose lease was taken over leaves the new holder's row alone"""
+    import time
+
+    stalled = Outbox(temp_db, lease_seconds=0.05)
+    outbox_id = stalled.add_to_outbox("event_001", "neo4j")
+    (stale,) = stalled.claim_pending(1)
+    time.sleep(0.1)
+    (current,) = Outbox(temp_db).claim_pending(1)
+
+    assert stalled.mark_processed(outbox_id, lease_id=stale.lease_id) is False
+    assert stalled.mark_failed(outbox_id, "late", lease_id=stale.lease_id) is False
+    assert stalled.mark_processed_many([outbox_id], lease_id=stale.lease_id) == 0
+    assert stalled.mark_failed_many([(outbox_id, "late")], lease_id=stale.lease_id) == 0
+    assert stalled.count_by_status() == {Outbox.STATUS_PROCESSING: 1}
+
+    assert stalled.mark_processed_many([outbox_id], lease_id=current.lease_id) == 1
+    assert stalled.count_by_status() == {Outbox.STATUS_COMPLETED: 1}
+
+
+def test_archive_completed_moves_rows_to_history(temp_db):
+    """Test completed rows leave the outbox in compressed batches and stay readable"""
+    outbox = Outbox(temp_db)
+    ids = [outbox.add_to_outbox(f"event_{i:03d}", "neo4j") for i in range(5)]
+    outbox.mark_processed_many(ids[:4])
+
+    assert outbox.archive_completed(batch_size=3) == 4
+
+    assert outbox.count_by_status() == {Outbox.STATUS_PENDING: 1}
+    history = list(outbox.iter_history())
+    assert [item.outbox_id for item in history] == ids[:4]
+    assert all(item.status == Outbox.STATUS_COMPLETED for item in history)
+    conn = outbox._get_connection()
+    assert [row[0] for row in conn.execute("SELECT row_count FROM outbox_history")] == [3, 1]
+
+
+def test_archive_completed_respects_retention(temp_db):
+    """Test recently completed rows are kept until they age past the retention"""
+    outbox = Outbox(temp_db)
+    outbox_id = outbox.add_to_outbox("event_001", "neo4j")
+    outbox.mark_processed(outbox_id)
+
+    assert outbox.archive_completed(older_than_seconds=3600) == 0
+    assert outbox.count_by_status() == {Outbox.STATUS_COMPLETED: 1}
+
+
+def test_concurrent_threads_share_connection_safely(temp_db):
+    """Test claims, completions, inserts and archival from many threads do not interleave"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    outbox = Outbox(temp_db)
+    rounds = 40
+
+    def produce(worker):
+        for i in range(rounds):
+            outbox.add_to_outbox(f"event_{worker}_{i:03d}", "neo4j")
+
+    def drain():
+        for _ in range(rounds):
+            claimed = outbox.claim_pending(limit=5)
+            if claimed:
+                outbox.mark_processed_many(
+                    [item.outbox_id for item in claimed], lease_id=claimed[0].lease_id
+                )
+
+    def archive():
+        for _ in range(rounds):
+            outbox.archive_completed()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [pool.submit(produce, w) for w in range(3)]
+        futures += [pool.submit(drain), pool.submit(drain), pool.submit(archive)]
+        for future in futures:
+            future.result()
+
+    while claimed := outbox.claim_pending(limit=50):
+        outbox.mark_processed_many([item.outbox_id for item in claimed], claimed[0].lease_id)
+    outbox.archive_completed()
+
+    assert outbox.count_by_status() == {}
+    assert len(list(outbox.iter_history())) == 3 * rounds
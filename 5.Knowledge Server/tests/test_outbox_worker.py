@@ -0,0 +1,203 @@
+"""
+Unit tests for OutboxWorker
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from models.events import ConceptCreated, ConceptUpdated, RelationshipCreated
+from services.event_store import EventStore
+from services.outbox import Outbox
+from services.outbox_worker import OutboxWorker
+
+
+class RecordingProjection:
+    """Projection stub recording each project_events() call."""
+
+    def __init__(self, fail_ids=(), delay=0.0):
+        self.calls = []
+        self.fail_ids = set(fail_ids)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def project_events(self, events):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        self.calls.append([event.aggregate_id for event in events])
+        return [event.aggregate_id not in self.fail_ids for event in events]
+
+
+@pytest.fixture
+def stores(temp_event_db):
+    """EventStore and Outbox sharing one database."""
+    event_store = EventStore(temp_event_db)
+    outbox = Outbox(temp_event_db)
+    yield event_store, outbox
+    event_store.close()
+    outbox.close()
+
+
+def _append_with_outbox(event_store, outbox, events):
+    entries = outbox.build_entries([e.event_id for e in events], ["neo4j", "chromadb"])
+    event_store.append_events(events, outbox_entries=entries)
+
+
+async def test_drain_once_batches_each_lane(stores):
+    """Test one claim is split into one project_events call per lane"""
+    event_store, outbox = stores
+    events = [
+        ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+        for i in range(10)
+    ]
+    _append_with_outbox(event_store, outbox, events)
+    neo4j, chromadb = RecordingProjection(), RecordingProjection()
+    worker = OutboxWorker(outbox, event_store, {"neo4j": neo4j, "chromadb": chromadb})
+
+    stats = await worker.drain_once()
+
+    assert stats == {"processed": 20, "failed": 0, "total": 20}
+    assert len(neo4j.calls) == 1 and len(neo4j.calls[0]) == 10
+    assert len(chromadb.calls) == 1 and len(chromadb.calls[0]) == 10
+    assert outbox.count_by_status() == {Outbox.STATUS_COMPLETED: 20}
+
+
+async def test_failed_events_return_to_pending(stores):
+    """Test per-event failures are recorded without failing the batch"""
+    event_store, outbox = stores
+    events = [
+        ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+        for i in range(3)
+    ]
+    _append_with_outbox(event_store, outbox, events)
+    worker = OutboxWorker(
+        outbox,
+        event_store,
+        {"neo4j": RecordingProjection(fail_ids={"c1"}), "chromadb": RecordingProjection()},
+    )
+
+    stats = await worker.drain_once()
+
+    assert stats["processed"] == 5
+    assert stats["failed"] == 1
+    pending = outbox.get_pending()
+    assert len(pending) == 1
+    assert pending[0].projection_name == "neo4j"
+    assert pending[0].attempts == 1
+
+
+async def test_missing_event_marked_failed(stores):
+    """Test outbox rows pointing at unknown events fail cleanly"""
+    event_store, outbox = stores
+    outbox.add_to_outbox("missing-event", "neo4j")
+    worker = OutboxWorker(outbox, event_store, {"neo4j": RecordingProjection()})
+
+    stats = await worker.drain_once()
+
+    assert stats == {"processed": 0, "failed": 1, "total": 1}
+    assert outbox.get_pending()[0].error_message == "Event not found in event store"
+
+
+async def test_related_events_stay_in_one_sub_batch(stores):
+    """Test events touching the same concept keep their order in one sub-batch"""
+    event_store, outbox = stores
+    events = [
+        ConceptCreated(aggregate_id="a", concept_data={"name": "a"}, version=1),
+        ConceptCreated(aggregate_id="b", concept_data={"name": "b"}, version=1),
+        ConceptCreated(aggregate_id="c", concept_data={"name": "c"}, version=1),
+        RelationshipCreated(
+            aggregate_id="rel", relationship_data={"from_concept_id": "a", "to_concept_id": "c"}
+        ),
+        ConceptUpdated(aggregate_id="a", updates={"name": "a2"}, version=2),
+    ]
+    _append_with_outbox(event_store, outbox, events)
+    neo4j = RecordingProjection()
+    worker = OutboxWorker(
+        outbox,
+        event_store,
+        {"neo4j": neo4j, "chromadb": RecordingProjection()},
+        sub_batch_size=1,
+    )
+
+    await worker.drain_once()
+
+    assert sorted(neo4j.calls) == [["a", "c", "rel", "a"], ["b"]]
+
+
+async def test_lanes_bounded_in_flight(stores):
+    """Test sub-batches run concurrently but never above max_in_flight"""
+    event_store, outbox = stores
+    events = [
+        ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+        for i in range(8)
+    ]
+    _append_with_outbox(event_store, outbox, events)
+    neo4j = RecordingProjection(delay=0.05)
+    worker = OutboxWorker(
+        outbox,
+        event_store,
+        {"neo4j": neo4j, "chromadb": RecordingProjection(delay=0.05)},
+        sub_batch_size=1,
+        max_in_flight=2,
+    )
+
+    await worker.drain_once()
+
+    assert len(neo4j.calls) == 8
+    assert neo4j.max_active == 2
+
+
+async def test_metrics_report_throughput_and_backlog(stores):
+    """Test metrics include throughput, lanes and backlog age"""
+    event_store, outbox = stores
+    events = [
+        ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+        for i in range(4)
+    ]
+    _append_with_outbox(event_store, outbox, events)
+    worker = OutboxWorker(
+        outbox,
+        event_store,
+        {"neo4j": RecordingProjection(), "chromadb": RecordingProjection()},
+        batch_size=4,
+    )
+
+    totals = await worker.drain()
+    metrics = worker.get_metrics()
+
+    assert totals["processed"] == 8
+    assert metrics["batches"] == 2
+    assert metrics["processed"] == 8
+    assert metrics["throughput_per_second"] > 0
+    assert metrics["lanes"]["neo4j"]["processed"] == 4
+    assert metrics["backlog_pending"] == 0
+    assert metrics["backlog_oldest_age_seconds"] == 0.0
+
+
+async def test_projection_exception_fails_sub_batch(stores):
+    """Test an exception from project_events fails only that sub-batch"""
+    event_store, outbox = stores
+    _append_with_outbox(
+        event_store,
+        outbox,
+        [ConceptCreated(aggregate_id="c1", concept_data={"name": "x"}, version=1)],
+    )
+    broken = Mock()
+    broken.project_events = Mock(side_effect=RuntimeError("neo4j down"))
+    worker = OutboxWorker(
+        outbox, event_store, {"neo4j": broken, "chromadb": RecordingProjection()}
+    )
+
+    stats = await worker.drain_once()
+
+    assert stats["processed"] == 1
+    assert stats["failed"] == 1
+    assert "neo4j down" in outbox.get_pending()[0].error_message
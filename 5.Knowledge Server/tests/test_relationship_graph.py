@@ -0,0 +1,211 @@
+"""
+Unit tests for RelationshipGraph (event-maintained adjacency index)
+"""
+
+from unittest.mock import Mock
+
+from models.events import (
+    ConceptCreated,
+    ConceptDeleted,
+    ConceptUpdated,
+    RelationshipCreated,
+    RelationshipDeleted,
+)
+from services.relationship_graph import RelationshipGraph
+
+
+def _concept(concept_id, name=None, deleted=False):
+    return {"concept_id": concept_id, "name": name or concept_id, "deleted": deleted}
+
+
+def _rel(relationship_id, source, target, rel_type="PREREQUISITE", strength=1.0):
+    return {
+        "relationship_id": relationship_id,
+        "source_id": source,
+        "target_id": target,
+        "relationship_type": rel_type,
+        "strength": strength,
+    }
+
+
+def _rel_created(relationship_id, source, target, rel_type="RELATES_TO", strength=0.5):
+    return RelationshipCreated(
+        aggregate_id=relationship_id,
+        relationship_data={
+            "relationship_type": rel_type,
+            "from_concept_id": source,
+            "to_concept_id": target,
+            "strength": strength,
+        },
+    )
+
+
+def _chain_graph():
+    """a -> b -> c -> d (PREREQUISITE), plus a -RELATES_TO-> e."""
+    graph = RelationshipGraph()
+    graph.load(
+        [_concept(c) for c in "abcde"],
+        [
+            _rel("r1", "a", "b"),
+            _rel("r2", "b", "c"),
+            _rel("r3", "c", "d"),
+            _rel("r4", "a", "e", "RELATES_TO", 0.5),
+        ],
+        sequence=5,
+    )
+    return graph
+
+
+def _ids(rows):
+    return [row["concept_id"] for row in rows]
+
+
+class TestRelationshipGraphLoad:
+    """Tests for loading and incremental maintenance"""
+
+    def test_new_graph_needs_rebuild(self):
+        assert RelationshipGraph().needs_rebuild is True
+
+    def test_load_indexes_concepts_and_edges(self):
+        graph = _chain_graph()
+
+        stats = graph.get_stats()
+        assert graph.needs_rebuild is False
+        assert graph.last_sequence == 5
+        assert stats["concepts"] == 5
+        assert stats["indexed_edges"] == 4
+        assert stats["delta_edges"] == 0
+
+    def test_relationship_with_unknown_endpoint_is_skipped(self):
+        graph = RelationshipGraph()
+        graph.load([_concept("a")], [], sequence=0)
+
+        assert graph.apply_event(_rel_created("r1", "a", "missing")) is False
+
+    def test_created_relationship_is_idempotent(self):
+        graph = _chain_graph()
+
+        assert graph.apply_event(_rel_created("r1", "a", "b")) is False
+        assert graph.get_stats()["relationships"] == 4
+
+    def test_created_relationship_visible_before_compaction(self):
+        graph = _chain_graph()
+        graph.apply_event(ConceptCreated(aggregate_id="f", concept_data={"name": "f"}))
+
+        graph.apply_event(_rel_created("r5", "d", "f"))
+
+        assert graph.get_stats()["delta_edges"] == 1
+        assert _ids(graph.related("d")) == ["f"]
+
+    def test_deleted_relationship_is_removed(self):
+        graph = _chain_graph()
+
+        assert graph.apply_event(RelationshipDeleted(aggregate_id="r2", version=2)) is True
+
+        assert _ids(graph.related("a", max_depth=3)) == ["b", "e"]
+        assert graph.apply_event(RelationshipDeleted(aggregate_id="r2", version=3)) is False
+
+    def test_compaction_keeps_traversals(self):
+        graph = RelationshipGraph()
+        graph.load([_concept("hub")] + [_concept(f"n{i}") for i in range(300)], [], sequence=0)
+        events = [(i + 1, _rel_created(f"r{i}", "hub", f"n{i}")) for i in range(300)]
+        event_store = Mock()
+        event_store.iter_events_after = Mock(return_value=iter(events))
+
+        graph.catch_up(event_store)
+
+        stats = graph.get_stats()
+        assert stats["delta_edges"] == 0
+        assert stats["indexed_edges"] == 300
+        assert len(graph.related("hub", limit=500)) == 300
+
+    def test_concept_update_renames(self):
+        graph = _chain_graph()
+
+        graph.apply_event(ConceptUpdated(aggregate_id="b", updates={"name": "Bee"}, version=2))
+
+        assert graph.get_concept("b") == {"concept_id": "b", "name": "Bee"}
+
+    def test_catch_up_advances_cursor(self):
+        graph = _chain_graph()
+        event_store = Mock()
+        event_store.iter_events_after = Mock(
+            return_value=iter([(6, _rel_created("r5", "e", "d")), (7, _rel_created("r6", "d", "a"))])
+        )
+
+        assert graph.catch_up(event_store) == 2
+
+        event_store.iter_events_after.assert_called_once_with(5)
+        assert graph.last_sequence == 7
+
+    def test_mark_stale_requests_rebuild(self):
+        graph = _chain_graph()
+
+        graph.mark_stale()
+
+        assert graph.needs_rebuild is True
+
+
+class TestRelationshipGraphQueries:
+    """Tests for traversal queries"""
+
+    def test_related_outgoing_with_distance_and_first_edge(self):
+        graph = _chain_graph()
+
+        rows = graph.related("a", max_depth=2)
+
+        assert [(r["concept_id"], r["distance"]) for r in rows] == [("b", 1), ("e", 1), ("c", 2)]
+        assert rows[2]["relationship_type"] == "PREREQUISITE"
+        assert rows[1]["strength"] == 0.5
+
+    def test_related_type_filter_and_direction(self):
+        graph = _chain_graph()
+
+        assert _ids(graph.related("a", "PREREQUISITE", max_depth=5)) == ["b", "c", "d"]
+        assert _ids(graph.related("c", direction="incoming", max_depth=5)) == ["b", "a"]
+        assert _ids(graph.related("b", direction="both")) == ["a", "c"]
+        assert graph.related("a", "CONTAINS") == []
+
+    def test_related_skips_deleted_but_traverses_through(self):
+        graph = _chain_graph()
+
+        graph.apply_event(ConceptDeleted(aggregate_id="b", version=2))
+
+        assert _ids(graph.related("a", max_depth=2)) == ["e", "c"]
+        assert graph.related("b") == []
+
+    def test_prerequisites_deepest_first(self):
+        graph = _chain_graph()
+
+        rows = graph.prerequisites("d", max_depth=5)
+
+        assert [(r["concept_id"], r["depth"]) for r in rows] == [("a", 3), ("b", 2), ("c", 1)]
+
+    def test_prerequisites_respect_max_depth(self):
+        graph = _chain_graph()
+
+        assert _ids(graph.prerequisites("d", max_depth=1)) == ["c"]
+
+    def test_shortest_path_is_undirected(self):
+        graph = _chain_graph()
+
+        found = graph.shortest_path("d", "e")
+
+        assert [n["concept_id"] for n in found["path"]] == ["d", "c", "b", "a", "e"]
+        assert found["length"] == 4
+
+    def test_shortest_path_avoids_deleted_and_filters_type(self):
+        graph = _chain_graph()
+
+        assert graph.shortest_path("a", "e", "PREREQUISITE") is None
+
+        graph.apply_event(ConceptDeleted(aggregate_id="c", version=2))
+        assert graph.shortest_path("a", "d") is None
+
+    def test_get_concept_hides_deleted(self):
+        graph = RelationshipGraph()
+        graph.load([_concept("a"), _concept("b", deleted=True)], [], sequence=0)
+
+        assert graph.get_concept("a") == {"concept_id": "a", "name": "a"}
+        assert graph.get_concept("b") is None
+        assert graph.get_concept("missing") is None
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from services.relationship_graph import RelationshipGraph
 from tools import relationship_tools
 
 
@@ -436,3 +437,67 @@ class TestRelationshipTypeEnum:
         types = [t.value for t in relationship_tools.RelationshipType]
         assert len(types) == 4
         assert "PREREQUISITE" in types
+
+
+@pytest.fixture
+def loaded_graph(setup_services, configured_container):
+    """Relationship graph already loaded: a -> b -> c (PREREQUISITE)"""
+    graph = RelationshipGraph()
+    graph.load(
+        [{"concept_id": c, "name": c.upper(), "deleted": False} for c in "abc"],
+        [
+            {"relationship_id": "r1", "source_id": "a", "target_id": "b",
+             "relationship_type": "PREREQUISITE", "strength": 1.0},
+            {"relationship_id": "r2", "source_id": "b", "target_id": "c",
+             "relationship_type": "PREREQUISITE", "strength": 0.8},
+        ],
+        sequence=0,
+    )
+    configured_container.relationship_graph = graph
+    configured_container.event_store.iter_events_after = Mock(return_value=iter([]))
+    return graph
+
+
+class TestRelationshipGraphPath:
+    """Tests for traversal tools served from the in-memory relationship graph"""
+
+    @pytest.mark.asyncio
+    async def test_get_related_concepts_uses_graph(self, setup_services, loaded_graph):
+        result = await relationship_tools.get_related_concepts("a", max_depth=2)
+
+        assert result["success"] is True
+        assert [(r["concept_id"], r["distance"]) for r in result["data"]["related"]] == [
+            ("b", 1), ("c", 2)
+        ]
+        assert result["data"]["related"][0]["relationship_type"] == "prerequisite"
+        setup_services["neo4j"].execute_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_prerequisites_uses_graph(self, setup_services, loaded_graph):
+        result = await relationship_tools.get_prerequisites("c")
+
+        assert [(r["concept_id"], r["depth"]) for r in result["data"]["chain"]] == [("a", 2), ("b", 1)]
+        setup_services["neo4j"].execute_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_concept_chain_uses_graph(self, setup_services, loaded_graph):
+        result = await relationship_tools.get_concept_chain("c", "a")
+
+        assert [n["concept_id"] for n in result["data"]["path"]] == ["c", "b", "a"]
+        assert result["data"]["length"] == 2
+
+        same = await relationship_tools.get_concept_chain("b", "b")
+        assert same["data"]["path"] == [{"concept_id": "b", "name": "B"}]
+        setup_services["neo4j"].execute_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cold_graph_falls_back_to_neo4j(self, setup_services, configured_container):
+        configured_container.relationship_graph = RelationshipGraph()
+        configured_container.event_store.get_projected_sequence = Mock(return_value=0)
+
+        result = await relationship_tools.get_prerequisites("c")
+
+        assert result["success"] is True
+        query = setup_services["neo4j"].execute_read.call_args_list[0].args[0]
+        assert "PREREQUISITE" in query
+        await relationship_tools._graph_warmup_task
@@ -0,0 +1,261 @@
+"""
+Unit tests for ProjectionRebuilder
+"""
+
+import json
+
+import pytest
+
+from models.events import (
+    ConceptCreated,
+    ConceptDeleted,
+    ConceptTauUpdated,
+    ConceptUpdated,
+    RelationshipCreated,
+    RelationshipDeleted,
+)
+from services.event_store import EventStore
+from services.replay import ProjectionRebuilder, RebuildCheckpoint
+
+
+class RecordingProjection:
+    """Projection stub recording each project_events() call."""
+
+    def __init__(self, crash_after_calls=None):
+        self.calls = []
+        self.crash_after_calls = crash_after_calls
+
+    def project_events(self, events):
+        if self.crash_after_calls is not None and len(self.calls) >= self.crash_after_calls:
+            raise KeyboardInterrupt("simulated crash")
+        self.calls.append(list(events))
+        return [True] * len(events)
+
+    @property
+    def events(self):
+        return [event for call in self.calls for event in call]
+
+
+@pytest.fixture
+def event_store(temp_event_db):
+    store = EventStore(temp_event_db)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    return tmp_path / "rebuild_checkpoint.json"
+
+
+def _seed(event_store):
+    """Two live concepts (one with history), one deleted concept, two relationships."""
+    event_store.append_events(
+        [
+            ConceptCreated(aggregate_id="c1", concept_data={"name": "one"}, version=1),
+            ConceptCreated(aggregate_id="c2", concept_data={"name": "two"}, version=1),
+            ConceptCreated(aggregate_id="c3", concept_data={"name": "three"}, version=1),
+            ConceptUpdated(aggregate_id="c1", updates={"name": "uno"}, version=2),
+            ConceptUpdated(aggregate_id="c1", updates={"explanation": "first"}, version=3),
+            ConceptTauUpdated(aggregate_id="c1", tau=3, version=4),
+            ConceptTauUpdated(aggregate_id="c1", tau=9, version=5),
+            ConceptDeleted(aggregate_id="c3", version=2),
+            RelationshipCreated(
+                aggregate_id="r1",
+                relationship_data={
+                    "relationship_type": "PREREQUISITE",
+                    "from_concept_id": "c1",
+                    "to_concept_id": "c2",
+                },
+            ),
+            RelationshipCreated(
+                aggregate_id="r2",
+                relationship_data={
+                    "relationship_type": "RELATES_TO",
+                    "from_concept_id": "c2",
+                    "to_concept_id": "c1",
+                },
+            ),
+            RelationshipDeleted(aggregate_id="r2", version=2),
+        ]
+    )
+
+
+def test_fold_keeps_net_state_per_aggregate(event_store, checkpoint_path):
+    """Test updates coalesce, the last tau wins and deletions are recorded"""
+    _seed(event_store)
+    rebuilder = ProjectionRebuilder(event_store, {}, checkpoint_path=checkpoint_path)
+
+    concepts, relationships, replayed, orphaned = rebuilder.fold(
+        event_store.get_last_sequence()
+    )
+
+    assert replayed == 11 and orphaned == 0
+    assert list(concepts) == ["c1", "c2", "c3"]
+    assert concepts["c1"].updates == {"name": "uno", "explanation": "first"}
+    assert concepts["c1"].tau == 9
+    assert concepts["c3"].deleted
+    assert not relationships["r1"].deleted and relationships["r2"].deleted
+
+
+def test_fold_stops_at_target_sequence(event_store, checkpoint_path):
+    """Test events appended after the target sequence are not folded"""
+    _seed(event_store)
+    target = event_store.get_last_sequence()
+    event_store.append_event(ConceptUpdated(aggregate_id="c2", updates={"name": "dos"}, version=2))
+    rebuilder = ProjectionRebuilder(event_store, {}, checkpoint_path=checkpoint_path)
+
+    concepts, _, replayed, _ = rebuilder.fold(target)
+
+    assert replayed == 11
+    assert concepts["c2"].last_update is None
+
+
+def test_fold_skips_events_without_creation(event_store, checkpoint_path):
+    """Test updates to unknown concepts are counted as orphaned"""
+    event_store.append_event(ConceptUpdated(aggregate_id="ghost", updates={"a": 1}, version=1))
+    rebuilder = ProjectionRebuilder(event_store, {}, checkpoint_path=checkpoint_path)
+
+    concepts, _, replayed, orphaned = rebuilder.fold(event_store.get_last_sequence())
+
+    assert concepts == {}
+    assert replayed == 1 and orphaned == 1
+
+
+def test_graph_plan_is_phase_ordered(event_store, checkpoint_path):
+    """Test the graph projection gets one event per net change, creations first"""
+    _seed(event_store)
+    neo4j = RecordingProjection()
+    rebuilder = ProjectionRebuilder(
+        event_store, {"neo4j": neo4j}, checkpoint_path=checkpoint_path
+    )
+
+    report = rebuilder.rebuild()
+
+    assert [(e.event_type, e.aggregate_id) for e in neo4j.events] == [
+        ("ConceptCreated", "c1"),
+        ("ConceptCreated", "c2"),
+        ("ConceptCreated", "c3"),
+        ("ConceptUpdated", "c1"),
+        ("ConceptTauUpdated", "c1"),
+        ("ConceptDeleted", "c3"),
+        ("RelationshipCreated", "r1"),
+    ]
+    assert neo4j.events[3].event_data == {"name": "uno", "explanation": "first"}
+    assert neo4j.events[4].event_data["tau"] == 9
+    assert report.written == {"neo4j": 7} and report.failed == {"neo4j": 0}
+
+
+def test_document_plan_has_live_concepts_only(event_store, checkpoint_path):
+    """Test the document projection skips deleted concepts, tau and relationships"""
+    _seed(event_store)
+    chromadb = RecordingProjection()
+    rebuilder = ProjectionRebuilder(
+        event_store, {"chromadb": chromadb}, checkpoint_path=checkpoint_path
+    )
+
+    rebuilder.rebuild()
+
+    assert [(e.event_type, e.aggregate_id) for e in chromadb.events] == [
+        ("ConceptCreated", "c1"),
+        ("ConceptUpdated", "c1"),
+        ("ConceptCreated", "c2"),
+    ]
+
+
+def test_rebuild_writes_in_batches_and_reports_throughput(event_store, checkpoint_path):
+    """Test batch size bounds each write and the report carries events/sec"""
+    event_store.append_events(
+        [
+            ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+            for i in range(25)
+        ]
+    )
+    neo4j = RecordingProjection()
+    rebuilder = ProjectionRebuilder(
+        event_store, {"neo4j": neo4j}, batch_size=10, checkpoint_path=checkpoint_path
+    )
+
+    report = rebuilder.rebuild()
+
+    assert [len(call) for call in neo4j.calls] == [10, 10, 5]
+    assert report.events_replayed == 25 and report.concepts == 25
+    assert report.events_per_second > 0
+    assert report.to_dict()["events_per_second"] > 0
+    assert RebuildCheckpoint.from_file(checkpoint_path).completed
+
+
+def test_failed_results_are_counted(event_store, checkpoint_path):
+    """Test per-event failures and batch exceptions are reported, not raised"""
+    _seed(event_store)
+
+    class FailingProjection:
+        def project_events(self, events):
+            raise RuntimeError("store down")
+
+    rebuilder = ProjectionRebuilder(
+        event_store, {"neo4j": FailingProjection()}, checkpoint_path=checkpoint_path
+    )
+
+    report = rebuilder.rebuild()
+
+    assert report.failed == {"neo4j": 7}
+
+
+def test_resume_skips_written_batches(event_store, checkpoint_path):
+    """Test a crashed rebuild resumes from the checkpoint on the same target"""
+    event_store.append_events(
+        [
+            ConceptCreated(aggregate_id=f"c{i}", concept_data={"name": str(i)}, version=1)
+            for i in range(25)
+        ]
+    )
+    crashing = RecordingProjection(crash_after_calls=2)
+    rebuilder = ProjectionRebuilder(
+        event_store, {"neo4j": crashing}, batch_size=10, checkpoint_path=checkpoint_path
+    )
+    with pytest.raises(KeyboardInterrupt):
+        rebuilder.rebuild()
+
+    checkpoint = RebuildCheckpoint.from_file(checkpoint_path)
+    assert checkpoint.written == {"neo4j": 20} and not checkpoint.completed
+
+    # Events appended after the crash are not part of the resumed rebuild
+    event_store.append_event(ConceptCreated(aggregate_id="late", concept_data={}, version=1))
+
+    resumed = RecordingProjection()
+    rebuilder = ProjectionRebuilder(
+        event_store, {"neo4j": resumed}, batch_size=10, checkpoint_path=checkpoint_path
+    )
+    report = rebuilder.rebuild(resume=True)
+
+    assert report.resumed
+    assert [e.aggregate_id for e in resumed.events] == [f"c{i}" for i in range(20, 25)]
+    assert report.written == {"neo4j": 25}
+
+
+def test_resume_after_completion_starts_over(event_store, checkpoint_path):
+    """Test resuming a finished rebuild runs a fresh one"""
+    _seed(event_store)
+    ProjectionRebuilder(
+        event_store, {"neo4j": RecordingProjection()}, checkpoint_path=checkpoint_path
+    ).rebuild()
+
+    neo4j = RecordingProjection()
+    report = ProjectionRebuilder(
+        event_store, {"neo4j": neo4j}, checkpoint_path=checkpoint_path
+    ).rebuild(resume=True)
+
+    assert not report.resumed
+    assert len(neo4j.events) == 7
+
+
+def test_corrupt_checkpoint_is_ignored(event_store, checkpoint_path):
+    """Test an unreadable checkpoint falls back to a fresh rebuild"""
+    checkpoint_path.write_text("{not json", encoding="utf-8")
+
+    assert RebuildCheckpoint.from_file(checkpoint_path) is None
+
+    checkpoint = RebuildCheckpoint(target_sequence=5, written={"neo4j": 3})
+    checkpoint.save(checkpoint_path)
+    assert json.loads(checkpoint_path.read_text())["written"] == {"neo4j": 3}
@@ -35,6 +35,7 @@ def mock_outbox():
     outbox.mark_processed = Mock()
     outbox.mark_failed = Mock()
     outbox.get_pending = Mock(return_value=[])
+    outbox.claim_pending = Mock(return_value=[])
     outbox.count_by_status = Mock(return_value={"pending": 0, "completed": 0, "failed": 0})
     return outbox
 
@@ -65,6 +66,7 @@ def mock_embedding_service():
     service.generate_batch = Mock(return_value=[[0.1] * 384])
     service.config = Mock()
     service.config.model_name = "all-MiniLM-L6-v2"
+    service.config.cache_key = "all-MiniLM-L6-v2"
     return service
 
 
@@ -387,6 +389,25 @@ class TestCreateConcept:
         assert error is not None
         assert concept_id is not None  # Event was still stored
 
+    def test_create_concept_deferred_projection_is_not_a_failure(
+        self, repository, mock_outbox, mock_chromadb_projection
+    ):
+        """A projection leased by the outbox worker is deferred: no rollback, no failure."""
+        repository.compensation_manager = Mock()
+        # Neo4j lease taken here; the ChromaDB entry is already leased by a worker
+        mock_outbox.mark_processing = Mock(side_effect=["lease-neo4j", None])
+
+        concept_data = {"name": "Test Concept", "explanation": "Test explanation"}
+
+        success, error, _concept_id = repository.create_concept(concept_data)
+
+        assert success is True
+        assert error is None
+        mock_chromadb_projection.project_event.assert_not_called()
+        repository.compensation_manager.rollback_neo4j.assert_not_called()
+        repository.compensation_manager.rollback_chromadb.assert_not_called()
+        mock_outbox.mark_failed.assert_not_called()
+
     def test_create_concept_updates_version_cache(self, repository):
         """Test that version cache is updated after creation."""
         concept_data = {"name": "Test Concept", "explanation": "Test explanation"}
@@ -397,6 +418,86 @@ class TestCreateConcept:
         assert repository._version_cache.get(concept_id) == 1
 
 
+class TestCreateConceptsBulk:
+    """Test create_concepts_bulk method."""
+
+    @pytest.fixture(autouse=True)
+    def outbox_entries(self, mock_outbox):
+        """Build deterministic outbox rows like Outbox.build_entries."""
+        mock_outbox.build_entries = Mock(
+            side_effect=lambda event_ids, names: [
+                (f"{event_id}:{name}", event_id, name, "pending", 0, "now")
+                for event_id in event_ids
+                for name in names
+            ]
+        )
+
+    def test_bulk_create_single_commit_and_batch_embedding(
+        self, repository, mock_event_store, mock_embedding_service, mock_embedding_cache
+    ):
+        """Test texts are deduplicated and embedded with one generate_batch call."""
+        mock_embedding_cache.get_many = Mock(return_value=[[0.2] * 384, None])
+        mock_embedding_service.generate_batch = Mock(return_value=[[0.3] * 384])
+        concepts = [
+            {"name": "A", "explanation": "Same text"},
+            {"name": "A", "explanation": "Same text"},
+            {"name": "B", "explanation": "Other text"},
+        ]
+
+        results = repository.create_concepts_bulk(concepts)
+
+        assert [success for success, _, _ in results] == [True, True, True]
+        mock_embedding_cache.get_many.assert_called_once_with(
+            ["A. Same text", "B. Other text"], "all-MiniLM-L6-v2"
+        )
+        mock_embedding_service.generate_batch.assert_called_once_with(["B. Other text"])
+        mock_embedding_service.generate_embedding.assert_not_called()
+        mock_embedding_cache.store_many.assert_called_once()
+
+        mock_event_store.append_events.assert_called_once()
+        events = mock_event_store.append_events.call_args[0][0]
+        entries = mock_event_store.append_events.call_args.kwargs["outbox_entries"]
+        assert len(events) == 3
+        assert len(entries) == 6
+        mock_event_store.append_event.assert_not_called()
+
+    def test_bulk_create_projects_with_prebuilt_outbox_ids(
+        self, repository, mock_event_store, mock_outbox
+    ):
+        """Test projections mark the outbox rows written with the events."""
+        results = repository.create_concepts_bulk([{"name": "A", "explanation": "x"}])
+
+        event = mock_event_store.append_events.call_args[0][0][0]
+        assert results == [(True, None, event.aggregate_id)]
+        processed = [call.args[0] for call in mock_outbox.mark_processed.call_args_list]
+        assert processed == [f"{event.event_id}:neo4j", f"{event.event_id}:chromadb"]
+        mock_outbox.add_to_outbox.assert_not_called()
+        assert repository._version_cache.get(event.aggregate_id) == 1
+
+    def test_bulk_create_without_projections(
+        self, repository, mock_neo4j_projection, mock_outbox
+    ):
+        """Test projections are left to the outbox worker when disabled."""
+        results = repository.create_concepts_bulk(
+            [{"name": "A", "explanation": "x", "concept_id": "c1"}], process_projections=False
+        )
+
+        assert results == [(True, None, "c1")]
+        mock_neo4j_projection.project_event.assert_not_called()
+        mock_outbox.mark_processing.assert_not_called()
+
+    def test_bulk_create_event_store_failure(self, repository, mock_event_store):
+        """Test every concept fails when the batch cannot be persisted."""
+        mock_event_store.append_events = Mock(side_effect=Exception("conflict"))
+
+        results = repository.create_concepts_bulk(
+            [{"name": "A", "explanation": "x"}, {"name": "B", "explanation": "y"}]
+        )
+
+        assert len(results) == 2
+        assert all(not success and "conflict" in error for success, error, _ in results)
+
+
 class TestUpdateConcept:
     """Test update_concept method."""
 
@@ -499,6 +600,19 @@ class TestDeleteConcept:
         assert isinstance(event_arg, ConceptDeleted)
         assert event_arg.aggregate_id == concept_id
 
+    def test_delete_concept_deferred_projections_report_success(
+        self, repository, mock_event_store, mock_outbox, mock_neo4j_projection
+    ):
+        """Entries leased by the outbox worker are left to it rather than reported failed."""
+        mock_event_store.get_latest_version = Mock(return_value=1)
+        mock_outbox.mark_processing = Mock(return_value=None)
+
+        success, error = repository.delete_concept("test-concept-123")
+
+        assert success is True
+        assert error is None
+        mock_neo4j_projection.project_event.assert_not_called()
+
     def test_delete_concept_not_found(self, repository, mock_event_store):
         """Test deleting non-existent concept."""
         concept_id = "nonexistent-concept"
@@ -573,7 +687,7 @@ class TestProcessPendingOutbox:
 
     def test_process_pending_outbox_empty(self, repository, mock_outbox):
         """Test processing when outbox is empty."""
-        mock_outbox.get_pending = Mock(return_value=[])
+        mock_outbox.claim_pending = Mock(return_value=[])
 
         result = repository.process_pending_outbox()
 
@@ -590,8 +704,9 @@ class TestProcessPendingOutbox:
         mock_entry.outbox_id = "outbox-123"
         mock_entry.event_id = "event-123"
         mock_entry.projection_name = "neo4j"
+        mock_entry.lease_id = "lease-1"
 
-        mock_outbox.get_pending = Mock(return_value=[mock_entry])
+        mock_outbox.claim_pending = Mock(return_value=[mock_entry])
 
         # Setup event store to return event
         mock_event = Mock(spec=ConceptCreated)
@@ -603,9 +718,9 @@ class TestProcessPendingOutbox:
         assert result["processed"] == 1
         assert result["failed"] == 0
 
-        # Verify outbox was updated
-        assert mock_outbox.mark_processing.called
-        assert mock_outbox.mark_processed.called
+        # The claim took the lease; the result is recorded under it
+        mock_outbox.mark_processing.assert_not_called()
+        mock_outbox.mark_processed.assert_called_once_with("outbox-123", lease_id="lease-1")
 
     def test_process_pending_outbox_handles_failures(
         self, repository, mock_outbox, mock_event_store, mock_neo4j_projection
@@ -616,8 +731,9 @@ class TestProcessPendingOutbox:
         mock_entry.outbox_id = "outbox-123"
         mock_entry.event_id = "event-123"
         mock_entry.projection_name = "neo4j"
+        mock_entry.lease_id = "lease-1"
 
-        mock_outbox.get_pending = Mock(return_value=[mock_entry])
+        mock_outbox.claim_pending = Mock(return_value=[mock_entry])
 
         # Setup event store to return event
         mock_event = Mock(spec=ConceptCreated)
@@ -632,16 +748,14 @@ class TestProcessPendingOutbox:
         assert result["processed"] == 0
         assert result["failed"] == 1
 
-        # Verify outbox was marked as failed
-        assert mock_outbox.mark_failed.called
+        # Verify outbox was marked as failed under the claim's lease
+        assert mock_outbox.mark_failed.call_args.kwargs["lease_id"] == "lease-1"
 
     def test_process_pending_outbox_respects_limit(self, repository, mock_outbox):
         """Test that limit parameter is respected."""
         repository.process_pending_outbox(limit=50)
 
-        assert mock_outbox.get_pending.called
-        call_kwargs = mock_outbox.get_pending.call_args[1]
-        assert call_kwargs["limit"] == 50
+        mock_outbox.claim_pending.assert_called_once_with(50)
 
 
 class TestPrivateMethods:
@@ -762,3 +876,116 @@ class TestErrorHandling:
         result = repository.get_concept("concept-123")
 
         assert result is None  # Should return None instead of raising
+
+
+class TestAggregateSnapshots:
+    """Test snapshot-backed state loading and version cache warm-up."""
+
+    @pytest.fixture
+    def stores(self, temp_event_db):
+        """Real EventStore and SnapshotStore sharing one database."""
+        from services.event_store import EventStore
+        from services.snapshot_store import SnapshotStore
+
+        event_store = EventStore(temp_event_db)
+        snapshot_store = SnapshotStore(temp_event_db)
+        yield event_store, snapshot_store
+        event_store.close()
+        snapshot_store.close()
+
+    @pytest.fixture
+    def snapshot_repository(
+        self,
+        stores,
+        mock_outbox,
+        mock_neo4j_projection,
+        mock_chromadb_projection,
+        mock_embedding_service,
+        mock_embedding_cache,
+    ):
+        event_store, snapshot_store = stores
+        return DualStorageRepository(
+            event_store=event_store,
+            outbox=mock_outbox,
+            neo4j_projection=mock_neo4j_projection,
+            chromadb_projection=mock_chromadb_projection,
+            embedding_service=mock_embedding_service,
+            embedding_cache=mock_embedding_cache,
+            snapshot_store=snapshot_store,
+            snapshot_interval=5,
+        )
+
+    def test_update_snapshots_every_interval(self, snapshot_repository, stores):
+        """Test a snapshot is written when the version hits the interval"""
+        _, snapshot_store = stores
+        snapshot_repository.create_concept(
+            {"concept_id": "c1", "name": "A", "explanation": "v1"}
+        )
+        for i in range(2, 5):
+            snapshot_repository.update_concept("c1", {"explanation": f"v{i}"})
+        assert snapshot_store.get("c1") is None
+
+        snapshot_repository.update_concept("c1", {"explanation": "v5"})
+
+        snapshot = snapshot_store.get("c1")
+        assert snapshot.version == 5
+        assert snapshot.state["explanation"] == "v5"
+
+    def test_load_state_reads_snapshot_plus_newer_events(self, snapshot_repository, stores):
+        """Test only events after the snapshot are read"""
+        event_store, _ = stores
+        snapshot_repository.create_concept({"concept_id": "c1", "name": "A"})
+        for i in range(2, 8):
+            snapshot_repository.update_concept("c1", {"explanation": f"v{i}"})
+
+        event_store.get_events_by_aggregate = Mock(wraps=event_store.get_events_by_aggregate)
+        state = snapshot_repository.load_concept_state("c1")
+
+        event_store.get_events_by_aggregate.assert_called_once_with("c1", from_version=6)
+        assert state["version"] == 7
+        assert state["explanation"] == "v7"
+        assert len(state["explanation_history"]) == 6
+
+    def test_snapshot_concept_on_demand(self, snapshot_repository, stores):
+        """Test explicit snapshots and missing concepts"""
+        _, snapshot_store = stores
+        snapshot_repository.create_concept({"concept_id": "c1", "name": "A"})
+
+        snapshot = snapshot_repository.snapshot_concept("c1")
+
+        assert snapshot.version == 1
+        assert snapshot_store.get("c1").state["name"] == "A"
+        assert snapshot_repository.snapshot_concept("missing") is None
+
+    def test_get_concept_with_history(self, snapshot_repository, mock_neo4j_projection):
+        """Test include_history attaches the explanation history from the event log"""
+        snapshot_repository.create_concept(
+            {"concept_id": "c1", "name": "A", "explanation": "v1"}
+        )
+        snapshot_repository.update_concept("c1", {"explanation": "v2"})
+        mock_neo4j_projection.neo4j.execute_read = Mock(
+            return_value=[{"c": {"concept_id": "c1", "explanation": "v2"}}]
+        )
+
+        concept = snapshot_repository.get_concept("c1", include_history=True)
+
+        assert [h["explanation"] for h in concept["explanation_history"]] == ["v1", "v2"]
+        assert "explanation_history" not in snapshot_repository.get_concept("c1")
+
+    def test_warm_version_cache_from_snapshots(self, snapshot_repository, stores):
+        """Test warm-up loads snapshot versions advanced by newer events"""
+        event_store, _ = stores
+        snapshot_repository.create_concept({"concept_id": "c1", "name": "A"})
+        snapshot_repository.snapshot_concept("c1")
+        snapshot_repository.update_concept("c1", {"name": "B"})
+        snapshot_repository._version_cache.clear()
+
+        loaded = snapshot_repository.warm_version_cache()
+
+        assert loaded == 1
+        assert snapshot_repository._version_cache.get("c1") == 2
+
+    def test_warm_version_cache_without_snapshot_store(self, repository):
+        """Test warm-up is a no-op when snapshots are disabled"""
+        assert repository.warm_version_cache() == 0
+        assert repository.snapshot_concept("c1") is None
@@ -8,6 +8,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from services.lexical_index import LexicalIndex
 from tools import search_tools
 
 
@@ -83,8 +84,13 @@ class TestSearchConceptsSemantic:
         # Verify filter was passed to ChromaDB
         services["collection"].query.assert_called_once()
         call_args = services["collection"].query.call_args
-        assert call_args[1]["where"]["area"] == "Programming"
-        assert call_args[1]["where"]["topic"] == "Python"
+        assert call_args[1]["where"] == {
+            "$and": [
+                {"area": "Programming"},
+                {"topic": "Python"},
+                {"confidence_score": {"$gte": 80}},
+            ]
+        }
 
     @pytest.mark.asyncio
     async def test_semantic_search_embedding_failure(self, setup_services):
@@ -399,6 +405,124 @@ class TestSearchConceptsExact:
         assert result["error"]["type"] in ["internal_error", "unexpected_error", "neo4j_error", "database_error"]
 
 
+@pytest.fixture
+def lexical_index(setup_services, configured_container):
+    """Warm lexical index with no pending events"""
+    index = LexicalIndex()
+    index.load(
+        [
+            {"concept_id": "concept-001", "name": "Python For Loops",
+             "explanation": "Iterate over items", "area": "Programming", "topic": "Python"},
+            {"concept_id": "concept-003", "name": "Binary Search",
+             "explanation": "Halve a sorted array", "area": "Programming", "topic": "Python"},
+        ],
+        sequence=0,
+    )
+    configured_container.lexical_index = index
+    configured_container.event_store.iter_events_after = Mock(side_effect=lambda _: iter([]))
+    return index
+
+
+class TestHybridSearch:
+    """Tests for hybrid mode, filter push-down and lexical name lookups"""
+
+    @pytest.mark.asyncio
+    async def test_hybrid_fuses_vector_and_keyword_rankings(self, setup_services, lexical_index):
+        services = setup_services
+        services["embedding"].generate_embedding = Mock(return_value=[0.1] * 384)
+        services["collection"].query = Mock(return_value={
+            "ids": [["concept-001", "concept-002"]],
+            "metadatas": [[{"name": "Python For Loops", "confidence_score": 90.0},
+                           {"name": "While Loops", "confidence_score": 85.0}]],
+            "distances": [[0.1, 0.2]],
+        })
+        services["collection"].get = Mock(return_value={
+            "ids": ["concept-003"],
+            "metadatas": [{"name": "Binary Search", "confidence_score": 70.0}],
+        })
+
+        result = await search_tools.search_concepts_semantic(
+            query="python binary search", mode="hybrid"
+        )
+
+        results = result["data"]["results"]
+        assert [r["concept_id"] for r in results] == ["concept-001", "concept-003", "concept-002"]
+        assert results[0]["matched_by"] == ["semantic", "lexical"]
+        assert results[1]["similarity"] is None
+        services["collection"].get.assert_called_once_with(
+            ids=["concept-003"], include=["metadatas"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_hybrid_with_cold_index_returns_semantic_results(self, setup_services):
+        services = setup_services
+        services["embedding"].generate_embedding = Mock(return_value=[0.1] * 384)
+        services["neo4j"].execute_read = Mock(return_value=[])
+        services["collection"].query = Mock(return_value={
+            "ids": [["concept-001"]],
+            "metadatas": [[{"name": "Python For Loops", "confidence_score": 90.0}]],
+            "distances": [[0.1]],
+        })
+
+        result = await search_tools.search_concepts_semantic(query="loops", mode="hybrid")
+
+        assert result["success"] is True
+        assert result["data"]["total"] == 1
+        assert "warnings" in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_mode_is_rejected(self, setup_services):
+        result = await search_tools.search_concepts_semantic(query="loops", mode="fuzzy")
+
+        assert result["success"] is False
+        assert result["error"]["type"] == "validation_error"
+
+    @pytest.mark.asyncio
+    async def test_filtered_query_widens_until_limit_is_met(self, setup_services):
+        services = setup_services
+        services["embedding"].generate_embedding = Mock(return_value=[0.1] * 384)
+
+        def query(**params):
+            n = params["n_results"]
+            return {
+                "ids": [[f"concept-{i:03d}" for i in range(n)]],
+                "metadatas": [[{"confidence_score": 90.0 if i % 4 == 0 else 10.0}
+                               for i in range(n)]],
+                "distances": [[0.01 * i for i in range(n)]],
+            }
+
+        services["collection"].query = Mock(side_effect=query)
+
+        result = await search_tools.search_concepts_semantic(
+            query="test", limit=10, min_confidence=50
+        )
+
+        assert result["data"]["total"] == 10
+        assert [c[1]["n_results"] for c in services["collection"].query.call_args_list] == [20, 40]
+
+    @pytest.mark.asyncio
+    async def test_exact_name_filter_uses_lexical_index(self, setup_services, lexical_index):
+        services = setup_services
+        services["neo4j"].execute_read = Mock(return_value=[])
+
+        await search_tools.search_concepts_exact(name="LOOP")
+
+        query, params = services["neo4j"].execute_read.call_args[0]
+        assert "c.concept_id IN $concept_ids" in query
+        assert "CONTAINS" not in query
+        assert params["concept_ids"] == ["concept-001"]
+
+    @pytest.mark.asyncio
+    async def test_exact_name_without_index_match_skips_neo4j(self, setup_services, lexical_index):
+        services = setup_services
+        services["neo4j"].execute_read = Mock(return_value=[])
+
+        result = await search_tools.search_concepts_exact(name="graph")
+
+        assert result["data"]["total"] == 0
+        services["neo4j"].execute_read.assert_not_called()
+
+
 class TestSearchToolsEdgeCases:
     """Tests for edge cases and error handling"""
 
@@ -317,19 +317,19 @@ class TestServiceStatusUtilities:
         assert tools["available"] == sorted(tools["available"])
         assert tools["unavailable"] == sorted(tools["unavailable"])
 
-    def test_get_available_tools_total_count_is_17(self):
-        """Test that total tool count is 17"""
+    def test_get_available_tools_total_count_is_18(self):
+        """Test that total tool count is 18"""
         tools = get_available_tools()
 
-        assert tools["total_tools"] == 17
+        assert tools["total_tools"] == 18
 
     def test_get_available_tools_includes_all_tools(self):
-        """Test that all 17 tools are accounted for"""
+        """Test that all 18 tools are accounted for"""
         tools = get_available_tools()
 
         # Total should equal available + unavailable
         total = len(tools["available"]) + len(tools["unavailable"])
-        assert total == 17
+        assert total == 18
 
         # Check that key tools are in the list
         all_tools = tools["available"] + tools["unavailable"]
@@ -382,7 +382,7 @@ class TestToolAvailabilityIntegration:
         # Verify it's returning the correct data
         assert isinstance(result["available"], list)
         assert isinstance(result["unavailable"], list)
-        assert result["total_tools"] == 17
+        assert result["total_tools"] == 18
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""
+Unit tests for SnapshotStore and concept state folding
+"""
+
+import sqlite3
+
+import pytest
+
+from models.events import ConceptCreated, ConceptDeleted, ConceptTauUpdated, ConceptUpdated
+from services.event_store import EventStore
+from services.snapshot_store import AggregateSnapshot, SnapshotStore, apply_concept_event
+
+
+@pytest.fixture
+def snapshot_store(temp_event_db):
+    store = SnapshotStore(temp_event_db)
+    yield store
+    store.close()
+
+
+def _snapshot(aggregate_id, version, **state):
+    return AggregateSnapshot(
+        aggregate_id=aggregate_id,
+        aggregate_type="Concept",
+        version=version,
+        state={"version": version, **state},
+    )
+
+
+class TestApplyConceptEvent:
+    """Test folding Concept events into state."""
+
+    def test_fold_full_lifecycle(self):
+        """Test creation, updates, tau and deletion fold into one state"""
+        events = [
+            ConceptCreated(
+                aggregate_id="c1", concept_data={"name": "A", "explanation": "v1"}, version=1
+            ),
+            ConceptUpdated(aggregate_id="c1", updates={"area": "Math"}, version=2),
+            ConceptUpdated(aggregate_id="c1", updates={"explanation": "v2"}, version=3),
+            ConceptTauUpdated(aggregate_id="c1", tau=7, version=4),
+            ConceptDeleted(aggregate_id="c1", version=5),
+        ]
+
+        state = None
+        for event in events:
+            state = apply_concept_event(state, event)
+
+        assert state["name"] == "A" and state["area"] == "Math"
+        assert state["explanation"] == "v2"
+        assert state["retention_tau"] == 7
+        assert state["deleted"] is True
+        assert state["version"] == 5
+        assert [h["explanation"] for h in state["explanation_history"]] == ["v1", "v2"]
+        assert [h["version"] for h in state["explanation_history"]] == [1, 3]
+
+    def test_fold_does_not_mutate_previous_state(self):
+        """Test each fold step returns a new state"""
+        created = apply_concept_event(
+            None,
+            ConceptCreated(aggregate_id="c1", concept_data={"explanation": "v1"}, version=1),
+        )
+
+        updated = apply_concept_event(
+            created, ConceptUpdated(aggregate_id="c1", updates={"explanation": "v2"}, version=2)
+        )
+
+        assert created["explanation"] == "v1"
+        assert len(created["explanation_history"]) == 1
+        assert len(updated["explanation_history"]) == 2
+
+
+class TestSnapshotStore:
+    """Test snapshot persistence."""
+
+    def test_save_and_get_round_trip(self, snapshot_store):
+        """Test a saved snapshot is returned with its state"""
+        assert snapshot_store.save(_snapshot("c1", 3, name="A"))
+
+        snapshot = snapshot_store.get("c1")
+
+        assert snapshot.version == 3
+        assert snapshot.aggregate_type == "Concept"
+        assert snapshot.state == {"version": 3, "name": "A"}
+        assert snapshot_store.get("missing") is None
+
+    def test_older_snapshot_does_not_replace_newer(self, snapshot_store):
+        """Test snapshots only move forward"""
+        snapshot_store.save(_snapshot("c1", 5, name="new"))
+
+        assert snapshot_store.save(_snapshot("c1", 4, name="old")) is False
+        assert snapshot_store.get("c1").state["name"] == "new"
+
+    def test_save_many_and_get_versions(self, snapshot_store):
+        """Test bulk save and index-only version lookups"""
+        written = snapshot_store.save_many([_snapshot(f"c{i}", i + 1) for i in range(5)])
+
+        assert written == 5
+        assert snapshot_store.count() == 5
+        assert snapshot_store.get_versions(["c0", "c4", "missing"]) == {"c0": 1, "c4": 5}
+
+    def test_corrupt_state_is_ignored(self, snapshot_store, temp_event_db):
+        """Test an undecodable snapshot is treated as missing"""
+        snapshot_store.save(_snapshot("c1", 1))
+        conn = sqlite3.connect(temp_event_db)
+        conn.execute("UPDATE aggregate_snapshots SET state = '{bad' WHERE aggregate_id = 'c1'")
+        conn.commit()
+        conn.close()
+
+        assert snapshot_store.get("c1") is None
+
+    def test_load_current_versions_includes_newer_events(self, snapshot_store, temp_event_db):
+        """Test snapshot versions are advanced by events appended after them"""
+        event_store = EventStore(temp_event_db)
+        try:
+            event_store.append_events(
+                [
+                    ConceptCreated(aggregate_id="c1", concept_data={}, version=1),
+                    ConceptUpdated(aggregate_id="c1", updates={"a": 1}, version=2),
+                    ConceptCreated(aggregate_id="c2", concept_data={}, version=1),
+                ]
+            )
+            snapshot_store.save_many([_snapshot("c1", 1), _snapshot("c2", 1)])
+
+            assert snapshot_store.load_current_versions() == {"c1": 2, "c2": 1}
+            assert len(snapshot_store.load_current_versions(limit=1)) == 1
+        finally:
+            event_store.close()
+
+    def test_delete(self, snapshot_store):
+        """Test deleting a snapshot"""
+        snapshot_store.save(_snapshot("c1", 1))
+
+        assert snapshot_store.delete("c1") is True
+        assert snapshot_store.delete("c1") is False
+        assert snapshot_store.count() == 0
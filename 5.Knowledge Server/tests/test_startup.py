@@ -0,0 +1,218 @@
+"""
+Tests for staged startup (services/startup.py and mcp_server.initialize)
+"""
+
+import asyncio
+import contextlib
+import io
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+import mcp_server
+from config.settings import reset_settings
+from scripts.init_database import init_event_store
+from services.container import ServiceContainer, get_container, reset_container, set_container
+from services.startup import StartupState
+from tests.benchmarks.stand_ins import (
+    HashingChromaDbService,
+    InMemoryNeo4jService,
+    StubEmbeddingService,
+)
+from tools.responses import ErrorType
+from tools.service_utils import get_available_tools, requires_services
+
+
+@pytest.fixture
+def staged_container():
+    container = ServiceContainer(startup=StartupState())
+    container.startup.expect("neo4j_service", "repository")
+    set_container(container)
+    yield container
+    reset_container()
+
+
+class TestStartupState:
+    """Tests for readiness gates and phase timings"""
+
+    def test_phase_records_status_and_duration(self):
+        startup = StartupState()
+
+        with startup.phase("storage"):
+            pass
+        with pytest.raises(RuntimeError), startup.phase("neo4j"):
+            raise RuntimeError("connection refused")
+
+        phases = startup.snapshot()["phases"]
+        assert phases["storage"]["status"] == "ready"
+        assert phases["storage"]["duration_ms"] >= 0
+        assert phases["neo4j"]["status"] == "failed"
+        assert "connection refused" in phases["neo4j"]["error"]
+
+    async def test_wait_for_returns_when_gate_opens(self):
+        startup = StartupState()
+        startup.expect("neo4j_service", "embedding_service")
+
+        asyncio.get_running_loop().call_later(0.01, startup.ready, "neo4j_service")
+
+        assert await startup.wait_for(["neo4j_service"], timeout=1) is True
+        assert startup.pending_services() == ["embedding_service"]
+        assert await startup.wait_for(["embedding_service"], timeout=0.01) is False
+
+    async def test_finish_releases_waiters_and_records_error(self):
+        startup = StartupState()
+        startup.expect("repository")
+
+        startup.finish(error=RuntimeError("boom"))
+
+        assert await startup.wait_for(["repository"], timeout=0.01) is True
+        snapshot = startup.snapshot()
+        assert snapshot["complete"] is True
+        assert snapshot["error"] == "RuntimeError: boom"
+
+
+class TestStagedServiceGates:
+    """Tests for requires_services and get_available_tools during startup"""
+
+    async def test_requires_services_waits_for_pending_service(self, staged_container):
+        @requires_services("neo4j_service")
+        async def exact_search():
+            return {"success": True}
+
+        def connect():
+            staged_container.neo4j_service = Mock()
+            staged_container.startup.ready("neo4j_service")
+
+        asyncio.get_running_loop().call_later(0.01, connect)
+
+        assert await exact_search() == {"success": True}
+
+    async def test_requires_services_reports_unavailable_after_failed_startup(
+        self, staged_container
+    ):
+        @requires_services("repository")
+        async def create():
+            return {"success": True}
+
+        asyncio.get_running_loop().call_later(
+            0.01, staged_container.startup.finish, RuntimeError("Neo4j down")
+        )
+
+        result = await create()
+
+        assert result["success"] is False
+        assert result["error"]["type"] == ErrorType.SERVICE_UNAVAILABLE
+
+    def test_available_tools_lists_starting_tools(self, staged_container):
+        staged_container.neo4j_service = Mock()
+        staged_container.startup.ready("neo4j_service")
+
+        tools = get_available_tools()
+
+        assert "search_concepts_exact" in tools["available"]
+        assert "create_concept" in tools["starting"]
+        assert tools["startup"]["pending_services"] == ["repository"]
+
+
+class TestStagedInitialize:
+    """Tests for mcp_server.initialize() against local stand-ins"""
+
+    async def test_staged_lifespan_serves_ping_while_initializing(self):
+        reset_container()
+        initialize = AsyncMock(side_effect=lambda startup: asyncio.sleep(30))
+
+        with patch.object(mcp_server, "initialize", initialize):
+            async with mcp_server.lifespan(mcp_server.mcp):
+                tools = await mcp_server.mcp.get_tools()
+                result = (await tools["ping"].run({})).structured_content
+                startup_task = get_container().startup_task
+
+                assert result["status"] == "ok"
+                assert get_container().startup.pending_services() != []
+
+        assert startup_task.cancelled()
+        reset_container()
+
+    async def test_failed_staged_startup_is_reported_unhealthy(self):
+        reset_container()
+
+        async def failing_initialize(startup):
+            container = get_container()
+            container.event_store = Mock(
+                count_events=Mock(return_value=0), get_segment_stats=Mock(return_value={})
+            )
+            container.outbox = Mock(count_by_status=Mock(return_value={}))
+            startup.ready("event_store", "outbox")
+            error = RuntimeError("Database migration required")
+            startup.finish(error=error)
+            raise error
+
+        with patch.object(mcp_server, "initialize", failing_initialize):
+            async with mcp_server.lifespan(mcp_server.mcp):
+                await get_container().startup_task
+                tools = await mcp_server.mcp.get_tools()
+                ping = (await tools["ping"].run({})).structured_content
+                stats = (await tools["get_server_stats"].run({})).structured_content
+
+        assert ping["status"] == "error"
+        assert ping["startup_error"] == "RuntimeError: Database migration required"
+        assert stats["status"] == "unhealthy"
+        assert stats["startup_error"] == ping["startup_error"]
+        reset_container()
+
+    async def test_neo4j_tools_are_ready_before_embedding_model(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "events.db"
+        with contextlib.redirect_stdout(io.StringIO()):
+            init_event_store(db_path)
+        monkeypatch.setenv("EVENT_STORE_PATH", str(db_path))
+        reset_settings()
+        reset_container()
+
+        model_gate = asyncio.Event()
+
+        class GatedEmbeddingService(StubEmbeddingService):
+            async def initialize(self):
+                await model_gate.wait()
+                return await super().initialize()
+
+        async_neo4j = Mock(connect=AsyncMock(return_value=False))
+        startup = StartupState()
+        startup.expect("neo4j_service", "chromadb_service", "embedding_service", "repository")
+        with (
+            patch.object(mcp_server, "Neo4jService", lambda **_: InMemoryNeo4jService()),
+            patch.object(
+                mcp_server,
+                "ChromaDbService",
+                lambda **_: HashingChromaDbService(persist_directory=str(tmp_path / "chroma")),
+            ),
+            patch.object(mcp_server, "EmbeddingService", GatedEmbeddingService),
+            patch.object(mcp_server, "create_async_neo4j_service_from_env", lambda: async_neo4j),
+            patch.object(mcp_server, "build_confidence_runtime", AsyncMock(return_value=None)),
+        ):
+            initialize_task = asyncio.create_task(mcp_server.initialize(startup))
+            try:
+                assert await startup.wait_for(["neo4j_service", "chromadb_service"], timeout=10)
+                tools = get_available_tools()
+
+                assert "search_concepts_exact" in tools["available"]
+                assert "get_prerequisites" in tools["available"]
+                assert "search_concepts_semantic" in tools["starting"]
+                assert tools["startup"]["phases"]["embedding_model"]["status"] == "running"
+
+                model_gate.set()
+                await asyncio.wait_for(initialize_task, timeout=10)
+            finally:
+                model_gate.set()
+                if not initialize_task.done():
+                    initialize_task.cancel()
+                await get_container().shutdown()
+                reset_container()
+                reset_settings()
+
+        snapshot = startup.snapshot()
+        assert snapshot["complete"] is True
+        assert snapshot["pending_services"] == []
+        assert set(snapshot["phases"]) == {
+            "storage", "neo4j", "chromadb", "embedding_model", "repository", "workers",
+        }
+        assert all(phase["status"] == "ready" for phase in snapshot["phases"].values())
@@ -0,0 +1,149 @@
+"""
+Tests for per-tool and per-stage latency tracing (services/tracing.py)
+"""
+
+import inspect
+
+import pytest
+
+import mcp_server
+from services.tracing import (
+    HdrHistogram,
+    get_trace_recorder,
+    prometheus_lines,
+    span,
+    traced,
+    traced_tool,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_recorder():
+    get_trace_recorder().reset()
+    yield
+    get_trace_recorder().reset()
+
+
+class TestHdrHistogram:
+    """Tests for the log-linear histogram"""
+
+    def test_small_values_are_exact(self):
+        histogram = HdrHistogram()
+        for value_us in range(1, 31):
+            histogram.record(value_us)
+
+        assert histogram.percentile(50) == pytest.approx(0.015)
+        assert histogram.max_us == 30
+
+    def test_percentiles_within_relative_error(self):
+        histogram = HdrHistogram()
+        for value_us in range(1, 100_001):
+            histogram.record(value_us)
+
+        p50, p99 = histogram.percentiles(50, 99)
+
+        assert p50 == pytest.approx(50.0, rel=1 / 32)
+        assert p99 == pytest.approx(99.0, rel=1 / 32)
+        assert histogram.percentile(100) == pytest.approx(100.0)
+
+    def test_values_above_range_are_clamped(self):
+        histogram = HdrHistogram(max_value_us=1_000)
+        histogram.record(5_000_000)
+
+        assert histogram.count == 1
+        assert histogram.percentile(99) == pytest.approx(5000.0)
+
+    def test_snapshot_buckets_sum_to_count(self):
+        histogram = HdrHistogram()
+        for value_us in (500, 3_000, 40_000, 9_000_000):
+            histogram.record(value_us, error=value_us > 1_000_000)
+
+        snapshot = histogram.snapshot()
+
+        assert sum(snapshot["buckets"].values()) == 4
+        assert snapshot["buckets"]["le_1ms"] == 1
+        assert snapshot["buckets"]["overflow"] == 1
+        assert snapshot["errors"] == 1
+
+
+class TestTracingDecorators:
+    """Tests for span, traced and traced_tool"""
+
+    def test_span_records_exceptions_as_errors(self):
+        with span("stage.ok"):
+            pass
+        with pytest.raises(ValueError), span("stage.failing"):
+            raise ValueError("boom")
+
+        stages = get_trace_recorder().snapshot()["stages"]
+        assert stages["stage.ok"]["errors"] == 0
+        assert stages["stage.failing"]["errors"] == 1
+
+    def test_traced_counts_false_return_as_error(self):
+        @traced("projection.test")
+        def project(success):
+            return success
+
+        project(True)
+        project(False)
+
+        stats = get_trace_recorder().snapshot()["stages"]["projection.test"]
+        assert stats["count"] == 2
+        assert stats["errors"] == 1
+
+    async def test_traced_wraps_coroutines(self):
+        @traced("outbox.test")
+        async def drain():
+            return {"processed": 1}
+
+        assert await drain() == {"processed": 1}
+        assert get_trace_recorder().snapshot()["stages"]["outbox.test"]["count"] == 1
+
+    async def test_traced_tool_keeps_signature_and_flags_failures(self):
+        @traced_tool
+        async def sample_tool(concept_id: str, limit: int = 5) -> dict:
+            return {"success": concept_id != "missing"}
+
+        assert list(inspect.signature(sample_tool).parameters) == ["concept_id", "limit"]
+
+        await sample_tool("c1")
+        await sample_tool("missing")
+
+        stats = get_trace_recorder().snapshot()["tools"]["sample_tool"]
+        assert stats["count"] == 2
+        assert stats["errors"] == 1
+
+
+class TestToolMetricsExposure:
+    """Tests for the get_tool_metrics tool and the Prometheus rendering"""
+
+    async def test_get_tool_metrics_reports_tool_calls(self):
+        tools = await mcp_server.mcp.get_tools()
+        await tools["ping"].run({})
+
+        result = (await tools["get_tool_metrics"].run({})).structured_content
+
+        assert result["success"] is True
+        assert result["tools"]["ping"]["count"] == 1
+        assert result["tools"]["ping"]["p99_ms"] >= 0
+
+    async def test_get_tool_metrics_prometheus_format(self):
+        tools = await mcp_server.mcp.get_tools()
+        await tools["ping"].run({})
+
+        result = (
+            await tools["get_tool_metrics"].run({"output_format": "prometheus"})
+        ).structured_content
+
+        assert 'mcp_tool_latency_seconds_bucket{tool="ping",le="+Inf"} 1' in result["prometheus"]
+
+    def test_prometheus_lines_are_cumulative(self):
+        with span("chromadb.query"):
+            pass
+
+        lines = prometheus_lines(get_trace_recorder().snapshot())
+
+        assert "# TYPE mcp_stage_latency_seconds histogram" in lines
+        assert 'mcp_stage_latency_seconds_bucket{stage="chromadb.query",le="5"} 1' in lines
+        assert 'mcp_stage_errors_total{stage="chromadb.query"} 0' in lines
+        assert prometheus_lines({"tools": {}, "stages": {}}) == []
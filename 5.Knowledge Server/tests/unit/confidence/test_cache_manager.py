@@ -5,7 +5,7 @@ Tests cache operations, serialization, invalidation, and error handling.
 """
 
 import json
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -374,3 +374,189 @@ async def test_concept_lock_lua_script_checks_owner(mock_redis_client, cache_con
     assert call_args[0][1] == 1
     # Check the lock key (third arg)
     assert call_args[0][2] == "confidence:lock:concept-123"
+
+
+@pytest.mark.asyncio
+async def test_set_scores_many_uses_single_pipeline(mock_redis_client, cache_config):
+    """Batch score writes should go through one pipeline round trip"""
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    mock_redis_client.pipeline = Mock(return_value=pipe)
+
+    cache = CacheManager(mock_redis_client, cache_config)
+    await cache.set_scores_many({"c1": 0.5, "c2": 0.75})
+
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    pipe.set.assert_any_call("confidence:score:c1", 0.5, ex=cache_config.SCORE_CACHE_TTL)
+    pipe.set.assert_any_call("confidence:score:c2", 0.75, ex=cache_config.SCORE_CACHE_TTL)
+    pipe.execute.assert_awaited_once()
+    mock_redis_client.set.assert_not_called()
+
+
+class FakeRedis:
+    """In-memory stand-in for the decode_responses=True Redis client"""
+
+    def __init__(self):
+        self.store = {}
+        self.calls = []
+
+    async def get(self, key):
+        self.calls.append("get")
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.calls.append("mget")
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        self.calls.append("set")
+        self.store[key] = str(value)
+        return True
+
+    async def delete(self, *keys):
+        self.calls.append("delete")
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        self.redis.calls.append("pipeline")
+        for key, value in self.commands:
+            self.redis.store[key] = str(value)
+        return [True] * len(self.commands)
+
+
+def _relationships(count=2):
+    return RelationshipData(
+        total_relationships=count,
+        relationship_types={"PREREQUISITE": count},
+        connected_concept_ids=[f"r{i}" for i in range(count)],
+    )
+
+
+def _review(days=3):
+    return ReviewData(
+        last_reviewed_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC), days_since_review=days, review_count=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_scores_many_uses_single_mget_and_skips_misses(cache_config):
+    """Multi-get should return hits only and cost one round trip"""
+    redis = FakeRedis()
+    redis.store = {"confidence:score:c1": "0.25", "confidence:score:c3": "0.75"}
+
+    cache = CacheManager(redis, cache_config, near_cache_ttl=0)
+    scores = await cache.get_scores_many(["c1", "c2", "c3", "c1"])
+
+    assert scores == {"c1": 0.25, "c3": 0.75}
+    assert redis.calls == ["mget"]
+
+
+@pytest.mark.asyncio
+async def test_get_scores_many_degrades_on_redis_failure(mock_redis_client, cache_config):
+    """Multi-get errors should look like misses"""
+    mock_redis_client.mget = AsyncMock(side_effect=Exception("Connection refused"))
+
+    cache = CacheManager(mock_redis_client, cache_config)
+
+    assert await cache.get_scores_many(["c1"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_calc_inputs_many_round_trip(cache_config):
+    """Calculation inputs written in a batch should read back in one MGET"""
+    redis = FakeRedis()
+    cache = CacheManager(redis, cache_config, near_cache_ttl=0)
+
+    await cache.set_calc_inputs_many(
+        relationships={"c1": _relationships(2), "c2": _relationships(0)},
+        reviews={"c1": _review(3)},
+    )
+    relationships, reviews = await cache.get_calc_inputs_many(["c1", "c2", "c3"])
+
+    assert redis.calls == ["pipeline", "mget"]
+    assert relationships == {"c1": _relationships(2), "c2": _relationships(0)}
+    assert reviews == {"c1": _review(3)}
+    # Single-key readers understand batch-written entries
+    assert await cache.get_cached_review_history("c1") == _review(3)
+
+
+@pytest.mark.asyncio
+async def test_calc_inputs_many_skips_undecodable_entries(cache_config):
+    """A corrupt entry should be a miss, not fail the whole batch"""
+    redis = FakeRedis()
+    redis.store = {
+        "confidence:calc:relationships:c1": "not json",
+        "confidence:calc:relationships:c2": json.dumps(_relationships(1).model_dump()),
+    }
+
+    cache = CacheManager(redis, cache_config, near_cache_ttl=0)
+    relationships, reviews = await cache.get_calc_inputs_many(["c1", "c2"])
+
+    assert list(relationships) == ["c2"]
+    assert reviews == {}
+
+
+@pytest.mark.asyncio
+async def test_near_cache_serves_repeat_reads_without_redis(cache_config):
+    """With a near-cache, repeated reads should not go back to Redis"""
+    redis = FakeRedis()
+    redis.store = {"confidence:score:c1": "0.5"}
+
+    cache = CacheManager(redis, cache_config, near_cache_ttl=30)
+    assert await cache.get_cached_score("c1") == 0.5
+    assert await cache.get_scores_many(["c1"]) == {"c1": 0.5}
+    assert await cache.get_cached_score("c1") == 0.5
+
+    assert redis.calls == ["get"]
+
+
+@pytest.mark.asyncio
+async def test_near_cache_is_cleared_by_invalidation(cache_config):
+    """Event-driven invalidation should drop near-cache entries"""
+    redis = FakeRedis()
+    cache = CacheManager(redis, cache_config, near_cache_ttl=30)
+    await cache.set_cached_score("c1", 0.5)
+    await cache.set_cached_relationships("c1", _relationships(1))
+
+    await cache.invalidate_concept_cache("c1")
+
+    assert await cache.get_cached_score("c1") is None
+    assert await cache.get_cached_relationships("c1") is None
+
+
+@pytest.mark.asyncio
+async def test_near_cache_entries_expire(cache_config, monkeypatch):
+    """Expired near-cache entries should fall through to Redis"""
+    clock = [1000.0]
+    monkeypatch.setattr("services.confidence.cache_manager.time.monotonic", lambda: clock[0])
+    redis = FakeRedis()
+    cache = CacheManager(redis, cache_config, near_cache_ttl=5)
+    await cache.set_cached_score("c1", 0.5)
+    redis.store["confidence:score:c1"] = "0.9"
+
+    assert await cache.get_cached_score("c1") == 0.5
+    clock[0] += 6
+    assert await cache.get_cached_score("c1") == 0.9
+
+
+@pytest.mark.asyncio
+async def test_near_cache_disabled_by_default(cache_config):
+    """Default configuration should always read through to Redis"""
+    redis = FakeRedis()
+    cache = CacheManager(redis, cache_config)
+    await cache.set_cached_score("c1", 0.5)
+    redis.store["confidence:score:c1"] = "0.9"
+
+    assert await cache.get_cached_score("c1") == 0.9
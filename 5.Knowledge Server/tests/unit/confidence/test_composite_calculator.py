@@ -1,11 +1,22 @@
 """Unit tests for composite confidence calculator."""
 
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from services.confidence.composite_calculator import CompositeCalculator
-from services.confidence.models import Error, ErrorCode, Success
+from services.confidence.models import (
+    ConceptData,
+    ConfidenceInputs,
+    Error,
+    ErrorCode,
+    RelationshipData,
+    ReviewData,
+    Success,
+)
+from services.confidence.retention_calculator import RetentionCalculator
+from services.confidence.understanding_calculator import UnderstandingCalculator
 
 
 @pytest.fixture
@@ -81,3 +92,92 @@ async def test_composite_propagates_retention_errors(
 
     assert isinstance(result, Error)
     assert result.code == ErrorCode.NOT_FOUND
+
+
+def _inputs(concept_id, *, links, days, tau, tags=None):
+    reviewed = datetime.now() - timedelta(days=days)
+    return ConfidenceInputs(
+        concept=ConceptData(
+            id=concept_id,
+            name=concept_id,
+            explanation="Caching stores computed results so repeated API calls avoid the database",
+            created_at=reviewed,
+            last_reviewed_at=reviewed,
+            tags=tags or [],
+            area="coding-development",
+        ),
+        relationships=RelationshipData(
+            total_relationships=len(links),
+            relationship_types={"RELATES_TO": len(links)} if links else {},
+            connected_concept_ids=links,
+        ),
+        review=ReviewData(last_reviewed_at=reviewed, days_since_review=days),
+        tau=tau,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_scores_match_single_concept_path():
+    inputs = {
+        "c1": _inputs("c1", links=["a", "b", "c"], days=2, tau=7, tags=["cache"]),
+        "c2": _inputs("c2", links=[], days=30, tau=21),
+    }
+
+    data_access = Mock()
+    data_access.get_confidence_inputs_batch = AsyncMock(return_value=Success(inputs))
+    data_access.get_concept_for_confidence = AsyncMock(
+        side_effect=lambda cid: Success(inputs[cid].concept)
+    )
+    data_access.get_concept_relationships = AsyncMock(
+        side_effect=lambda cid: Success(inputs[cid].relationships)
+    )
+    data_access.get_review_history = AsyncMock(side_effect=lambda cid: Success(inputs[cid].review))
+    data_access.get_concept_tau = AsyncMock(side_effect=lambda cid: Success(inputs[cid].tau))
+
+    cache = Mock()
+    cache.get_cached_relationships = AsyncMock(return_value=None)
+    cache.set_cached_relationships = AsyncMock()
+    cache.get_cached_review_history = AsyncMock(return_value=None)
+    cache.set_cached_review_history = AsyncMock()
+
+    calculator = CompositeCalculator(
+        UnderstandingCalculator(data_access, cache), RetentionCalculator(data_access, cache)
+    )
+
+    batch = await calculator.calculate_composite_scores(["c1", "c2"])
+
+    data_access.get_confidence_inputs_batch.assert_awaited_once_with(["c1", "c2"])
+    for concept_id in ("c1", "c2"):
+        single = await calculator.calculate_composite_score(concept_id)
+        assert batch[concept_id].value == pytest.approx(single.value)
+
+
+@pytest.mark.asyncio
+async def test_batch_scores_keep_per_concept_errors(
+    mock_understanding_calculator, mock_retention_calculator
+):
+    missing = Error("Concept not found: gone", ErrorCode.NOT_FOUND)
+    mock_understanding_calculator.data_access.get_confidence_inputs_batch = AsyncMock(
+        return_value=Success({"gone": missing})
+    )
+
+    calculator = CompositeCalculator(mock_understanding_calculator, mock_retention_calculator)
+    results = await calculator.calculate_composite_scores(["gone"])
+
+    assert results == {"gone": missing}
+    mock_understanding_calculator.score_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_scores_fetch_error_applies_to_all(
+    mock_understanding_calculator, mock_retention_calculator
+):
+    failure = Error("db down", ErrorCode.DATABASE_ERROR)
+    mock_understanding_calculator.data_access.get_confidence_inputs_batch = AsyncMock(
+        return_value=failure
+    )
+
+    calculator = CompositeCalculator(mock_understanding_calculator, mock_retention_calculator)
+    results = await calculator.calculate_composite_scores(["c1", "c2"])
+
+    assert results == {"c1": failure, "c2": failure}
@@ -240,3 +240,109 @@ async def test_get_review_history_with_database_error_returns_database_error(
 
     assert isinstance(result, Error)
     assert result.code == ErrorCode.DATABASE_ERROR
+
+
+@pytest.mark.asyncio
+async def test_get_confidence_inputs_batch_uses_two_queries(mock_neo4j_session):
+    """Batch fetch should read every concept with two UNWIND queries"""
+    created = datetime.now() - timedelta(days=10)
+    reviewed = datetime.now() - timedelta(days=3)
+    node_result = Mock()
+    node_result.data = AsyncMock(
+        return_value=[
+            {
+                "id": "c1",
+                "name": "One",
+                "explanation": "First explanation",
+                "created_at": created.isoformat(),
+                "last_reviewed_at": reviewed.isoformat(),
+                "tags": ["tag"],
+                "examples": None,
+                "area": "learning",
+                "topic": None,
+                "subtopic": None,
+                "review_count": 2,
+                "tau": 14,
+            },
+            {
+                "id": "c2",
+                "name": "Two",
+                "explanation": "Second explanation",
+                "created_at": created.isoformat(),
+                "last_reviewed_at": None,
+                "tags": None,
+                "examples": None,
+                "review_count": 0,
+                "tau": 7,
+            },
+        ]
+    )
+    relationship_result = Mock()
+    relationship_result.data = AsyncMock(
+        return_value=[
+            {
+                "concept_id": "c1",
+                "links": [
+                    {"target_id": "c2", "type": "PREREQUISITE"},
+                    {"target_id": "c3", "type": "RELATES_TO"},
+                ],
+            },
+            {"concept_id": "c2", "links": [{"target_id": None, "type": None}]},
+        ]
+    )
+    mock_neo4j_session.run.side_effect = [node_result, relationship_result]
+
+    dal = DataAccessLayer(mock_neo4j_session)
+    result = await dal.get_confidence_inputs_batch(["c1", "c2", "missing"])
+
+    assert isinstance(result, Success)
+    assert mock_neo4j_session.run.await_count == 2
+    assert "UNWIND $concept_ids" in mock_neo4j_session.run.call_args_list[0].args[0]
+    assert mock_neo4j_session.run.call_args_list[0].kwargs["concept_ids"] == [
+        "c1", "c2", "missing"
+    ]
+
+    first = result.value["c1"]
+    assert first.concept.area == "learning"
+    assert first.relationships.unique_connections == 2
+    assert first.relationships.relationship_types == {"PREREQUISITE": 1, "RELATES_TO": 1}
+    assert first.review.days_since_review == 3
+    assert first.tau == 14
+
+    second = result.value["c2"]
+    assert second.relationships.total_relationships == 0
+    assert second.review.days_since_review == 10
+
+    assert isinstance(result.value["missing"], Error)
+    assert result.value["missing"].code == ErrorCode.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_get_confidence_inputs_batch_database_error(mock_neo4j_session):
+    """A failed batch query should return DATABASE_ERROR"""
+    mock_neo4j_session.run.side_effect = Exception("Connection lost")
+
+    dal = DataAccessLayer(mock_neo4j_session)
+    result = await dal.get_confidence_inputs_batch(["c1"])
+
+    assert isinstance(result, Error)
+    assert result.code == ErrorCode.DATABASE_ERROR
+
+
+@pytest.mark.asyncio
+async def test_get_all_explanations_skips_empty_explanations(mock_neo4j_session):
+    """The TF-IDF corpus query should return non-empty explanations only"""
+    mock_result = Mock()
+    mock_result.data = AsyncMock(
+        return_value=[
+            {"concept_id": "c1", "explanation": "Closures capture scope"},
+            {"concept_id": "c2", "explanation": ""},
+        ]
+    )
+    mock_neo4j_session.run.return_value = mock_result
+
+    dal = DataAccessLayer(mock_neo4j_session)
+    result = await dal.get_all_explanations()
+
+    assert isinstance(result, Success)
+    assert result.value == {"c1": "Closures capture scope"}
@@ -34,7 +34,9 @@ def create_mock_concept_lock(always_acquired: bool = True, per_concept: dict = N
 
 def build_listener(tmp_path, events, lock_always_acquired=True, lock_per_concept=None):
     event_store = Mock(spec=EventStore)
-    event_store.get_all_events.return_value = events
+    event_store.iter_events_after.return_value = [
+        (sequence, event) for sequence, event in enumerate(events, start=1)
+    ]
 
     calculator = SimpleNamespace()
     calculator.calculate_composite_score = AsyncMock()
@@ -91,7 +93,34 @@ async def test_concept_created_event_updates_score(tmp_path):
     assert checkpoint["last_offset"] == 1
     assert checkpoint["last_event_id"] == "evt-1"
 
-    event_store.get_all_events.assert_called_once_with(limit=100, offset=0)
+    assert checkpoint["last_sequence"] == 1
+
+    event_store.iter_events_after.assert_called_once_with(0, limit=100)
+
+
+@pytest.mark.asyncio
+async def test_legacy_offset_checkpoint_migrates_to_sequence(tmp_path):
+    """Offset-only checkpoints resume from the sequence of their last event."""
+    listener, _calculator, _cache, _neo4j, event_store = build_listener(tmp_path, [])
+    (tmp_path / "checkpoint.json").write_text(
+        json.dumps({"last_offset": 12, "last_event_id": "evt-12"})
+    )
+    event_store.get_event_sequence.return_value = 40
+    listener = ConfidenceEventListener(
+        event_store=event_store,
+        calculator=listener.calculator,
+        cache_manager=listener.cache,
+        neo4j_service=listener.neo4j,
+        checkpoint_path=tmp_path / "checkpoint.json",
+        recalc_db_path=tmp_path / "pending_recalc.db",
+    )
+
+    await listener.process_pending_events()
+
+    event_store.get_event_sequence.assert_called_with("evt-12")
+    event_store.iter_events_after.assert_called_with(40, limit=100)
+    with (tmp_path / "checkpoint.json").open() as fp:
+        assert json.load(fp)["last_sequence"] == 40
 
 
 @pytest.mark.asyncio
@@ -350,7 +379,7 @@ async def test_pending_recalc_retried_on_next_cycle(tmp_path):
     # Second cycle: locks succeed - change the mock
     cache_manager.concept_lock = create_mock_concept_lock(always_acquired=True)
     calculator.calculate_composite_score.return_value = Success(0.80)
-    event_store.get_all_events.return_value = []  # No new events
+    event_store.iter_events_after.return_value = []  # No new events
 
     stats2 = await listener.process_pending_events()
 
@@ -472,7 +501,7 @@ async def test_max_retries_escalates_to_outbox(tmp_path):
     conn.commit()
 
     # Next retry cycle - lock still fails
-    event_store.get_all_events.return_value = []
+    event_store.iter_events_after.return_value = []
 
     await listener.process_pending_events()
 
@@ -533,7 +562,7 @@ async def test_linear_backoff_respects_delay(tmp_path):
     conn.commit()
 
     # Now try to process - concept-backoff should NOT be retried (not enough time)
-    event_store.get_all_events.return_value = []
+    event_store.iter_events_after.return_value = []
     cache_manager.concept_lock = create_mock_concept_lock(always_acquired=True)
     calculator.calculate_composite_score.return_value = Success(0.85)
 
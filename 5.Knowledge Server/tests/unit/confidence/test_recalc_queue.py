@@ -0,0 +1,112 @@
+"""
+Unit tests for RecalculationQueue (durable, coalescing recalculation queue)
+"""
+
+from services.confidence.recalc_queue import RecalculationQueue
+
+
+def _ids(rows):
+    return [row.concept_id for row in rows]
+
+
+def test_repeated_enqueues_coalesce_into_one_row():
+    queue = RecalculationQueue()
+
+    assert queue.enqueue("c1", 3, now=100.0) is True
+    assert queue.enqueue("c1", 1, now=101.0) is False
+    assert queue.enqueue("c1", 2, now=102.0) is False
+
+    claimed = queue.claim(10, now=200.0)
+    assert [(row.concept_id, row.priority, row.enqueued_at) for row in claimed] == [
+        ("c1", 1, 100.0)
+    ]
+    assert queue.get_metrics(now=200.0)["coalesced"] == 2
+
+
+def test_claim_orders_by_priority_then_age():
+    queue = RecalculationQueue()
+    queue.enqueue("low", 3, now=1.0)
+    queue.enqueue("high-late", 1, now=3.0)
+    queue.enqueue("high-early", 1, now=2.0)
+
+    assert _ids(queue.claim(10, now=10.0)) == ["high-early", "high-late", "low"]
+    assert queue.claim(10, now=10.0) == []
+
+
+def test_debounce_window_delays_first_claim():
+    queue = RecalculationQueue(debounce_seconds=5.0)
+    queue.enqueue("c1", 2, now=100.0)
+    queue.enqueue("c1", 2, now=104.0)
+
+    assert queue.claim(10, now=104.9) == []
+    # The window is anchored at the first enqueue, so bursts cannot starve it
+    assert _ids(queue.claim(10, now=105.0)) == ["c1"]
+
+
+def test_complete_removes_claimed_rows():
+    queue = RecalculationQueue()
+    queue.enqueue("c1", 2, now=1.0)
+    queue.claim(10, now=1.0)
+
+    queue.complete(["c1"], now=2.0)
+
+    assert queue.depth() == 0
+    assert queue.get_metrics(now=2.0)["completed"] == 1
+
+
+def test_enqueue_while_claimed_requeues_after_completion():
+    queue = RecalculationQueue()
+    queue.enqueue("c1", 2, now=1.0)
+    queue.claim(10, now=1.0)
+
+    queue.enqueue("c1", 2, now=1.5)
+    queue.complete(["c1"], now=2.0)
+
+    assert _ids(queue.claim(10, now=2.0)) == ["c1"]
+
+
+def test_defer_backs_off_exponentially_and_drops():
+    queue = RecalculationQueue()
+    queue.enqueue("c1", 2, now=0.0)
+    queue.claim(10, now=0.0)
+
+    assert queue.defer("c1", 2, backoff_seconds=1.0, max_attempts=2, now=10.0) is True
+    assert queue.claim(10, now=10.9) == []
+    assert _ids(queue.claim(10, now=11.0)) == ["c1"]
+
+    assert queue.defer("c1", 2, backoff_seconds=1.0, max_attempts=2, now=20.0) is True
+    assert queue.claim(10, now=21.9) == []
+    assert [row.attempts for row in queue.claim(10, now=22.0)] == [2]
+
+    assert queue.defer("c1", 2, backoff_seconds=1.0, max_attempts=2, now=30.0) is False
+    assert queue.depth() == 0
+
+
+def test_queue_survives_restart_and_releases_claims(tmp_path):
+    db_path = tmp_path / "recalc_queue.db"
+    queue = RecalculationQueue(db_path)
+    queue.enqueue("c1", 2, now=1.0)
+    queue.enqueue("c2", 2, now=2.0)
+    queue.claim(1, now=3.0)  # c1 in flight when the process dies
+    queue.close()
+
+    reopened = RecalculationQueue(db_path)
+
+    assert reopened.depth() == 2
+    assert _ids(reopened.claim(10, now=4.0)) == ["c1", "c2"]
+
+
+def test_metrics_report_depth_age_and_rate():
+    queue = RecalculationQueue()
+    queue.enqueue("c1", 2, now=100.0)
+    queue.enqueue("c2", 2, now=110.0)
+    queue.claim(1, now=115.0)
+    queue.complete(["c1"], now=115.0)
+
+    metrics = queue.get_metrics(now=120.0)
+
+    assert metrics["depth"] == 1
+    assert metrics["due"] == 1
+    assert metrics["in_flight"] == 0
+    assert metrics["oldest_age_seconds"] == 10.0
+    assert metrics["processing_rate_per_second"] == 1 / queue.RATE_WINDOW_SECONDS
@@ -23,6 +23,7 @@ def build_scheduler(lock_side_effect=None):
         composite_calculator=calculator,
         cache_manager=cache,
         redis_client=redis_client,
+        queue_path=":memory:",
     )
     return scheduler, calculator, cache, redis_client
 
@@ -92,3 +93,132 @@ async def test_concurrent_recalculations_respect_lock():
     assert calculator.calculate_composite_score.await_count == 1
     assert cache.set_cached_score.await_count == 1
     assert redis_client.eval.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_one_calculation_and_cache_write():
+    scheduler, calculator, cache, redis_client = build_scheduler()
+    calculator.calculate_composite_scores = AsyncMock(
+        return_value={"c1": Success(0.4), "c2": Success(0.6)}
+    )
+    cache.set_scores_many = AsyncMock()
+
+    await scheduler.schedule_recalculation("c1")
+    await scheduler.schedule_recalculation("c2")
+    await scheduler.process_queue()
+
+    calculator.calculate_composite_scores.assert_awaited_once_with(["c1", "c2"])
+    calculator.calculate_composite_score.assert_not_awaited()
+    cache.set_scores_many.assert_awaited_once_with({"c1": 0.4, "c2": 0.6})
+    assert redis_client.eval.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_locked_concepts():
+    lock_effects = [True, False]
+
+    async def lock_side_effect(*_args, **_kwargs):
+        return lock_effects.pop(0)
+
+    scheduler, calculator, cache, _ = build_scheduler(lock_side_effect=lock_side_effect)
+    calculator.calculate_composite_scores = AsyncMock(return_value={"c1": Success(0.4)})
+    cache.set_scores_many = AsyncMock()
+
+    await scheduler.process_batch_recalculation(["c1", "c2"])
+
+    calculator.calculate_composite_scores.assert_awaited_once_with(["c1"])
+    cache.set_scores_many.assert_awaited_once_with({"c1": 0.4})
+
+
+@pytest.mark.asyncio
+async def test_locked_concept_is_requeued_with_backoff():
+    lock_effects = [False, True]
+
+    async def lock_side_effect(*_args, **_kwargs):
+        return lock_effects.pop(0)
+
+    scheduler, calculator, _, _ = build_scheduler(lock_side_effect=lock_side_effect)
+    scheduler.lock_retry_backoff_seconds = 0.01
+
+    await scheduler.schedule_recalculation("c1")
+    await scheduler.process_queue()
+
+    calculator.calculate_composite_score.assert_not_awaited()
+    assert await scheduler.get_queue_size() == 1
+
+    await asyncio.sleep(0.02)
+    await scheduler.process_queue()
+
+    calculator.calculate_composite_score.assert_awaited_once_with("c1")
+    assert await scheduler.get_queue_size() == 0
+
+
+@pytest.mark.asyncio
+async def test_event_storm_coalesces_to_one_recalculation_per_concept():
+    scheduler, calculator, _, _ = build_scheduler()
+    scheduler.max_batch_size = 1
+
+    for _ in range(20):
+        for concept_id in ("c1", "c2"):
+            await scheduler.schedule_recalculation(concept_id, priority=Priority.HIGH)
+    await scheduler.process_queue()
+
+    assert sorted(call.args[0] for call in calculator.calculate_composite_score.call_args_list) == [
+        "c1",
+        "c2",
+    ]
+    metrics = await scheduler.get_queue_metrics()
+    assert metrics["coalesced"] == 38
+    assert metrics["completed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_process_queue_respects_concurrency_limit():
+    scheduler, calculator, _, _ = build_scheduler()
+    scheduler.max_concurrency = 2
+    scheduler.max_batch_size = 1
+    running = 0
+    peak = 0
+
+    async def slow_calculation(_concept_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return Success(0.5)
+
+    calculator.calculate_composite_score = AsyncMock(side_effect=slow_calculation)
+    for concept_id in ("c1", "c2", "c3", "c4"):
+        await scheduler.schedule_recalculation(concept_id)
+
+    await scheduler.process_queue()
+
+    assert calculator.calculate_composite_score.await_count == 4
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_default_queue_path_comes_from_config_and_survives_restart(tmp_path, monkeypatch):
+    queue_path = tmp_path / "confidence" / "recalc_queue.db"
+    monkeypatch.setattr(
+        "services.confidence.scheduler.ConfidenceConfig",
+        lambda: SimpleNamespace(RECALC_QUEUE_PATH=str(queue_path)),
+    )
+    redis_client = SimpleNamespace(set=AsyncMock(return_value=True), eval=AsyncMock())
+
+    scheduler = RecalculationScheduler(  # type: ignore[arg-type]
+        composite_calculator=SimpleNamespace(),
+        cache_manager=SimpleNamespace(),
+        redis_client=redis_client,
+    )
+    await scheduler.schedule_recalculation("concept-1")
+
+    restarted = RecalculationScheduler(  # type: ignore[arg-type]
+        composite_calculator=SimpleNamespace(),
+        cache_manager=SimpleNamespace(),
+        redis_client=redis_client,
+    )
+
+    assert queue_path.exists()
+    assert await restarted.get_queue_size() == 1
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
 
 from services.confidence.models import (
     ConceptData,
@@ -245,6 +246,167 @@ def test_explanation_quality_minimum_floor_on_error_recovery(
         assert score >= 0.0, f"Case '{case}' scored {score}, should be >= 0.0"
 
 
+def test_explanation_quality_batch_matches_single_scoring(mock_data_access, mock_cache):
+    """Batch scoring should reproduce the per-explanation heuristic exactly"""
+    calculator = UnderstandingCalculator(mock_data_access, mock_cache)
+    explanations = [
+        "Comprehensive explanation with domain-specific terminology including advanced "
+        "vocabulary and technical concepts specialized knowledge expertise",
+        "Basic",
+        "the and or but",
+        "",
+        "   ",
+        "API",
+        "REST API using HTTP and JSON",
+        "AI and ML models",
+        "xy",
+        "...",
+        "Repeated words repeated WORDS repeated words in a longer explanation of caching",
+    ]
+
+    batch = calculator.calculate_explanation_quality_batch(explanations)
+
+    assert batch.tolist() == [calculator.calculate_explanation_quality(e) for e in explanations]
+
+
+def test_explanation_quality_batch_handles_empty_inputs(mock_data_access, mock_cache):
+    """Empty batches and whitespace-only batches should score zero"""
+    calculator = UnderstandingCalculator(mock_data_access, mock_cache)
+
+    assert calculator.calculate_explanation_quality_batch([]).tolist() == []
+    assert calculator.calculate_explanation_quality_batch(["", " "]).tolist() == [0.0, 0.0]
+
+
+CORPUS = [
+    "closures capture variables from the enclosing scope",
+    "decorators wrap functions and return new functions",
+    "generators yield values lazily from functions",
+    "closures and decorators both rely on nested functions",
+    "list comprehensions build lists from iterables",
+    "generators and iterables support lazy iteration",
+    "variables in the enclosing scope outlive the call",
+    "iterables produce values through an iterator protocol",
+]
+CORPUS_BY_ID = {f"c{i}": text for i, text in enumerate(CORPUS)}
+
+
+@pytest.fixture
+def fitted_corpus(tmp_path):
+    """Corpus manager with a vectorizer fitted on CORPUS"""
+    manager = TFIDFCorpusManager(vectorizer_path=str(tmp_path / "tfidf.pkl"))
+    assert isinstance(manager.fit_corpus(CORPUS_BY_ID, event_sequence=0), Success)
+    return manager
+
+
+def test_tfidf_score_version_batch_matches_single_scoring(
+    mock_data_access, mock_cache, fitted_corpus
+):
+    """Score version 2 should score single explanations through the batch path"""
+    calculator = UnderstandingCalculator(
+        mock_data_access,
+        mock_cache,
+        score_version=UnderstandingCalculator.SCORE_VERSION_TFIDF,
+        corpus_manager=fitted_corpus,
+    )
+    explanations = [
+        "closures capture variables from the enclosing scope of nested functions",
+        "generators yield values lazily",
+        "completely unrelated words",
+        "",
+        None,
+    ]
+
+    batch = calculator.calculate_explanation_quality_batch(explanations)
+
+    assert batch.tolist() == pytest.approx(
+        [calculator.calculate_explanation_quality(e) for e in explanations]
+    )
+    assert batch[0] > batch[1] > batch[2] == calculator.MINIMUM_EXPLANATION_SCORE
+    assert batch[3] == batch[4] == 0.0
+
+
+def test_tfidf_score_version_without_vectorizer_uses_heuristic(
+    mock_data_access, mock_cache, tmp_path
+):
+    """Until the corpus is fitted, score version 2 should fall back to version 1"""
+    heuristic = UnderstandingCalculator(mock_data_access, mock_cache)
+    calculator = UnderstandingCalculator(
+        mock_data_access,
+        mock_cache,
+        score_version=UnderstandingCalculator.SCORE_VERSION_TFIDF,
+        corpus_manager=TFIDFCorpusManager(vectorizer_path=str(tmp_path / "tfidf.pkl")),
+    )
+
+    assert calculator.calculate_explanation_quality_batch(CORPUS).tolist() == (
+        heuristic.calculate_explanation_quality_batch(CORPUS).tolist()
+    )
+
+
+def test_corpus_update_documents_matches_full_idf(fitted_corpus):
+    """Incremental updates should give the idf a full fit over the same vocabulary gives"""
+    changes = {
+        "c0": "closures capture scope",  # replaces the fitted document
+        "c1": None,  # deleted
+        "c8": "decorators return functions",  # new concept
+        "c9": "  ",  # no explanation
+    }
+
+    assert fitted_corpus.update_documents(changes, event_sequence=5) == 3
+
+    live = {**CORPUS_BY_ID, "c0": changes["c0"], "c8": changes["c8"]}
+    del live["c1"]
+    reference = TfidfVectorizer(
+        vocabulary=fitted_corpus.vectorizer.vocabulary_,
+        stop_words="english",
+        ngram_range=(1, 2),
+    ).fit(list(live.values()))
+    assert fitted_corpus.document_count == len(live)
+    assert fitted_corpus.vectorizer.idf_ == pytest.approx(reference.idf_)
+
+    reloaded = TFIDFCorpusManager(vectorizer_path=fitted_corpus.vectorizer_path)
+    assert isinstance(reloaded.load_vectorizer(), Success)
+    assert reloaded.event_sequence == 5
+    assert reloaded.document_count == len(live)
+    assert reloaded.vectorizer.idf_ == pytest.approx(reference.idf_)
+
+    # Applying the same changes again (an event replay) changes nothing
+    fitted_corpus.update_documents(changes)
+    assert fitted_corpus.vectorizer.idf_ == pytest.approx(reference.idf_)
+
+
+@pytest.mark.asyncio
+async def test_corpus_refresh_fits_then_folds_in_new_events(tmp_path):
+    """refresh() should fit from Neo4j first, then read only new concept events"""
+    manager = TFIDFCorpusManager(vectorizer_path=str(tmp_path / "tfidf.pkl"))
+    data_access = Mock()
+    data_access.get_all_explanations = AsyncMock(return_value=Success(CORPUS_BY_ID))
+    event_store = Mock()
+    event_store.get_last_sequence.return_value = 10
+    event_store.iter_events_after.return_value = [
+        (11, Mock(event_type="ConceptCreated", aggregate_id="new",
+                  event_data={"explanation": "closures again"})),
+        (12, Mock(event_type="ConceptUpdated", aggregate_id="c2", event_data={"name": "renamed"})),
+        (13, Mock(event_type="ConceptUpdated", aggregate_id="c3",
+                  event_data={"explanation": "nested functions"})),
+        (14, Mock(event_type="ConceptUpdated", aggregate_id="c3",
+                  event_data={"explanation": "nested functions again"})),
+        (15, Mock(event_type="ConceptDeleted", aggregate_id="c4", event_data={"deleted": True})),
+        (16, Mock(event_type="RelationshipCreated", aggregate_id="r1", event_data={})),
+    ]
+
+    first = await manager.refresh(data_access, event_store)
+    second = await manager.refresh(data_access, event_store)
+
+    assert first.value == len(CORPUS)
+    assert second.value == 3  # new added, c3 replaced, c4 removed
+    event_store.iter_events_after.assert_called_once_with(10)
+    assert manager.event_sequence == 16
+    # Updates replace documents, so only the live concept count drives growth
+    assert manager.document_count == len(CORPUS)
+    assert set(manager.concept_terms) == set(CORPUS_BY_ID) - {"c4"} | {"new"}
+    data_access.get_all_explanations.assert_awaited_once()
+
+
 # Test Suite 3: Weighted Combination
 @pytest.mark.asyncio
 async def test_understanding_score_combines_all_components_with_correct_weights(
@@ -143,3 +143,27 @@ async def test_multiple_events_trigger_signal(event_store):
 
         # Clear for next iteration
         event_store.new_event_signal.clear()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_their_own_signal(event_store, sample_event):
+    """Test that clearing one consumer's signal does not hide the event from another."""
+    outbox_signal = event_store.subscribe_new_events()
+    confidence_signal = event_store.subscribe_new_events()
+
+    event_store.append_event(sample_event)
+    outbox_signal.clear()
+
+    assert confidence_signal.is_set()
+    assert event_store.new_event_signal.is_set()
+    await asyncio.wait_for(confidence_signal.wait(), timeout=1.0)
+
+
+def test_dropped_subscription_is_released(event_store):
+    """Test that a subscriber's Event is not kept alive by the store."""
+    import gc
+
+    event_store.subscribe_new_events()
+    gc.collect()
+
+    assert len(event_store._new_event_subscribers) == 0
@@ -5,11 +5,15 @@ Provides analytics capabilities and knowledge hierarchy navigation through
 the Model Context Protocol.
 
 Data Access Pattern (Read-Only):
-    - Hierarchy queries: Uses neo4j_service with in-memory caching (5-min TTL)
+    - Hierarchy queries: Served from the HierarchyView materialized from the
+      event stream; falls back to neo4j_service with a 5-min TTL cache when
+      no view is configured
     - Confidence filtering: Uses neo4j_service for score-based queries
 
 Caching Strategy:
-    - list_hierarchy(): Cached for 5 minutes (expensive aggregation)
+    - list_hierarchy() / list_areas(): Always fresh from HierarchyView
+      (Neo4j is only rescanned on cold start or after a failed consistency
+      check); otherwise cached for 5 minutes (expensive aggregation)
     - get_concepts_by_confidence(): Not cached (parameterized queries)
 
 For write operations, use concept_tools which routes through
@@ -19,6 +23,7 @@ See docs/adr/001-data-access-patterns.md for architecture guidelines.
 See docs/adr/003-caching-strategy.md for caching documentation.
 """
 
+import asyncio
 import logging
 import threading
 from dataclasses import dataclass, field
@@ -27,13 +32,14 @@ from typing import Any, Dict, List, Optional
 
 from config import PREDEFINED_AREAS, AREAS_BY_SLUG
 from services.container import get_container, ServiceContainer
+from services.hierarchy_view import PLACEMENT_QUERY, HierarchyView
 from .responses import (
     ErrorType,
     success_response,
     validation_error,
     internal_error,
 )
-from .service_utils import requires_services
+from .service_utils import execute_neo4j_read, requires_services
 
 
 logger = logging.getLogger(__name__)
@@ -46,6 +52,14 @@ def _get_neo4j_service(container: Optional[ServiceContainer] = None):
     return get_container().neo4j_service
 
 
+def _get_hierarchy_view(container: Optional[ServiceContainer] = None) -> Optional[HierarchyView]:
+    """Get the hierarchy view from container (None unless view and event store are set)."""
+    container = container or get_container()
+    if container.hierarchy_view is None or container.event_store is None:
+        return None
+    return container.hierarchy_view
+
+
 # =============================================================================
 # Thread-Safe Caching Infrastructure
 # =============================================================================
@@ -116,6 +130,10 @@ class QueryCache:
 _CACHE_TTL_SECONDS = 300
 _query_cache = QueryCache(default_ttl=_CACHE_TTL_SECONDS)
 
+# Responses built from the hierarchy view, memoized per (view, view version)
+_view_responses: Dict[str, tuple[tuple[int, int], Dict[str, Any]]] = {}
+_view_rebuild_lock = asyncio.Lock()
+
 # Predefined area lookups (slug and label normalization)
 _PREDEFINED_SLUGS = [area.slug for area in PREDEFINED_AREAS]
 _PREDEFINED_LABEL_TO_SLUG = {area.label: area.slug for area in PREDEFINED_AREAS}
@@ -214,6 +232,180 @@ def _ordered_area_keys(areas_dict: dict[str, dict[str, Any]]) -> list[str]:
     return ordered
 
 
+def _build_hierarchy_response(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Build the list_hierarchy response from area/topic/subtopic count rows.
+
+    Args:
+        results: Rows with "area", "topic", "subtopic" and "count" keys
+
+    Returns:
+        success_response with nested areas and total_concepts
+    """
+    # Build nested structure - initialize with all predefined areas
+    areas_dict = {}
+    total_concepts = 0
+
+    # Pre-populate with all predefined areas (empty, with no topics)
+    for predefined_area in PREDEFINED_AREAS:
+        areas_dict[predefined_area.slug] = {
+            "name": predefined_area.slug,
+            "label": predefined_area.label,
+            "description": predefined_area.description,
+            "concept_count": 0,
+            "topics": {},
+            "is_predefined": True,
+        }
+
+    for record in results:
+        area_key, area_meta = _normalize_area_value(record.get("area"))
+        topic = record.get("topic") or "General"
+        subtopic = record.get("subtopic") or "General"
+        count = record.get("count") or 0  # Treats both None and missing key as 0
+
+        total_concepts += count
+
+        # Ensure area exists
+        if area_key not in areas_dict:
+            areas_dict[area_key] = {
+                **area_meta,
+                "concept_count": 0,
+                "topics": {},
+            }
+
+        # Ensure topic exists
+        if topic not in areas_dict[area_key]["topics"]:
+            areas_dict[area_key]["topics"][topic] = {
+                "name": topic,
+                "concept_count": 0,
+                "subtopics": {},
+            }
+
+        # Add subtopic
+        if subtopic not in areas_dict[area_key]["topics"][topic]["subtopics"]:
+            areas_dict[area_key]["topics"][topic]["subtopics"][subtopic] = {
+                "name": subtopic,
+                "concept_count": 0,
+            }
+
+        # Update counts
+        areas_dict[area_key]["topics"][topic]["subtopics"][subtopic]["concept_count"] += count
+        areas_dict[area_key]["topics"][topic]["concept_count"] += count
+        areas_dict[area_key]["concept_count"] += count
+
+    # Convert nested dicts to lists
+    areas_list = []
+    for area_key in _ordered_area_keys(areas_dict):
+        area_data = areas_dict[area_key]
+        topics_list = []
+        for _topic_name, topic_data in sorted(area_data["topics"].items()):
+            subtopics_list = [
+                {"name": subtopic_data["name"], "concept_count": subtopic_data["concept_count"]}
+                for subtopic_name, subtopic_data in sorted(topic_data["subtopics"].items())
+            ]
+
+            topics_list.append(
+                {
+                    "name": topic_data["name"],
+                    "concept_count": topic_data["concept_count"],
+                    "subtopics": subtopics_list,
+                }
+            )
+
+        areas_list.append(
+            {
+                "name": area_data["name"],
+                "label": area_data["label"],
+                "description": area_data["description"],
+                "concept_count": area_data["concept_count"],
+                "topics": topics_list,
+                "is_predefined": area_data["is_predefined"],
+            }
+        )
+
+    message = f"Hierarchy contains {len(areas_list)} areas with {total_concepts} concepts"
+    return success_response(message, areas=areas_list, total_concepts=total_concepts)
+
+
+def _build_areas_response(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Build the list_areas response from rows with "area" and "count" keys.
+
+    Rows may be finer-grained (per topic/subtopic); counts are summed per area.
+    """
+    # Build areas dict - initialize with all predefined areas
+    areas_dict = {}
+    total_concepts = 0
+
+    # Pre-populate with all predefined areas (zero counts)
+    for predefined_area in PREDEFINED_AREAS:
+        areas_dict[predefined_area.slug] = {
+            "name": predefined_area.slug,
+            "label": predefined_area.label,
+            "description": predefined_area.description,
+            "concept_count": 0,
+            "is_predefined": True,
+        }
+
+    for record in results:
+        area_key, area_meta = _normalize_area_value(record.get("area"))
+        count = record.get("count") or 0  # Treats both None and missing key as 0
+
+        total_concepts += count
+
+        # Update or add the area
+        if area_key in areas_dict:
+            areas_dict[area_key]["concept_count"] += count
+        else:
+            # Custom area not in predefined list
+            areas_dict[area_key] = {
+                **area_meta,
+                "concept_count": count,
+            }
+
+    # Convert to list and apply ordering rules
+    areas_list = [areas_dict[key] for key in _ordered_area_keys(areas_dict)]
+
+    message = f"Found {len(areas_list)} areas with {total_concepts} concepts"
+    return success_response(
+        message,
+        areas=areas_list,
+        total_areas=len(areas_list),
+        total_concepts=total_concepts
+    )
+
+
+async def _refresh_hierarchy_view(view: HierarchyView) -> None:
+    """Rescan Neo4j if the view is cold or stale, then apply newly appended events."""
+    event_store = get_container().event_store
+    if view.needs_rebuild:
+        async with _view_rebuild_lock:
+            if view.needs_rebuild:
+                # Read the cursor first, before any event Neo4j has yet to see:
+                # events racing the scan or still in the outbox are re-applied
+                sequence = event_store.get_projected_sequence()
+                records = await execute_neo4j_read(
+                    PLACEMENT_QUERY, {}, query_name="hierarchy_view_rebuild"
+                )
+                view.load(records, sequence)
+    view.catch_up(event_store)
+
+
+async def _hierarchy_view_response(name: str, builder) -> Dict[str, Any]:
+    """Build (or reuse) a response from the current hierarchy view counters."""
+    view = _get_hierarchy_view()
+    await _refresh_hierarchy_view(view)
+
+    key = (id(view), view.version)
+    cached = _view_responses.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    result = builder(view.get_records())
+    _view_responses[name] = (key, result)
+    return result
+
+
 # =============================================================================
 # MCP Tool Functions
 # =============================================================================
@@ -257,10 +449,15 @@ async def list_hierarchy() -> dict[str, Any]:
         }
 
     Note:
-        Results are cached for 5 minutes for performance optimization.
-        Cache is thread-safe and automatically invalidates when service changes.
+        Served from the event-maintained HierarchyView when configured, so
+        counts reflect every committed event without a Neo4j aggregation.
+        Without a view, results are cached for 5 minutes (thread-safe,
+        invalidated when the Neo4j service changes).
     """
     try:
+        if _get_hierarchy_view() is not None:
+            return await _hierarchy_view_response('hierarchy', _build_hierarchy_response)
+
         # Get Neo4j service from container
         neo4j = _get_neo4j_service()
 
@@ -285,96 +482,17 @@ async def list_hierarchy() -> dict[str, Any]:
         ORDER BY area, topic, subtopic
         """
 
-        results = neo4j.execute_read(query, {})
-
-        # Build nested structure - initialize with all predefined areas
-        areas_dict = {}
-        total_concepts = 0
-
-        # Pre-populate with all predefined areas (empty, with no topics)
-        for predefined_area in PREDEFINED_AREAS:
-            areas_dict[predefined_area.slug] = {
-                "name": predefined_area.slug,
-                "label": predefined_area.label,
-                "description": predefined_area.description,
-                "concept_count": 0,
-                "topics": {},
-                "is_predefined": True,
-            }
-
-        for record in results:
-            area_key, area_meta = _normalize_area_value(record.get("area"))
-            topic = record.get("topic") or "General"
-            subtopic = record.get("subtopic") or "General"
-            count = record.get("count") or 0  # Treats both None and missing key as 0
-
-            total_concepts += count
-
-            # Ensure area exists
-            if area_key not in areas_dict:
-                areas_dict[area_key] = {
-                    **area_meta,
-                    "concept_count": 0,
-                    "topics": {},
-                }
-
-            # Ensure topic exists
-            if topic not in areas_dict[area_key]["topics"]:
-                areas_dict[area_key]["topics"][topic] = {
-                    "name": topic,
-                    "concept_count": 0,
-                    "subtopics": {},
-                }
-
-            # Add subtopic
-            if subtopic not in areas_dict[area_key]["topics"][topic]["subtopics"]:
-                areas_dict[area_key]["topics"][topic]["subtopics"][subtopic] = {
-                    "name": subtopic,
-                    "concept_count": 0,
-                }
+        results = await execute_neo4j_read(query, {}, query_name="list_hierarchy")
 
-            # Update counts
-            areas_dict[area_key]["topics"][topic]["subtopics"][subtopic]["concept_count"] += count
-            areas_dict[area_key]["topics"][topic]["concept_count"] += count
-            areas_dict[area_key]["concept_count"] += count
-
-        # Convert nested dicts to lists
-        areas_list = []
-        for area_key in _ordered_area_keys(areas_dict):
-            area_data = areas_dict[area_key]
-            topics_list = []
-            for _topic_name, topic_data in sorted(area_data["topics"].items()):
-                subtopics_list = [
-                    {"name": subtopic_data["name"], "concept_count": subtopic_data["concept_count"]}
-                    for subtopic_name, subtopic_data in sorted(topic_data["subtopics"].items())
-                ]
-
-                topics_list.append(
-                    {
-                        "name": topic_data["name"],
-                        "concept_count": topic_data["concept_count"],
-                        "subtopics": subtopics_list,
-                    }
-                )
-
-            areas_list.append(
-                {
-                    "name": area_data["name"],
-                    "label": area_data["label"],
-                    "description": area_data["description"],
-                    "concept_count": area_data["concept_count"],
-                    "topics": topics_list,
-                    "is_predefined": area_data["is_predefined"],
-                }
-            )
-
-        message = f"Hierarchy contains {len(areas_list)} areas with {total_concepts} concepts"
-        result = success_response(message, areas=areas_list, total_concepts=total_concepts)
+        result = _build_hierarchy_response(results)
 
         # Update cache (thread-safe)
         _query_cache.set('hierarchy', result, service_id=current_service_id)
 
-        logger.info(f"Hierarchy built: {len(areas_list)} areas, {total_concepts} concepts")
+        logger.info(
+            f"Hierarchy built: {len(result['data']['areas'])} areas, "
+            f"{result['data']['total_concepts']} concepts"
+        )
 
         return result
 
@@ -414,10 +532,15 @@ async def list_areas() -> dict[str, Any]:
         }
 
     Note:
-        Results are cached for 5 minutes for performance optimization.
-        Cache is thread-safe and automatically invalidates when service changes.
+        Served from the event-maintained HierarchyView when configured, so
+        counts reflect every committed event without a Neo4j aggregation.
+        Without a view, results are cached for 5 minutes (thread-safe,
+        invalidated when the Neo4j service changes).
     """
     try:
+        if _get_hierarchy_view() is not None:
+            return await _hierarchy_view_response('areas', _build_areas_response)
+
         # Get Neo4j service from container
         neo4j = _get_neo4j_service()
 
@@ -439,53 +562,17 @@ async def list_areas() -> dict[str, Any]:
         ORDER BY area
         """
 
-        results = neo4j.execute_read(query, {})
-
-        # Build areas dict - initialize with all predefined areas
-        areas_dict = {}
-        total_concepts = 0
+        results = await execute_neo4j_read(query, {}, query_name="list_areas")
 
-        # Pre-populate with all predefined areas (zero counts)
-        for predefined_area in PREDEFINED_AREAS:
-            areas_dict[predefined_area.slug] = {
-                "name": predefined_area.slug,
-                "label": predefined_area.label,
-                "description": predefined_area.description,
-                "concept_count": 0,
-                "is_predefined": True,
-            }
-
-        for record in results:
-            area_key, area_meta = _normalize_area_value(record.get("area"))
-            count = record.get("count") or 0  # Treats both None and missing key as 0
-
-            total_concepts += count
-
-            # Update or add the area
-            if area_key in areas_dict:
-                areas_dict[area_key]["concept_count"] += count
-            else:
-                # Custom area not in predefined list
-                areas_dict[area_key] = {
-                    **area_meta,
-                    "concept_count": count,
-                }
-
-        # Convert to list and apply ordering rules
-        areas_list = [areas_dict[key] for key in _ordered_area_keys(areas_dict)]
-
-        message = f"Found {len(areas_list)} areas with {total_concepts} concepts"
-        result = success_response(
-            message,
-            areas=areas_list,
-            total_areas=len(areas_list),
-            total_concepts=total_concepts
-        )
+        result = _build_areas_response(results)
 
         # Update cache (thread-safe)
         _query_cache.set('areas', result, service_id=current_service_id)
 
-        logger.info(f"Areas list built: {len(areas_list)} areas, {total_concepts} concepts")
+        logger.info(
+            f"Areas list built: {result['data']['total_areas']} areas, "
+            f"{result['data']['total_concepts']} concepts"
+        )
 
         return result
 
@@ -584,9 +671,6 @@ async def get_concepts_by_confidence(
             f"limit={limit}, sort_order={sort_order}"
         )
 
-        # Get Neo4j service from container
-        neo4j = _get_neo4j_service()
-
         # Query concepts within confidence range
         # Scores are stored as 0-100 in Neo4j
         # COALESCE handles NULL confidence_score by treating it as 0 (fixes #H003)
@@ -607,11 +691,11 @@ async def get_concepts_by_confidence(
         LIMIT $limit
         """
 
-        results = neo4j.execute_read(query, {
+        results = await execute_neo4j_read(query, {
             "min_confidence": min_confidence,
             "max_confidence": max_confidence,
             "limit": limit
-        })
+        }, query_name="get_concepts_by_confidence")
 
         # Format results
         formatted_results = []
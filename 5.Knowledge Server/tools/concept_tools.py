@@ -4,6 +4,7 @@ MCP Tools for Concept Management
 Provides CRUD operations for concepts through the Model Context Protocol.
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, Optional
@@ -41,6 +42,29 @@ def _get_confidence_service(container: Optional[ServiceContainer] = None):
     return get_container().confidence_service
 
 
+def _get_embedding_batcher(container: Optional[ServiceContainer] = None):
+    """Get embedding micro-batcher from container (None if not configured)."""
+    if container is not None and container.embedding_batcher is not None:
+        return container.embedding_batcher
+    return get_container().embedding_batcher
+
+
+async def _prefetch_embeddings(repo, **kwargs) -> None:
+    """
+    Warm the embedding cache through the micro-batcher before a write.
+
+    Failures are logged and ignored: the repository then embeds the text
+    itself, exactly as it would without a batcher.
+    """
+    batcher = _get_embedding_batcher()
+    if batcher is None:
+        return
+    try:
+        await repo.prefetch_embeddings(batcher, **kwargs)
+    except Exception as e:
+        logger.warning(f"Batched embedding prefetch failed, falling back to inline: {e}")
+
+
 # =============================================================================
 # Pydantic Models for Request Validation
 # =============================================================================
@@ -251,8 +275,11 @@ async def create_concept(
         if source_urls:
             concept_dict["source_urls"] = json.loads(source_urls)  # Store as list, not string
 
-        # Call repository
-        success, error, concept_id = repo.create_concept(concept_dict)
+        # Embed off the event loop, batched with concurrent tool calls
+        await _prefetch_embeddings(repo, concept_data=concept_dict)
+
+        # Call repository off the event loop (appends may wait for a group commit)
+        success, error, concept_id = await asyncio.to_thread(repo.create_concept, concept_dict)
 
         if success:
             if warnings:
@@ -332,7 +359,7 @@ async def get_concept(concept_id: str, include_history: bool = False) -> dict[st
         repo = _get_repository()
 
         # Get concept from repository
-        concept = repo.get_concept(concept_id)
+        concept = repo.get_concept(concept_id, include_history=include_history)
 
         if concept:
             # Remove history if not requested (token efficiency)
@@ -445,8 +472,11 @@ async def update_concept(
         # Get repository from container
         repo = _get_repository()
 
-        # Call repository
-        success, error = repo.update_concept(concept_id, update_dict)
+        # Embed off the event loop, batched with concurrent tool calls
+        await _prefetch_embeddings(repo, updates=update_dict)
+
+        # Call repository off the event loop (appends may wait for a group commit)
+        success, error = await asyncio.to_thread(repo.update_concept, concept_id, update_dict)
 
         if success:
             return success_response("Updated", updated_fields=list(updates.keys()))
@@ -508,8 +538,8 @@ async def delete_concept(concept_id: str) -> dict[str, Any]:
         # Get repository from container
         repo = _get_repository()
 
-        # Call repository
-        success, error = repo.delete_concept(concept_id)
+        # Call repository off the event loop (appends may wait for a group commit)
+        success, error = await asyncio.to_thread(repo.delete_concept, concept_id)
 
         if success:
             return success_response("Deleted", concept_id=concept_id)
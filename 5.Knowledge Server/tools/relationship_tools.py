@@ -4,12 +4,14 @@ MCP Tools for Relationship Operations
 Provides relationship creation and management capabilities through the Model Context Protocol.
 """
 
+import asyncio
 import logging
 import uuid
 from enum import Enum
 from typing import Any, Optional
 
 from services.container import get_container, ServiceContainer
+from services.relationship_graph import CONCEPTS_QUERY, RELATIONSHIPS_QUERY, RelationshipGraph
 from .responses import (
     ErrorType,
     success_response,
@@ -18,7 +20,7 @@ from .responses import (
     database_error,
     internal_error,
 )
-from .service_utils import requires_services
+from .service_utils import execute_neo4j_read, requires_services
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +47,66 @@ def _get_outbox(container: Optional[ServiceContainer] = None):
     return get_container().outbox
 
 
+def _get_relationship_graph(
+    container: Optional[ServiceContainer] = None,
+) -> Optional[RelationshipGraph]:
+    """Get the relationship graph from container (None unless graph and event store are set)."""
+    container = container or get_container()
+    if container.relationship_graph is None or container.event_store is None:
+        return None
+    return container.relationship_graph
+
+
+# Background load of the relationship graph (one at a time)
+_graph_warmup_task: Optional[asyncio.Task] = None
+
+
+async def _warm_relationship_graph(graph: RelationshipGraph) -> None:
+    """Load the relationship graph from Neo4j."""
+    try:
+        # Read the cursor first, before any event Neo4j has yet to see:
+        # events racing the scan or still in the outbox are re-applied
+        sequence = get_container().event_store.get_projected_sequence()
+        concepts = await execute_neo4j_read(
+            CONCEPTS_QUERY, {}, query_name="relationship_graph_rebuild"
+        )
+        relationships = await execute_neo4j_read(
+            RELATIONSHIPS_QUERY, {}, query_name="relationship_graph_rebuild"
+        )
+        graph.load(concepts, relationships, sequence)
+    except Exception as e:
+        logger.warning(f"Relationship graph load failed, traversals stay on Neo4j: {e}")
+
+
+def _ready_relationship_graph() -> Optional[RelationshipGraph]:
+    """
+    Return the caught-up relationship graph, or None to query Neo4j.
+
+    A cold (or stale) graph schedules a background load and the current call
+    falls back to Cypher, so no tool call waits for the full graph scan.
+    """
+    global _graph_warmup_task
+
+    graph = _get_relationship_graph()
+    if graph is None:
+        return None
+
+    if graph.needs_rebuild:
+        if _graph_warmup_task is None or _graph_warmup_task.done():
+            _graph_warmup_task = asyncio.get_running_loop().create_task(
+                _warm_relationship_graph(graph)
+            )
+        return None
+
+    try:
+        graph.catch_up(get_container().event_store)
+    except Exception as e:
+        logger.warning(f"Relationship graph catch-up failed, querying Neo4j: {e}")
+        graph.mark_stale()
+        return None
+    return graph
+
+
 class RelationshipType(str, Enum):
     """Enum for valid relationship types with type safety."""
 
@@ -256,9 +318,10 @@ async def create_relationship(
         RETURN c.concept_id AS concept_id
         """
 
-        existing_concepts = neo4j.execute_read(
+        existing_concepts = await execute_neo4j_read(
             check_query,
-            {"source_id": source_id, "target_id": target_id}
+            {"source_id": source_id, "target_id": target_id},
+            query_name="create_relationship",
         )
 
         existing_ids = {record.get("concept_id") for record in existing_concepts}
@@ -276,13 +339,14 @@ async def create_relationship(
         RETURN r.relationship_id AS relationship_id
         """
 
-        duplicates = neo4j.execute_read(
+        duplicates = await execute_neo4j_read(
             duplicate_check_query,
             {
                 "source_id": source_id,
                 "target_id": target_id,
                 "rel_type": _normalize_relationship_type(relationship_type),
             },
+            query_name="create_relationship",
         )
 
         if duplicates:
@@ -322,7 +386,7 @@ async def create_relationship(
         )
 
         # Store event in event store
-        evt_store.append_event(event)
+        await asyncio.to_thread(evt_store.append_event, event)
         logger.debug(f"RelationshipCreated event stored: {event.event_id}")
 
         # Add to outbox for Neo4j projection
@@ -437,13 +501,14 @@ async def delete_relationship(
         RETURN r.relationship_id AS relationship_id
         """
 
-        existing_rels = neo4j.execute_read(
+        existing_rels = await execute_neo4j_read(
             find_query,
             {
                 "source_id": source_id,
                 "target_id": target_id,
                 "rel_type": _normalize_relationship_type(relationship_type),
             },
+            query_name="delete_relationship",
         )
 
         if not existing_rels:
@@ -467,7 +532,7 @@ async def delete_relationship(
         )
 
         # Store event in event store
-        evt_store.append_event(event)
+        await asyncio.to_thread(evt_store.append_event, event)
         logger.debug(f"RelationshipDeleted event stored: {event.event_id}")
 
         # Add to outbox for Neo4j projection
@@ -516,6 +581,63 @@ async def delete_relationship(
         return internal_error(str(e))
 
 
+async def _query_related_concepts(
+    concept_id: str, relationship_type: str | None, direction: str, max_depth: int
+) -> list[dict[str, Any]]:
+    """
+    Run the variable-length traversal for get_related_concepts in Neo4j.
+
+    Like RelationshipGraph.related(), each related concept is returned once, at
+    its shortest distance, with the type and strength of the first relationship
+    on a shortest path.
+    """
+    # Build direction-specific pattern
+    if direction == "outgoing":
+        rel_pattern = f"-[r*1..{max_depth}]->"
+    elif direction == "incoming":
+        rel_pattern = f"<-[r*1..{max_depth}]-"
+    else:  # both
+        rel_pattern = f"-[r*1..{max_depth}]-"
+
+    # Build relationship type filter
+    # SECURITY: Using safe interpolation due to Neo4j limitation (can't parameterize type filters)
+    if relationship_type:
+        normalized_type = _normalize_relationship_type(relationship_type)
+        allowed_types = {e.value for e in RelationshipType}
+        type_filter = _safe_cypher_interpolation(
+            template="AND all(rel in r WHERE type(rel) = '{value}')",
+            value_to_inject=normalized_type,
+            allowed_values=allowed_types,
+            value_name="relationship_type",
+        )
+    else:
+        type_filter = ""
+
+    # Query for related concepts
+    query = f"""
+    MATCH path = (start:Concept {{concept_id: $concept_id}}){rel_pattern}(related:Concept)
+    WHERE (start.deleted IS NULL OR start.deleted = false)
+      AND (related.deleted IS NULL OR related.deleted = false)
+      AND related <> start
+      {type_filter}
+    WITH related, path
+    ORDER BY length(path)
+    WITH related, head(collect(path)) as shortest
+    WITH related, length(shortest) as distance, relationships(shortest)[0] as first_rel
+    RETURN related.concept_id as concept_id,
+           related.name as name,
+           type(first_rel) as relationship_type,
+           coalesce(first_rel.strength, 1.0) as strength,
+           distance
+    ORDER BY distance, related.name
+    LIMIT 50
+    """
+
+    return await execute_neo4j_read(
+        query, {"concept_id": concept_id}, query_name="get_related_concepts"
+    )
+
+
 @requires_services("neo4j_service")
 async def get_related_concepts(
     concept_id: str,
@@ -553,9 +675,6 @@ async def get_related_concepts(
         >>> get_related_concepts("concept-001", relationship_type="prerequisite", direction="incoming")
     """
     try:
-        # Get Neo4j service from container
-        neo4j = _get_neo4j_service()
-
         # Validate concept_id
         if not concept_id or not isinstance(concept_id, str):
             return validation_error(
@@ -591,49 +710,21 @@ async def get_related_concepts(
             f"direction={direction}, type={relationship_type}, depth={max_depth}"
         )
 
-        # Build direction-specific pattern
-        if direction == "outgoing":
-            rel_pattern = f"-[r*1..{max_depth}]->"
-        elif direction == "incoming":
-            rel_pattern = f"<-[r*1..{max_depth}]-"
-        else:  # both
-            rel_pattern = f"-[r*1..{max_depth}]-"
-
-        # Build relationship type filter
-        # SECURITY: Using safe interpolation due to Neo4j limitation (can't parameterize type filters)
-        if relationship_type:
-            normalized_type = _normalize_relationship_type(relationship_type)
-            allowed_types = {e.value for e in RelationshipType}
-            type_filter = _safe_cypher_interpolation(
-                template="AND all(rel in r WHERE type(rel) = '{value}')",
-                value_to_inject=normalized_type,
-                allowed_values=allowed_types,
-                value_name="relationship_type",
+        graph = _ready_relationship_graph()
+        if graph is not None:
+            results = graph.related(
+                concept_id,
+                relationship_type=(
+                    _normalize_relationship_type(relationship_type) if relationship_type else None
+                ),
+                direction=direction,
+                max_depth=max_depth,
+                limit=50,
             )
         else:
-            type_filter = ""
-
-        # Query for related concepts
-        query = f"""
-        MATCH path = (start:Concept {{concept_id: $concept_id}}){rel_pattern}(related:Concept)
-        WHERE (start.deleted IS NULL OR start.deleted = false)
-          AND (related.deleted IS NULL OR related.deleted = false)
-          {type_filter}
-        WITH DISTINCT related,
-             relationships(path) as rels,
-             length(path) as distance,
-             [rel in relationships(path) | type(rel)][0] as rel_type,
-             [rel in relationships(path) | coalesce(rel.strength, 1.0)][0] as strength
-        RETURN related.concept_id as concept_id,
-               related.name as name,
-               rel_type as relationship_type,
-               strength,
-               distance
-        ORDER BY distance, related.name
-        LIMIT 50
-        """
-
-        results = neo4j.execute_read(query, {"concept_id": concept_id})
+            results = await _query_related_concepts(
+                concept_id, relationship_type, direction, max_depth
+            )
 
         # Format results
         related = []
@@ -678,6 +769,30 @@ async def get_related_concepts(
         return internal_error(str(e))
 
 
+async def _query_prerequisites(concept_id: str, max_depth: int) -> list[dict[str, Any]]:
+    """Run the PREREQUISITE closure for get_prerequisites in Neo4j."""
+    # Query for prerequisite chain
+    # SECURITY NOTE: Neo4j doesn't allow parameters in variable-length patterns [:REL*1..{n}]
+    # max_depth is validated above to be an integer in range [1,10], making injection impossible
+    # The relationship type is hardcoded as PREREQUISITE (not user input), so no type injection risk
+    query = f"""
+    MATCH path = (target:Concept {{concept_id: $concept_id}})<-[:PREREQUISITE*1..{max_depth}]-(prereq:Concept)
+    WHERE (prereq.deleted IS NULL OR prereq.deleted = false)
+      AND (target.deleted IS NULL OR target.deleted = false)
+    WITH DISTINCT prereq.concept_id as concept_id,
+         prereq.name as name,
+         length(path) as depth
+    RETURN concept_id, name, depth
+    ORDER BY depth DESC, name
+    """
+
+    return await execute_neo4j_read(
+        query,
+        {"concept_id": concept_id},
+        query_name="get_prerequisites",
+    )
+
+
 @requires_services("neo4j_service")
 async def get_prerequisites(concept_id: str, max_depth: int = 5) -> dict[str, Any]:
     """
@@ -705,9 +820,6 @@ async def get_prerequisites(concept_id: str, max_depth: int = 5) -> dict[str, An
         >>> get_prerequisites("concept-advanced-topic", max_depth=5)
     """
     try:
-        # Get Neo4j service from container
-        neo4j = _get_neo4j_service()
-
         # Validate concept_id
         if not concept_id or not isinstance(concept_id, str):
             return validation_error(
@@ -723,25 +835,11 @@ async def get_prerequisites(concept_id: str, max_depth: int = 5) -> dict[str, An
 
         logger.info(f"Finding prerequisites for {concept_id} (max_depth={max_depth})")
 
-        # Query for prerequisite chain
-        # SECURITY NOTE: Neo4j doesn't allow parameters in variable-length patterns [:REL*1..{n}]
-        # max_depth is validated above to be an integer in range [1,10], making injection impossible
-        # The relationship type is hardcoded as PREREQUISITE (not user input), so no type injection risk
-        query = f"""
-        MATCH path = (target:Concept {{concept_id: $concept_id}})<-[:PREREQUISITE*1..{max_depth}]-(prereq:Concept)
-        WHERE (prereq.deleted IS NULL OR prereq.deleted = false)
-          AND (target.deleted IS NULL OR target.deleted = false)
-        WITH DISTINCT prereq.concept_id as concept_id,
-             prereq.name as name,
-             length(path) as depth
-        RETURN concept_id, name, depth
-        ORDER BY depth DESC, name
-        """
-
-        results = neo4j.execute_read(
-            query,
-            {"concept_id": concept_id}
-        )
+        graph = _ready_relationship_graph()
+        if graph is not None:
+            results = graph.prerequisites(concept_id, max_depth=max_depth)
+        else:
+            results = await _query_prerequisites(concept_id, max_depth)
 
         # Format results
         chain = []
@@ -810,9 +908,6 @@ async def get_concept_chain(
         >>> get_concept_chain("concept-001", "concept-010", relationship_type="prerequisite")
     """
     try:
-        # Get Neo4j service from container
-        neo4j = _get_neo4j_service()
-
         # Validate IDs
         if not start_id or not isinstance(start_id, str):
             return validation_error(
@@ -847,10 +942,16 @@ async def get_concept_chain(
             RETURN c.concept_id as concept_id, c.name as name
             """
 
-            verify_results = neo4j.execute_read(
-                verify_query,
-                {"concept_id": start_id}
-            )
+            graph = _ready_relationship_graph()
+            if graph is not None:
+                concept = graph.get_concept(start_id)
+                verify_results = [concept] if concept else []
+            else:
+                verify_results = await execute_neo4j_read(
+                    verify_query,
+                    {"concept_id": start_id},
+                    query_name="get_concept_chain",
+                )
 
             if not verify_results:
                 return not_found_error("Concept", start_id)
@@ -868,6 +969,21 @@ async def get_concept_chain(
 
         logger.info(f"Finding shortest path from {start_id} to {end_id}")
 
+        graph = _ready_relationship_graph()
+        if graph is not None:
+            found = graph.shortest_path(
+                start_id,
+                end_id,
+                relationship_type=(
+                    _normalize_relationship_type(relationship_type) if relationship_type else None
+                ),
+            )
+            if found is None:
+                logger.info(f"No path found from {start_id} to {end_id}")
+                return success_response("No path found", path=[], length=0)
+            logger.info(f"Found path of length {found['length']} from {start_id} to {end_id}")
+            return success_response("Found", path=found["path"], length=found["length"])
+
         # Build WHERE clause with both relationship type and deletion filters
         # SECURITY: Using safe interpolation due to Neo4j limitation (can't parameterize type filters)
         where_conditions = []
@@ -897,9 +1013,10 @@ async def get_concept_chain(
                length(path) as length
         """
 
-        results = neo4j.execute_read(
+        results = await execute_neo4j_read(
             query,
-            {"start_id": start_id, "end_id": end_id}
+            {"start_id": start_id, "end_id": end_id},
+            query_name="get_concept_chain",
         )
 
         if not results:
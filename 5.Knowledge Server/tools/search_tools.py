@@ -4,7 +4,8 @@ MCP Tools for Search Operations
 Provides semantic and exact search capabilities through the Model Context Protocol.
 
 Data Access Pattern (Read-Only):
-    - Semantic search: Uses chromadb_service directly for embedding similarity
+    - Semantic search: Uses chromadb_service directly for embedding similarity,
+      fused with the event-maintained LexicalIndex (BM25) in hybrid mode
     - Exact search: Uses neo4j_service directly for filtered graph queries
     - Recent concepts: Uses neo4j_service for time-based queries
 
@@ -14,11 +15,14 @@ through DualStorageRepository to maintain event sourcing integrity.
 See docs/adr/001-data-access-patterns.md for architecture guidelines.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from services.container import get_container, ServiceContainer
+from services.lexical_index import LEXICAL_QUERY, LexicalIndex
+from services.tracing import span
 from .responses import (
     ErrorType,
     success_response,
@@ -26,7 +30,7 @@ from .responses import (
     database_error,
     internal_error,
 )
-from .service_utils import requires_services
+from .service_utils import execute_neo4j_read, requires_services
 
 
 logger = logging.getLogger(__name__)
@@ -39,13 +43,6 @@ def _get_chromadb_service(container: Optional[ServiceContainer] = None):
     return get_container().chromadb_service
 
 
-def _get_neo4j_service(container: Optional[ServiceContainer] = None):
-    """Get Neo4j service from container."""
-    if container is not None and container.neo4j_service is not None:
-        return container.neo4j_service
-    return get_container().neo4j_service
-
-
 def _get_embedding_service(container: Optional[ServiceContainer] = None):
     """Get embedding service from container."""
     if container is not None and container.embedding_service is not None:
@@ -53,6 +50,226 @@ def _get_embedding_service(container: Optional[ServiceContainer] = None):
     return get_container().embedding_service
 
 
+def _get_embedding_batcher(container: Optional[ServiceContainer] = None):
+    """Get embedding micro-batcher from container (None if not configured)."""
+    if container is not None and container.embedding_batcher is not None:
+        return container.embedding_batcher
+    return get_container().embedding_batcher
+
+
+def _get_lexical_index(container: Optional[ServiceContainer] = None) -> Optional[LexicalIndex]:
+    """Get the lexical index from container (None unless it can be loaded and caught up)."""
+    container = container or get_container()
+    if (
+        container.lexical_index is None
+        or container.event_store is None
+        or container.neo4j_service is None
+    ):
+        return None
+    return container.lexical_index
+
+
+# Search modes of search_concepts_semantic
+SEARCH_MODES = ("semantic", "hybrid")
+
+# Reciprocal rank fusion constant: score = sum over rankings of 1 / (RRF_K + rank)
+RRF_K = 60
+
+# Filtered vector queries ask for OVERFETCH_FACTOR x the wanted results, doubling
+# up to MAX_CANDIDATES while post-filtering still leaves results missing
+OVERFETCH_FACTOR = 2
+MAX_CANDIDATES = 200
+
+# search_concepts_exact resolves name filters through the lexical index when at
+# most this many concepts match; broader filters stay in Cypher
+MAX_NAME_MATCHES = 1000
+
+# Background load of the lexical index (one at a time)
+_index_warmup_task: Optional[asyncio.Task] = None
+
+
+async def _warm_lexical_index(index: LexicalIndex) -> None:
+    """Load the lexical index from Neo4j."""
+    try:
+        # Read the cursor first, before any event Neo4j has yet to see:
+        # events racing the scan or still in the outbox are re-applied
+        sequence = get_container().event_store.get_projected_sequence()
+        records = await execute_neo4j_read(LEXICAL_QUERY, {}, query_name="lexical_index_rebuild")
+        index.load(records, sequence)
+    except Exception as e:
+        logger.warning(f"Lexical index load failed, searches stay on Neo4j/ChromaDB: {e}")
+
+
+def _ready_lexical_index() -> Optional[LexicalIndex]:
+    """
+    Return the caught-up lexical index, or None to search without it.
+
+    A cold (or stale) index schedules a background load and the current call
+    falls back, so no search waits for the full concept scan.
+    """
+    global _index_warmup_task
+
+    index = _get_lexical_index()
+    if index is None:
+        return None
+
+    if index.needs_rebuild:
+        if _index_warmup_task is None or _index_warmup_task.done():
+            _index_warmup_task = asyncio.get_running_loop().create_task(
+                _warm_lexical_index(index)
+            )
+        return None
+
+    try:
+        index.catch_up(get_container().event_store)
+    except Exception as e:
+        logger.warning(f"Lexical index catch-up failed, searching without it: {e}")
+        index.mark_stale()
+        return None
+    return index
+
+
+def _build_where_filter(
+    area: Optional[str], topic: Optional[str], min_confidence: Optional[float]
+) -> Optional[Dict[str, Any]]:
+    """ChromaDB where clause for the metadata filters (None when unfiltered)."""
+    clauses: list[Dict[str, Any]] = []
+    if area:
+        clauses.append({"area": area})
+    if topic:
+        clauses.append({"topic": topic})
+    # Scores are stored in 0-100 scale; concepts without a score count as 0
+    if min_confidence is not None and min_confidence > 0:
+        clauses.append({"confidence_score": {"$gte": min_confidence}})
+
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def _meets_confidence(metadata: Dict[str, Any], min_confidence: Optional[float]) -> bool:
+    return min_confidence is None or (metadata.get("confidence_score") or 0) >= min_confidence
+
+
+def _query_vectors(
+    collection: Any,
+    query_embedding: list[float],
+    wanted: int,
+    where_filter: Optional[Dict[str, Any]],
+    min_confidence: Optional[float],
+) -> list[tuple[str, Dict[str, Any], float]]:
+    """
+    Nearest concepts as (concept_id, metadata, similarity), best first.
+
+    HNSW search under a selective where clause can come back short, so
+    filtered queries over-fetch; when a full page still leaves fewer than
+    ``wanted`` matches after the confidence check, the query is widened.
+    """
+    n_results = wanted if where_filter is None else min(wanted * OVERFETCH_FACTOR, MAX_CANDIDATES)
+    while True:
+        search_params = {
+            "query_embeddings": [query_embedding],
+            "n_results": n_results,
+            "include": ["metadatas", "distances"],
+        }
+        if where_filter:
+            search_params["where"] = where_filter
+
+        with span("chromadb.query"):
+            results_data = collection.query(**search_params)
+
+        hits = []
+        ids = results_data["ids"][0] if results_data and results_data.get("ids") else []
+        if ids:
+            metadatas = results_data.get("metadatas", [[]])[0]
+            distances = results_data.get("distances", [[]])[0]
+            for i, concept_id in enumerate(ids):
+                metadata = metadatas[i] if i < len(metadatas) else {}
+                distance = distances[i] if i < len(distances) else 1.0
+                if _meets_confidence(metadata, min_confidence):
+                    # For cosine distance: similarity = 1 - distance
+                    hits.append((concept_id, metadata, 1.0 - distance))
+
+        if len(hits) >= wanted or len(ids) < n_results or n_results >= MAX_CANDIDATES:
+            return hits[:wanted]
+        n_results = min(n_results * 2, MAX_CANDIDATES)
+
+
+def _fusion_depth(limit: int) -> int:
+    """Candidates taken from each ranking before fusion."""
+    return min(max(limit * 3, 30), MAX_CANDIDATES)
+
+
+def _format_hit(
+    concept_id: str, metadata: Dict[str, Any], similarity: Optional[float]
+) -> Dict[str, Any]:
+    return {
+        "concept_id": concept_id,
+        "name": metadata.get("name", ""),
+        "similarity": round(similarity, 4) if similarity is not None else None,
+        "area": metadata.get("area"),
+        "topic": metadata.get("topic"),
+        "confidence_score": metadata.get("confidence_score", 0),
+    }
+
+
+def _fuse_hits(
+    collection: Any,
+    vector_hits: list[tuple[str, Dict[str, Any], float]],
+    lexical_hits: list[tuple[str, float]],
+    where_filter: Optional[Dict[str, Any]],
+    min_confidence: Optional[float],
+    limit: int,
+) -> list[Dict[str, Any]]:
+    """
+    Merge the vector and BM25 rankings with reciprocal rank fusion.
+
+    Keyword-only candidates are fetched from ChromaDB with the same where
+    clause, which supplies their metadata and drops those outside the filters.
+    """
+    scores: Dict[str, float] = {}
+    matched_by: Dict[str, list[str]] = {}
+    rankings = (
+        ("semantic", [concept_id for concept_id, _, _ in vector_hits]),
+        ("lexical", [concept_id for concept_id, _ in lexical_hits]),
+    )
+    for source, ranking in rankings:
+        for rank, concept_id in enumerate(ranking, start=1):
+            scores[concept_id] = scores.get(concept_id, 0.0) + 1.0 / (RRF_K + rank)
+            matched_by.setdefault(concept_id, []).append(source)
+
+    details = {
+        concept_id: (metadata, similarity) for concept_id, metadata, similarity in vector_hits
+    }
+    keyword_only = [concept_id for concept_id, _ in lexical_hits if concept_id not in details]
+    if keyword_only:
+        get_params: Dict[str, Any] = {"ids": keyword_only, "include": ["metadatas"]}
+        if where_filter:
+            get_params["where"] = where_filter
+        with span("chromadb.get"):
+            fetched = collection.get(**get_params)
+        for concept_id, metadata in zip(
+            fetched.get("ids") or [], fetched.get("metadatas") or [], strict=False
+        ):
+            metadata = metadata or {}
+            if _meets_confidence(metadata, min_confidence):
+                details[concept_id] = (metadata, None)
+
+    ranked = sorted(
+        (concept_id for concept_id in scores if concept_id in details),
+        key=lambda concept_id: (-scores[concept_id], concept_id),
+    )
+    concepts = []
+    for concept_id in ranked[:limit]:
+        metadata, similarity = details[concept_id]
+        concepts.append({
+            **_format_hit(concept_id, metadata, similarity),
+            "score": round(scores[concept_id], 6),
+            "matched_by": matched_by[concept_id],
+        })
+    return concepts
+
+
 # =============================================================================
 # MCP Tool Functions
 # =============================================================================
@@ -64,15 +281,21 @@ async def search_concepts_semantic(
     limit: int = 10,
     min_confidence: Optional[float] = None,
     area: Optional[str] = None,
-    topic: Optional[str] = None
+    topic: Optional[str] = None,
+    mode: str = "semantic",
 ) -> Dict[str, Any]:
     """
     Search for concepts using semantic similarity (ChromaDB embeddings).
 
     This tool performs semantic search by:
     1. Generating an embedding for the query
-    2. Finding similar concepts using cosine similarity
-    3. Optionally filtering by metadata (area, topic, min_confidence)
+    2. Finding similar concepts using cosine similarity, with the area, topic
+       and min_confidence filters applied inside the ChromaDB query
+    3. In "hybrid" mode, ranking concepts by BM25 over names and explanations
+       as well and fusing both lists with reciprocal rank fusion
+
+    Filtered queries over-fetch and widen the ChromaDB query until ``limit``
+    matches are found or the filter is exhausted.
 
     Args:
         query: Natural language search query (required)
@@ -80,6 +303,7 @@ async def search_concepts_semantic(
         min_confidence: Minimum confidence score filter (0-100, optional)
         area: Filter by subject area (optional, e.g., "Programming")
         topic: Filter by topic (optional, e.g., "Python")
+        mode: "semantic" (vector search only, default) or "hybrid"
 
     Returns:
         {
@@ -88,10 +312,12 @@ async def search_concepts_semantic(
                 {
                     "concept_id": str,
                     "name": str,
-                    "similarity": float,
+                    "similarity": float,   # None for keyword-only hybrid matches
                     "area": str,
                     "topic": str,
-                    "confidence_score": float
+                    "confidence_score": float,
+                    "score": float,        # hybrid mode: fused RRF score
+                    "matched_by": [str]    # hybrid mode: "semantic" and/or "lexical"
                 }
             ],
             "total": int,
@@ -101,8 +327,16 @@ async def search_concepts_semantic(
     Examples:
         >>> search_concepts_semantic("How to loop through items in Python?", limit=5)
         >>> search_concepts_semantic("machine learning basics", area="AI", min_confidence=80)
+        >>> search_concepts_semantic("binary search tree", mode="hybrid")
     """
     try:
+        if mode not in SEARCH_MODES:
+            return validation_error(
+                f"Invalid mode '{mode}'. Must be one of: {', '.join(SEARCH_MODES)}",
+                field="mode",
+                invalid_value=mode,
+            )
+
         # Validate limit
         warnings = []
         original_limit = limit
@@ -112,11 +346,16 @@ async def search_concepts_semantic(
 
         # Get services from container
         emb_service = _get_embedding_service()
+        emb_batcher = _get_embedding_batcher()
         chroma_service = _get_chromadb_service()
 
-        # Generate embedding for query
+        # Generate embedding for query (batched with concurrent calls when available)
         logger.info(f"Generating embedding for query: {query[:50]}...")
-        query_embedding = emb_service.generate_embedding(query)
+        with span("embedding.query"):
+            if emb_batcher is not None:
+                query_embedding = await emb_batcher.embed(query)
+            else:
+                query_embedding = emb_service.generate_embedding(query)
 
         if query_embedding is None or len(query_embedding) == 0:
             logger.warning("Embedding generation returned None or empty", extra={
@@ -125,62 +364,34 @@ async def search_concepts_semantic(
             })
             return database_error(service_name="embedding", operation="generate")
 
-        # Build metadata filter
-        where_filter = {}
-        if area:
-            where_filter["area"] = area
-        if topic:
-            where_filter["topic"] = topic
-
-        # Perform semantic search in ChromaDB
+        # Perform semantic search in ChromaDB (filters pushed into the query)
         collection = chroma_service.get_collection()
+        where_filter = _build_where_filter(area, topic, min_confidence)
+        depth = limit if mode == "semantic" else _fusion_depth(limit)
+        vector_hits = _query_vectors(
+            collection, query_embedding, depth, where_filter, min_confidence
+        )
 
-        search_params = {
-            "query_embeddings": [query_embedding],
-            "n_results": limit,
-            "include": ["metadatas", "distances"],
-        }
-
-        if where_filter:
-            search_params["where"] = where_filter
-
-        results_data = collection.query(**search_params)
-
-        # Process results
-        concepts = []
-        if results_data and results_data.get("ids"):
-            ids = results_data["ids"][0]
-            metadatas = results_data.get("metadatas", [[]])[0]
-            distances = results_data.get("distances", [[]])[0]
-
-            for i, concept_id in enumerate(ids):
-                metadata = metadatas[i] if i < len(metadatas) else {}
-                distance = distances[i] if i < len(distances) else 1.0
-
-                # Convert distance to similarity (0-1, where 1 is most similar)
-                # For cosine distance: similarity = 1 - distance
-                similarity = 1.0 - distance
-
-                # Apply min_confidence filter (post-query filtering)
-                # Scores are stored in 0-100 scale
-                confidence_score = metadata.get("confidence_score", 0)
-
-                if min_confidence is not None and confidence_score < min_confidence:
-                    continue
-
-                concepts.append({
-                    "concept_id": concept_id,
-                    "name": metadata.get("name", ""),
-                    "similarity": round(similarity, 4),
-                    "area": metadata.get("area"),
-                    "topic": metadata.get("topic"),
-                    "confidence_score": confidence_score
-                })
-
-        # Sort by similarity (descending)
-        concepts.sort(key=lambda x: x["similarity"], reverse=True)
-
-        logger.info(f"Semantic search returned {len(concepts)} results")
+        if mode == "semantic":
+            concepts = [
+                _format_hit(concept_id, metadata, similarity)
+                for concept_id, metadata, similarity in vector_hits
+            ]
+            # Sort by similarity (descending)
+            concepts.sort(key=lambda x: x["similarity"], reverse=True)
+        else:
+            index = _ready_lexical_index()
+            lexical_hits: list[tuple[str, float]] = []
+            if index is None:
+                warnings.append("Keyword index is not ready yet; returned semantic matches only")
+            else:
+                with span("lexical.search"):
+                    lexical_hits = index.search(query, depth, area=area, topic=topic)
+            concepts = _fuse_hits(
+                collection, vector_hits, lexical_hits, where_filter, min_confidence, limit
+            )
+
+        logger.info(f"Semantic search ({mode}) returned {len(concepts)} results")
 
         if warnings:
             return success_response("Found", results=concepts, total=len(concepts), warnings=warnings)
@@ -262,10 +473,22 @@ async def search_concepts_exact(
         where_clauses = []
         params = {}
 
-        # Name filter (case-insensitive CONTAINS)
+        # Name filter (case-insensitive partial match): resolved through the
+        # lexical index's name trigrams when it is warm, CONTAINS otherwise
         if name:
-            where_clauses.append("toLower(c.name) CONTAINS toLower($name)")
-            params["name"] = name
+            name_ids = None
+            index = _ready_lexical_index()
+            if index is not None:
+                with span("lexical.name_match"):
+                    name_ids = index.name_matches(name, MAX_NAME_MATCHES)
+            if name_ids is None:
+                where_clauses.append("toLower(c.name) CONTAINS toLower($name)")
+                params["name"] = name
+            elif not name_ids:
+                return success_response("Found", results=[], total=0)
+            else:
+                where_clauses.append("c.concept_id IN $concept_ids")
+                params["concept_ids"] = name_ids
 
         # Area filter (exact match)
         if area:
@@ -309,11 +532,8 @@ async def search_concepts_exact(
 
         logger.info(f"Executing exact search with filters: {params}")
 
-        # Get Neo4j service from container
-        neo4j = _get_neo4j_service()
-
         # Execute query
-        results = neo4j.execute_read(query, params)
+        results = await execute_neo4j_read(query, params, query_name="search_concepts_exact")
 
         # Process results
         concepts = []
@@ -420,11 +640,8 @@ async def get_recent_concepts(days: int = 7, limit: int = 20) -> dict[str, Any]:
 
         params = {"cutoff": cutoff_iso, "limit": limit}
 
-        # Get Neo4j service from container
-        neo4j = _get_neo4j_service()
-
         # Execute query
-        results = neo4j.execute_read(query, params)
+        results = await execute_neo4j_read(query, params, query_name="get_recent_concepts")
 
         # Process results
         concepts = []
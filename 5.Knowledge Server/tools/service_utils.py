@@ -8,7 +8,10 @@ import functools
 import logging
 from typing import Any, Callable, Dict, Optional
 
+from config import get_settings
+from services.async_neo4j_service import QUERY_STAGE_PREFIX
 from services.container import get_container, ServiceContainer
+from services.tracing import span
 from .responses import ErrorType, error_response
 
 
@@ -26,6 +29,10 @@ def requires_services(*service_names: str) -> Callable:
     1. 'container' kwarg if provided (for explicit dependency injection)
     2. Global container via get_container()
 
+    During a staged startup (see services/startup.py) a call waits up to
+    STARTUP_WAIT_TIMEOUT_SECONDS for services that are still coming up, so
+    each tool is served as soon as its own dependencies are ready.
+
     Args:
         *service_names: Names of required service variables (as strings)
             Valid service names:
@@ -74,6 +81,18 @@ def requires_services(*service_names: str) -> Callable:
             # Prefer container kwarg if provided, otherwise use global container
             container: Optional[ServiceContainer] = kwargs.get('container') or get_container()
 
+            # Wait for services a staged startup has not assigned yet
+            startup = getattr(container, "startup", None)
+            if startup is not None:
+                starting = [
+                    name for name in service_names
+                    if getattr(container, name, None) is None and startup.is_pending(name)
+                ]
+                if starting:
+                    await startup.wait_for(
+                        starting, timeout=get_settings().startup_wait_timeout_seconds
+                    )
+
             # Check each required service
             for service_name in service_names:
                 service = getattr(container, service_name, None)
@@ -100,6 +119,39 @@ def requires_services(*service_names: str) -> Callable:
     return decorator
 
 
+async def execute_neo4j_read(
+    query: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    *,
+    query_name: str = "read",
+    container: Optional[ServiceContainer] = None,
+) -> list[dict[str, Any]]:
+    """
+    Run a read query for a tool handler without blocking the event loop.
+
+    Uses the async Neo4j service when it is connected and falls back to the
+    synchronous neo4j_service otherwise (e.g. in unit tests).
+
+    Args:
+        query: Cypher query string
+        parameters: Query parameters
+        query_name: Latency label, recorded as trace stage
+            ``neo4j.query.<query_name>`` (normally the tool name)
+        container: Optional container (defaults to the global container)
+
+    Returns:
+        List of result records as dictionaries
+    """
+    container = container or get_container()
+    if container.async_neo4j_service is not None:
+        # The async service records the query's latency itself
+        return await container.async_neo4j_service.execute_read(
+            query, parameters, query_name=query_name
+        )
+    with span(QUERY_STAGE_PREFIX + query_name):
+        return container.neo4j_service.execute_read(query, parameters)
+
+
 def get_service_status() -> dict[str, dict[str, bool]]:
     """
     Check the initialization status of all services.
@@ -144,17 +196,22 @@ def get_available_tools() -> dict[str, Any]:
     Determine which tools are currently available based on service status.
 
     Returns:
-        Dict with 'available' and 'unavailable' lists of tool names
+        Dict with 'available' and 'unavailable' lists of tool names, plus
+        'starting' (unavailable tools whose services are still coming up)
+        and 'startup' (phase timings) once initialize() has begun
 
     Example:
         {
             "available": ["ping", "create_concept", ...],
             "unavailable": ["search_concepts_semantic"],
-            "total_tools": 17,
-            "service_status": {...}
+            "starting": ["search_concepts_semantic"],
+            "total_tools": 18,
+            "service_status": {...},
+            "startup": {"mode": "staged", "complete": False, "phases": {...}, ...}
         }
     """
     status = get_service_status()
+    startup = get_container().startup
 
     # Define tool-to-service dependencies
     tool_dependencies = {
@@ -191,6 +248,7 @@ def get_available_tools() -> dict[str, Any]:
         # Server tools (no dependencies)
         "ping": [],
         "get_server_stats": [],
+        "get_tool_metrics": [],
 
         # Taxonomy tools
         "list_areas": ["analytics_tools.neo4j_service"],
@@ -198,6 +256,7 @@ def get_available_tools() -> dict[str, Any]:
 
     available = []
     unavailable = []
+    starting = []
 
     for tool_name, dependencies in tool_dependencies.items():
         if not dependencies:
@@ -217,10 +276,18 @@ def get_available_tools() -> dict[str, Any]:
             available.append(tool_name)
         else:
             unavailable.append(tool_name)
+            if startup is not None and any(
+                startup.is_pending(dep.split(".")[1]) for dep in dependencies
+            ):
+                starting.append(tool_name)
 
-    return {
+    result = {
         "available": sorted(available),
         "unavailable": sorted(unavailable),
+        "starting": sorted(starting),
         "total_tools": len(tool_dependencies),
         "service_status": status,
     }
+    if startup is not None:
+        result["startup"] = startup.snapshot()
+    return result